@@ -0,0 +1,4 @@
+"""Reproducible performance benchmarks for the TeXSmith conversion pipeline.
+
+Run ``python -m benchmarks --help`` for the available options.
+"""
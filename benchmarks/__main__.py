@@ -0,0 +1,92 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+import json
+from pathlib import Path
+import sys
+import warnings
+
+from .suite import STAGES, Suite, compare
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark suite; return 1 when a comparison finds regressions."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the TeXSmith conversion hot paths.",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="BASELINE",
+        help="Compare the results with a JSON file written by an earlier run.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Slowdown, as a fraction, reported as a regression (default: 0.10).",
+    )
+    parser.add_argument(
+        "--scales",
+        default="1,10,100",
+        help="Comma-separated sizes of the synthetic documents (default: 1,10,100).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (default: 5).")
+    parser.add_argument(
+        "--stage",
+        action="append",
+        choices=STAGES,
+        help="Only run this stage; may be repeated.",
+    )
+    parser.add_argument(
+        "--no-examples", action="store_true", help="Skip the documents of examples/."
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the summary.")
+    args = parser.parse_args(argv)
+    # Unresolved citations in the examples warn on every run; keep the log readable.
+    warnings.simplefilter("ignore")
+
+    baseline = None
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+
+    suite = Suite(
+        scales=tuple(int(scale) for scale in args.scales.split(",") if scale.strip()),
+        repeat=max(args.repeat, 1),
+        stages=args.stage or STAGES,
+        include_examples=not args.no_examples,
+        log=None if args.quiet else _print,
+    )
+    results = suite.run()
+    for case, message in results["errors"].items():
+        _print(f"skipped {case}: {message}")
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        _print(f"Wrote {len(results['results'])} measurements to {args.output}")
+    if baseline is None:
+        return 0
+
+    rows, regressions = compare(results, baseline, threshold=args.threshold)
+    for row in sorted(rows, key=lambda item: item["ratio"], reverse=True):
+        flag = "  REGRESSION" if row in regressions else ""
+        _print(
+            f"{row['key']:<60} {row['baseline'] * 1000:10.2f} ms -> "
+            f"{row['current'] * 1000:10.2f} ms  x{row['ratio']:.2f}{flag}"
+        )
+    _print(f"{len(regressions)} regression(s) over {len(rows)} matched measurements.")
+    return 1 if regressions else 0
+
+
+def _print(line: str) -> None:
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
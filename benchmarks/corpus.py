@@ -0,0 +1,237 @@
+"""Benchmark inputs: the ``examples/`` corpus and synthetic scaling documents.
+
+Synthetic documents are generated from a fixed seed so every run, on every
+machine, measures the same text. Each kind stresses one part of the pipeline;
+a scale of ``n`` repeats the kind's base unit ``n`` times.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+import random
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES = ROOT / "examples"
+
+_WORDS = [
+    "lorem",
+    "ipsum",
+    "dolor",
+    "sit",
+    "amet",
+    "consectetur",
+    "adipiscing",
+    "elit",
+    "sed",
+    "do",
+    "eiusmod",
+    "tempor",
+    "incididunt",
+    "ut",
+    "labore",
+    "et",
+    "dolore",
+    "magna",
+    "aliqua",
+    "enim",
+    "ad",
+    "minim",
+    "veniam",
+    "quis",
+    "nostrud",
+    "exercitation",
+    "ullamco",
+    "laboris",
+    "nisi",
+    "aliquip",
+    "ex",
+    "ea",
+    "commodo",
+    "consequat",
+    "duis",
+    "aute",
+    "irure",
+    "in",
+    "reprehenderit",
+    "voluptate",
+    "velit",
+    "esse",
+    "cillum",
+    "fugiat",
+    "nulla",
+    "pariatur",
+    "excepteur",
+    "sint",
+    "occaecat",
+    "cupidatat",
+    "non",
+    "proident",
+    "sunt",
+    "culpa",
+    "qui",
+    "officia",
+    "deserunt",
+    "mollit",
+    "anim",
+    "id",
+    "est",
+]
+_CJK = "漢字仮名交じり文は日本語の表記に用いられる中文的书写系统使用汉字한국어는한글로적는다"
+_ARABIC = "اللغة العربية هي أكثر اللغات السامية تحدثا وإحدى أكثر اللغات انتشارا في العالم"
+_DEVANAGARI = "हिन्दी विश्व की एक प्रमुख भाषा है और भारत की राजभाषा है"
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """One benchmark input."""
+
+    name: str
+    source: str
+    base_path: Path
+
+    @property
+    def size(self) -> int:
+        """Return the size of the source in bytes."""
+        return len(self.source.encode("utf-8"))
+
+
+def example_cases() -> Iterator[Case]:
+    """Yield every Markdown document of the examples corpus."""
+    for path in sorted(EXAMPLES.glob("*/*.md")):
+        if path.name == "README.md":
+            continue
+        yield Case(
+            name=path.relative_to(ROOT).as_posix(),
+            source=path.read_text(encoding="utf-8"),
+            base_path=path.parent,
+        )
+
+
+def synthetic_cases(scales: tuple[int, ...]) -> Iterator[Case]:
+    """Yield the synthetic documents of every kind at every scale."""
+    for kind, generate in SYNTHETIC_KINDS.items():
+        for scale in scales:
+            rng = random.Random(f"{kind}-{scale}")
+            units = (generate(rng, index) for index in range(scale))
+            yield Case(
+                name=f"synthetic/{kind}@{scale}x",
+                source=f"# {kind.title()}\n\n" + "\n".join(units),
+                base_path=ROOT,
+            )
+
+
+def bibliography_files() -> list[Path]:
+    """Return the BibTeX files shipped with the examples."""
+    return sorted(EXAMPLES.glob("**/*.bib"))
+
+
+def synthetic_bibliography(entries: int) -> str:
+    """Return a BibTeX database with ``entries`` generated articles."""
+    rng = random.Random(f"bibliography-{entries}")
+    records = []
+    for index in range(entries):
+        title = " ".join(rng.choice(_WORDS) for _ in range(8)).capitalize()
+        authors = " and ".join(
+            f"{rng.choice(_WORDS).title()}, {rng.choice(_WORDS).title()}" for _ in range(3)
+        )
+        records.append(
+            f"@article{{entry{index},\n"
+            f"  author = {{{authors}}},\n"
+            f"  title = {{{title}}},\n"
+            f"  journal = {{Journal of {rng.choice(_WORDS).title()}}},\n"
+            f"  year = {{{1950 + index % 70}}},\n"
+            f"  volume = {{{index % 40 + 1}}},\n"
+            f"  pages = {{{index}--{index + 12}}},\n"
+            f"  doi = {{10.1000/bench.{index}}}\n"
+            "}\n"
+        )
+    return "\n".join(records)
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(8, 20))]
+    if rng.random() < 0.3:
+        words[rng.randrange(len(words))] = f"*{rng.choice(_WORDS)}*"
+    if rng.random() < 0.2:
+        words[rng.randrange(len(words))] = f"`{rng.choice(_WORDS)}_{rng.randint(0, 99)}`"
+    return " ".join(words).capitalize() + "."
+
+
+def _prose(rng: random.Random, index: int) -> str:
+    paragraphs = [" ".join(_sentence(rng) for _ in range(rng.randint(4, 8))) for _ in range(6)]
+    return f"## Section {index + 1}\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+def _lists(rng: random.Random, index: int) -> str:
+    lines = [f"## Outline {index + 1}\n"]
+    for item in range(4):
+        for depth in range(6):
+            marker = "1." if depth % 2 else "-"
+            lines.append(f"{'    ' * depth}{marker} Item {item}.{depth} {_sentence(rng)}")
+    return "\n".join(lines) + "\n"
+
+
+def _tables(rng: random.Random, index: int) -> str:
+    rows = "\n".join(
+        f"  - [{rng.choice(_WORDS).title()}, {rng.randint(0, 999)}, "
+        f"{rng.randint(0, 999)}, {rng.randint(0, 999)}]"
+        for _ in range(30)
+    )
+    pipe_rows = "\n".join(
+        f"| {rng.choice(_WORDS)} | {rng.randint(0, 99)} | {_sentence(rng)} |" for _ in range(10)
+    )
+    return (
+        f"Table: Stock {index + 1}\n\n"
+        "```yaml table\n"
+        "columns: [Item, Geneva, Zurich, Basel]\n"
+        f"rows:\n{rows}\n"
+        "```\n\n"
+        f"| Name | Count | Notes |\n|---|---|---|\n{pipe_rows}\n"
+    )
+
+
+def _code(rng: random.Random, index: int) -> str:
+    blocks = []
+    for block in range(5):
+        body = "\n".join(
+            f"    total_{line} = compute({rng.randint(0, 99)}, '{rng.choice(_WORDS)}')"
+            for line in range(12)
+        )
+        blocks.append(
+            f"Listing {index}.{block} uses `compute`.\n\n"
+            f"```python\ndef step_{index}_{block}():\n{body}\n    return total_0\n```\n"
+        )
+    return "\n".join(blocks)
+
+
+def _scripts(rng: random.Random, index: int) -> str:
+    paragraphs = []
+    for _ in range(6):
+        snippets = [_CJK, _ARABIC, _DEVANAGARI]
+        rng.shuffle(snippets)
+        paragraphs.append(f"{_sentence(rng)} {snippets[0]} {_sentence(rng)} {snippets[1]}")
+    return f"## Scripts {index + 1}\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+SYNTHETIC_KINDS: dict[str, Callable[[random.Random, int], str]] = {
+    "prose": _prose,
+    "lists": _lists,
+    "tables": _tables,
+    "code": _code,
+    "scripts": _scripts,
+}
+
+
+__all__ = [
+    "EXAMPLES",
+    "ROOT",
+    "SYNTHETIC_KINDS",
+    "Case",
+    "bibliography_files",
+    "example_cases",
+    "synthetic_bibliography",
+    "synthetic_cases",
+]
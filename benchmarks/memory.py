@@ -0,0 +1,119 @@
+"""Memory footprint of the document IR: ``python -m benchmarks.memory``.
+
+Reads every synthetic document with the default and the compact
+(``compact_text=True``) HTML reader under :mod:`tracemalloc` and reports the
+peak allocation of the read, the memory the resulting IR keeps alive and its
+node count.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+from dataclasses import dataclass
+import gc
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+from typing import Any
+
+from texsmith.adapters.markdown import DEFAULT_MARKDOWN_EXTENSIONS, render_markdown
+from texsmith.ir.visitor import walk
+from texsmith.readers.html import HtmlReader
+
+from .corpus import SYNTHETIC_KINDS, synthetic_cases
+
+
+VARIANTS = ("default", "compact")
+
+
+@dataclass(slots=True)
+class Footprint:
+    """Memory used by one read of one document."""
+
+    peak: int
+    retained: int
+    nodes: int
+
+    def to_json(self) -> dict[str, int]:
+        """Return the JSON representation stored in result files."""
+        return {"peak": self.peak, "retained": self.retained, "nodes": self.nodes}
+
+
+def measure(html: str, *, compact: bool) -> Footprint:
+    """Read ``html`` and return the memory the read and its IR take."""
+    reader = HtmlReader(compact_text=compact)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        document = reader.read(html)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Footprint(peak=peak, retained=retained, nodes=sum(1 for _ in walk(document)))
+
+
+def run(scales: tuple[int, ...], kinds: Sequence[str]) -> dict[str, Any]:
+    """Measure both reader variants on the synthetic documents of ``kinds``."""
+    results: dict[str, Any] = {}
+    for case in synthetic_cases(scales):
+        if case.name.split("/", 1)[1].split("@", 1)[0] not in kinds:
+            continue
+        html = render_markdown(
+            case.source, DEFAULT_MARKDOWN_EXTENSIONS, base_path=case.base_path
+        ).html
+        results[case.name] = {
+            variant: measure(html, compact=variant == "compact").to_json() for variant in VARIANTS
+        }
+    return {"schema": 1, "results": results}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Print the footprint of both reader variants, optionally writing JSON."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.memory",
+        description="Measure the memory taken by the HTML reader and its IR.",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--scales",
+        default="10,100",
+        help="Comma-separated sizes of the synthetic documents (default: 10,100).",
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=tuple(SYNTHETIC_KINDS),
+        help="Only measure this kind of synthetic document; may be repeated.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(
+        tuple(int(scale) for scale in args.scales.split(",") if scale.strip()),
+        args.kind or ("prose", "lists"),
+    )
+    for name, variants in results["results"].items():
+        default, compact = variants["default"], variants["compact"]
+        saved = 1 - compact["retained"] / default["retained"] if default["retained"] else 0.0
+        _print(
+            f"{name:<28} retained {default['retained'] / 1024:9.1f} KiB -> "
+            f"{compact['retained'] / 1024:9.1f} KiB ({saved:6.1%} less)  "
+            f"peak {default['peak'] / 1024:9.1f} KiB -> {compact['peak'] / 1024:9.1f} KiB  "
+            f"nodes {default['nodes']:>7} -> {compact['nodes']:>7}"
+        )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        _print(f"Wrote {len(results['results'])} measurements to {args.output}")
+    return 0
+
+
+def _print(line: str) -> None:
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
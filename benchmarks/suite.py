@@ -0,0 +1,293 @@
+"""Benchmark stages, timing and baseline comparison.
+
+Every stage is timed on inputs prepared ahead of time by the previous stages,
+so a measurement covers one hot path only: Markdown rendering, HTML reading,
+LaTeX writing, text escaping, font-script detection, template wrapping and
+bibliography loading. Each measurement keeps the best of ``repeat`` runs, which
+is the figure least disturbed by other activity on the machine.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+import gc
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from texsmith.adapters.latex.renderer import LaTeXRenderer
+from texsmith.adapters.markdown import DEFAULT_MARKDOWN_EXTENSIONS, render_markdown
+from texsmith.core.bibliography.collection import BibliographyCollection
+from texsmith.core.context import DocumentState
+from texsmith.core.diagnostics import NullEmitter
+from texsmith.core.templates.runtime import TemplateRuntime, load_template_runtime
+from texsmith.core.templates.wrapper import wrap_template_document
+from texsmith.fonts.scripts import ScriptDetector
+from texsmith.ir import nodes as ir
+from texsmith.ir.visitor import walk
+from texsmith.readers.html import HtmlReader
+from texsmith.version import get_version
+from texsmith.writers.latex import LaTeXWriter, WriterState
+from texsmith.writers.latex.escaper import escape_text_segment
+
+from .corpus import (
+    ROOT,
+    Case,
+    bibliography_files,
+    example_cases,
+    synthetic_bibliography,
+    synthetic_cases,
+)
+
+
+SCHEMA_VERSION = 1
+DOCUMENT_STAGES = (
+    "markdown",
+    "html_reader",
+    "latex_writer",
+    "escape",
+    "script_detector",
+    "template_wrap",
+)
+STAGES = (*DOCUMENT_STAGES, "bibliography")
+# Differences below this many seconds are treated as noise when comparing.
+NOISE_FLOOR = 0.001
+
+
+@dataclass(slots=True)
+class Measurement:
+    """Timings of one stage on one input."""
+
+    stage: str
+    case: str
+    size: int
+    runs: list[float]
+
+    @property
+    def key(self) -> str:
+        """Return the identifier used to match measurements across runs."""
+        return f"{self.stage}:{self.case}"
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the JSON representation stored in result files."""
+        return {
+            "stage": self.stage,
+            "case": self.case,
+            "size": self.size,
+            "min": min(self.runs),
+            "median": statistics.median(self.runs),
+            "runs": len(self.runs),
+        }
+
+
+@dataclass(slots=True)
+class _Prepared:
+    case: Case
+    html: str
+    document: ir.Document
+    latex: str
+    texts: list[str]
+    paragraphs: list[str]
+
+
+class Suite:
+    """Run the benchmark stages over the examples and synthetic documents."""
+
+    def __init__(
+        self,
+        *,
+        scales: tuple[int, ...] = (1, 10, 100),
+        repeat: int = 5,
+        stages: Iterable[str] = STAGES,
+        include_examples: bool = True,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self.scales = scales
+        self.repeat = repeat
+        self.stages = tuple(stages)
+        self.include_examples = include_examples
+        self._log = log or (lambda _line: None)
+        self._workdir = Path()
+        self._detector = ScriptDetector()
+        self._template: TemplateRuntime | None = None
+
+    def run(self) -> dict[str, Any]:
+        """Run the selected stages and return the result document."""
+        with tempfile.TemporaryDirectory(prefix="texsmith-bench-") as workdir:
+            self._workdir = Path(workdir)
+            return self._run()
+
+    def _run(self) -> dict[str, Any]:
+        measurements: list[Measurement] = []
+        errors: dict[str, str] = {}
+        cases = list(example_cases()) if self.include_examples else []
+        cases.extend(synthetic_cases(self.scales))
+        document_stages = [stage for stage in self.stages if stage in DOCUMENT_STAGES]
+        if document_stages:
+            # Load the font fallback index and the template outside the timings.
+            self._detector.render("warm up")
+            self._template = load_template_runtime("article")
+        for case in cases:
+            if not document_stages:
+                break
+            try:
+                prepared = self._prepare(case)
+            except Exception as exc:
+                errors[case.name] = f"{type(exc).__name__}: {exc}"
+                continue
+            for stage in document_stages:
+                measurements.append(self._measure(stage, case.name, case.size, prepared))
+        if "bibliography" in self.stages:
+            measurements.extend(self._bibliography())
+        return {
+            "schema": SCHEMA_VERSION,
+            "meta": _environment(),
+            "results": {item.key: item.to_json() for item in measurements},
+            "errors": errors,
+        }
+
+    def _measure(self, stage: str, case: str, size: int, prepared: Any) -> Measurement:
+        action = getattr(self, f"_stage_{stage}")
+        runs = []
+        for _ in range(self.repeat):
+            gc.collect()
+            started = time.perf_counter()
+            action(prepared)
+            runs.append(time.perf_counter() - started)
+        self._log(f"{stage:<16} {case:<40} {min(runs) * 1000:10.2f} ms")
+        return Measurement(stage=stage, case=case, size=size, runs=runs)
+
+    def _prepare(self, case: Case) -> _Prepared:
+        html = render_markdown(
+            case.source, DEFAULT_MARKDOWN_EXTENSIONS, base_path=case.base_path
+        ).html
+        document = HtmlReader().read(html)
+        prepared = _Prepared(
+            case=case, html=html, document=document, latex="", texts=[], paragraphs=[]
+        )
+        prepared.latex = self._writer().write(document)
+        for node in walk(document):
+            if isinstance(node, ir.Str):
+                prepared.texts.append(node.text)
+            elif isinstance(node, ir.Para):
+                prepared.paragraphs.append(_plain_text(node))
+        return prepared
+
+    def _writer(self) -> LaTeXWriter:
+        renderer = LaTeXRenderer(output_root=self._workdir, copy_assets=False)
+        return LaTeXWriter(
+            WriterState(
+                state=DocumentState(),
+                config=renderer.config,
+                formatter=renderer.formatter,
+                assets=renderer.assets,
+                runtime={
+                    "copy_assets": False,
+                    "convert_assets": False,
+                    "hash_assets": False,
+                    "emitter": NullEmitter(),
+                },
+            )
+        )
+
+    # -- stages ------------------------------------------------------------
+
+    def _stage_markdown(self, prepared: _Prepared) -> None:
+        case = prepared.case
+        render_markdown(case.source, DEFAULT_MARKDOWN_EXTENSIONS, base_path=case.base_path)
+
+    def _stage_html_reader(self, prepared: _Prepared) -> None:
+        HtmlReader().read(prepared.html)
+
+    def _stage_latex_writer(self, prepared: _Prepared) -> None:
+        self._writer().write(prepared.document)
+
+    def _stage_escape(self, prepared: _Prepared) -> None:
+        for text in prepared.texts:
+            escape_text_segment(text)
+
+    def _stage_script_detector(self, prepared: _Prepared) -> None:
+        for paragraph in prepared.paragraphs:
+            self._detector.render(paragraph)
+
+    def _stage_template_wrap(self, prepared: _Prepared) -> None:
+        template = self._template
+        if template is None:  # pragma: no cover - loaded by ``run``
+            raise RuntimeError("The template runtime is not loaded.")
+        wrap_template_document(
+            template=template.instance,
+            default_slot=template.default_slot,
+            slot_outputs={template.default_slot: prepared.latex},
+            document_state=DocumentState(),
+            template_overrides=None,
+            output_dir=self._workdir,
+            copy_assets=False,
+            output_name="benchmark.tex",
+            template_runtime=template,
+        )
+
+    def _bibliography(self) -> list[Measurement]:
+        inputs = [(path.relative_to(ROOT).as_posix(), path) for path in bibliography_files()]
+        for scale in self.scales:
+            path = self._workdir / f"synthetic-{scale}.bib"
+            path.write_text(synthetic_bibliography(50 * scale), encoding="utf-8")
+            inputs.append((f"synthetic/bibliography@{scale}x", path))
+        return [
+            self._measure("bibliography", name, path.stat().st_size, path) for name, path in inputs
+        ]
+
+    def _stage_bibliography(self, path: Path) -> None:
+        BibliographyCollection().load_files([path])
+
+
+def compare(
+    current: Mapping[str, Any], baseline: Mapping[str, Any], *, threshold: float
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Match ``current`` results against ``baseline`` on their best run.
+
+    Returns every matched row and, separately, the regressions: rows slower
+    than the baseline by more than ``threshold`` (a fraction) and by more than
+    the noise floor.
+    """
+    rows: list[dict[str, Any]] = []
+    regressions: list[dict[str, Any]] = []
+    previous = baseline.get("results", {})
+    for key, result in current.get("results", {}).items():
+        reference = previous.get(key)
+        if reference is None or not reference.get("min"):
+            continue
+        ratio = result["min"] / reference["min"]
+        row = {"key": key, "baseline": reference["min"], "current": result["min"], "ratio": ratio}
+        rows.append(row)
+        if ratio > 1 + threshold and result["min"] - reference["min"] > NOISE_FLOOR:
+            regressions.append(row)
+    return rows, regressions
+
+
+def _plain_text(node: ir.Para) -> str:
+    parts: list[str] = []
+    for child in walk(node):
+        if isinstance(child, ir.Str):
+            parts.append(child.text)
+        elif isinstance(child, ir.Space | ir.SoftBreak):
+            parts.append(" ")
+    return "".join(parts)
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "texsmith": get_version(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+__all__ = ["DOCUMENT_STAGES", "STAGES", "Measurement", "Suite", "compare"]
@@ -12,6 +12,7 @@ from texsmith.core.bibliography import (
 from texsmith.core.config import BookConfig, LaTeXConfig
 from texsmith.core.context import AssetRegistry, DocumentState, RenderContext
 from texsmith.core.conversion import ConversionRequest, SlotAssignment
+from texsmith.core.conversion.cache import FragmentCache
 from texsmith.core.conversion.core import (
     ConversionBundle,
     LaTeXFragment,
@@ -66,6 +67,7 @@ __all__ = [
     "DocumentState",
     "DoiBibliographyFetcher",
     "DoiLookupError",
+    "FragmentCache",
     "LaTeXConfig",
     "LaTeXFragment",
     "RenderContext",
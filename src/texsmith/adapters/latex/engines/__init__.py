@@ -14,6 +14,8 @@ from typing import Any, Literal
 from rich.console import Console
 
 from texsmith.core.context import DocumentState
+from texsmith.core.diagnostics import DiagnosticEmitter
+from texsmith.core.profiling import timed_phase
 from texsmith.core.user_dir import get_user_dir
 
 from ..latexmk import (
@@ -335,23 +337,50 @@ def run_engine_command(
     classic_output: bool = False,
     features: EngineFeatures | None = None,
     rerun_limit: int = 5,
+    emitter: DiagnosticEmitter | None = None,
 ) -> EngineResult:
-    """Execute the engine command, streaming logs when requested."""
-    argv = command.argv
-    log_path = command.log_path
-    console = console or Console(file=io.StringIO())
+    """Execute the engine command, streaming logs when requested.
 
-    if backend == "tectonic" and features is not None:
-        return _run_tectonic_build(
+    ``emitter`` receives the timings of the engine run and, for Tectonic
+    builds, of each pass and auxiliary tool when it records phases.
+    """
+    console = console or Console(file=io.StringIO())
+    with timed_phase(emitter, "engine", backend=backend):
+        if backend == "tectonic" and features is not None:
+            return _run_tectonic_build(
+                command,
+                features,
+                workdir=workdir,
+                env=env,
+                console=console,
+                classic_output=classic_output,
+                rerun_limit=rerun_limit,
+                emitter=emitter,
+            )
+        return _run_engine(
             command,
-            features,
+            backend=backend,
             workdir=workdir,
             env=env,
             console=console,
+            verbosity=verbosity,
             classic_output=classic_output,
-            rerun_limit=rerun_limit,
         )
 
+
+def _run_engine(
+    command: EngineCommand,
+    *,
+    backend: EngineBackend,
+    workdir: Path,
+    env: Mapping[str, str],
+    console: Console,
+    verbosity: int,
+    classic_output: bool,
+) -> EngineResult:
+    argv = command.argv
+    log_path = command.log_path
+
     if classic_output:
         process = subprocess.run(
             argv,
@@ -485,6 +514,7 @@ def _run_tectonic_build(
     console: Console,
     classic_output: bool,
     rerun_limit: int,
+    emitter: DiagnosticEmitter | None = None,
 ) -> EngineResult:
     job_stem = command.log_path.with_suffix("").name
     index_engine = normalise_index_engine(features.index_engine) if features.has_index else None
@@ -496,13 +526,14 @@ def _run_tectonic_build(
     last_result: LatexStreamResult | None = None
 
     for pass_number in range(1, rerun_target + 1):
-        result = _run_single_tectonic_pass(
-            command,
-            workdir=workdir,
-            env=env,
-            console=console,
-            classic_output=classic_output,
-        )
+        with timed_phase(emitter, "engine.pass", number=pass_number):
+            result = _run_single_tectonic_pass(
+                command,
+                workdir=workdir,
+                env=env,
+                console=console,
+                classic_output=classic_output,
+            )
         last_result = result
         if result.returncode != 0:
             return _stream_result_to_engine_result(result, command)
@@ -510,13 +541,14 @@ def _run_tectonic_build(
         forced_rerun = False
 
         if features.bibliography and not ran_biber:
-            ran, failure = _maybe_run_biber(
-                job_stem,
-                workdir=workdir,
-                env=env,
-                console=console,
-                command=command,
-            )
+            with timed_phase(emitter, "engine.biber"):
+                ran, failure = _maybe_run_biber(
+                    job_stem,
+                    workdir=workdir,
+                    env=env,
+                    console=console,
+                    command=command,
+                )
             if failure is not None:
                 return failure
             if ran:
@@ -524,14 +556,15 @@ def _run_tectonic_build(
                 forced_rerun = True
 
         if features.has_index and not ran_index and index_engine:
-            ran, failure = _maybe_run_index(
-                job_stem,
-                engine_name=index_engine,
-                workdir=workdir,
-                env=env,
-                console=console,
-                command=command,
-            )
+            with timed_phase(emitter, "engine.index"):
+                ran, failure = _maybe_run_index(
+                    job_stem,
+                    engine_name=index_engine,
+                    workdir=workdir,
+                    env=env,
+                    console=console,
+                    command=command,
+                )
             if failure is not None:
                 return failure
             if ran:
@@ -539,13 +572,14 @@ def _run_tectonic_build(
                 forced_rerun = True
 
         if features.has_glossary and not ran_glossary:
-            ran, failure = _maybe_run_glossaries(
-                job_stem,
-                workdir=workdir,
-                env=env,
-                console=console,
-                command=command,
-            )
+            with timed_phase(emitter, "engine.glossaries"):
+                ran, failure = _maybe_run_glossaries(
+                    job_stem,
+                    workdir=workdir,
+                    env=env,
+                    console=console,
+                    command=command,
+                )
             if failure is not None:
                 return failure
             if ran:
@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+import contextlib
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-
-from jinja2 import Environment, FileSystemLoader, Template
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    pass_context,
+)
 from requests.utils import requote_uri as requote_url
 
 from .pygments import PygmentsLatexHighlighter
@@ -14,10 +22,18 @@ from .utils import escape_latex_chars
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from jinja2.bccache import Bucket
+    from jinja2.runtime import Context
+
     from texsmith.core.context import DocumentState
 
 
 TEMPLATE_DIR = Path(__file__).resolve().parent / "partials"
+BYTECODE_CACHE_NAMESPACE = "jinja"
+
+# Render-context variable carrying the formatter's accent setting, read by the
+# ``latex_escape`` filter of the shared (formatter-independent) environment.
+_LEGACY_ACCENTS_VAR = "__texsmith_legacy_accents__"
 
 
 def optimize_list(numbers: Iterable[int]) -> list[str]:
@@ -40,18 +56,48 @@ def optimize_list(numbers: Iterable[int]) -> list[str]:
     return optimized
 
 
-class TemplateNotFoundError(KeyError):
-    """Raised when a requested LaTeX partial does not exist."""
+@pass_context
+def _escape_latex_filter(context: Context, value: str) -> str:
+    """``latex_escape`` filter honouring the rendering formatter's accent setting."""
+    return escape_latex_chars(value, legacy_accents=bool(context.get(_LEGACY_ACCENTS_VAR)))
 
-    def __init__(self, name: str) -> None:
-        super().__init__(f"No LaTeX partial named '{name}' (backend: latex).")
-        self.name = name
 
+class _BytecodeCache(FileSystemBytecodeCache):
+    """On-disk Jinja bytecode cache that never fails a render.
 
-class LaTeXFormatter:
-    """Render LaTeX templates using Jinja2 with custom delimiters."""
+    An unreadable or unwritable cache directory only costs a recompilation.
+    """
 
-    def __init__(self, template_dir: Path = TEMPLATE_DIR) -> None:
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except (OSError, EOFError, ValueError):
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        with contextlib.suppress(OSError):
+            super().dump_bytecode(bucket)
+
+
+@lru_cache(maxsize=1)
+def _bytecode_cache() -> _BytecodeCache | None:
+    from texsmith.core.user_dir import get_user_dir
+
+    try:
+        directory = get_user_dir().cache_dir(BYTECODE_CACHE_NAMESPACE)
+    except OSError:
+        return None
+    return _BytecodeCache(str(directory))
+
+
+class _PartialLibrary:
+    """Jinja environment and partial index shared by every formatter of a directory.
+
+    The environment keeps the compiled templates (and checks their sources for
+    changes on load); the directory is globbed once per process.
+    """
+
+    def __init__(self, template_dir: Path) -> None:
         self.env = Environment(
             block_start_string=r"\BLOCK{",
             block_end_string=r"}",
@@ -60,20 +106,81 @@ class LaTeXFormatter:
             comment_start_string=r"\COMMENT{",
             comment_end_string=r"}",
             loader=FileSystemLoader(template_dir),
+            bytecode_cache=_bytecode_cache(),
         )
-        self.legacy_latex_accents: bool = False
-        self.env.filters.setdefault("latex_escape", self._escape_latex)
-        self.env.filters.setdefault("escape_latex", self._escape_latex)
+        self.env.filters["latex_escape"] = _escape_latex_filter
+        self.env.filters["escape_latex"] = _escape_latex_filter
 
         template_paths: list[Path] = []
         for ext in (".tex", ".cls"):
             template_paths.extend(template_dir.glob(f"**/*{ext}"))
 
-        self._template_names: dict[str, str] = {}
+        self.template_names: dict[str, str] = {}
         for path in template_paths:
             relative = path.relative_to(template_dir)
-            key = self._normalise_key(relative.with_suffix("").as_posix())
-            self._template_names[key] = relative.as_posix()
+            key = LaTeXFormatter.normalise_key(relative.with_suffix("").as_posix())
+            self.template_names[key] = relative.as_posix()
+
+
+@cache
+def _partial_library(template_dir: Path) -> _PartialLibrary:
+    return _PartialLibrary(template_dir)
+
+
+@lru_cache(maxsize=256)
+def _compile_override(template_dir: Path, template_name: str, source: str) -> Template:
+    """Compile an override payload once per process (per directory and source)."""
+    template = _partial_library(template_dir).env.from_string(source)
+    template.name = template_name
+    return template
+
+
+class TemplateNotFoundError(KeyError):
+    """Raised when a requested LaTeX partial does not exist."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"No LaTeX partial named '{name}' (backend: latex).")
+        self.name = name
+
+
+class LaTeXFormatter:
+    """Render LaTeX templates using Jinja2 with custom delimiters.
+
+    The Jinja environment (``env``) and its compiled partials are shared by
+    every formatter using the same template directory; overrides stay local to
+    the formatter that applies them.
+    """
+
+    #: Built-in partials rendered with :meth:`str.format` instead of Jinja. Each
+    #: entry must produce exactly what the partial file renders; it is dropped
+    #: when the partial is overridden or the formatter uses another directory.
+    FORMAT_PARTIALS: ClassVar[dict[str, str]] = {
+        "acronym": r"\gls{{{text}}}",
+        "citation": r"\cite{{{key}}}",
+        "codeinlinett": r"\texttt{{{text}}}",
+        "deletion": r"\xout{{{text}}}",
+        "enquote": r"\enquote{{{text}}}",
+        "href": r"\href{{{url}}}{{{text}}}",
+        "icon": r"\includegraphics[width=1em]{{{text}}}",
+        "italic": r"\emph{{{text}}}",
+        "label": r"\label{{{text}}}",
+        "smallcaps": r"\textsc{{{text}}}",
+        "strikethrough": r"\sout{{{text}}}",
+        "strong": r"\textbf{{{text}}}",
+        "subscript": r"\textsubscript{{{text}}}",
+        "superscript": r"\textsuperscript{{{text}}}",
+        "underline": r"\uline{{{text}}}",
+    }
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR) -> None:
+        self._template_dir = template_dir
+        library = _partial_library(template_dir)
+        self.env = library.env
+        self.legacy_latex_accents: bool = False
+        self._template_names: dict[str, str] = dict(library.template_names)
+        self._format_partials: dict[str, str] = (
+            dict(self.FORMAT_PARTIALS) if template_dir == TEMPLATE_DIR else {}
+        )
 
         self.templates: dict[str, Template] = {}
         self.default_code_engine = "pygments"
@@ -123,15 +230,25 @@ class LaTeXFormatter:
         handler = getattr(type(self), mangled, None)
         if handler is not None:
             return handler(self, *args, **kwargs)
-        try:
-            template = self._get_template(name)
-        except KeyError:
-            raise TemplateNotFoundError(name) from None
+        if self._normalise_key(name) not in self._template_names:
+            raise TemplateNotFoundError(name)
         if len(args) > 1:
             msg = f"Expected at most 1 argument, got {len(args)}, use keyword arguments instead"
             raise ValueError(msg)
         if args:
             kwargs["text"] = args[0]
+        return self._render(name, **kwargs)
+
+    def _render(self, name: str, /, **kwargs: Any) -> str:
+        """Render the partial ``name``, through its format string when it has one."""
+        pattern = self._format_partials.get(name)
+        if pattern is not None:
+            try:
+                return pattern.format_map(kwargs)
+            except KeyError:
+                pass  # Jinja renders a missing variable as empty: let it.
+        template = self._get_template(name)
+        kwargs[_LEGACY_ACCENTS_VAR] = self.legacy_latex_accents
         return template.render(**kwargs)
 
     def _escape_url(self, url: str) -> str:
@@ -142,7 +259,7 @@ class LaTeXFormatter:
         """Render plain inline code inside \\texttt."""
         escaped = escape_latex_chars(text, legacy_accents=self.legacy_latex_accents)
         escaped = escaped.replace("-", "-\\allowbreak{}")
-        return self._get_template("codeinlinett").render(text=escaped)
+        return self._render("codeinlinett", text=escaped)
 
     def handle_codeblock(
         self,
@@ -175,7 +292,8 @@ class LaTeXFormatter:
             )
             if state is not None and style_defs:
                 state.pygments_styles.setdefault(self._pygments.style_key, style_defs)
-            return self._get_template("codeblock_pygments").render(
+            return self._render(
+                "codeblock_pygments",
                 code=latex_code,
                 language=language,
                 linenos=lineno,
@@ -185,7 +303,8 @@ class LaTeXFormatter:
             )
 
         if normalized_engine == "listings":
-            return self._get_template("codeblock_listings").render(
+            return self._render(
+                "codeblock_listings",
                 code=code,
                 language=language,
                 linenos=lineno,
@@ -195,7 +314,8 @@ class LaTeXFormatter:
             )
 
         if normalized_engine == "verbatim":
-            return self._get_template("codeblock_verbatim").render(
+            return self._render(
+                "codeblock_verbatim",
                 code=code,
                 language=language,
                 linenos=lineno,
@@ -204,7 +324,8 @@ class LaTeXFormatter:
                 highlight=optimized_highlight,
             )
 
-        return self._get_template("codeblock").render(
+        return self._render(
+            "codeblock",
             code=code,
             language=language,
             linenos=lineno,
@@ -215,11 +336,11 @@ class LaTeXFormatter:
 
     def handle_href(self, text: str, url: str) -> str:
         """Render \\href links with escaped URLs."""
-        return self._get_template("href").render(text=text, url=self._escape_url(url))
+        return self._render("href", text=text, url=self._escape_url(url))
 
     def handle_regex(self, text: str, url: str) -> str:
         """Render regex helper links with escaped URLs."""
-        return self._get_template("regex").render(text=text, url=self._escape_url(url))
+        return self._render("regex", text=text, url=self._escape_url(url))
 
     def handle_codeinline(
         self,
@@ -234,7 +355,8 @@ class LaTeXFormatter:
         normalized_engine = (engine or self.default_code_engine or "pygments").lower()
         if normalized_engine == "minted":
             delimiter = delimiter or "|"
-            return self._get_template("codeinline").render(
+            return self._render(
+                "codeinline",
                 language=language or "text",
                 text=text,
                 delimiter=delimiter,
@@ -252,10 +374,6 @@ class LaTeXFormatter:
         # listings/verbatim fallback to plain typewriter
         return self.handle_codeinlinett(text)
 
-    def _escape_latex(self, value: str) -> str:
-        """Escape helper that honours the formatter legacy accent setting."""
-        return escape_latex_chars(value, legacy_accents=self.legacy_latex_accents)
-
     def override_template(self, name: str, source: str | Path) -> None:
         """Override a built-in template snippet using an external payload."""
         if isinstance(source, Path):
@@ -265,11 +383,11 @@ class LaTeXFormatter:
             template_source = source
             template_name = name
 
-        template = self.env.from_string(template_source)
-        template.name = template_name
+        template = _compile_override(self._template_dir, template_name, template_source)
         normalised = self._normalise_key(name)
         self.templates[normalised] = template
         self._template_names[normalised] = template_name
+        self._format_partials.pop(normalised, None)
 
 
 __all__ = ["LaTeXFormatter", "TemplateNotFoundError", "optimize_list"]
@@ -11,12 +11,15 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from bs4.element import Tag
 
 from texsmith.core.config import BookConfig
 from texsmith.core.context import AssetRegistry, DocumentState
 from texsmith.core.diagnostics import DiagnosticEmitter, NullEmitter
 from texsmith.core.exceptions import LatexRenderingError
+from texsmith.core.profiling import timed_phase
 from texsmith.readers.html import HtmlReader
 from texsmith.writers.latex import LaTeXWriter, WriterState
 
@@ -35,6 +38,7 @@ class LaTeXRenderer:
         copy_assets: bool = True,
         convert_assets: bool = False,
         hash_assets: bool = False,
+        compact_text: bool = False,
     ) -> None:
         self.config = config or BookConfig()
         self.formatter = formatter or LaTeXFormatter()
@@ -42,6 +46,8 @@ class LaTeXRenderer:
         self.copy_assets = copy_assets
         self.convert_assets = convert_assets
         self.hash_assets = hash_assets
+        # Read prose as packed ``TextRun`` nodes; the output is unchanged.
+        self.compact_text = compact_text
 
         self.output_root = Path(output_root)
         self.assets_root = (self.output_root / "assets").resolve()
@@ -64,13 +70,35 @@ class LaTeXRenderer:
 
     def render(
         self,
-        html: str,
+        html: str | Tag,
         *,
         runtime: Mapping[str, Any] | None = None,
         state: DocumentState | None = None,
         emitter: DiagnosticEmitter | None = None,
     ) -> str:
-        """Render an HTML fragment into LaTeX via the IR."""
+        """Render an HTML fragment into LaTeX via the IR.
+
+        ``html`` may also be an already parsed tree, which is read in place
+        instead of being parsed again.
+        """
+        chunks: list[str] = []
+        self.render_to(html, chunks, runtime=runtime, state=state, emitter=emitter)
+        return "".join(chunks)
+
+    def render_to(
+        self,
+        html: str | Tag,
+        sink: TextIO | list[str],
+        *,
+        runtime: Mapping[str, Any] | None = None,
+        state: DocumentState | None = None,
+        emitter: DiagnosticEmitter | None = None,
+    ) -> None:
+        """Render an HTML fragment into LaTeX, streaming the output to ``sink``.
+
+        ``sink`` is a text stream or a list collecting the emitted chunks; see
+        :meth:`texsmith.writers.latex.LaTeXWriter.write_to`.
+        """
         active_emitter = emitter or NullEmitter()
         document_state = state or DocumentState()
 
@@ -87,18 +115,25 @@ class LaTeXRenderer:
 
         def _make_reader(parser: str) -> HtmlReader:
             return HtmlReader(
-                diagnostics=active_emitter, parser=parser, registry=self.reader_registry
+                diagnostics=active_emitter,
+                parser=parser,
+                registry=self.reader_registry,
+                compact_text=self.compact_text,
             )
 
-        try:
-            document = _make_reader(self.parser_backend).read(html)
-        except FeatureNotFound:
-            # Fall back to the always-available built-in parser, mirroring the
-            # legacy renderer's behaviour when the preferred backend is missing.
-            self.parser_backend = "html.parser"
-            document = _make_reader("html.parser").read(html)
-        except Exception as exc:  # pragma: no cover - defensive
-            raise LatexRenderingError("HTML reading failed") from exc
+        with timed_phase(active_emitter, "html_reader"):
+            try:
+                if isinstance(html, Tag):
+                    document = _make_reader(self.parser_backend).read_tree(html)
+                else:
+                    document = _make_reader(self.parser_backend).read(html)
+            except FeatureNotFound:
+                # Fall back to the always-available built-in parser, mirroring the
+                # legacy renderer's behaviour when the preferred backend is missing.
+                self.parser_backend = "html.parser"
+                document = _make_reader("html.parser").read(html)
+            except Exception as exc:  # pragma: no cover - defensive
+                raise LatexRenderingError("HTML reading failed") from exc
 
         writer_state = WriterState(
             state=document_state,
@@ -108,7 +143,8 @@ class LaTeXRenderer:
             runtime=merged_runtime,
         )
         try:
-            return self.writer_class(writer_state).write(document)
+            with timed_phase(active_emitter, "latex_writer"):
+                self.writer_class(writer_state).write_to(document, sink)
         except LatexRenderingError:
             raise
         except Exception as exc:  # pragma: no cover - defensive
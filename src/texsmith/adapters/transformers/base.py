@@ -10,6 +10,7 @@ import time
 from typing import Any, Protocol
 
 from texsmith.core.exceptions import TransformerExecutionError
+from texsmith.core.profiling import timed_phase
 
 
 class ConverterStrategy(Protocol):
@@ -64,9 +65,10 @@ class CachedConversionStrategy:
         last_error: Exception | None = None
         for attempt in range(1, self.max_attempts + 1):
             try:
-                return self._perform_conversion(
-                    source, target=target, cache_dir=cache_dir, **options
-                )
+                with timed_phase(options.get("emitter"), f"asset.{self.namespace}"):
+                    return self._perform_conversion(
+                        source, target=target, cache_dir=cache_dir, **options
+                    )
             except Exception as exc:  # pragma: no cover - defensive
                 last_error = exc
                 should_retry = attempt < self.max_attempts and not isinstance(
@@ -39,6 +39,7 @@ class DocumentState:
     citations: list[str] = field(default_factory=list)
     _citation_index: set[str] = field(default_factory=set, init=False, repr=False)
     footnotes: dict[str, str] = field(default_factory=dict)
+    unresolved_footnotes: list[str] = field(default_factory=list)
     index_entries: list[tuple[str, ...]] = field(default_factory=list)
     pygments_styles: dict[str, str] = field(default_factory=dict)
     script_usage: list[dict[str, Any]] = field(default_factory=list)
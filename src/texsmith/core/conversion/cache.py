@@ -0,0 +1,376 @@
+"""Content-addressed on-disk cache of converted document fragments.
+
+A cache entry stores everything the conversion of one document produced: the
+LaTeX fragment, its :class:`~texsmith.core.context.DocumentState`
+contribution, the diagnostics raised while rendering it and the bibliography
+it was rendered against. Entries are keyed by a digest of every input that can
+influence the output (document HTML and front matter, conversion settings,
+template files, bibliography files and the TeXSmith version), so a stale entry
+is never looked up rather than explicitly invalidated.
+
+A hit is only served when the files the original conversion left on disk
+(copied assets, the wrapped ``.tex`` output) are still present and the local
+source assets are unchanged. The cache is capped in size; the least recently
+used entries are evicted first.
+
+Entries are pickled. The cache directory must therefore only be writable by
+the user running TeXSmith, which is the case for the default location under
+the TeXSmith cache root.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import contextlib
+import dataclasses
+from enum import Enum
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Protocol
+
+from texsmith.core.user_dir import get_user_dir
+from texsmith.version import get_version
+
+from ..documents import Document
+from ..profiling import PHASE_EVENT
+from .models import ConversionRequest
+
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .parallel import DocumentOutcome
+
+
+CACHE_NAMESPACE = "fragments"
+CACHE_VERSION = 2
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Request fields that never influence how a single document renders: the
+# emitter is a live object, the next two describe the batch, not the document,
+# and the last two only change how the output is produced.
+_IGNORED_REQUEST_FIELDS = frozenset(
+    {"emitter", "documents", "slot_assignments", "escape_cache_size", "compact_text"}
+)
+_ENTRY_SUFFIX = ".pkl"
+_TEMP_SUFFIX = ".tmp"
+# Temporary entries older than this belong to a writer that died mid-store.
+_STALE_TEMP_SECONDS = 3600
+
+
+class FragmentStorage(Protocol):
+    """Byte store behind a :class:`FragmentCache`."""
+
+    def read(self, key: str) -> bytes | None:
+        """Return the payload stored under ``key``, ``None`` when absent."""
+        ...
+
+    def write(self, key: str, payload: bytes, *, source: Path | None) -> None:
+        """Store ``payload`` under ``key`` for the document read from ``source``."""
+        ...
+
+    def touch(self, key: str) -> None:
+        """Record that the entry under ``key`` was just used."""
+        ...
+
+    def invalidate(self, sources: Iterable[Path]) -> None:
+        """Drop the entries of the documents read from ``sources``."""
+        ...
+
+    def prune(self) -> None:
+        """Evict entries the storage no longer wants to hold."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class DiskStorage:
+    """Keep pickled entries as files under ``root``, capped at ``max_bytes``."""
+
+    def __init__(self, root: Path | None = None, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root or get_user_dir().cache_dir(CACHE_NAMESPACE, create=False)
+        self.max_bytes = max_bytes
+
+    def read(self, key: str) -> bytes | None:
+        try:
+            return self._entry_path(key).read_bytes()
+        except OSError:
+            return None
+
+    def write(self, key: str, payload: bytes, *, source: Path | None) -> None:
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            handle = tempfile.NamedTemporaryFile(  # noqa: SIM115 - renamed below
+                dir=self.root, suffix=_TEMP_SUFFIX, delete=False
+            )
+        except OSError:
+            return
+        staging = Path(handle.name)
+        try:
+            with handle:
+                handle.write(payload)
+            staging.replace(self._entry_path(key))
+        except OSError:
+            staging.unlink(missing_ok=True)
+
+    def touch(self, key: str) -> None:
+        with contextlib.suppress(OSError):
+            os.utime(self._entry_path(key))
+
+    def invalidate(self, sources: Iterable[Path]) -> None:
+        # Entries are content addressed: a changed document gets a new key.
+        return
+
+    def prune(self) -> None:
+        """Evict least recently used entries until the cache fits ``max_bytes``.
+
+        Temporary files left behind by an interrupted write are removed once
+        they are older than an hour.
+        """
+        try:
+            paths = list(self.root.iterdir())
+        except OSError:
+            return
+        entries: list[tuple[os.stat_result, Path]] = []
+        stale_before = time.time() - _STALE_TEMP_SECONDS
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.suffix == _ENTRY_SUFFIX:
+                entries.append((stat, path))
+            elif path.suffix == _TEMP_SUFFIX and stat.st_mtime < stale_before:
+                path.unlink(missing_ok=True)
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda item: item[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+
+    def clear(self) -> None:
+        try:
+            paths = list(self.root.iterdir())
+        except OSError:
+            return
+        for path in paths:
+            if path.suffix in (_ENTRY_SUFFIX, _TEMP_SUFFIX):
+                path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}{_ENTRY_SUFFIX}"
+
+
+class MemoryStorage:
+    """Keep the latest entry of each source document in memory.
+
+    A warm :class:`~.service.ConversionService` uses it when no on-disk cache
+    is configured, so a long-lived process such as ``render --watch`` only
+    reconverts the documents whose inputs changed. Each document keeps its most
+    recent entry only, and :meth:`invalidate` drops the entries of documents
+    that changed on disk.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, bytes] = {}
+        self._latest: dict[Path | None, str] = {}
+
+    def read(self, key: str) -> bytes | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def write(self, key: str, payload: bytes, *, source: Path | None) -> None:
+        source = source.resolve() if source is not None else None
+        with self._lock:
+            previous = self._latest.get(source)
+            if previous is not None:
+                self._entries.pop(previous, None)
+            self._latest[source] = key
+            self._entries[key] = payload
+
+    def touch(self, key: str) -> None:
+        return
+
+    def invalidate(self, sources: Iterable[Path]) -> None:
+        stale = {Path(source).resolve() for source in sources}
+        with self._lock:
+            for source in stale & self._latest.keys():
+                self._entries.pop(self._latest.pop(source), None)
+
+    def prune(self) -> None:
+        # Replacing each document's entry on write already bounds the memory.
+        return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._latest.clear()
+
+
+class FragmentCache:
+    """Persist per-document conversion outcomes keyed by their inputs.
+
+    Entries live in ``storage``, on disk under the TeXSmith cache root by
+    default.
+    """
+
+    def __init__(self, storage: FragmentStorage | None = None) -> None:
+        self.storage = storage if storage is not None else DiskStorage()
+
+    def key_for(
+        self,
+        document: Document,
+        request: ConversionRequest,
+        **inputs: Any,
+    ) -> str | None:
+        """Return the cache key of ``document`` rendered with ``request`` and ``inputs``.
+
+        Returns ``None`` when the inputs cannot be serialised deterministically,
+        in which case the document is simply not cached.
+        """
+        payload = {
+            "cache_version": CACHE_VERSION,
+            "texsmith": get_version(),
+            "document": {
+                definition.name: getattr(document, definition.name)
+                for definition in dataclasses.fields(document)
+            },
+            "request": {
+                definition.name: getattr(request, definition.name)
+                for definition in dataclasses.fields(request)
+                if definition.name not in _IGNORED_REQUEST_FIELDS
+            },
+            "inputs": inputs,
+        }
+        try:
+            encoded = json.dumps(payload, sort_keys=True, default=_encode)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> DocumentOutcome | None:
+        """Return the outcome stored under ``key`` if it is still usable."""
+        payload = self.storage.read(key)
+        if payload is None:
+            return None
+        try:
+            entry = pickle.loads(payload)
+        except Exception:
+            # A truncated or incompatible entry is a miss; it gets overwritten.
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+            return None
+        if entry.get("sources") != _source_fingerprints(entry.get("sources", {})):
+            return None
+        outcome = entry.get("outcome")
+        if outcome is None or outcome.result is None:
+            return None
+        result = outcome.result
+        outputs = [*result.assets_map.values()]
+        if result.tex_path is not None:
+            outputs.append(result.tex_path)
+        if not all(Path(output).exists() for output in outputs):
+            return None
+        self.storage.touch(key)
+        return outcome
+
+    def store(self, key: str, outcome: DocumentOutcome, *, source: Path | None = None) -> None:
+        """Persist ``outcome`` of the document read from ``source`` under ``key``.
+
+        Failures never break the conversion.
+        """
+        if outcome.result is None or outcome.error is not None:
+            return
+        entry = {
+            "version": CACHE_VERSION,
+            "sources": _source_fingerprints(outcome.result.assets_map),
+            # Phase timings describe the run that produced the entry, not later hits.
+            "outcome": dataclasses.replace(
+                outcome, diagnostics=outcome.diagnostics.without_event(PHASE_EVENT)
+            ),
+        }
+        try:
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self.storage.write(key, payload, source=source)
+
+    def invalidate(self, sources: Iterable[Path]) -> None:
+        """Drop the outcomes of the documents read from ``sources``."""
+        self.storage.invalidate(sources)
+
+    def prune(self) -> None:
+        """Let the storage evict the entries it no longer wants to hold."""
+        self.storage.prune()
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        self.storage.clear()
+
+
+def file_fingerprint(*paths: Path | str) -> list[tuple[str, int, int] | None]:
+    """Return cheap ``(path, size, mtime)`` fingerprints, ``None`` for missing files."""
+    fingerprints: list[tuple[str, int, int] | None] = []
+    for candidate in paths:
+        try:
+            stat = Path(candidate).stat()
+        except OSError:
+            fingerprints.append(None)
+            continue
+        fingerprints.append((str(candidate), stat.st_size, stat.st_mtime_ns))
+    return fingerprints
+
+
+def tree_fingerprint(root: Path) -> list[tuple[str, int, int] | None]:
+    """Fingerprint every file below ``root`` in a stable order."""
+    return file_fingerprint(*sorted(path for path in root.rglob("*") if path.is_file()))
+
+
+def _source_fingerprints(assets: Mapping[str, Any]) -> dict[str, tuple[str, int, int] | None]:
+    # Asset keys are the local source paths for files copied from disk; remote
+    # URLs and generated artefacts have no local source to track.
+    fingerprints: dict[str, tuple[str, int, int] | None] = {}
+    for key in assets:
+        if Path(key).is_absolute():
+            fingerprints[key] = file_fingerprint(key)[0]
+    return fingerprints
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (tuple, list)):
+        return list(value)
+    # A repr may embed an object address, giving a key that never hits again.
+    raise TypeError(f"Cannot derive a cache key from {type(value).__name__}.")
+
+
+__all__ = [
+    "CACHE_NAMESPACE",
+    "DEFAULT_MAX_BYTES",
+    "DiskStorage",
+    "FragmentCache",
+    "FragmentStorage",
+    "MemoryStorage",
+    "file_fingerprint",
+    "tree_fingerprint",
+]
@@ -6,8 +6,9 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 import copy
 import dataclasses
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from texsmith.adapters.latex.formatter import LaTeXFormatter
 from texsmith.adapters.latex.renderer import LaTeXRenderer
@@ -24,9 +25,14 @@ from texsmith.core.templates import (
     TemplateRuntime,
     wrap_template_document,
 )
+from texsmith.extensions.index.registry import get_registry
+from texsmith.fonts.fallback import merge_fallback_summaries
+from texsmith.fonts.scripts import merge_script_usage
 
 from ..diagnostics import DiagnosticEmitter, NullEmitter
+from ..profiling import timed_phase
 from ._utils import build_unique_stem_map
+from .cache import FragmentCache
 from .debug import (
     debug_enabled,
     ensure_emitter,
@@ -35,7 +41,7 @@ from .debug import (
     raise_conversion_error,
     record_event,
 )
-from .execution import resolve_conversion_context
+from .execution import report_bibliography_issues, resolve_conversion_context
 from .models import ConversionRequest
 from .renderer import TemplateFragment
 from .templates import (
@@ -45,6 +51,12 @@ from .templates import (
 )
 
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from bs4.element import Tag
+
+    from .parallel import DocumentOutcome
+
+
 @dataclass(slots=True)
 class ConversionResult:
     """Artifacts produced during a document conversion."""
@@ -198,9 +210,47 @@ def convert_document(
     emitter: DiagnosticEmitter | None = None,
     preloaded_bibliography: BibliographyCollection | None = None,
     seen_bibliography_issues: set[tuple[str, str | None, str | None]] | None = None,
+    sink: TextIO | None = None,
 ) -> ConversionResult:
-    """Orchestrate the full HTML-to-LaTeX conversion for a single document."""
+    """Orchestrate the full HTML-to-LaTeX conversion for a single document.
+
+    ``sink`` is a readable text stream that receives ``latex_output``. A
+    document no template wraps is streamed to it as it is rendered, then read
+    back once; a wrapped document is written to it once wrapped.
+    """
     emitter = ensure_emitter(emitter or request.emitter)
+    with timed_phase(emitter, "document", document=document.source_path.name):
+        return _convert_document(
+            document,
+            output_dir,
+            request,
+            slot_overrides=slot_overrides,
+            template_overrides=template_overrides,
+            state=state,
+            template_runtime=template_runtime,
+            wrap_document=wrap_document,
+            emitter=emitter,
+            preloaded_bibliography=preloaded_bibliography,
+            seen_bibliography_issues=seen_bibliography_issues,
+            sink=sink,
+        )
+
+
+def _convert_document(
+    document: Document,
+    output_dir: Path,
+    request: ConversionRequest,
+    *,
+    slot_overrides: Mapping[str, str] | None,
+    template_overrides: Mapping[str, Any] | None,
+    state: DocumentState | None,
+    template_runtime: TemplateRuntime | None,
+    wrap_document: bool,
+    emitter: DiagnosticEmitter,
+    preloaded_bibliography: BibliographyCollection | None,
+    seen_bibliography_issues: set[tuple[str, str | None, str | None]] | None,
+    sink: TextIO | None,
+) -> ConversionResult:
     output_dir = output_dir.resolve()
 
     context = resolve_conversion_context(
@@ -238,6 +288,7 @@ def convert_document(
         emitter=emitter,
         initial_state=state,
         wrap_document=wrap_document,
+        sink=sink,
     )
 
 
@@ -247,6 +298,7 @@ def _render_document(
     emitter: DiagnosticEmitter,
     initial_state: DocumentState | None,
     wrap_document: bool,
+    sink: TextIO | None,
 ) -> ConversionResult:
     # Everything the per-document render needs is carried on the context: the
     # document, the resolved request, and the generation strategy. Derive the
@@ -262,6 +314,7 @@ def _render_document(
         "convert_assets": strategy.convert_assets,
         "hash_assets": strategy.hash_assets,
         "parser": request.parser or "html.parser",
+        "compact_text": request.compact_text,
     }
 
     if request.persist_debug_html:
@@ -286,8 +339,10 @@ def _render_document(
     active_slot_requests = context.slot_requests
 
     parser_backend = str(renderer_kwargs.get("parser", "html.parser"))
+    html_tree = context.html_tree
+    context.html_tree = None
     slot_fragments, missing_slots = extract_slot_fragments(
-        document.html,
+        html_tree if html_tree is not None else document.html,
         active_slot_requests,
         binding.default_slot,
         slot_definitions=binding.slots,
@@ -312,6 +367,8 @@ def _render_document(
         else:
             fragment_offsets[fragment.name] = 1 - min(levels)
 
+    # Only unwrapped output can be streamed: the template needs the slots whole.
+    wrapped = binding.instance is not None and wrap_document
     try:
         render_result = _render_slot_fragments(
             slot_fragments=slot_fragments,
@@ -326,6 +383,7 @@ def _render_document(
             context=context,
             legacy_latex_accents=legacy_latex_accents,
             emitter=emitter,
+            sink=None if wrapped else sink,
         )
     except TemplateError as exc:
         if debug_enabled(emitter):
@@ -363,28 +421,29 @@ def _render_document(
             document_state.requires_shell_escape or binding.requires_shell_escape
         )
     template_instance = binding.instance
-    if template_instance is not None and wrap_document:
+    if template_instance is not None and wrapped:
         try:
-            wrap_result = wrap_template_document(
-                template=template_instance,
-                default_slot=binding.default_slot,
-                slot_outputs=slot_outputs,
-                document_state=document_state,
-                template_overrides=(
-                    context.template_overrides if context.template_overrides else None
-                ),
-                output_dir=context.output_dir,
-                copy_assets=strategy.copy_assets,
-                output_name=f"{document.source_path.stem}.tex",
-                bibliography_path=bibliography_output,
-                emitter=emitter,
-                fragments=list(
-                    context.template_overrides.get(
-                        "fragments", binding.runtime.extras.get("fragments", [])
-                    )
-                ),
-                template_runtime=binding.runtime,
-            )
+            with timed_phase(emitter, "template.wrap"):
+                wrap_result = wrap_template_document(
+                    template=template_instance,
+                    default_slot=binding.default_slot,
+                    slot_outputs=slot_outputs,
+                    document_state=document_state,
+                    template_overrides=(
+                        context.template_overrides if context.template_overrides else None
+                    ),
+                    output_dir=context.output_dir,
+                    copy_assets=strategy.copy_assets,
+                    output_name=f"{document.source_path.stem}.tex",
+                    bibliography_path=bibliography_output,
+                    emitter=emitter,
+                    fragments=list(
+                        context.template_overrides.get(
+                            "fragments", binding.runtime.extras.get("fragments", [])
+                        )
+                    ),
+                    template_runtime=binding.runtime,
+                )
             latex_output = wrap_result.latex_output
             tex_path = wrap_result.output_path
         except TemplateError as exc:
@@ -399,6 +458,8 @@ def _render_document(
                 f"Failed to write LaTeX output to '{context.output_dir}': {exc}",
                 exc,
             )
+        if sink is not None:
+            sink.write(latex_output)
 
     asset_map: dict[str, Path] = {}
     if renderer is not None:
@@ -454,6 +515,8 @@ def _build_runtime_common(
     }
     if isinstance(http_user_agent, str) and http_user_agent.strip():
         runtime_common["http_user_agent"] = http_user_agent.strip()
+    if context.request.escape_cache_size is not None:
+        runtime_common["escape_cache_size"] = context.request.escape_cache_size
     template_callouts = context.template_overrides.get("callouts")
     runtime_common["callouts_definitions"] = normalise_callouts(
         merge_callouts(
@@ -521,8 +584,14 @@ def _render_slot_fragments(
     context: ConversionContext,
     legacy_latex_accents: bool,
     emitter: DiagnosticEmitter,
+    sink: TextIO | None,
 ) -> dict[str, Any]:
-    """Render slot fragments for the document into LaTeX slot outputs."""
+    """Render slot fragments for the document into LaTeX slot outputs.
+
+    Each slot collects the chunks of its fragments and is joined once. When
+    ``sink`` is given the default slot is streamed to it instead, and read
+    back from it afterwards.
+    """
     formatter = LaTeXFormatter()
     formatter.legacy_latex_accents = legacy_latex_accents
     code_opts = runtime_common.get("code") or {}
@@ -577,7 +646,8 @@ def _render_slot_fragments(
             _apply_template_render_extensions(renderer, binding)
         return renderer
 
-    slot_outputs: dict[str, str] = {}
+    slot_chunks: dict[str, list[str]] = {}
+    sink_start = sink.tell() if sink is not None else 0
     document_state: DocumentState | None = initial_state
     for fragment in slot_fragments:
         runtime_fragment = dict(runtime_common)
@@ -590,23 +660,27 @@ def _render_slot_fragments(
         if drop_title_flag and fragment.name == binding.default_slot:
             runtime_fragment["drop_title"] = True
             drop_title_flag = False
-        fragment_output = ""
+        chunks = slot_chunks.setdefault(fragment.name, [])
         try:
-            fragment_output, document_state = render_with_fallback(
+            _output, document_state = render_with_fallback(
                 renderer_factory,
-                fragment.html,
+                fragment.root,
                 runtime_fragment,
                 context.bibliography_map,
                 state=document_state,
                 emitter=emitter,
+                sink=sink if sink is not None and fragment.name == binding.default_slot else chunks,
             )
         except LatexRenderingError as exc:
             if debug_enabled(emitter):
                 raise
             message = format_user_friendly_render_error(exc)
             raise_conversion_error(emitter, message, exc)
-        existing_fragment = slot_outputs.get(fragment.name, "")
-        slot_outputs[fragment.name] = f"{existing_fragment}{fragment_output}"
+
+    slot_outputs = {name: "".join(chunks) for name, chunks in slot_chunks.items()}
+    if sink is not None:
+        sink.seek(sink_start)
+        slot_outputs[binding.default_slot] = sink.read()
 
     if document_state is None:
         document_state = DocumentState(bibliography=dict(context.bibliography_map))
@@ -628,16 +702,102 @@ def copy_document_state(target: DocumentState, source: DocumentState) -> None:
         )
 
 
+def merge_document_state(target: DocumentState, source: DocumentState) -> None:
+    """Fold the contributions of a separately converted document into ``target``.
+
+    ``source`` is expected to have been populated from an empty state, as
+    happens when documents are converted in parallel. Merging the per-document
+    states in input order yields the same aggregate as threading one state
+    through a serial conversion: first definitions win for acronyms, ordered
+    collections are concatenated, and flags are combined.
+    """
+    for citation in source.citations:
+        target.record_citation(citation)
+
+    for term, description in source.abbreviations.items():
+        if term in target.abbreviations:
+            target.remember_abbreviation(term, description)
+            continue
+        key = source.acronym_keys.get(term, "")
+        if key and key not in target.acronyms:
+            target.abbreviations[term] = description
+            target.acronym_keys[term] = key
+            target.acronyms[key] = source.acronyms.get(key, (term, description))
+        else:
+            target.remember_abbreviation(term, description)
+    for key, group in source.acronym_entry_groups.items():
+        target.acronym_entry_groups.setdefault(key, group)
+    for group in source.acronym_groups:
+        if group not in target.acronym_groups:
+            target.acronym_groups.append(group)
+
+    target.glossary.update(source.glossary)
+    target.snippets.update(source.snippets)
+    target.footnotes.update(source.footnotes)
+    target.unresolved_footnotes.extend(source.unresolved_footnotes)
+    target.bibliography.update(source.bibliography)
+    target.pygments_styles.update(source.pygments_styles)
+    for name, value in source.counters.items():
+        target.counters[name] = max(target.counters.get(name, 0), value)
+
+    target.headings.extend(source.headings)
+    target.index_entries.extend(source.index_entries)
+    target.has_index_entries = target.has_index_entries or source.has_index_entries
+    target.requires_shell_escape = target.requires_shell_escape or source.requires_shell_escape
+    target.callouts_used = target.callouts_used or source.callouts_used
+
+    if source.script_usage:
+        target.script_usage = merge_script_usage(target.script_usage, source.script_usage)
+    if source.fallback_summary:
+        target.fallback_summary = merge_fallback_summaries(
+            target.fallback_summary, source.fallback_summary
+        )
+
+
+def depends_on_shared_state(target: DocumentState, source: DocumentState) -> bool:
+    """Return whether ``source`` would have rendered differently on top of ``target``.
+
+    ``source`` is the state of a document converted from an empty state, and
+    ``target`` the state a serial conversion would have rendered it with. The
+    output differs when the document references a footnote only ``target``
+    defines, redefines an acronym ``target`` already knows, or was given an
+    acronym key that ``target`` already uses for another term. Such documents
+    must be converted again on top of ``target``; the others can be merged
+    with :func:`merge_document_state`.
+    """
+    if any(footnote in target.footnotes for footnote in source.unresolved_footnotes):
+        return True
+    keys = set(target.acronyms)
+    for term, description in source.abbreviations.items():
+        key = source.acronym_keys.get(term)
+        known = target.abbreviations.get(term)
+        if known is not None:
+            if known != description or target.acronym_keys.get(term) != key:
+                return True
+            continue
+        # Keys are generated as the first free ``slug``, ``slug2``… so the key
+        # chosen in isolation stands unless ``target`` already took it.
+        if key in keys:
+            return True
+        keys.add(key)
+    return False
+
+
 def render_with_fallback(
     renderer_factory: Callable[[], LaTeXRenderer],
-    html: str,
+    html: str | Tag,
     runtime: dict[str, object],
     bibliography: Mapping[str, dict[str, Any]] | None = None,
     *,
     state: DocumentState | None = None,
     emitter: DiagnosticEmitter | None = None,
+    sink: TextIO | list[str] | None = None,
 ) -> tuple[str, DocumentState]:
-    """Render HTML to LaTeX."""
+    """Render HTML, given as a string or an already parsed tree, to LaTeX.
+
+    When ``sink`` is given the LaTeX is streamed to it (see
+    :meth:`LaTeXRenderer.render_to`) and the returned output is empty.
+    """
     emitter = ensure_emitter(emitter)
     bibliography_payload = dict(bibliography or {})
     base_state = state
@@ -649,12 +809,15 @@ def render_with_fallback(
     )
 
     renderer = renderer_factory()
-    output = renderer.render(
+    chunks: list[str] = []
+    renderer.render_to(
         html,
+        chunks if sink is None else sink,
         runtime=runtime,
         state=current_state,
         emitter=emitter,
     )
+    output = "".join(chunks)
 
     if base_state is not None:
         copy_document_state(base_state, current_state)
@@ -704,8 +867,24 @@ def convert_documents(
     wrap_document: bool = True,
     shared_state: DocumentState | None = None,
     write_fragments: bool | None = None,
+    max_workers: int | None = None,
+    cache: FragmentCache | None = None,
+    bibliography: BibliographyCollection | None = None,
 ) -> ConversionBundle:
-    """Convert one or more documents into LaTeX fragments while coordinating shared state."""
+    """Convert one or more documents into LaTeX fragments while coordinating shared state.
+
+    ``max_workers`` enables parallel conversion: ``None`` or ``1`` converts the
+    documents one after the other, ``0`` uses one worker process per CPU and
+    any other value caps the size of the process pool. Parallel runs produce
+    the same fragments, in the same order, as serial ones; see
+    :mod:`.parallel` for the details of how shared state is reconciled.
+
+    ``cache`` reuses the fragments of documents whose inputs did not change
+    since they were last converted, and records the others.
+
+    ``bibliography`` is a collection already loaded from ``bibliography_files``;
+    it is reused instead of parsing the files again.
+    """
     if not documents:
         raise ValueError("At least one document is required for conversion.")
 
@@ -717,36 +896,101 @@ def convert_documents(
     shared_bibliography: BibliographyCollection | None = None
     seen_bibliography_issues: set[tuple[str, str | None, str | None]] = set()
 
-    if bibliography_files:
+    if bibliography is not None:
+        shared_bibliography = bibliography
+    elif request.bibliography_files:
         shared_bibliography = BibliographyCollection()
-        shared_bibliography.load_files(bibliography_files)
+        shared_bibliography.load_files(request.bibliography_files)
 
-    fragments: list[LaTeXFragment] = []
     should_write_fragments = write_fragments if write_fragments is not None else True
-    state = shared_state
     active_emitter = emitter or NullEmitter()
-
-    for document in documents:
-        document = document.prepare_for_conversion()
-        target_dir = Path(output_dir) if output_dir is not None else Path("build")
-        slot_overrides = dict(document.slot_selectors)
-        result = convert_document(
-            document=document,
+    target_dir = Path(output_dir) if output_dir is not None else Path("build")
+    prepared = [document.prepare_for_conversion() for document in documents]
+
+    from .parallel import convert_isolated, resolve_worker_count, template_identifier
+
+    workers = resolve_worker_count(max_workers, len(prepared))
+    identifier = template_identifier(template, template_runtime)
+    if template_runtime is not None and identifier is None:
+        # A runtime that was not loaded from disk can neither be rebuilt in a
+        # worker process nor fingerprinted for the cache.
+        workers = 1
+        cache = None
+
+    results: list[ConversionResult] = []
+    written: dict[Path, Path] = {}
+    if workers > 1 or cache is not None:
+        if shared_bibliography is not None:
+            report_bibliography_issues(
+                shared_bibliography, active_emitter, seen_bibliography_issues
+            )
+        isolated_state: DocumentState | None = None
+        cited = False
+        if not wrap_document:
+            isolated_state = shared_state if shared_state is not None else DocumentState()
+            cited = bool(isolated_state.citations)
+        outcomes = convert_isolated(
+            prepared,
             output_dir=target_dir,
             request=request,
-            slot_overrides=slot_overrides or None,
             emitter=active_emitter,
-            template_overrides=template_overrides,
-            state=None if wrap_document else state,
+            template=identifier,
             template_runtime=template_runtime,
+            template_overrides=template_overrides,
             wrap_document=wrap_document,
-            preloaded_bibliography=shared_bibliography,
+            shared_bibliography=shared_bibliography,
             seen_bibliography_issues=seen_bibliography_issues,
+            max_workers=workers,
+            cache=cache,
+            state=isolated_state,
         )
+        results = [outcome.result for outcome in outcomes if outcome.result is not None]
+        # Index entries recorded in isolation never reached this process's registry.
+        registry = get_registry()
+        for result in results:
+            if result.document_state is not None:
+                for entry in result.document_state.index_entries:
+                    registry.add(entry)
+        if isolated_state is not None:
+            _share_isolated_state(
+                outcomes,
+                isolated_state,
+                cited=cited,
+                output_dir=target_dir,
+                emitter=active_emitter,
+            )
+    else:
+        state = shared_state
+        for document in prepared:
+            convert = partial(
+                convert_document,
+                document=document,
+                output_dir=target_dir,
+                request=request,
+                slot_overrides=dict(document.slot_selectors) or None,
+                emitter=active_emitter,
+                template_overrides=template_overrides,
+                state=None if wrap_document else state,
+                template_runtime=template_runtime,
+                wrap_document=wrap_document,
+                preloaded_bibliography=shared_bibliography,
+                seen_bibliography_issues=seen_bibliography_issues,
+            )
+            if output_dir is not None and should_write_fragments:
+                # The writer streams the fragment straight into its file.
+                target = target_dir / f"{unique_stems[document.source_path]}.tex"
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with target.open("w+", encoding="utf-8") as sink:
+                    result = convert(sink=sink)
+                written[document.source_path] = target
+            else:
+                result = convert()
+            if not wrap_document:
+                state = result.document_state or state
+            results.append(result)
 
-        if not wrap_document:
-            state = result.document_state or state
-
+    fragments: list[LaTeXFragment] = []
+    for document, result in zip(prepared, results, strict=True):
         stem = unique_stems[document.source_path]
         fragment = LaTeXFragment(
             document=document,
@@ -754,7 +998,9 @@ def convert_documents(
             stem=stem,
             conversion=result,
         )
-        if output_dir is not None and should_write_fragments:
+        if document.source_path in written:
+            fragment.output_path = written[document.source_path]
+        elif output_dir is not None and should_write_fragments:
             target = target_dir / f"{stem}.tex"
             fragment.write_to(target)
         fragments.append(fragment)
@@ -762,6 +1008,42 @@ def convert_documents(
     return ConversionBundle(fragments=fragments)
 
 
+def _share_isolated_state(
+    outcomes: Sequence[DocumentOutcome],
+    state: DocumentState,
+    *,
+    cited: bool,
+    output_dir: Path,
+    emitter: DiagnosticEmitter,
+) -> None:
+    """Point every isolated result at the merged ``state`` and write its bibliography.
+
+    Serial conversion rewrites the shared bibliography file after every
+    document, each time with the citations accumulated so far; only the last
+    write survives, and it is reproduced here once the states are merged.
+    ``cited`` tells whether ``state`` held citations before the conversion.
+    """
+    bibliography: BibliographyCollection | None = None
+    bibliography_output = output_dir / "texsmith-bibliography.bib"
+    for outcome in outcomes:
+        result = outcome.result
+        contribution = result.document_state
+        cited = cited or bool(contribution is not None and contribution.citations)
+        result.document_state = state
+        if cited and outcome.bibliography is not None and outcome.bibliography.to_dict():
+            bibliography = outcome.bibliography
+            result.bibliography_path = bibliography_output
+            result.has_bibliography = True
+    if bibliography is None:
+        return
+    try:
+        bibliography.write_bibtex(bibliography_output, keys=list(state.citations))
+    except OSError as exc:
+        if debug_enabled(emitter):
+            raise
+        emitter.warning(f"Failed to write bibliography file: {exc}")
+
+
 def to_template_fragments(bundle: ConversionBundle) -> list[TemplateFragment]:
     """Convert bundle fragments into the template fragment contract used by the template engine."""
     fragments: list[TemplateFragment] = []
@@ -803,6 +1085,8 @@ __all__ = [
     "convert_document",
     "convert_documents",
     "copy_document_state",
+    "depends_on_shared_state",
+    "merge_document_state",
     "render_with_fallback",
     "to_template_fragments",
 ]
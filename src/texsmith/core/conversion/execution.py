@@ -15,14 +15,16 @@ from texsmith.core.templates.runtime import (
     build_template_overrides,
     resolve_template_language,
 )
+from texsmith.readers.html.backends import parse_html
 
+from ..diagnostics import DiagnosticEmitter
 from .debug import ensure_emitter, raise_conversion_error
 from .inputs import InlineBibliographyValidationError, extract_front_matter_bibliography
 from .models import ConversionRequest
 from .templates import (
     _build_mustache_defaults,
     _merge_template_overrides,
-    _replace_mustaches_in_html,
+    _replace_mustaches_in_tree,
 )
 
 
@@ -120,14 +122,16 @@ def resolve_conversion_context(
         )
     )
     merged_contexts = (overrides, document.front_matter)
-    document.set_html(
-        _replace_mustaches_in_html(
-            document.html,
-            merged_contexts,
-            emitter=emitter,
-            source=str(document.source_path),
-        )
-    )
+    # The HTML is parsed once here; slot extraction and the reader work on
+    # this tree rather than re-parsing serialised fragments.
+    html_tree = parse_html(document.html, request.parser or "html.parser")
+    if "{{" in document.html and _replace_mustaches_in_tree(
+        html_tree,
+        merged_contexts,
+        emitter=emitter,
+        source=str(document.source_path),
+    ):
+        document.set_html(str(html_tree))
 
     bibliography_paths = list(bibliography_files or request.bibliography_files)
     issue_signatures = seen_bibliography_issues if seen_bibliography_issues is not None else set()
@@ -161,14 +165,7 @@ def resolve_conversion_context(
         )
 
     bibliography_map = bibliography_collection.to_dict()
-    for issue in bibliography_collection.issues:
-        signature = (issue.message, issue.key, str(issue.source) if issue.source else None)
-        if signature in issue_signatures:
-            continue
-        prefix = f"[{issue.key}] " if issue.key else ""
-        source_hint = f" ({issue.source})" if issue.source else ""
-        emitter.warning(f"{prefix}{issue.message}{source_hint}")
-        issue_signatures.add(signature)
+    report_bibliography_issues(bibliography_collection, emitter, issue_signatures)
 
     document.bibliography = bibliography_map
 
@@ -198,9 +195,26 @@ def resolve_conversion_context(
         slot_requests=slot_requests,
         bibliography_collection=bibliography_collection,
         bibliography_map=bibliography_map,
+        html_tree=html_tree,
     )
 
 
+def report_bibliography_issues(
+    collection: BibliographyCollection,
+    emitter: DiagnosticEmitter,
+    seen: set[tuple[str, str | None, str | None]],
+) -> None:
+    """Warn about bibliography issues not already reported, recording them in ``seen``."""
+    for issue in collection.issues:
+        signature = (issue.message, issue.key, str(issue.source) if issue.source else None)
+        if signature in seen:
+            continue
+        prefix = f"[{issue.key}] " if issue.key else ""
+        source_hint = f" ({issue.source})" if issue.source else ""
+        emitter.warning(f"{prefix}{issue.message}{source_hint}")
+        seen.add(signature)
+
+
 def _replace_mustaches_in_structure(
     payload: Mapping[str, Any],
     contexts: tuple[Mapping[str, Any], Mapping[str, Any], Mapping[str, Any]],
@@ -9,7 +9,7 @@ from enum import Enum
 import re
 from typing import Any
 
-from bs4 import BeautifulSoup, FeatureNotFound
+from texsmith.readers.html.backends import select_inner_html
 
 
 DOCUMENT_SELECTOR_SENTINEL = "@document"
@@ -443,16 +443,15 @@ def _validate_day(key: str, value: str) -> None:
 
 
 def extract_content(html: str, selector: str) -> str:
-    """Extract and return the inner HTML for the first element matching selector."""
-    try:
-        soup = BeautifulSoup(html, "lxml")
-    except FeatureNotFound:
-        soup = BeautifulSoup(html, "html.parser")
-
-    element = soup.select_one(selector)
-    if element is None:
+    """Extract and return the inner HTML for the first element matching selector.
+
+    With ``lxml`` installed, simple selectors are resolved on an ``lxml.html``
+    tree and no BeautifulSoup tree is built for the page.
+    """
+    content = select_inner_html(html, selector)
+    if content is None:
         raise ValueError(f"Unable to locate content using selector '{selector}'.")
-    return element.decode_contents()
+    return content
 
 
 __all__ = [
@@ -56,6 +56,8 @@ class ConversionRequest:
     language: str | None = None
     http_user_agent: str | None = None
     legacy_latex_accents: bool = False
+    escape_cache_size: int | None = None
+    compact_text: bool = False
     diagrams_backend: str | None = None
 
     emitter: DiagnosticEmitter | None = None
@@ -0,0 +1,387 @@
+"""Isolated per-document conversion: process pools and the fragment cache.
+
+:func:`.core.convert_documents` delegates here when ``max_workers`` asks for
+more than one worker or when a :class:`~.cache.FragmentCache` is supplied.
+Each document is then read, lowered and written starting from an empty
+:class:`~texsmith.core.context.DocumentState`, which makes its outcome a pure
+function of its inputs: it can run in a worker process, or be served from the
+cache without rendering at all. The outcomes are returned in input order and
+the caller folds their state into the shared one with
+:func:`.core.merge_document_state`.
+
+Worker processes load the template runtime and the shared bibliography files
+once and reuse them for every document they convert. Diagnostics raised while
+converting a document (emitter calls as well as Python warnings) are buffered
+and replayed through the caller's emitter, document by document and in input
+order, so an isolated run reports exactly what a serial one would; cached
+outcomes replay the diagnostics recorded when they were first rendered.
+
+Documents converted in isolation cannot see each other's state while they are
+rendered. When the documents share one state (fragments of a template build),
+each outcome is checked in input order against the state merged so far with
+:func:`.core.depends_on_shared_state`: a document referencing a footnote an
+earlier document defines, or whose acronym keys would have been assigned
+differently, is converted again in this process on top of that state, exactly
+as a serial run would have converted it. The output is therefore identical to
+a serial run's, and only the documents whose output does not depend on their
+predecessors are taken from the pool or the cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from functools import cache, partial
+import os
+from pathlib import Path
+import pickle
+from typing import Any
+import warnings
+
+from texsmith.core.bibliography.collection import BibliographyCollection
+from texsmith.core.context import DocumentState
+from texsmith.core.documents import Document
+from texsmith.core.templates import TemplateRuntime
+from texsmith.core.templates.runtime import load_template_runtime
+
+from ..diagnostics import DiagnosticEmitter, capture_warnings
+from ..profiling import profile_enabled
+from .cache import FragmentCache, file_fingerprint, tree_fingerprint
+from .core import (
+    ConversionResult,
+    convert_document,
+    depends_on_shared_state,
+    merge_document_state,
+)
+from .debug import ConversionError
+from .models import ConversionRequest
+
+
+BibliographyIssue = tuple[str, str | None, str | None]
+
+
+def resolve_worker_count(max_workers: int | None, job_count: int) -> int:
+    """Return how many worker processes should convert ``job_count`` documents.
+
+    ``None`` and ``1`` select serial conversion, ``0`` requests one worker per
+    CPU. The pool never grows beyond the number of documents.
+    """
+    if max_workers is not None and max_workers < 0:
+        raise ValueError("max_workers must be a non-negative integer.")
+    if max_workers is None or job_count < 2:
+        return 1
+    workers = max_workers or os.cpu_count() or 1
+    return max(1, min(workers, job_count))
+
+
+def template_identifier(
+    template: str | None, template_runtime: TemplateRuntime | None
+) -> str | None:
+    """Return an identifier worker processes can reload the template from.
+
+    Returns ``None`` when no template is involved, or when ``template_runtime``
+    was not loaded from disk and thus cannot be rebuilt in another process.
+    """
+    if template_runtime is None:
+        return template
+    root = getattr(template_runtime.instance, "root", None)
+    return str(root) if root is not None else None
+
+
+class RecordingEmitter:
+    """Diagnostic emitter buffering calls so they can be replayed elsewhere."""
+
+    def __init__(self, *, debug_enabled: bool = False, profile_enabled: bool = False) -> None:
+        self.debug_enabled = debug_enabled
+        self.profile_enabled = profile_enabled
+        self.records: list[tuple[str, tuple[Any, ...]]] = []
+
+    def warning(self, message: str, exc: BaseException | None = None) -> None:
+        self.records.append(("warning", (message, _portable_exception(exc))))
+
+    def error(self, message: str, exc: BaseException | None = None) -> None:
+        self.records.append(("error", (message, _portable_exception(exc))))
+
+    def event(self, name: str, payload: Mapping[str, Any]) -> None:
+        self.records.append(("event", (name, {k: _portable(v) for k, v in payload.items()})))
+
+    def replay(self, emitter: DiagnosticEmitter) -> None:
+        """Forward the buffered diagnostics to ``emitter`` in their original order."""
+        for method, arguments in self.records:
+            getattr(emitter, method)(*arguments)
+
+    def without_event(self, name: str) -> RecordingEmitter:
+        """Return a copy of this recording leaving out the ``name`` events."""
+        copy = RecordingEmitter(
+            debug_enabled=self.debug_enabled, profile_enabled=self.profile_enabled
+        )
+        copy.records = [
+            record for record in self.records if record[0] != "event" or record[1][0] != name
+        ]
+        return copy
+
+
+@dataclass(slots=True)
+class DocumentOutcome:
+    """Everything converting one document in isolation produced."""
+
+    result: ConversionResult | None
+    diagnostics: RecordingEmitter
+    bibliography: BibliographyCollection | None = None
+    warnings: list[tuple[str, type[Warning], str, int]] = field(default_factory=list)
+    error: BaseException | None = None
+
+    def replay(self, emitter: DiagnosticEmitter) -> None:
+        """Re-emit the recorded diagnostics and warnings, then raise the recorded error."""
+        self.diagnostics.replay(emitter)
+        for message, category, filename, lineno in self.warnings:
+            warnings.warn_explicit(message, category, filename, lineno)
+        if self.error is not None:
+            raise self.error
+
+
+@dataclass(slots=True)
+class _DocumentJob:
+    document: Document
+    output_dir: Path
+    request: ConversionRequest
+    template: str | None
+    template_overrides: Mapping[str, Any] | None
+    wrap_document: bool
+    seen_bibliography_issues: set[BibliographyIssue]
+    debug_enabled: bool
+    profile_enabled: bool = False
+
+
+def convert_isolated(
+    documents: Sequence[Document],
+    *,
+    output_dir: Path,
+    request: ConversionRequest,
+    emitter: DiagnosticEmitter,
+    template: str | None,
+    template_runtime: TemplateRuntime | None,
+    template_overrides: Mapping[str, Any] | None,
+    wrap_document: bool,
+    shared_bibliography: BibliographyCollection | None,
+    seen_bibliography_issues: set[BibliographyIssue],
+    max_workers: int,
+    cache: FragmentCache | None = None,
+    state: DocumentState | None = None,
+) -> list[DocumentOutcome]:
+    """Convert each document from an empty state, returning outcomes in input order.
+
+    Cached outcomes are reused when ``cache`` holds them; the remaining
+    documents are converted in a pool of ``max_workers`` processes, or in this
+    process when a single worker is requested. ``request.emitter`` is ignored:
+    diagnostics are replayed into ``emitter``, and the first failing document
+    re-raises its exception once its diagnostics have been replayed.
+
+    With a shared ``state``, every outcome is folded into it in input order,
+    and documents whose output depends on it are converted again on top of it
+    (their result then carries ``state`` itself).
+    """
+    worker_request = request.copy()
+    worker_request.emitter = None
+    debug = bool(getattr(emitter, "debug_enabled", False))
+    profile = profile_enabled(emitter)
+    jobs = [
+        _DocumentJob(
+            document=document,
+            output_dir=output_dir,
+            request=worker_request,
+            template=template,
+            template_overrides=template_overrides,
+            wrap_document=wrap_document,
+            seen_bibliography_issues=set(seen_bibliography_issues),
+            debug_enabled=debug,
+            profile_enabled=profile,
+        )
+        for document in documents
+    ]
+
+    runtime = template_runtime
+    if runtime is None and template is not None:
+        runtime = load_template_runtime(template)
+
+    keys: list[str | None] = [None] * len(jobs)
+    hits: list[DocumentOutcome | None] = [None] * len(jobs)
+    if cache is not None:
+        shared_inputs = {
+            "output_dir": output_dir,
+            "template": _template_fingerprint(runtime),
+            "template_overrides": template_overrides,
+            "wrap_document": wrap_document,
+            "bibliography": file_fingerprint(*request.bibliography_files),
+        }
+        for index, job in enumerate(jobs):
+            keys[index] = cache.key_for(job.document, worker_request, **shared_inputs)
+            if keys[index] is not None:
+                hits[index] = cache.load(keys[index])
+
+    pending = [job for job, hit in zip(jobs, hits, strict=True) if hit is None]
+    outcomes: list[DocumentOutcome] = []
+    with ExitStack() as stack:
+        converted: Iterator[DocumentOutcome]
+        if max_workers > 1 and len(pending) > 1:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(max_workers, len(pending)))
+            )
+            stack.callback(executor.shutdown, cancel_futures=True)
+            converted = executor.map(_convert_job, pending)
+        else:
+            convert = partial(_convert_job, runtime=runtime, bibliography=shared_bibliography)
+            converted = map(convert, pending)
+
+        for job, key, hit in zip(jobs, keys, hits, strict=True):
+            outcome = hit if hit is not None else next(converted)
+            if hit is not None:
+                _restore_outputs(outcome)
+            elif cache is not None and key is not None:
+                cache.store(key, outcome, source=job.document.source_path)
+            if state is not None and outcome.result is not None:
+                contribution = outcome.result.document_state or DocumentState()
+                if depends_on_shared_state(state, contribution):
+                    outcome = _convert_job(
+                        job, runtime=runtime, bibliography=shared_bibliography, state=state
+                    )
+                else:
+                    merge_document_state(state, contribution)
+            outcome.replay(emitter)
+            outcomes.append(outcome)
+
+    if cache is not None:
+        cache.prune()
+    return outcomes
+
+
+def _convert_job(
+    job: _DocumentJob,
+    *,
+    runtime: TemplateRuntime | None = None,
+    bibliography: BibliographyCollection | None = None,
+    state: DocumentState | None = None,
+) -> DocumentOutcome:
+    recorder = RecordingEmitter(
+        debug_enabled=job.debug_enabled, profile_enabled=job.profile_enabled
+    )
+    request = job.request.copy()
+    request.emitter = recorder
+    outcome = DocumentOutcome(result=None, diagnostics=recorder)
+    if runtime is None and job.template is not None:
+        runtime = _load_runtime(job.template)
+    if bibliography is None:
+        bibliography = _load_bibliography(tuple(request.bibliography_files))
+    with capture_warnings() as caught:
+        try:
+            result = convert_document(
+                document=job.document,
+                output_dir=job.output_dir,
+                request=request,
+                slot_overrides=dict(job.document.slot_selectors) or None,
+                emitter=recorder,
+                template_overrides=job.template_overrides,
+                state=state,
+                template_runtime=runtime,
+                wrap_document=job.wrap_document,
+                preloaded_bibliography=bibliography,
+                seen_bibliography_issues=set(job.seen_bibliography_issues),
+            )
+        except Exception as exc:
+            outcome.error = _portable_exception(exc) or ConversionError(str(exc))
+        else:
+            # The conversion context holds live template objects that only make
+            # sense inside this process; keep just the bibliography it used.
+            if result.context is not None:
+                outcome.bibliography = result.context.bibliography_collection
+            result.context = None
+            result.template_overrides = {
+                key: _portable(value) for key, value in result.template_overrides.items()
+            }
+            outcome.result = result
+    outcome.warnings = [
+        (str(entry.message), entry.category, entry.filename, entry.lineno) for entry in caught
+    ]
+    return outcome
+
+
+def _restore_outputs(outcome: DocumentOutcome) -> None:
+    """Recreate the files a cached conversion wrote next to its fragment."""
+    result = outcome.result
+    if result is None:
+        return
+    if result.tex_path is not None:
+        _write_if_changed(result.tex_path, result.latex_output)
+    if (
+        result.bibliography_path is not None
+        and outcome.bibliography is not None
+        and result.document_state is not None
+    ):
+        outcome.bibliography.write_bibtex(
+            result.bibliography_path, keys=result.document_state.citations
+        )
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return
+    except OSError:
+        pass
+    path.write_text(content, encoding="utf-8")
+
+
+def _template_fingerprint(runtime: TemplateRuntime | None) -> Any:
+    if runtime is None:
+        return None
+    info = getattr(runtime.instance, "info", None)
+    root = getattr(runtime.instance, "root", None)
+    return {
+        "name": runtime.name,
+        "version": getattr(info, "version", None),
+        "files": tree_fingerprint(root) if root is not None else None,
+    }
+
+
+@cache
+def _load_runtime(identifier: str) -> TemplateRuntime:
+    return load_template_runtime(identifier)
+
+
+@cache
+def _load_bibliography(paths: tuple[Path, ...]) -> BibliographyCollection | None:
+    if not paths:
+        return None
+    collection = BibliographyCollection()
+    collection.load_files(paths)
+    return collection
+
+
+def _portable(value: Any) -> Any:
+    """Return ``value`` if it survives a pickle round-trip, else its ``repr``."""
+    try:
+        pickle.loads(pickle.dumps(value))
+    except Exception:
+        return repr(value)
+    return value
+
+
+def _portable_exception(exc: BaseException | None) -> BaseException | None:
+    if exc is None:
+        return None
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return None
+    return exc
+
+
+__all__ = [
+    "DocumentOutcome",
+    "RecordingEmitter",
+    "convert_isolated",
+    "resolve_worker_count",
+    "template_identifier",
+]
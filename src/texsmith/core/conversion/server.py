@@ -0,0 +1,403 @@
+"""Long-running conversion server speaking JSON-RPC 2.0 over a Unix socket.
+
+Starting TeXSmith costs several hundred milliseconds of imports and template
+setup before any document is converted. :class:`ConversionServer` pays that
+once: it keeps a warm :class:`~texsmith.core.conversion.service.ConversionService`
+(template runtimes, parsed documents and bibliographies), along with the
+process-wide Markdown processors, highlighters and font fallback index, and
+serves conversions to local clients.
+
+Protocol
+--------
+Clients connect to the socket and exchange newline-delimited JSON-RPC 2.0
+messages; a connection may carry any number of requests, answered in order.
+Requests without an ``id`` are notifications and get no answer.
+
+``execute``
+    Run :meth:`ConversionService.execute`. ``params`` are
+    :class:`~texsmith.core.conversion.models.ConversionRequest` fields;
+    ``documents`` and ``render_dir`` are required. Like on the command line,
+    ``.bib`` files and YAML configuration files may be listed among the
+    documents. Relative paths are resolved against the server's working
+    directory.
+``build_pdf``
+    ``execute`` followed by :meth:`ConversionService.build_pdf`. Accepts the
+    ``execute`` parameters plus ``engine``, ``isolate_cache`` and
+    ``use_system_tectonic``; requires a template.
+``ping``
+    Return the TeXSmith version.
+
+Results describe the produced files, the diagnostics emitted while converting
+(Python warnings included) and the request ``timings`` in seconds (``queued``
+waiting for a worker, ``execute``, ``build`` and ``total``). Conversion
+failures are reported as error ``-32000`` with the diagnostics and timings in
+``error.data``.
+
+Requests run concurrently on a bounded pool of worker threads. Requests
+converting into the same ``render_dir`` at the same time are not isolated from
+each other; clients should give every request its own directory.
+
+The server needs Unix domain sockets; on platforms without them (Windows
+Python builds) :class:`ConversionServer` raises :class:`ConversionError`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import json
+import os
+from pathlib import Path
+import socket
+import socketserver
+import stat
+import time
+from typing import Any
+
+from texsmith.version import get_version
+
+from ..diagnostics import CollectingEmitter, capture_warnings
+from .debug import ConversionError
+from .models import ConversionRequest
+from .service import ConversionResponse, ConversionService
+
+
+DEFAULT_WORKERS = 4
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+CONVERSION_FAILED = -32000
+
+_BUILD_OPTIONS = frozenset({"engine", "isolate_cache", "use_system_tectonic"})
+
+
+class ServerError(Exception):
+    """JSON-RPC error raised by a request handler or returned to a client."""
+
+    def __init__(self, code: int, message: str, data: Any = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the JSON-RPC ``error`` member describing this error."""
+        payload: dict[str, Any] = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            payload["data"] = self.data
+        return payload
+
+
+class ConversionServer:
+    """Serve :class:`ConversionService` requests on a Unix domain socket."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        *,
+        service: ConversionService | None = None,
+        workers: int = DEFAULT_WORKERS,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        if workers < 0:
+            raise ValueError("workers must be a non-negative integer.")
+        if not unix_sockets_available():
+            raise ConversionError(
+                "The conversion server needs Unix domain sockets, "
+                "which this platform does not provide."
+            )
+        self.socket_path = Path(socket_path)
+        self.service = service or ConversionService(warm=True)
+        self.workers = workers or os.cpu_count() or 1
+        self._log = log
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="texsmith-serve"
+        )
+        self._server: _UnixServer | None = None
+
+    def __enter__(self) -> ConversionServer:
+        self.bind()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def bind(self) -> None:
+        """Create the socket, replacing a stale one left by a previous server."""
+        if self._server is not None:
+            return
+        _remove_stale_socket(self.socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Conversions read and write arbitrary local files on behalf of the
+        # caller, so only the user running the server may connect. The socket
+        # is created under a restrictive umask so it is never reachable with
+        # wider permissions, not even between bind and chmod.
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(str(self.socket_path), self)
+        finally:
+            os.umask(previous_umask)
+
+    def serve_forever(self) -> None:
+        """Accept connections until :meth:`shutdown` is called."""
+        self.bind()
+        assert self._server is not None
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop :meth:`serve_forever`; safe to call from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """Release the socket and wait for in-flight requests to finish."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+        self._executor.shutdown(wait=True)
+
+    def handle(self, message: Any) -> dict[str, Any] | None:
+        """Answer one decoded JSON-RPC message; ``None`` for notifications."""
+        received = time.perf_counter()
+        identifier = message.get("id") if isinstance(message, Mapping) else None
+        method = message.get("method") if isinstance(message, Mapping) else None
+        try:
+            handler, params = self._resolve(message)
+            result = self._executor.submit(handler, params, received=received).result()
+            response: dict[str, Any] = {"jsonrpc": "2.0", "id": identifier, "result": result}
+        except ServerError as exc:
+            response = {"jsonrpc": "2.0", "id": identifier, "error": exc.to_json()}
+        except Exception as exc:  # pragma: no cover - defensive
+            error = ServerError(INTERNAL_ERROR, f"Internal error: {exc}")
+            response = {"jsonrpc": "2.0", "id": identifier, "error": error.to_json()}
+        self._report(method, identifier, response, received)
+        if isinstance(message, Mapping) and "id" not in message:
+            return None
+        return response
+
+    def handle_line(self, line: bytes | str) -> str | None:
+        """Decode one protocol line and return the encoded answer, if any."""
+        try:
+            message = json.loads(line)
+        except ValueError:
+            error = ServerError(PARSE_ERROR, "Parse error")
+            return _encode({"jsonrpc": "2.0", "id": None, "error": error.to_json()})
+        response = self.handle(message)
+        return None if response is None else _encode(response)
+
+    # -- methods -----------------------------------------------------------
+
+    def ping(self, params: Mapping[str, Any], *, received: float | None = None) -> dict[str, Any]:
+        """Answer the ``ping`` method."""
+        return {"version": get_version(), "workers": self.workers}
+
+    def execute(
+        self, params: Mapping[str, Any], *, received: float | None = None
+    ) -> dict[str, Any]:
+        """Answer the ``execute`` method."""
+        return self._convert(dict(params), received, build=False)
+
+    def build_pdf(
+        self, params: Mapping[str, Any], *, received: float | None = None
+    ) -> dict[str, Any]:
+        """Answer the ``build_pdf`` method."""
+        return self._convert(dict(params), received, build=True)
+
+    def _resolve(self, message: Any) -> tuple[Callable[..., dict[str, Any]], dict[str, Any]]:
+        if not isinstance(message, Mapping) or message.get("jsonrpc") != "2.0":
+            raise ServerError(INVALID_REQUEST, "Invalid Request")
+        method = message.get("method")
+        if not isinstance(method, str):
+            raise ServerError(INVALID_REQUEST, "Invalid Request")
+        if method not in _METHODS:
+            raise ServerError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        params = message.get("params", {})
+        if not isinstance(params, Mapping):
+            raise ServerError(INVALID_PARAMS, "params must be an object.")
+        return getattr(self, method), dict(params)
+
+    def _convert(
+        self, params: dict[str, Any], received: float | None, *, build: bool
+    ) -> dict[str, Any]:
+        received = time.perf_counter() if received is None else received
+        build_options = {key: params.pop(key) for key in _BUILD_OPTIONS & params.keys()}
+        if build_options and not build:
+            raise ServerError(
+                INVALID_PARAMS, f"Unknown parameters: {', '.join(sorted(build_options))}"
+            )
+        emitter = CollectingEmitter()
+        request = self._build_request(params, emitter)
+        if build and request.template is None:
+            raise ServerError(INVALID_PARAMS, "build_pdf requires a template.")
+        # Requests share the process, so their Python warnings are collected
+        # per request rather than through process-wide warnings state.
+        with capture_warnings() as caught:
+            outcome = self.service.execute_job(
+                request, build=build, build_options=build_options, submitted=received
+            )
+        emitter.records.extend(
+            {"level": "warning", "message": str(entry.message)} for entry in caught
+        )
+        if outcome.error is not None:
+            raise ServerError(
+                CONVERSION_FAILED,
+                str(outcome.error) or type(outcome.error).__name__,
+                {"diagnostics": emitter.records, "timings": outcome.timings},
+            ) from outcome.error
+        result = _describe_response(outcome.response)
+        engine_result = outcome.engine_result
+        if engine_result is not None:
+            result["pdf"] = str(engine_result.pdf_path)
+            result["log"] = str(engine_result.log_path)
+            result["returncode"] = engine_result.returncode
+            result["messages"] = [
+                {"severity": message.severity.value, "summary": message.summary}
+                for message in engine_result.messages
+            ]
+        result["diagnostics"] = emitter.records
+        result["timings"] = outcome.timings
+        return result
+
+    def _build_request(
+        self, params: dict[str, Any], emitter: CollectingEmitter
+    ) -> ConversionRequest:
+        try:
+            return self.service.build_request(params, emitter=emitter)
+        except ConversionError as exc:
+            raise ServerError(INVALID_PARAMS, str(exc)) from exc
+
+    def _report(
+        self,
+        method: Any,
+        identifier: Any,
+        response: Mapping[str, Any],
+        received: float,
+    ) -> None:
+        if self._log is None:
+            return
+        elapsed = (time.perf_counter() - received) * 1000
+        outcome = "ok" if "result" in response else f"error {response['error']['code']}"
+        self._log(f"{method} (id={identifier!r}) {outcome} in {elapsed:.0f} ms")
+
+
+_METHODS = frozenset({"build_pdf", "execute", "ping"})
+
+
+def call(
+    socket_path: Path | str,
+    method: str,
+    params: Mapping[str, Any] | None = None,
+    *,
+    timeout: float | None = None,
+) -> Any:
+    """Send one request to a running server and return its result.
+
+    Raises :class:`ServerError` when the server answers with an error.
+    """
+    if not unix_sockets_available():
+        raise ServerError(INTERNAL_ERROR, "Unix domain sockets are not available.")
+    message = {"jsonrpc": "2.0", "id": 1, "method": method, "params": dict(params or {})}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(socket_path))
+        connection.sendall(_encode(message).encode("utf-8"))
+        with connection.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise ServerError(INTERNAL_ERROR, "The server closed the connection.")
+    response = json.loads(line)
+    if "error" in response:
+        error = response["error"]
+        raise ServerError(
+            error.get("code", INTERNAL_ERROR), error.get("message", ""), error.get("data")
+        )
+    return response.get("result")
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    server: _UnixServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            answer = self.server.owner.handle_line(line)
+            if answer is not None:
+                self.wfile.write(answer.encode("utf-8"))
+                self.wfile.flush()
+
+
+# ``socketserver`` only defines its Unix servers where ``AF_UNIX`` exists.
+if hasattr(socket, "AF_UNIX"):
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        # Connection threads only read and write the socket; conversions run
+        # on the owner's bounded worker pool.
+        daemon_threads = True
+
+        def __init__(self, address: str, owner: ConversionServer) -> None:
+            self.owner = owner
+            super().__init__(address, _ConnectionHandler)
+
+
+def unix_sockets_available() -> bool:
+    """Return whether this platform provides the Unix domain sockets the server needs."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def _describe_response(response: ConversionResponse) -> dict[str, Any]:
+    if response.is_template:
+        rendered = response.render_result
+        return {
+            "main_tex": str(rendered.main_tex_path),
+            "fragments": [str(path) for path in rendered.fragment_paths],
+            "bibliography": (
+                str(rendered.bibliography_path) if rendered.bibliography_path else None
+            ),
+            "assets": [str(path) for path in rendered.asset_paths],
+        }
+    return {
+        "fragments": [
+            {
+                "stem": fragment.stem,
+                "latex": fragment.latex,
+                "path": str(fragment.output_path) if fragment.output_path else None,
+            }
+            for fragment in response.bundle.fragments
+        ]
+    }
+
+
+def _remove_stale_socket(path: Path) -> None:
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ConversionError(f"'{path}' exists and is not a socket.")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()
+            return
+    raise ConversionError(f"Another server is already listening on '{path}'.")
+
+
+def _encode(payload: Mapping[str, Any]) -> str:
+    return json.dumps(payload, default=str) + "\n"
+
+
+__all__ = [
+    "DEFAULT_WORKERS",
+    "ConversionServer",
+    "ServerError",
+    "call",
+    "unix_sockets_available",
+]
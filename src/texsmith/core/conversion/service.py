@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 import copy
+import dataclasses
 from dataclasses import dataclass, field
+import os
 from pathlib import Path
+import threading
+import time
 from typing import Any
 
 import yaml
@@ -31,9 +36,13 @@ from texsmith.adapters.latex.tectonic import (
 )
 from texsmith.adapters.markdown import split_front_matter
 
+from ..bibliography.collection import BibliographyCollection
 from ..diagnostics import DiagnosticEmitter
 from ..documents import Document, TitleStrategy, front_matter_has_title
+from ..profiling import timed_phase
+from ..templates.runtime import TemplateRuntime, load_template_runtime
 from ..templates.session import TemplateRenderResult, TemplateSession, get_template
+from .cache import FragmentCache, MemoryStorage, file_fingerprint, tree_fingerprint
 from .core import ConversionBundle, convert_documents
 from .debug import ConversionError, ensure_emitter
 from .inputs import (
@@ -44,7 +53,21 @@ from .inputs import (
 from .models import ConversionRequest
 
 
+DEFAULT_BATCH_WORKERS = 4
+
+_PATH_FIELDS = frozenset({"render_dir"})
+_PATH_LIST_FIELDS = frozenset({"documents", "bibliography_files", "front_matter_paths"})
+# Live objects and CLI-only slot directives cannot be expressed as plain data.
+_REQUEST_FIELDS = frozenset(
+    definition.name
+    for definition in dataclasses.fields(ConversionRequest)
+    if definition.name not in {"emitter", "slot_assignments"}
+)
+
+
 __all__ = [
+    "DEFAULT_BATCH_WORKERS",
+    "BatchOutcome",
     "ConversionResponse",
     "ConversionService",
     "SplitInputsResult",
@@ -96,6 +119,52 @@ class ConversionResponse:
         raise TypeError("ConversionResponse does not contain a TemplateRenderResult.")
 
 
+@dataclass(slots=True)
+class BatchOutcome:
+    """Outcome of one request run by :meth:`ConversionService.execute_many`.
+
+    ``timings`` holds wall-clock seconds: ``queued`` waiting for a worker,
+    ``execute`` converting, ``build`` compiling the PDF (when built) and
+    ``total`` since the request was submitted.
+    """
+
+    request: ConversionRequest
+    response: ConversionResponse | None = None
+    engine_result: EngineResult | None = None
+    error: Exception | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the conversion, and the PDF build if any, succeeded."""
+        if self.error is not None:
+            return False
+        return self.engine_result is None or self.engine_result.returncode == 0
+
+    def to_json(self) -> dict[str, Any]:
+        """Summarise the outcome as a JSON-serialisable mapping."""
+        payload: dict[str, Any] = {"status": "ok" if self.ok else "failed"}
+        if self.error is not None:
+            payload["error"] = str(self.error) or type(self.error).__name__
+        response = self.response
+        if response is not None and response.is_template:
+            rendered = response.render_result
+            payload["main_tex"] = str(rendered.main_tex_path)
+            payload["fragments"] = [str(path) for path in rendered.fragment_paths]
+        elif response is not None:
+            payload["fragments"] = [
+                str(fragment.output_path)
+                for fragment in response.bundle.fragments
+                if fragment.output_path is not None
+            ]
+        if self.engine_result is not None:
+            payload["pdf"] = str(self.engine_result.pdf_path)
+            payload["log"] = str(self.engine_result.log_path)
+            payload["returncode"] = self.engine_result.returncode
+        payload["timings"] = dict(self.timings)
+        return payload
+
+
 @dataclass(slots=True)
 class _PreparedBatch:
     documents: list[Document]
@@ -105,7 +174,66 @@ class _PreparedBatch:
 
 
 class ConversionService:
-    """High-level façade that encapsulates document preparation and execution."""
+    """High-level façade that encapsulates document preparation and execution.
+
+    When built with a :class:`FragmentCache`, :meth:`execute` reuses the
+    fragments of documents that did not change since a previous run. A
+    ``warm`` service additionally keeps the parsed documents, template runtimes
+    and bibliography of previous runs in memory and only reloads them when
+    their files change, which long-lived callers such as ``texsmith render
+    --watch`` rely on to skip repeated setup. Without an on-disk cache it also
+    keeps the last fragment of each document in a :class:`MemoryStorage`, so
+    only the documents whose inputs changed are converted again.
+    """
+
+    def __init__(self, *, cache: FragmentCache | None = None, warm: bool = False) -> None:
+        self.cache = cache
+        self.warm = warm
+        self._fragments = FragmentCache(MemoryStorage()) if warm and cache is None else None
+        self._documents: dict[Path, tuple[Any, Document]] = {}
+        self._templates: dict[str, tuple[Any, TemplateRuntime]] = {}
+        self._template_lock = threading.Lock()
+        self._bibliography: tuple[Any, BibliographyCollection] | None = None
+
+    def build_request(
+        self,
+        params: Mapping[str, Any],
+        *,
+        emitter: DiagnosticEmitter | None = None,
+        base_dir: Path | None = None,
+    ) -> ConversionRequest:
+        """Build a :class:`ConversionRequest` from plain data, such as parsed JSON or YAML.
+
+        ``params`` are request fields; ``documents`` and ``render_dir`` are
+        required. Paths are accepted as strings and resolved against
+        ``base_dir`` when relative. As on the command line, ``.bib`` files and
+        YAML configuration files may be listed among the documents. Invalid
+        parameters raise :class:`ConversionError`.
+        """
+        params = dict(params)
+        unknown = params.keys() - _REQUEST_FIELDS
+        if unknown:
+            raise ConversionError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+        for name in ("documents", "render_dir"):
+            if not params.get(name):
+                raise ConversionError(f"Missing required parameter '{name}'.")
+        try:
+            for name in _PATH_FIELDS & params.keys():
+                params[name] = _resolve_path(params[name], base_dir)
+            for name in _PATH_LIST_FIELDS & params.keys():
+                params[name] = _path_list(name, params[name], base_dir)
+        except TypeError as exc:
+            raise ConversionError(str(exc)) from exc
+        split = self.split_inputs(params["documents"], params.get("bibliography_files", ()))
+        params["documents"] = split.documents
+        params["bibliography_files"] = split.bibliography_files
+        if split.front_matter is not None and params.get("front_matter") is None:
+            params["front_matter"] = split.front_matter
+            params["front_matter_paths"] = split.front_matter_paths
+        try:
+            return ConversionRequest(**params, emitter=emitter)
+        except TypeError as exc:  # pragma: no cover - guarded by the field check
+            raise ConversionError(str(exc)) from exc
 
     def split_inputs(
         self,
@@ -172,31 +300,22 @@ class ConversionService:
             else:
                 strategy = None
 
+            options: dict[str, Any] = {
+                "base_level": request.base_level,
+                "promote_title": extract_title,
+                "strip_heading": effective_strip,
+                "suppress_title": request.suppress_title,
+                "title_strategy": strategy,
+                "numbered": request.numbered,
+            }
             if input_kind is InputKind.MARKDOWN:
-                document = Document.from_markdown(
-                    path,
-                    extensions=list(request.markdown_extensions),
-                    base_level=request.base_level,
-                    promote_title=extract_title,
-                    strip_heading=effective_strip,
-                    suppress_title=request.suppress_title,
-                    title_strategy=strategy,
-                    numbered=request.numbered,
-                    emitter=emitter,
-                )
+                options["extensions"] = list(request.markdown_extensions)
+                loader = Document.from_markdown
             else:
-                document = Document.from_html(
-                    path,
-                    selector=request.selector,
-                    base_level=request.base_level,
-                    promote_title=extract_title,
-                    strip_heading=effective_strip,
-                    suppress_title=request.suppress_title,
-                    title_strategy=strategy,
-                    numbered=request.numbered,
-                    full_document=request.full_document,
-                    emitter=emitter,
-                )
+                options["selector"] = request.selector
+                options["full_document"] = request.full_document
+                loader = Document.from_html
+            document = self._load_document(path, loader, options, emitter=emitter)
 
             documents.append(document)
             mapping[path] = document
@@ -233,20 +352,123 @@ class ConversionService:
         request: ConversionRequest,
         *,
         prepared: _PreparedBatch | None = None,
+        max_workers: int | None = None,
+    ) -> ConversionResponse:
+        """Execute a conversion workflow and return a structured response, routing to template or raw conversion paths as needed.
+
+        ``max_workers`` converts the documents in a process pool of that size
+        (``0`` for one worker per CPU); the default converts them serially.
+        """
+        return self._execute(
+            request, prepared=prepared, max_workers=max_workers, share_templates=self.warm
+        )
+
+    def execute_many(
+        self,
+        requests: Iterable[ConversionRequest],
+        *,
+        workers: int = DEFAULT_BATCH_WORKERS,
+        build: bool = False,
+        build_options: Mapping[str, Any] | None = None,
+    ) -> list[BatchOutcome]:
+        """Run independent conversion requests on a bounded pool of worker threads.
+
+        Requests naming the same template share one loaded template runtime;
+        unless the service is warm, template files are only checked for changes
+        when the batch starts. With ``build``, every request that renders a
+        template is compiled to a PDF by its worker as soon as it is converted,
+        using ``build_options`` (keyword arguments of :meth:`build_pdf`); LaTeX
+        engines run as subprocesses, so builds overlap even though conversions
+        share the interpreter. ``workers`` caps how many requests run at once
+        (``0`` for one per CPU).
+
+        Outcomes are returned in request order. A failing request does not stop
+        the others: its error is recorded on its :class:`BatchOutcome`.
+        Diagnostics go to each request's own emitter, and requests should
+        render into distinct directories.
+        """
+        if workers < 0:
+            raise ValueError("workers must be a non-negative integer.")
+        pending = list(requests)
+        if not pending:
+            return []
+        size = min(workers or os.cpu_count() or 1, len(pending))
+        options = dict(build_options or {})
+        if not self.warm:
+            # Jobs trust the shared template runtimes for the whole batch.
+            self._drop_stale_templates()
+        submitted = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=size, thread_name_prefix="texsmith-batch") as pool:
+            futures = [
+                pool.submit(
+                    self.execute_job,
+                    request,
+                    build=build,
+                    build_options=options,
+                    submitted=submitted,
+                )
+                for request in pending
+            ]
+            return [future.result() for future in futures]
+
+    def execute_job(
+        self,
+        request: ConversionRequest,
+        *,
+        build: bool = False,
+        build_options: Mapping[str, Any] | None = None,
+        submitted: float | None = None,
+    ) -> BatchOutcome:
+        """Convert, and optionally build, one request of a batch and time it.
+
+        ``submitted`` is the :func:`time.perf_counter` value at which the
+        request was queued; it defaults to now. Any exception raised while
+        converting or building is recorded on the returned outcome rather than
+        raised, so one failing request cannot abort the rest of a batch.
+        """
+        started = time.perf_counter()
+        submitted = started if submitted is None else submitted
+        outcome = BatchOutcome(request=request, timings={"queued": started - submitted})
+        try:
+            outcome.response = self._execute(request, share_templates=True)
+            outcome.timings["execute"] = time.perf_counter() - started
+            if build and outcome.response.is_template:
+                started = time.perf_counter()
+                outcome.engine_result = self.build_pdf(
+                    outcome.response.render_result, **dict(build_options or {})
+                )
+                outcome.timings["build"] = time.perf_counter() - started
+        except Exception as exc:
+            outcome.error = exc
+        outcome.timings["total"] = time.perf_counter() - submitted
+        return outcome
+
+    def _execute(
+        self,
+        request: ConversionRequest,
+        *,
+        prepared: _PreparedBatch | None = None,
+        max_workers: int | None = None,
+        share_templates: bool,
     ) -> ConversionResponse:
-        """Execute a conversion workflow and return a structured response, routing to template or raw conversion paths as needed."""
         batch = prepared or self.prepare_documents(request)
         settings = request.copy()
         emitter = batch.emitter
 
+        bibliography = self._load_bibliography(batch.bibliography_files, emitter=emitter)
+
         if request.template is None:
-            bundle = convert_documents(
-                batch.documents,
-                output_dir=request.render_dir,
-                settings=settings,
-                emitter=emitter,
-                bibliography_files=batch.bibliography_files,
-            )
+            with timed_phase(emitter, "convert"):
+                bundle = convert_documents(
+                    batch.documents,
+                    output_dir=request.render_dir,
+                    settings=settings,
+                    emitter=emitter,
+                    bibliography_files=batch.bibliography_files,
+                    max_workers=max_workers,
+                    cache=self._fragment_cache,
+                    bibliography=bibliography,
+                )
             return ConversionResponse(
                 request=request,
                 documents=batch.documents,
@@ -255,11 +477,13 @@ class ConversionService:
                 emitter=emitter,
             )
 
-        session = self._initialise_template_session(
-            request.template,
-            settings=settings,
-            emitter=emitter,
-        )
+        with timed_phase(emitter, "template.load", template=request.template):
+            session = self._initialise_template_session(
+                request.template,
+                settings=settings,
+                emitter=emitter,
+                shared=share_templates,
+            )
         if request.template_options:
             session.update_options(request.template_options)
         if batch.bibliography_files:
@@ -268,7 +492,14 @@ class ConversionService:
             session.add_document(document)
 
         target_dir = (request.render_dir or Path("build")).resolve()
-        render_result = session.render(target_dir, embed_fragments=request.embed_fragments)
+        with timed_phase(emitter, "convert"):
+            render_result = session.render(
+                target_dir,
+                embed_fragments=request.embed_fragments,
+                max_workers=max_workers,
+                cache=self._fragment_cache,
+                bibliography=bibliography,
+            )
         return ConversionResponse(
             request=request,
             documents=batch.documents,
@@ -289,13 +520,43 @@ class ConversionService:
         verbosity: int = 0,
         use_system_tectonic: bool = False,
         run_engine: Callable[..., EngineResult] = run_engine_command,
+        emitter: DiagnosticEmitter | None = None,
     ) -> EngineResult:
         """Compile a rendered template into a PDF using the requested engine, selecting dependencies on demand.
 
         ``run_engine`` is the LaTeX-engine runner, injectable so callers (and
         tests) can substitute the execution step without monkeypatching module
-        globals; it defaults to :func:`run_engine_command`.
+        globals; it defaults to :func:`run_engine_command`. ``emitter``
+        receives the phase timings of the build when it records them.
         """
+        with timed_phase(emitter, "build", engine=engine):
+            return self._build_pdf(
+                render_result,
+                engine=engine,
+                classic_output=classic_output,
+                isolate_cache=isolate_cache,
+                env=env,
+                console=console,
+                verbosity=verbosity,
+                use_system_tectonic=use_system_tectonic,
+                run_engine=run_engine,
+                emitter=emitter,
+            )
+
+    def _build_pdf(
+        self,
+        render_result: TemplateRenderResult,
+        *,
+        engine: str | None,
+        classic_output: bool,
+        isolate_cache: bool,
+        env: Mapping[str, str] | None,
+        console: Any | None,
+        verbosity: int,
+        use_system_tectonic: bool,
+        run_engine: Callable[..., EngineResult],
+        emitter: DiagnosticEmitter | None,
+    ) -> EngineResult:
         template_context = getattr(render_result, "template_context", None) or getattr(
             render_result, "context", None
         )
@@ -372,20 +633,121 @@ class ConversionService:
             verbosity=verbosity,
             classic_output=classic_output,
             features=features,
+            emitter=emitter,
         )
 
-    @staticmethod
     def _initialise_template_session(
+        self,
         template: str,
         *,
         settings: ConversionRequest,
         emitter: DiagnosticEmitter,
+        shared: bool,
     ) -> TemplateSession:
-        return get_template(
-            template,
-            settings=settings,
-            emitter=emitter,
-        )
+        if not shared:
+            return get_template(
+                template,
+                settings=settings,
+                emitter=emitter,
+            )
+        return TemplateSession(self._shared_template(template), settings=settings, emitter=emitter)
+
+    def _shared_template(self, template: str) -> TemplateRuntime:
+        """Return the shared runtime of ``template``, loading it at most once at a time.
+
+        Only a warm service checks the template files on every request, and it
+        does so outside the lock; a batch checks them once when it starts
+        (see :meth:`_drop_stale_templates`).
+        """
+        cached = self._templates.get(template)
+        if cached is not None and (not self.warm or cached[0] == _template_files(cached[1])):
+            return cached[1]
+        # Concurrent requests for a template wait for a single load.
+        with self._template_lock:
+            current = self._templates.get(template)
+            if current is not None and current is not cached:
+                return current[1]
+            runtime = load_template_runtime(template)
+            self._templates[template] = (_template_files(runtime), runtime)
+        return runtime
+
+    def _drop_stale_templates(self) -> None:
+        """Forget the shared runtimes whose template files changed since they were loaded."""
+        with self._template_lock:
+            cached = dict(self._templates)
+        stale = {
+            name for name, (files, runtime) in cached.items() if files != _template_files(runtime)
+        }
+        with self._template_lock:
+            for name in stale:
+                if self._templates.get(name) is cached[name]:
+                    del self._templates[name]
+
+    def _load_document(
+        self,
+        path: Path,
+        loader: Callable[..., Document],
+        options: dict[str, Any],
+        *,
+        emitter: DiagnosticEmitter,
+    ) -> Document:
+        phase = "load.markdown" if loader == Document.from_markdown else "load.html"
+        with timed_phase(emitter, phase, document=path.name):
+            if not self.warm:
+                return loader(path, emitter=emitter, **options)
+            # Documents are mutated by front matter and slot assignments once
+            # loaded, so the memo hands out copies of a pristine instance.
+            signature = (file_fingerprint(path), repr(sorted(options.items())))
+            cached = self._documents.get(path)
+            if cached is None or cached[0] != signature:
+                document = loader(path, emitter=emitter, **options)
+                cached = (signature, copy.deepcopy(document))
+                self._documents[path] = cached
+                return document
+            return copy.deepcopy(cached[1])
+
+    @property
+    def _fragment_cache(self) -> FragmentCache | None:
+        return self.cache if self.cache is not None else self._fragments
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        """Drop the fragments memoised for the documents read from ``paths``."""
+        if self._fragments is not None:
+            self._fragments.invalidate(paths)
+
+    def _load_bibliography(
+        self, paths: list[Path], *, emitter: DiagnosticEmitter | None = None
+    ) -> BibliographyCollection | None:
+        if not self.warm or not paths:
+            return None
+        signature = file_fingerprint(*paths)
+        cached = self._bibliography
+        if cached is None or cached[0] != signature:
+            collection = BibliographyCollection()
+            with timed_phase(emitter, "bibliography"):
+                collection.load_files(paths)
+            cached = (signature, collection)
+            self._bibliography = cached
+        # Read through the local: a concurrent request may have replaced the memo.
+        return cached[1]
+
+
+def _resolve_path(value: Any, base_dir: Path | None) -> Path:
+    if not isinstance(value, str | os.PathLike):
+        raise TypeError(f"Expected a path, got {value!r}.")
+    path = Path(value)
+    return base_dir / path if base_dir is not None and not path.is_absolute() else path
+
+
+def _path_list(name: str, value: Any, base_dir: Path | None) -> list[Path]:
+    if isinstance(value, str) or not isinstance(value, Iterable):
+        raise TypeError(f"'{name}' must be a list of paths.")
+    return [_resolve_path(item, base_dir) for item in value]
+
+
+def _template_files(runtime: TemplateRuntime) -> Any:
+    root = getattr(runtime.instance, "root", None)
+    return tree_fingerprint(root) if root is not None else None
 
 
 _NOT_FRONT_MATTER = object()
@@ -10,12 +10,14 @@ from pathlib import Path
 import re
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup, FeatureNotFound
+from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
 from pybtex.exceptions import PybtexError
 from slugify import slugify
 import yaml
 
+from texsmith.readers.html.backends import parse_html
+
 from ...adapters.html_utils import strip_html_comments
 from ..bibliography.collection import BibliographyCollection
 from ..bibliography.parsing import (
@@ -86,32 +88,61 @@ def _replace_mustaches_in_html(
         return html
 
     soup = BeautifulSoup(html, "html.parser")
-    for node in soup.find_all(string=True):
+    _replace_mustaches_in_tree(soup, contexts, emitter=emitter, source=source)
+    return str(soup)
+
+
+def _replace_mustaches_in_tree(
+    root: Tag,
+    contexts: tuple[Mapping[str, Any], Mapping[str, Any]],
+    *,
+    emitter: DiagnosticEmitter,
+    source: str,
+) -> bool:
+    """Substitute mustaches in the text nodes of ``root``; return whether any changed."""
+    changed = False
+    for node in root.find_all(string=True):
         if not isinstance(node, NavigableString):
             continue
         if node.parent and node.parent.name in _MUSTACHE_SKIP_TAGS:
             continue
-        if node.find_parent(_MUSTACHE_SKIP_TAGS):
-            continue
         raw = str(node)
         if "{{" not in raw:
             continue
+        if node.find_parent(_MUSTACHE_SKIP_TAGS):
+            continue
         replaced = replace_mustaches(raw, contexts, emitter=emitter, source=source)
         if replaced != raw:
             node.replace_with(replaced)
-
-    return str(soup)
+            changed = True
+    return changed
 
 
 @dataclass(slots=True)
 class SlotFragment:
-    """HTML fragment mapped to a template slot with position metadata."""
+    """Parsed HTML nodes mapped to a template slot with position metadata.
+
+    ``root`` is a detached container whose children are the slot content; it
+    is handed to :meth:`~texsmith.readers.html.HtmlReader.read_tree` as is.
+    """
 
     name: str
-    html: str
+    root: Tag
     position: int
     heading_levels: list[int] = field(default_factory=list)
 
+    @property
+    def html(self) -> str:
+        """Serialise the slot content back to HTML."""
+        return "".join(str(node) for node in self.root.contents)
+
+
+def _slot_container(nodes: Iterable[Any]) -> BeautifulSoup:
+    container = BeautifulSoup("", "html.parser")
+    for node in list(nodes):
+        container.append(node)
+    return container
+
 
 def bind_template(
     *,
@@ -184,7 +215,7 @@ def _merge_template_overrides(
 
 
 def extract_slot_fragments(
-    html: str,
+    html: str | BeautifulSoup,
     requests: Mapping[str, str],
     default_slot: str,
     *,
@@ -192,16 +223,16 @@ def extract_slot_fragments(
     parser_backend: str,
     slot_options: Mapping[str, SlotOptions] | None = None,
 ) -> tuple[list[SlotFragment], list[str]]:
-    """Split the HTML document into fragments mapped to template slots."""
-    try:
-        soup = BeautifulSoup(html, parser_backend)
-    except FeatureNotFound:
-        soup = BeautifulSoup(html, "html.parser")
+    """Split the HTML document into fragments mapped to template slots.
+
+    ``html`` may be an already parsed tree, which is then consumed: its nodes
+    are moved into the returned fragments instead of being serialised.
+    """
+    soup = html if isinstance(html, BeautifulSoup) else parse_html(html, parser_backend)
 
     strip_html_comments(soup)
 
     container = soup.body or soup
-    document_html = "".join(str(node) for node in container.contents)
 
     wildcard_values = {
         DOCUMENT_SELECTOR_SENTINEL,
@@ -256,13 +287,16 @@ def extract_slot_fragments(
 
     fragments: list[SlotFragment] = []
 
+    document_levels = _heading_levels_for_nodes(document_nodes)
     for offset, slot_name in enumerate(full_document_slots):
+        # Section slots take their nodes out of the tree below, so every
+        # full-document slot renders its own copy of the complete content.
         fragments.append(
             SlotFragment(
                 name=slot_name,
-                html=document_html,
+                root=_slot_container(copy.copy(node) for node in document_nodes),
                 position=-(len(full_document_slots) - offset),
-                heading_levels=_heading_levels_for_nodes(document_nodes),
+                heading_levels=list(document_levels),
             )
         )
 
@@ -286,33 +320,31 @@ def extract_slot_fragments(
                 if str(render_nodes[0]).strip():
                     break
                 render_nodes.pop(0)
-        html_fragment = "".join(str(node) for node in render_nodes)
+        heading_levels = _heading_levels_for_nodes(render_nodes)
+        for node in section_nodes:
+            if hasattr(node, "extract"):
+                node.extract()
         fragments.append(
             SlotFragment(
                 name=slot_name,
-                html=html_fragment,
+                root=_slot_container(render_nodes),
                 position=order,
-                heading_levels=_heading_levels_for_nodes(render_nodes),
+                heading_levels=heading_levels,
             )
         )
-        for node in section_nodes:
-            if hasattr(node, "extract"):
-                node.extract()
 
     container = soup.body or soup
-    if full_document_slots:
-        remainder_html = ""
-    else:
-        remainder_html = "".join(str(node) for node in container.contents)
+    remainder_levels = _heading_levels_for_nodes(container.contents)
+    remainder_nodes = [] if full_document_slots else list(container.contents)
 
     remainder_position = max(fragment.position for fragment in fragments) + 1 if fragments else 0
 
     fragments.append(
         SlotFragment(
             name=default_slot,
-            html=remainder_html,
+            root=_slot_container(remainder_nodes),
             position=remainder_position,
-            heading_levels=_heading_levels_for_nodes(container.contents),
+            heading_levels=remainder_levels,
         )
     )
 
@@ -375,10 +407,7 @@ def compute_heading_offset(
     starting at ``<h2>`` therefore yield ``-1``. When ``drop_first_heading`` is
     true the first heading is ignored to mirror title promotion.
     """
-    try:
-        soup = BeautifulSoup(html, parser_backend)
-    except FeatureNotFound:
-        soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html, parser_backend)
 
     headings = soup.find_all(re.compile(r"^h[1-6]$"), recursive=True)
     if drop_first_heading and headings:
@@ -290,7 +290,7 @@ def _promote_title(document: ir.Document) -> tuple[str, ir.Document]:
 
 def _header_text(header: ir.Header) -> str:
     parts: list[str] = []
-    for node in header.content:
+    for node in _expand_runs(header.content):
         if isinstance(node, ir.Str):
             parts.append(node.text)
         elif isinstance(node, ir.Space):
@@ -298,6 +298,16 @@ def _header_text(header: ir.Header) -> str:
     return "".join(parts)
 
 
+def _expand_runs(inlines: tuple[ir.Inline, ...]) -> list[ir.Inline]:
+    expanded: list[ir.Inline] = []
+    for node in inlines:
+        if isinstance(node, ir.TextRun):
+            expanded.extend(node.expand())
+        else:
+            expanded.append(node)
+    return expanded
+
+
 def _slot_titles(document: Document) -> dict[str, str]:
     from texsmith.core.documents import extract_front_matter_slots
 
@@ -364,6 +374,7 @@ def render_typst_document(
     output_dir: Path | None = None,
     diagrams_backend: str | None = None,
     template_options: Mapping[str, Any] | None = None,
+    compact_text: bool = False,
 ) -> str:
     """Render one prepared document's HTML to a standalone ``.typ`` source.
 
@@ -381,7 +392,7 @@ def render_typst_document(
     collection, bib_resource = _build_bibliography(document, bibliography_files, output_dir)
     bib_keys = frozenset(citation_label(key) for key in collection.to_dict())
 
-    ir_document = HtmlReader().read(document.html)
+    ir_document = HtmlReader(compact_text=compact_text).read(document.html)
     source_dir = document.source_path.parent
     # Render Draw.io / Mermaid diagrams to PNGs Typst can embed, rewriting the
     # IR nodes; merge the produced assets over the generic image resolution map.
@@ -11,6 +11,8 @@ from .templates import TemplateBinding
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from bs4 import BeautifulSoup
+
     from .bibliography.collection import BibliographyCollection
     from .conversion.models import ConversionRequest
     from .documents import Document
@@ -56,6 +58,9 @@ class ConversionContext:
     slot_requests: dict[str, str] = field(default_factory=dict)
     bibliography_collection: BibliographyCollection | None = None
     bibliography_map: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # The document HTML parsed once, with mustaches substituted; consumed by
+    # slot extraction when the document is rendered.
+    html_tree: BeautifulSoup | None = None
 
     # Template-bound state (populated by bind_template)
     config: BookConfig | None = None
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 import logging
-from typing import Any, Protocol, runtime_checkable
+import threading
+from typing import Any, Protocol, TextIO, runtime_checkable
+import warnings
 
 
 logger = logging.getLogger(__name__)
 
+_WARNING_SINK: ContextVar[list[warnings.WarningMessage] | None] = ContextVar(
+    "texsmith_warning_sink", default=None
+)
+_SHOWWARNING_LOCK = threading.Lock()
+_fallback_showwarning = warnings.showwarning
+
 
 @runtime_checkable
 class DiagnosticEmitter(Protocol):
@@ -70,6 +80,24 @@ class LoggingEmitter:
             self._logger.debug("failed to log diagnostic event %s", name, exc_info=True)
 
 
+class CollectingEmitter:
+    """Emitter that keeps warnings and errors as JSON-friendly records."""
+
+    debug_enabled: bool = False
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, str]] = []
+
+    def warning(self, message: str, exc: BaseException | None = None) -> None:
+        self.records.append({"level": "warning", "message": message})
+
+    def error(self, message: str, exc: BaseException | None = None) -> None:
+        self.records.append({"level": "error", "message": message})
+
+    def event(self, name: str, payload: Mapping[str, Any]) -> None:
+        return
+
+
 def format_event_message(name: str, payload: Mapping[str, Any]) -> str | None:
     """Return a human-friendly summary for selected diagnostic events."""
     try:
@@ -110,9 +138,50 @@ def format_event_message(name: str, payload: Mapping[str, Any]) -> str | None:
     return None
 
 
+@contextmanager
+def capture_warnings() -> Iterator[list[warnings.WarningMessage]]:
+    """Collect the Python warnings raised by the current thread inside the block.
+
+    :class:`warnings.catch_warnings` swaps process-wide state, so conversions
+    running concurrently on other threads would record each other's warnings
+    and could leave the hook installed for good. Here a single routing hook
+    stays installed and each block registers its list in a context variable;
+    warnings raised outside any block are shown as before. The active warning
+    filters still apply.
+    """
+    global _fallback_showwarning
+    with _SHOWWARNING_LOCK:
+        if warnings.showwarning is not _route_warning:
+            _fallback_showwarning = warnings.showwarning
+            warnings.showwarning = _route_warning
+    caught: list[warnings.WarningMessage] = []
+    token = _WARNING_SINK.set(caught)
+    try:
+        yield caught
+    finally:
+        _WARNING_SINK.reset(token)
+
+
+def _route_warning(
+    message: Warning | str,
+    category: type[Warning],
+    filename: str,
+    lineno: int,
+    file: TextIO | None = None,
+    line: str | None = None,
+) -> None:
+    sink = _WARNING_SINK.get()
+    if sink is None:
+        _fallback_showwarning(message, category, filename, lineno, file, line)
+        return
+    sink.append(warnings.WarningMessage(message, category, filename, lineno, file, line))
+
+
 __all__ = [
+    "CollectingEmitter",
     "DiagnosticEmitter",
     "LoggingEmitter",
     "NullEmitter",
+    "capture_warnings",
     "format_event_message",
 ]
@@ -0,0 +1,235 @@
+"""Phase timing reported through diagnostic emitters.
+
+Instrumented code wraps each pipeline phase in :func:`timed_phase`. When the
+emitter has profiling enabled (a truthy ``profile_enabled`` attribute, as set
+by :class:`ProfilingEmitter`) the phase is reported as a ``phase`` event
+carrying its wall-clock and CPU durations; otherwise the wrapper only costs an
+attribute lookup. Phases nest, and a phase opened with ``document=`` labels
+every phase opened inside it on the same thread with that document.
+
+CPU time covers the calling thread plus the child processes (LaTeX engines,
+diagram converters) that exited while the phase was open.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from .diagnostics import DiagnosticEmitter, NullEmitter
+
+
+PHASE_EVENT = "phase"
+
+_CURRENT_DOCUMENT: ContextVar[str | None] = ContextVar("texsmith_phase_document", default=None)
+
+
+def profile_enabled(emitter: DiagnosticEmitter | None) -> bool:
+    """Return whether ``emitter`` records phase timings."""
+    return bool(emitter is not None and getattr(emitter, "profile_enabled", False))
+
+
+@contextmanager
+def timed_phase(
+    emitter: DiagnosticEmitter | None,
+    name: str,
+    *,
+    document: str | None = None,
+    **details: Any,
+) -> Iterator[None]:
+    """Time the enclosed block as phase ``name`` and report it to ``emitter``.
+
+    ``details`` are added to the event payload and must be JSON serialisable.
+    """
+    if emitter is None or not profile_enabled(emitter):
+        yield
+        return
+    token = _CURRENT_DOCUMENT.set(document) if document is not None else None
+    label = document if document is not None else _CURRENT_DOCUMENT.get()
+    start = time.perf_counter()
+    cpu_start = time.thread_time() + _children_cpu()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - start
+        cpu = time.thread_time() + _children_cpu() - cpu_start
+        if token is not None:
+            _CURRENT_DOCUMENT.reset(token)
+        emitter.event(
+            PHASE_EVENT,
+            {
+                **details,
+                "phase": name,
+                "document": label,
+                "start": start,
+                "wall": wall,
+                "cpu": cpu,
+                "pid": os.getpid(),
+                "thread": threading.get_ident(),
+            },
+        )
+
+
+@dataclass(slots=True)
+class PhaseSpan:
+    """One timed occurrence of a phase."""
+
+    phase: str
+    document: str | None
+    start: float
+    wall: float
+    cpu: float
+    pid: int = 0
+    thread: int = 0
+    details: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> PhaseSpan:
+        """Build a span from a ``phase`` event payload."""
+        data = dict(payload)
+        return cls(
+            phase=str(data.pop("phase")),
+            document=data.pop("document", None),
+            start=float(data.pop("start", 0.0)),
+            wall=float(data.pop("wall", 0.0)),
+            cpu=float(data.pop("cpu", 0.0)),
+            pid=int(data.pop("pid", 0)),
+            thread=int(data.pop("thread", 0)),
+            details=data,
+        )
+
+
+@dataclass(slots=True)
+class PhaseSummary:
+    """Aggregated timings of one phase, optionally for one document."""
+
+    phase: str
+    document: str | None
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+
+
+class ProfilingEmitter:
+    """Emitter collecting phase timings and forwarding every other diagnostic.
+
+    Phase events are kept as :class:`PhaseSpan` records instead of being
+    forwarded to ``inner``. Safe to share between threads.
+    """
+
+    profile_enabled = True
+
+    def __init__(self, inner: DiagnosticEmitter | None = None) -> None:
+        self.inner = inner if inner is not None else NullEmitter()
+        self.spans: list[PhaseSpan] = []
+        self._lock = threading.Lock()
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Mirror the debug flag of the wrapped emitter."""
+        return bool(getattr(self.inner, "debug_enabled", False))
+
+    def warning(self, message: str, exc: BaseException | None = None) -> None:
+        self.inner.warning(message, exc)
+
+    def error(self, message: str, exc: BaseException | None = None) -> None:
+        self.inner.error(message, exc)
+
+    def event(self, name: str, payload: Mapping[str, Any]) -> None:
+        if name != PHASE_EVENT:
+            self.inner.event(name, payload)
+            return
+        span = PhaseSpan.from_payload(payload)
+        with self._lock:
+            self.spans.append(span)
+
+    def __getattr__(self, name: str) -> Any:
+        # Optional emitter hooks (``info`` and friends) belong to the wrapped emitter.
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def take(self) -> list[PhaseSpan]:
+        """Return the spans recorded so far and start a new recording."""
+        with self._lock:
+            spans, self.spans = self.spans, []
+        return spans
+
+
+def summarise_phases(spans: Iterable[PhaseSpan], *, by_document: bool = True) -> list[PhaseSummary]:
+    """Aggregate ``spans`` per phase (and per document), slowest first.
+
+    Durations are inclusive: a phase counts the time of the phases nested in it.
+    """
+    totals: dict[tuple[str, str | None], PhaseSummary] = {}
+    for span in spans:
+        document = span.document if by_document else None
+        key = (span.phase, document)
+        summary = totals.get(key)
+        if summary is None:
+            summary = totals[key] = PhaseSummary(phase=span.phase, document=document)
+        summary.calls += 1
+        summary.wall += span.wall
+        summary.cpu += span.cpu
+    return sorted(totals.values(), key=lambda item: (-item.wall, item.phase, item.document or ""))
+
+
+def chrome_trace(spans: Iterable[PhaseSpan]) -> dict[str, Any]:
+    """Return ``spans`` in the Chrome trace-event format.
+
+    The result loads in ``chrome://tracing`` and Perfetto; timestamps are
+    relative to the earliest span.
+    """
+    ordered = sorted(spans, key=lambda span: span.start)
+    origin = ordered[0].start if ordered else 0.0
+    events = []
+    for span in ordered:
+        args: dict[str, Any] = {**span.details, "cpu_ms": round(span.cpu * 1000, 3)}
+        if span.document is not None:
+            args["document"] = span.document
+        events.append(
+            {
+                "name": span.phase,
+                "cat": "texsmith",
+                "ph": "X",
+                "ts": round((span.start - origin) * 1_000_000, 1),
+                "dur": round(span.wall * 1_000_000, 1),
+                "pid": span.pid,
+                "tid": span.thread,
+                "args": args,
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(spans: Iterable[PhaseSpan], path: Path) -> Path:
+    """Write ``spans`` to ``path`` as a Chrome trace-event JSON file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(chrome_trace(spans)), encoding="utf-8")
+    return path
+
+
+def _children_cpu() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+__all__ = [
+    "PHASE_EVENT",
+    "PhaseSpan",
+    "PhaseSummary",
+    "ProfilingEmitter",
+    "chrome_trace",
+    "profile_enabled",
+    "summarise_phases",
+    "timed_phase",
+    "write_chrome_trace",
+]
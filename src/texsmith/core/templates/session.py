@@ -47,10 +47,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from ..bibliography.collection import BibliographyCollection
 from ..context import DocumentState
 from ..conversion import ConversionRequest
-from ..conversion.debug import ensure_emitter
+from ..conversion.cache import FragmentCache
 from ..conversion.core import convert_documents, to_template_fragments
+from ..conversion.debug import ensure_emitter
 from ..conversion.renderer import TemplateRenderer
 from ..diagnostics import DiagnosticEmitter
 from ..documents import Document
@@ -171,8 +173,22 @@ class TemplateSession:
         """Return the registered documents as an immutable tuple to discourage in-place edits."""
         return tuple(self._documents)
 
-    def render(self, output_dir: Path, *, embed_fragments: bool = True) -> TemplateRenderResult:
-        """Render the registered documents into a LaTeX project, preparing outputs on disk for compilers."""
+    def render(
+        self,
+        output_dir: Path,
+        *,
+        embed_fragments: bool = True,
+        max_workers: int | None = None,
+        cache: FragmentCache | None = None,
+        bibliography: BibliographyCollection | None = None,
+    ) -> TemplateRenderResult:
+        """Render the registered documents into a LaTeX project, preparing outputs on disk for compilers.
+
+        ``max_workers``, ``cache`` and ``bibliography`` are forwarded to
+        :func:`convert_documents` to convert the documents in parallel, reuse
+        unchanged ones or an already loaded bibliography, before they are
+        assembled into the template.
+        """
         if not self._documents:
             raise ValueError("At least one document must be added before rendering.")
 
@@ -193,6 +209,9 @@ class TemplateSession:
             template_overrides=option_overrides or None,
             wrap_document=False,
             write_fragments=False,
+            max_workers=max_workers,
+            cache=cache,
+            bibliography=bibliography,
         )
         fragments = to_template_fragments(bundle)
 
@@ -1,8 +1,29 @@
-"""Helpers to fetch Noto font files on demand."""
+"""Helpers to fetch Noto font files on demand.
+
+Fonts are fetched on a bounded thread pool (:meth:`NotoFontDownloader.ensure_all`),
+streamed in chunks to a temporary file next to their cache entry and renamed
+into place only once they are complete and verified, so an interrupted or
+truncated download never leaves a corrupt font in the cache.
+
+A mirror (``mirror=``, or the ``TEXSMITH_FONT_MIRROR`` environment variable)
+is tried before the upstream CDNs. It is either a base URL or a local
+directory holding the font files under their own names, such as a copy of the
+font cache; air-gapped builds can point it at a pre-populated directory or a
+local HTTP server. A mirror may ship a ``SHA256SUMS`` file (``sha256sum``
+format), against which every copy of a listed font fetched from that mirror is
+verified. The file is read once, before the fetches start.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import os
 from pathlib import Path
+import threading
+from typing import Any, BinaryIO
 
 from texsmith.core.http import TLSCertificateError, open_url
 from texsmith.fonts.cache import FontCache
@@ -15,6 +36,28 @@ from texsmith.fonts.constants import (
 from texsmith.fonts.logging import FontPipelineLogger
 
 
+MIRROR_ENV = "TEXSMITH_FONT_MIRROR"
+CHECKSUMS_FILENAME = "SHA256SUMS"
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_STYLES = ("regular", "bold")
+
+_CHUNK_SIZE = 1 << 16
+_MIN_FONT_SIZE = 1024
+# sfnt versions of TrueType/OpenType fonts and collections, and WOFF/WOFF2.
+_FONT_SIGNATURES = (b"\x00\x01\x00\x00", b"OTTO", b"true", b"ttcf", b"wOFF", b"wOF2")
+
+
+@dataclass(frozen=True, slots=True)
+class FontRequest:
+    """One Noto family to fetch, in the given styles."""
+
+    font_name: str
+    styles: tuple[str, ...] = DEFAULT_STYLES
+    extension: str = ".otf"
+    dir_base: str | None = None
+
+
 class NotoFontDownloader:
     """Download individual Noto font files into the font cache."""
 
@@ -23,29 +66,125 @@ class NotoFontDownloader:
         *,
         cache: FontCache | None = None,
         logger: FontPipelineLogger | None = None,
+        mirror: str | Path | None = None,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
     ):
         self.cache = cache or FontCache()
         self.logger = logger or FontPipelineLogger()
         self.fonts_dir = self.cache.path("fonts")
+        if mirror is None:
+            mirror = os.environ.get(MIRROR_ENV) or None
+        self.mirror = _normalise_mirror(mirror)
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._file_locks: dict[Path, threading.Lock] = {}
+        self._checksums: dict[str, str] | None = None
 
-    def _download(self, url: str, dest: Path) -> bool:
+    def _download(self, url: str, dest: Path, *, expected_digest: str | None = None) -> bool:
         try:
-            with open_url(url) as response:
-                data = response.read()
+            with open_url(url, timeout=self.timeout) as response:
+                length = response.headers.get("Content-Length")
+                expected = int(length) if length and length.isdigit() else None
+                return self._store(
+                    response, dest, expected_size=expected, expected_digest=expected_digest
+                )
         except TLSCertificateError:
             raise
         except Exception:
             return False
-        if len(data) < 1024:
+
+    def _copy_local(self, source: Path, dest: Path, *, expected_digest: str | None) -> bool:
+        try:
+            with source.open("rb") as handle:
+                return self._store(
+                    handle,
+                    dest,
+                    expected_size=source.stat().st_size,
+                    expected_digest=expected_digest,
+                )
+        except OSError:
             return False
+
+    def _store(
+        self,
+        stream: BinaryIO | Any,
+        dest: Path,
+        *,
+        expected_size: int | None,
+        expected_digest: str | None,
+    ) -> bool:
+        """Stream ``stream`` into ``dest`` atomically, keeping it only if it verifies."""
         dest.parent.mkdir(parents=True, exist_ok=True)
+        staging = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.part")
+        hasher = hashlib.sha256()
+        size = 0
+        head = b""
         try:
-            dest.write_bytes(data)
-        except Exception:
+            with staging.open("wb") as handle:
+                for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b""):
+                    if len(head) < 4:
+                        head += chunk[: 4 - len(head)]
+                    handle.write(chunk)
+                    hasher.update(chunk)
+                    size += len(chunk)
+            problem = _verify(size, head, hasher.hexdigest(), expected_size, expected_digest)
+            if problem is not None:
+                self.logger.debug("Discarding download of %s: %s", dest.name, problem)
+                return False
+            staging.replace(dest)
+        except OSError:
             return False
+        finally:
+            staging.unlink(missing_ok=True)
         return True
 
+    def _mirror_checksums(self) -> dict[str, str]:
+        """Return the checksums published by the mirror, loading them once.
+
+        :meth:`ensure_all` loads them before starting any fetch, so worker
+        threads only read the loaded mapping and never wait on the mirror.
+        """
+        if self._checksums is None:
+            self._checksums = _parse_checksums(self._read_mirror_checksums())
+        return self._checksums
+
+    def _read_mirror_checksums(self) -> str:
+        if isinstance(self.mirror, Path):
+            try:
+                return (self.mirror / CHECKSUMS_FILENAME).read_text(encoding="utf-8")
+            except OSError:
+                return ""
+        if isinstance(self.mirror, str):
+            try:
+                with open_url(
+                    f"{self.mirror}/{CHECKSUMS_FILENAME}", timeout=self.timeout
+                ) as response:
+                    return response.read().decode("utf-8", errors="replace")
+            except TLSCertificateError:
+                raise
+            except Exception:
+                return ""
+        return ""
+
+    def _fetch_from_mirror(self, filename: str, dest: Path) -> bool:
+        expected_digest = self._mirror_checksums().get(filename)
+        if isinstance(self.mirror, Path):
+            source = self.mirror / filename
+            return source.is_file() and self._copy_local(
+                source, dest, expected_digest=expected_digest
+            )
+        if isinstance(self.mirror, str):
+            return self._download(
+                f"{self.mirror}/{filename}", dest, expected_digest=expected_digest
+            )
+        return False
+
     def _download_font_file(self, filename: str, dir_base: str | None, dest: Path) -> bool:
+        if self._fetch_from_mirror(filename, dest):
+            return True
+
         base = filename_base(filename)
         alias = CJK_ALIASES.get(base)
         if alias:
@@ -74,6 +213,54 @@ class NotoFontDownloader:
                 return True
         return dest.exists()
 
+    def _fetch_once(self, filename: str, dir_base: str | None) -> bool | None:
+        """Fetch ``filename`` unless it is cached; ``None`` means it already was.
+
+        Concurrent requests for the same file wait for the first one.
+        """
+        dest = self.fonts_dir / filename
+        with self._lock:
+            file_lock = self._file_locks.setdefault(dest, threading.Lock())
+        with file_lock:
+            if dest.exists():
+                return None
+            return self._download_font_file(filename, dir_base, dest)
+
+    def _ensure_style(self, request: FontRequest, style: str) -> None:
+        suffix = style_suffix(style)
+        filename = f"{request.font_name}-{suffix}{request.extension}"
+        fetched = self._fetch_once(filename, request.dir_base)
+        if fetched is None:
+            return
+        if fetched:
+            self.logger.info("Downloaded font %s", filename)
+            return
+        # Last-resort fallback to plain NotoSans to avoid missing files.
+        if request.font_name != "NotoSans":
+            fallback_filename = f"NotoSans-{suffix}{request.extension}"
+            if self._fetch_once(fallback_filename, "noto-sans"):
+                self.logger.info("Downloaded fallback font %s", fallback_filename)
+
+    def ensure_all(self, requests: Iterable[FontRequest]) -> None:
+        """Fetch the missing styles of every requested family concurrently."""
+        jobs: dict[str, tuple[FontRequest, str]] = {}
+        for request in requests:
+            for style in request.styles or DEFAULT_STYLES:
+                filename = f"{request.font_name}-{style_suffix(style)}{request.extension}"
+                if not (self.fonts_dir / filename).exists():
+                    jobs.setdefault(filename, (request, style))
+        if not jobs:
+            return
+        self._mirror_checksums()
+        workers = min(self.workers, len(jobs))
+        if workers == 1:
+            for request, style in jobs.values():
+                self._ensure_style(request, style)
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="texsmith-fonts") as pool:
+            for _ in pool.map(lambda job: self._ensure_style(*job), jobs.values()):
+                pass
+
     def ensure(
         self,
         *,
@@ -82,24 +269,50 @@ class NotoFontDownloader:
         extension: str,
         dir_base: str | None,
     ) -> None:
-        styles = list(styles or ["regular", "bold"])
-        for style in styles:
-            suffix = style_suffix(style)
-            filename = f"{font_name}-{suffix}{extension}"
-            dest = self.fonts_dir / filename
-            if dest.exists():
-                continue
-            if self._download_font_file(filename, dir_base, dest):
-                self.logger.info("Downloaded font %s", filename)
-                continue
-            # Last-resort fallback to plain NotoSans to avoid missing files.
-            if font_name != "NotoSans":
-                fallback_filename = f"NotoSans-{suffix}{extension}"
-                fallback_dest = self.fonts_dir / fallback_filename
-                if fallback_dest.exists():
-                    continue
-                if self._download_font_file(fallback_filename, "noto-sans", fallback_dest):
-                    self.logger.info("Downloaded fallback font %s", fallback_filename)
-
-
-__all__ = ["NotoFontDownloader"]
+        self.ensure_all(
+            [FontRequest(font_name, tuple(styles or DEFAULT_STYLES), extension, dir_base)]
+        )
+
+
+def _normalise_mirror(mirror: str | Path | None) -> str | Path | None:
+    """Return a mirror as a base URL without trailing slash, or a local directory."""
+    if mirror is None:
+        return None
+    if isinstance(mirror, str):
+        mirror = mirror.strip()
+        if not mirror:
+            return None
+        if mirror.startswith(("http://", "https://")):
+            return mirror.rstrip("/")
+        if mirror.startswith("file://"):
+            mirror = mirror.removeprefix("file://")
+    return Path(mirror).expanduser()
+
+
+def _verify(
+    size: int,
+    head: bytes,
+    digest: str,
+    expected_size: int | None,
+    expected_digest: str | None,
+) -> str | None:
+    """Return why a fetched file must be discarded, or ``None`` if it is sound."""
+    if expected_size is not None and size != expected_size:
+        return f"received {size} of {expected_size} bytes"
+    if size < _MIN_FONT_SIZE or not head.startswith(_FONT_SIGNATURES):
+        return "not a font file"
+    if expected_digest is not None and digest != expected_digest:
+        return f"SHA-256 {digest} does not match {expected_digest}"
+    return None
+
+
+def _parse_checksums(text: str) -> dict[str, str]:
+    checksums: dict[str, str] = {}
+    for line in text.splitlines():
+        parts = line.strip().split(maxsplit=1)
+        if len(parts) == 2 and len(parts[0]) == 64:
+            checksums[Path(parts[1].lstrip("*")).name] = parts[0].lower()
+    return checksums
+
+
+__all__ = ["MIRROR_ENV", "FontRequest", "NotoFontDownloader"]
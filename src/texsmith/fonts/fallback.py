@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
-from bisect import bisect_left
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 import hashlib
+from itertools import pairwise
 import json
-import pickle
+import mmap
+import os
+from pathlib import Path
+import struct
 from typing import Any
 
 from texsmith.fonts.cache import FontCache
-from texsmith.fonts.coverage import NotoCoverage
+from texsmith.fonts.coverage import NotoCoverage, NotoCoverageBuilder
 from texsmith.fonts.logging import FontPipelineLogger
-from texsmith.fonts.ucharclasses import UCharClass
+from texsmith.fonts.ucharclasses import UCharClass, UCharClassesBuilder
+from texsmith.version import get_version
 
 
-CACHE_VERSION = 1
+CACHE_VERSION = 2
 BLOCK_SHIFT = 8  # 256-codepoint buckets
+_BMP_LAST = 0xFFFF
+
+# Binary index layout: header, source key, entries as JSON, then (4-byte
+# aligned) the dense BMP table and the astral ``starts``/``ends``/``positions``
+# arrays as unsigned 32-bit integers, all in native byte order. A file written
+# with the other byte order fails the version check and is rebuilt.
+_INDEX_MAGIC = b"TXFB"
+_INDEX_HEADER = struct.Struct("=4sIIIII")  # magic, version, key, meta, item size, astral
 
 
 def _sanitize_family(name: str) -> str:
@@ -84,12 +99,49 @@ class FallbackEntry:
         }
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> FallbackEntry:
+        return cls(
+            name=payload["name"],
+            start=int(payload["start"]),
+            end=int(payload["end"]),
+            group=payload.get("group"),
+            font=payload.get("font", {}),
+        )
+
 
 _FALLBACK_FAMILY_OVERRIDES = {
     "Arrows": "Noto Sans Symbols",
 }
 
 
+def _first_intervals(
+    ranges: Iterable[tuple[int, int, int]],
+) -> tuple[list[int], list[int], list[int]]:
+    """Flatten overlapping ``(start, end, position)`` ranges into disjoint intervals.
+
+    Each codepoint keeps the lowest position covering it. Returns parallel
+    ``starts``, ``ends`` and ``positions`` lists sorted by start.
+    """
+    ranges = list(ranges)
+    bounds = sorted({start for start, _, _ in ranges} | {end + 1 for _, end, _ in ranges})
+    starts: list[int] = []
+    ends: list[int] = []
+    positions: list[int] = []
+    for low, high in pairwise(bounds):
+        covering = [position for start, end, position in ranges if start <= low <= end]
+        if not covering:
+            continue
+        position = min(covering)
+        if positions and positions[-1] == position and ends[-1] == low - 1:
+            ends[-1] = high - 1
+            continue
+        starts.append(low)
+        ends.append(high - 1)
+        positions.append(position)
+    return starts, ends, positions
+
+
 class FallbackBuilder:
     """Associate ucharclasses with the best matching Noto font."""
 
@@ -237,15 +289,64 @@ class FallbackIndex:
 
     def __init__(self, entries: Iterable[FallbackEntry]) -> None:
         self.entries = tuple(entries)
-        self._buckets: dict[int, list[int]] = {}
-        for idx, entry in enumerate(self.entries):
-            start_block = entry.start >> BLOCK_SHIFT
-            end_block = entry.end >> BLOCK_SHIFT
-            for block in range(start_block, end_block + 1):
-                self._buckets.setdefault(block, []).append(idx)
+        # Bucket and first-entry tables, built on first use (or mapped from a
+        # binary cache file, see ``from_binary``).
+        self._buckets: dict[int, list[int]] | None = None
+        self._bmp: array[int] | memoryview | None = None
+        self._astral: tuple[list[int], list[int], list[int]] = ([], [], [])
+
+    def _ensure_buckets(self) -> dict[int, list[int]]:
+        buckets = self._buckets
+        if buckets is None:
+            buckets = {}
+            for idx, entry in enumerate(self.entries):
+                start_block = entry.start >> BLOCK_SHIFT
+                end_block = entry.end >> BLOCK_SHIFT
+                for block in range(start_block, end_block + 1):
+                    buckets.setdefault(block, []).append(idx)
+            self._buckets = buckets
+        return buckets
+
+    def entry_index(self, codepoint: int) -> int:
+        """Return the position of the first entry covering ``codepoint``, or ``-1``.
+
+        Equivalent to the first hit of :meth:`ranges_for_codepoint`, answered
+        from a dense table over the BMP and a bisected list of disjoint
+        intervals above it, without allocating.
+        """
+        bmp = self._bmp
+        if bmp is None:
+            bmp = self._build_first_tables()
+        if codepoint <= _BMP_LAST:
+            return bmp[codepoint] - 1
+        starts, ends, positions = self._astral
+        slot = bisect_right(starts, codepoint) - 1
+        if slot >= 0 and codepoint <= ends[slot]:
+            return positions[slot]
+        return -1
+
+    def _build_first_tables(self) -> array[int]:
+        # Cells hold position + 1 (0 means uncovered); later entries are written
+        # first so the earliest entry covering a codepoint wins.
+        typecode = "H" if len(self.entries) < 0xFFFF else "I"
+        bmp = array(typecode, [0]) * (_BMP_LAST + 1)
+        astral: list[tuple[int, int, int]] = []
+        for position in range(len(self.entries) - 1, -1, -1):
+            entry = self.entries[position]
+            start, end = max(entry.start, 0), entry.end
+            if start > end:
+                continue
+            if start <= _BMP_LAST:
+                stop = min(end, _BMP_LAST) + 1
+                bmp[start:stop] = array(typecode, [position + 1]) * (stop - start)
+            if end > _BMP_LAST:
+                astral.append((max(start, _BMP_LAST + 1), end, position))
+        self._astral = _first_intervals(astral)
+        self._bmp = bmp
+        return bmp
 
     def ranges_for_codepoint(self, codepoint: int) -> list[FallbackEntry]:
-        bucket = self._buckets.get(codepoint >> BLOCK_SHIFT)
+        bucket = self._ensure_buckets().get(codepoint >> BLOCK_SHIFT)
         if not bucket:
             return []
         hits: list[FallbackEntry] = []
@@ -260,25 +361,80 @@ class FallbackIndex:
             "version": CACHE_VERSION,
             "block_shift": BLOCK_SHIFT,
             "entries": [entry.to_dict() for entry in self.entries],
-            "buckets": self._buckets,
+            "buckets": self._ensure_buckets(),
         }
 
     @classmethod
     def from_serialized(cls, payload: dict) -> FallbackIndex | None:
         if payload.get("version") != CACHE_VERSION or payload.get("block_shift") != BLOCK_SHIFT:
             return None
-        entries = [
-            FallbackEntry(
-                name=entry["name"],
-                start=int(entry["start"]),
-                end=int(entry["end"]),
-                group=entry.get("group"),
-                font=entry.get("font", {}),
+        entries = [FallbackEntry.from_dict(entry) for entry in payload.get("entries", [])]
+        index = cls(entries)
+        index._buckets = {int(k): list(v) for k, v in payload.get("buckets", {}).items()}
+        return index
+
+    def to_binary(self, key: str) -> bytes:
+        """Encode the index, stamped with ``key``, in the binary cache layout."""
+        bmp = self._bmp if self._bmp is not None else self._build_first_tables()
+        starts, ends, positions = self._astral
+        key_bytes = key.encode("utf-8")
+        meta = json.dumps([entry.to_dict() for entry in self.entries], separators=(",", ":"))
+        meta_bytes = meta.encode("utf-8")
+        head = (
+            _INDEX_HEADER.pack(
+                _INDEX_MAGIC,
+                CACHE_VERSION,
+                len(key_bytes),
+                len(meta_bytes),
+                bmp.itemsize,
+                len(starts),
             )
-            for entry in payload.get("entries", [])
-        ]
+            + key_bytes
+            + meta_bytes
+        )
+        astral = array("I", [*starts, *ends, *positions])
+        return b"".join((head, bytes(-len(head) % 4), bytes(bmp), astral.tobytes()))
+
+    @classmethod
+    def from_binary(cls, buffer: Any, expected_key: str | None = None) -> FallbackIndex | None:
+        """Decode an index written by :meth:`to_binary` without copying its tables.
+
+        ``buffer`` is typically a memory-mapped cache file: the dense BMP table
+        is a view into it, so only the entry metadata is parsed. Returns
+        ``None`` when the buffer is not a valid index or is stamped with a key
+        other than ``expected_key``.
+        """
+        view = memoryview(buffer)
+        if len(view) < _INDEX_HEADER.size:
+            return None
+        magic, version, key_size, meta_size, item_size, astral_count = _INDEX_HEADER.unpack_from(
+            view
+        )
+        if magic != _INDEX_MAGIC or version != CACHE_VERSION or item_size not in (2, 4):
+            return None
+        offset = _INDEX_HEADER.size
+        key = bytes(view[offset : offset + key_size])
+        if expected_key is not None and key != expected_key.encode("utf-8"):
+            return None
+        offset += key_size
+        meta = view[offset : offset + meta_size]
+        offset += meta_size
+        offset += -offset % 4
+        bmp_end = offset + (_BMP_LAST + 1) * item_size
+        if len(view) != bmp_end + 3 * astral_count * 4:
+            return None
+        try:
+            entries = [FallbackEntry.from_dict(entry) for entry in json.loads(bytes(meta))]
+        except (ValueError, TypeError, KeyError):
+            return None
         index = cls(entries)
-        index._buckets = {int(k): list(v) for k, v in payload.get("buckets", {}).items()}  # type: ignore[assignment]
+        index._bmp = view[offset:bmp_end].cast("H" if item_size == 2 else "I")
+        astral = view[bmp_end:].cast("I").tolist()
+        index._astral = (
+            astral[:astral_count],
+            astral[astral_count : 2 * astral_count],
+            astral[2 * astral_count :],
+        )
         return index
 
 
@@ -293,38 +449,76 @@ class FallbackRepository:
     ) -> None:
         self.cache = cache or FontCache()
         self.logger = logger or FontPipelineLogger()
-        self.cache_path = self.cache.path("fallback_index.pkl")
+        self.cache_path = self.cache.path("fallback_index.bin")
 
     def _signature(self, entries: list[FallbackEntry]) -> str:
         data = [e.to_dict() for e in entries]
         return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
 
+    def source_paths(self) -> list[Path]:
+        """Return the cached datasets the fallback entries are built from."""
+        return [
+            UCharClassesBuilder(cache=self.cache, logger=self.logger).cache_path,
+            NotoCoverageBuilder(cache=self.cache, logger=self.logger).cache_path,
+        ]
+
+    def source_key(self) -> str | None:
+        """Return a key identifying the current datasets, or ``None`` if one is missing.
+
+        The key hashes the size and modification time of every dataset file
+        together with the index format and TeXSmith versions (the font
+        selection rules live in the code), so checking a cached index costs a
+        few ``stat`` calls rather than rebuilding the entries to hash them.
+        """
+        parts = [str(CACHE_VERSION), get_version()]
+        for path in self.source_paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                return None
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
     def load(self, expected_signature: str | None = None) -> FallbackIndex | None:
-        if not self.cache_path.exists():
-            return None
         try:
-            raw = pickle.loads(self.cache_path.read_bytes())
-        except Exception:
+            with self.cache_path.open("rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing, unreadable or empty cache file.
             return None
-        if raw.get("version") != CACHE_VERSION:
-            return None
-        if expected_signature and raw.get("signature") != expected_signature:
+        index = FallbackIndex.from_binary(mapped, expected_signature)
+        if index is None:
+            # Unmap a stale index now: Windows cannot replace a mapped file,
+            # so keeping it open would stop the rebuilt index from being saved.
+            mapped.close()
+        return index
+
+    def load_current(self) -> FallbackIndex | None:
+        """Return the cached index if the datasets have not changed since it was built."""
+        key = self.source_key()
+        if key is None:
             return None
-        return FallbackIndex.from_serialized(raw.get("index", {}))
+        return self.load(expected_signature=key)
 
     def save(self, index: FallbackIndex, signature: str) -> None:
-        payload = {
-            "version": CACHE_VERSION,
-            "signature": signature,
-            "index": index.serialize(),
-        }
+        # Write aside and rename so concurrent readers never map a partial file.
+        staging = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
         try:
-            self.cache_path.write_bytes(pickle.dumps(payload))
+            staging.write_bytes(index.to_binary(signature))
         except Exception:
+            staging.unlink(missing_ok=True)
             self.logger.warning("Impossible d'écrire le cache des fallbacks.")
+            return
+        try:
+            staging.replace(self.cache_path)
+        except OSError:
+            # Another process still maps the current file (Windows refuses to
+            # replace it): keep that cache and use the rebuilt index in memory.
+            staging.unlink(missing_ok=True)
+            self.logger.warning("Cache des fallbacks en cours d'utilisation : %s", self.cache_path)
 
     def load_or_build(self, entries: list[FallbackEntry]) -> FallbackIndex:
-        signature = self._signature(entries)
+        signature = self.source_key() or self._signature(entries)
         cached = self.load(expected_signature=signature)
         if cached:
             self.logger.notice("Index fallback chargé depuis %s", self.cache_path)
@@ -334,11 +528,145 @@ class FallbackRepository:
         return index
 
 
+def _range_strings(codes: Iterable[int]) -> list[str]:
+    """Return ``U+XXXX`` / ``U+XXXX-U+YYYY`` strings covering ``codes``."""
+    codes = sorted(set(codes))
+    if not codes:
+        return []
+    merged: list[str] = []
+    start = end = codes[0]
+    for value in codes[1:]:
+        if value == end + 1:
+            end = value
+        else:
+            merged.append(f"U+{start:04X}" if start == end else f"U+{start:04X}-U+{end:04X}")
+            start = end = value
+    merged.append(f"U+{start:04X}" if start == end else f"U+{start:04X}-U+{end:04X}")
+    return merged
+
+
+@dataclass(slots=True)
+class _ClassUsage:
+    group: str
+    font: dict
+    fonts: set[str | None]
+    codepoints: Counter[int]
+
+
+class FallbackUsage:
+    """Codepoints met per fallback class, accumulated text by text.
+
+    Each text adds its distinct codepoints to a per-class :class:`Counter`, so
+    the ``count`` of a class is the number of distinct codepoints of each text
+    summed over the texts, as when the per-text summaries are merged with
+    :func:`merge_fallback_summaries`. Ranges are only merged by :meth:`summary`.
+    """
+
+    def __init__(self) -> None:
+        self.classes: dict[str, _ClassUsage] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.classes)
+
+    def add(self, hit: FallbackEntry, codepoint: int) -> None:
+        usage = self.classes.get(hit.name)
+        if usage is None:
+            usage = self.classes[hit.name] = _ClassUsage(
+                group=hit.group or hit.name, font=hit.font, fonts=set(), codepoints=Counter()
+            )
+        usage.fonts.add(hit.font.get("name") if hit.font else None)
+        usage.codepoints[codepoint] += 1
+
+    def update(self, other: FallbackUsage) -> None:
+        """Add the codepoints recorded by ``other``, which is left unchanged."""
+        for name, incoming in other.classes.items():
+            usage = self.classes.get(name)
+            if usage is None:
+                self.classes[name] = _ClassUsage(
+                    group=incoming.group,
+                    font=incoming.font,
+                    fonts=set(incoming.fonts),
+                    codepoints=Counter(incoming.codepoints),
+                )
+                continue
+            usage.fonts |= incoming.fonts
+            usage.codepoints.update(incoming.codepoints)
+
+    def group_counts(self) -> dict[str, int]:
+        """Return the codepoint count of every group."""
+        counts: dict[str, int] = {}
+        for usage in self.classes.values():
+            counts[usage.group] = counts.get(usage.group, 0) + usage.codepoints.total()
+        return counts
+
+    def dominant(self) -> tuple[str, dict] | None:
+        """Return the group and font of the class with the most codepoints.
+
+        Ties go to the first class in name order, as with ``max`` over a
+        :meth:`summary`.
+        """
+        best: _ClassUsage | None = None
+        for name in sorted(self.classes):
+            usage = self.classes[name]
+            if best is None or usage.codepoints.total() > best.codepoints.total():
+                best = usage
+        return None if best is None else (best.group, best.font)
+
+    def summary(self) -> list[dict]:
+        """Return the per-class summary, in the :meth:`FallbackLookup.summary` format."""
+        output = [
+            {
+                "class": name,
+                "group": usage.group,
+                "fonts": sorted(f for f in usage.fonts if f),
+                "font": usage.font,
+                "ranges": _range_strings(usage.codepoints),
+                "count": usage.codepoints.total(),
+            }
+            for name, usage in self.classes.items()
+        ]
+        return sorted(output, key=lambda entry: entry["class"])
+
+
 class FallbackLookup:
     """Lookup helper exposing a get_classes-like summary."""
 
     def __init__(self, index: FallbackIndex) -> None:
         self.index = index
+        # The last text scanned and its usage: the script detector and the
+        # usage recorder both scan the text they are given.
+        self._last_scan: tuple[str, FallbackUsage] | None = None
+
+    def scan(self, text: str) -> FallbackUsage:
+        """Return the fallback classes of the distinct codepoints of ``text``.
+
+        The result of the last call is reused for the same text, so it must be
+        treated as read-only; fold it into an accumulator with
+        :meth:`FallbackUsage.update`.
+        """
+        last = self._last_scan
+        if last is not None and last[0] == text:
+            return last[1]
+        usage = FallbackUsage()
+        ranges_for_codepoint = self.index.ranges_for_codepoint
+        for codepoint in map(ord, set(text)):
+            hits = ranges_for_codepoint(codepoint)
+            if not hits:
+                if codepoint <= 0x7F:
+                    continue
+                hits = [
+                    FallbackEntry(
+                        name="Unknown",
+                        start=codepoint,
+                        end=codepoint,
+                        group=None,
+                        font={},
+                    )
+                ]
+            for hit in hits:
+                usage.add(hit, codepoint)
+        self._last_scan = (text, usage)
+        return usage
 
     def lookup(self, text: str) -> dict[str, dict]:
         classes: dict[str, dict] = {}
@@ -373,38 +701,10 @@ class FallbackLookup:
 
     @staticmethod
     def _merge_ranges(codes: list[int]) -> list[str]:
-        if not codes:
-            return []
-        codes = sorted(set(codes))
-        merged: list[str] = []
-        start = end = codes[0]
-        for value in codes[1:]:
-            if value == end + 1:
-                end = value
-            else:
-                merged.append(f"U+{start:04X}" if start == end else f"U+{start:04X}-U+{end:04X}")
-                start = end = value
-        merged.append(f"U+{start:04X}" if start == end else f"U+{start:04X}-U+{end:04X}")
-        return merged
+        return _range_strings(codes)
 
     def summary(self, text: str) -> list[dict]:
-        raw = self.lookup(text)
-        output: list[dict] = []
-        for cls, data in raw.items():
-            ranges = self._merge_ranges(data["ranges"])
-            count = len(set(data["ranges"]))
-            fonts = sorted(f for f in data["fonts"] if f)
-            output.append(
-                {
-                    "class": cls,
-                    "group": data.get("group", cls),
-                    "fonts": fonts,
-                    "font": data.get("font", {}),
-                    "ranges": ranges,
-                    "count": count,
-                }
-            )
-        return sorted(output, key=lambda entry: entry["class"])
+        return self.scan(text).summary()
 
 
 def merge_fallback_summaries(
@@ -465,5 +765,6 @@ __all__ = [
     "FallbackLookup",
     "FallbackPlan",
     "FallbackRepository",
+    "FallbackUsage",
     "merge_fallback_summaries",
 ]
@@ -8,7 +8,7 @@ import unicodedata
 from bs4 import BeautifulSoup
 from bs4.element import Comment, NavigableString, Tag
 
-from texsmith.fonts.scripts import ScriptDetector
+from texsmith.fonts.scripts import ScriptDetector, default_script_detector
 
 
 _DEFAULT_BLOCK_TAGS = {"p"}
@@ -78,7 +78,7 @@ def wrap_scripts_in_html(
 ) -> tuple[str, list[dict[str, str | None]], list[dict[str, object]]]:
     """Annotate script runs in ``html`` and return the transformed payload."""
     soup = BeautifulSoup(html, "html.parser")
-    detector = ScriptDetector()
+    detector = default_script_detector()
 
     skip_names = {name.lower() for name in _SKIP_TAGS}
     block_names = {name.lower() for name in (block_tags or _DEFAULT_BLOCK_TAGS)}
@@ -88,19 +88,20 @@ class FallbackManager:
         had_cache = repository.cache_path.exists()
 
         cache_key = _cache_key(self.cache)
-        cached_any = repository.load()
-        if cache_key and cache_key in _LOOKUP_CACHE and cached_any is None:
+        if cache_key and cache_key in _LOOKUP_CACHE and not had_cache:
             self._lookup = _LOOKUP_CACHE[cache_key]
             return self._lookup
 
-        classes = generate_ucharclasses_data(cache=self.cache, logger=self.logger)
-        coverage = self._ensure_coverage()
-        announce = not had_cache
-        entries = FallbackBuilder(logger=self.logger).build(classes, coverage, announce=announce)
-        signature = repository._signature(entries)  # noqa: SLF001
-
-        cached = repository.load(expected_signature=signature)
+        # A cache stamped with the current datasets is used as is; the entries
+        # are only rebuilt (and re-hashed) when a dataset is missing or changed.
+        cached = repository.load_current()
         if cached is None:
+            classes = generate_ucharclasses_data(cache=self.cache, logger=self.logger)
+            coverage = self._ensure_coverage()
+            announce = not had_cache
+            entries = FallbackBuilder(logger=self.logger).build(
+                classes, coverage, announce=announce
+            )
             cached = repository.load_or_build(entries)
 
         self._lookup = FallbackLookup(cached)
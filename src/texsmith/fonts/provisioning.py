@@ -23,8 +23,9 @@ from texsmith.core.templates.manifest import TemplateError
 from texsmith.core.user_dir import get_user_dir
 from texsmith.fonts.cache import FontCache
 from texsmith.fonts.constants import style_suffix
-from texsmith.fonts.downloader import NotoFontDownloader
+from texsmith.fonts.downloader import FontRequest, NotoFontDownloader
 from texsmith.fonts.logging import FontPipelineLogger
+from texsmith.fonts.subset import FontSubsetter, parse_ranges, subsetting_available
 
 
 _FAMILY_CHOICES: dict[str, str] = {
@@ -126,6 +127,101 @@ def _resolve_emoji_mode(context: Mapping[str, Any]) -> str:
     return "black"
 
 
+def _resolve_subset_mode(context: Mapping[str, Any]) -> bool:
+    """Return whether fallback fonts should be subset (``fonts.subset``)."""
+    fonts_cfg = context.get("fonts")
+    value = fonts_cfg.get("subset") if isinstance(fonts_cfg, Mapping) else None
+    if value is None:
+        value = context.get("fonts_subset")
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+def _resolve_font_mirror(context: Mapping[str, Any]) -> str | None:
+    """Return the font mirror configured with ``fonts.mirror``, if any."""
+    fonts_cfg = context.get("fonts")
+    value = fonts_cfg.get("mirror") if isinstance(fonts_cfg, Mapping) else None
+    if value is None:
+        value = context.get("fonts_mirror")
+    return str(value) if isinstance(value, (str, Path)) and str(value).strip() else None
+
+
+def _summary_font_requests(summary: Any) -> list[FontRequest]:
+    """Return the Noto families a fallback summary names, for prefetching."""
+    requests: list[FontRequest] = []
+    for entry in summary or []:
+        if not isinstance(entry, Mapping):
+            continue
+        group = entry.get("group") or entry.get("class")
+        font_meta = entry.get("font")
+        if not isinstance(group, str) or group.lower() in _SKIP_GROUPS:
+            continue
+        if not isinstance(font_meta, Mapping) or not isinstance(font_meta.get("name"), str):
+            continue
+        name = font_meta["name"]
+        if "emoji" in name.lower():
+            continue
+        styles = tuple(str(style).lower() for style in font_meta.get("styles", []) if style)
+        ext = font_meta.get("extension")
+        ext = ext if isinstance(ext, str) and ext.startswith(".") else ".otf"
+        dir_base = font_meta.get("dir")
+        requests.append(
+            FontRequest(
+                name,
+                styles or ("regular", "bold"),
+                ext,
+                dir_base if isinstance(dir_base, str) else None,
+            )
+        )
+    return requests
+
+
+def _summary_codepoints(summary: Any) -> set[int] | None:
+    """Return every codepoint a fallback summary records, or ``None`` if unknown."""
+    codepoints: set[int] = set()
+    for entry in summary or []:
+        if not isinstance(entry, Mapping):
+            continue
+        ranges = entry.get("ranges")
+        if not isinstance(ranges, (list, tuple)) or not ranges:
+            return None
+        codepoints |= parse_ranges(ranges)
+    return codepoints or None
+
+
+def _install_fallback_fonts(staged: Mapping[Path, Path], summary: Any | None) -> dict[str, str]:
+    """Copy the staged fallback fonts into the build, subsetting them when asked.
+
+    With a ``summary``, each font is cut down to the codepoints the summary
+    records (fallback fonts also render the spaces, punctuation and marks of
+    the runs they wrap, so every recorded codepoint is kept, not only those of
+    the font's own class). Returns the new file name of each subset font.
+    """
+    renamed: dict[str, str] = {}
+    subsets: dict[Path, Path] = {}
+    codepoints = _summary_codepoints(summary) if summary is not None else None
+    if codepoints is not None and staged:
+        if subsetting_available():
+            destination_root = next(iter(staged)).parent
+            subsets = FontSubsetter(logger=FontPipelineLogger()).install(
+                list(dict.fromkeys(staged.values())), codepoints, destination_root
+            )
+        else:
+            warnings.warn(
+                "Font subsetting requested but fontTools is not installed "
+                '(pip install "texsmith[subset]"); copying the full fallback fonts.',
+                stacklevel=3,
+            )
+    for destination, source in staged.items():
+        subset = subsets.get(source)
+        if subset is not None:
+            renamed[destination.name] = subset.name
+        elif not destination.exists():
+            shutil.copy2(source, destination)
+    return renamed
+
+
 def _normalise_family(raw_value: Any) -> str:
     if isinstance(raw_value, str):
         candidate = raw_value.strip().lower()
@@ -506,9 +602,14 @@ def _prepare_fallback_context(context: Mapping[str, Any], *, output_dir: Path) -
             usage_index[group] = entry
 
     roots = _candidate_font_roots(output_dir)
-    downloader = NotoFontDownloader(cache=FontCache(), logger=FontPipelineLogger())
+    downloader = NotoFontDownloader(
+        cache=FontCache(), logger=FontPipelineLogger(), mirror=_resolve_font_mirror(context)
+    )
     emoji_cache = downloader.cache
     roots.append(downloader.fonts_dir)
+    # Fetch every family the summary names at once; the per-entry ``ensure``
+    # calls below then find them cached.
+    downloader.ensure_all(_summary_font_requests(fallback_summary))
 
     entries_by_slug: dict[str, dict[str, Any]] = {}
     package_options: set[str] = set()
@@ -516,6 +617,9 @@ def _prepare_fallback_context(context: Mapping[str, Any], *, output_dir: Path) -
     lua_regular: set[str] = set()
     lua_bold: set[str] = set()
     missing_commands: set[str] = set()
+    # Font files the entries use, keyed by their place in the build; copied
+    # (or subset) once every entry is resolved.
+    staged: dict[Path, Path] = {}
     package_options.add("Latin")
 
     for entry in fallback_summary or []:
@@ -614,9 +718,7 @@ def _prepare_fallback_context(context: Mapping[str, Any], *, output_dir: Path) -
                 src = downloader.fonts_dir / f"{font_name}-{style_suffix(style)}{ext}"
             if src.exists():
                 sources[style] = src
-                dest = destination_root / src.name
-                if not dest.exists():
-                    shutil.copy2(src, dest)
+                staged.setdefault(destination_root / src.name, src)
 
         upright_file = sources.get("regular") or _find_font_file(font_name, "regular", ext, roots)
         bold_file = (
@@ -686,14 +788,12 @@ def _prepare_fallback_context(context: Mapping[str, Any], *, output_dir: Path) -
             continue
 
         dest_upright = destination_root / upright_file.name
-        if not dest_upright.exists():
-            shutil.copy2(upright_file, dest_upright)
+        staged.setdefault(dest_upright, upright_file)
 
         dest_bold: Path | None = None
         if bold_file is not None:
             dest_bold = destination_root / bold_file.name
-            if not dest_bold.exists():
-                shutil.copy2(bold_file, dest_bold)
+            staged.setdefault(dest_bold, bold_file)
 
         existing = entries_by_slug.get(slug)
         candidate_payload = {
@@ -755,6 +855,19 @@ def _prepare_fallback_context(context: Mapping[str, Any], *, output_dir: Path) -
         else:
             lua_bold.add(f"{entry_ref['upright']}{entry_ref['extension']}")
 
+    installed = _install_fallback_fonts(
+        staged, fallback_summary if _resolve_subset_mode(context) else None
+    )
+    if installed:
+        for entry_ref in entries_by_slug.values():
+            for key in ("upright", "bold"):
+                stem = entry_ref.get(key)
+                if stem:
+                    name = installed.get(f"{stem}{entry_ref['extension']}")
+                    entry_ref[key] = Path(name).stem if name else stem
+        lua_regular = {installed.get(name, name) for name in lua_regular}
+        lua_bold = {installed.get(name, name) for name in lua_bold}
+
     if slug_classes:
         package_options.update(
             cls_name for classes in slug_classes.values() for cls_name in classes
@@ -830,7 +943,9 @@ def _prepare_mono_font(
             "bolditalic": destination_root / "IBMPlexMono-BoldItalic.ttf",
         }
     else:
-        downloader = NotoFontDownloader(cache=FontCache(), logger=FontPipelineLogger())
+        downloader = NotoFontDownloader(
+            cache=FontCache(), logger=FontPipelineLogger(), mirror=_resolve_font_mirror(context)
+        )
         extension = ".otf"
         downloader.ensure(font_name=font_name, styles=styles, extension=extension, dir_base=None)
         destination_root = (output_dir / "fonts").resolve()
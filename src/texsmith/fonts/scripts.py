@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from pathlib import Path
 import re
+import threading
 import unicodedata
 
 from texsmith.adapters.latex.utils import escape_latex_chars
 from texsmith.core.context import RenderContextLike
+from texsmith.core.profiling import timed_phase
 from texsmith.fonts.cache import FontCache
 from texsmith.fonts.fallback import (
     FallbackBuilder,
@@ -17,6 +20,7 @@ from texsmith.fonts.fallback import (
     FallbackLookup,
     FallbackPlan,
     FallbackRepository,
+    FallbackUsage,
     merge_fallback_summaries,
 )
 from texsmith.fonts.logging import FontPipelineLogger
@@ -24,6 +28,11 @@ from texsmith.fonts.pipeline import generate_noto_metadata, generate_ucharclasse
 
 
 _SKIP_GROUPS = {"latin", "common", "punctuation", "other"}
+_CJK_GROUPS = frozenset({"chinese", "japanese", "korean", "cjk"})
+# Runtime key of the fallback usage accumulated during a render.
+_FALLBACK_USAGE_KEY = "_texsmith_fallback_usage"
+# A run of identical segmentation keys (see ``_SegmentKeys``).
+_KEY_RUN = re.compile(r"(.)\1*", re.DOTALL)
 
 # Prefer native math macros for single-letter Greek/hebrew math symbols to avoid
 # relying on \textgreek wrappers when a math glyph already exists.
@@ -106,6 +115,75 @@ def _math_letter_override(chunk: str, group: str | None) -> str | None:
     return f"{prefix}${command}${suffix}"
 
 
+@dataclass(frozen=True, slots=True)
+class _CharClass:
+    """What segmentation needs to know about a character."""
+
+    entry: FallbackEntry | None
+    group: str | None
+    combining: bool
+    space: bool
+    cjk: bool
+    diacritic: bool
+
+
+class _SegmentKeys(dict):
+    """``str.translate`` table mapping codepoints to one-character segmentation keys.
+
+    Characters sharing a key (same fallback entry, combining and whitespace
+    flags) segment identically, so a translated text is segmented one run of
+    equal keys at a time. Keys are assigned on first sight of a codepoint,
+    under a lock: the table belongs to the shared detector, and a key is
+    derived from the number of classes, so two threads must not allocate one
+    concurrently.
+    """
+
+    def __init__(
+        self, index: FallbackIndex, group_name: Callable[[FallbackEntry | None], str | None]
+    ) -> None:
+        super().__init__()
+        self.index = index
+        self.group_name = group_name
+        self.classes: list[_CharClass] = []
+        self._keys: dict[tuple[int, bool, bool], str] = {}
+        self._lock = threading.Lock()
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        position = self.index.entry_index(codepoint)
+        signature = (position, bool(unicodedata.combining(char)), char.isspace())
+        key = self._keys.get(signature)
+        if key is None:
+            key = self._allocate(signature)
+        self[codepoint] = key
+        return key
+
+    def _allocate(self, signature: tuple[int, bool, bool]) -> str:
+        with self._lock:
+            key = self._keys.get(signature)
+            if key is not None:
+                return key
+            position = signature[0]
+            entry = self.index.entries[position] if position >= 0 else None
+            group = self.group_name(entry)
+            lowered = group.lower() if group else ""
+            key = chr(len(self.classes))
+            # Publish the class before the key, so a key seen by another
+            # thread always has its class in place.
+            self.classes.append(
+                _CharClass(
+                    entry=entry,
+                    group=group,
+                    combining=signature[1],
+                    space=signature[2],
+                    cjk=lowered in _CJK_GROUPS,
+                    diacritic=lowered == "diacritics",
+                )
+            )
+            self._keys[signature] = key
+            return key
+
+
 @dataclass(slots=True)
 class ScriptSpec:
     group: str
@@ -140,24 +218,29 @@ class ScriptDetector:
         self.logger = logger or FontPipelineLogger()
         self.skip_groups = {entry.lower() for entry in (skip_groups or _SKIP_GROUPS)}
         self._lookup: FallbackLookup | None = None
+        # The index file the lookup came from and its ``(mtime_ns, size)``;
+        # both stay ``None`` when the index could not be loaded.
+        self._index_path: Path | None = None
+        self._index_stamp: tuple[int, int] | None = None
+        self._segment_keys: _SegmentKeys | None = None
         self._specs: dict[str, ScriptSpec] = {}
 
     def _ensure_lookup(self) -> FallbackLookup:
         if self._lookup is None:
             try:
                 repository = FallbackRepository(cache=self.cache, logger=self.logger)
-                had_cache = repository.cache_path.exists()
-                classes = generate_ucharclasses_data(cache=self.cache, logger=self.logger)
-                coverage = generate_noto_metadata(cache=self.cache, logger=self.logger)
-                announce = not had_cache
-                entries = FallbackBuilder(logger=self.logger).build(
-                    classes, coverage, announce=announce
-                )
-                signature = repository._signature(entries)  # noqa: SLF001
-                cached = repository.load(expected_signature=signature)
+                cached = repository.load_current()
                 if cached is None:
+                    announce = not repository.cache_path.exists()
+                    classes = generate_ucharclasses_data(cache=self.cache, logger=self.logger)
+                    coverage = generate_noto_metadata(cache=self.cache, logger=self.logger)
+                    entries = FallbackBuilder(logger=self.logger).build(
+                        classes, coverage, announce=announce
+                    )
                     cached = repository.load_or_build(entries)
                 self._lookup = FallbackLookup(cached)
+                self._index_path = repository.cache_path
+                self._index_stamp = _file_stamp(self._index_path)
             except Exception as exc:
                 # Building the fallback index needs the Noto/ucharclasses metadata,
                 # which is downloaded on a cold cache. If that fails (e.g. offline),
@@ -170,12 +253,30 @@ class ScriptDetector:
                 self._lookup = FallbackLookup(FallbackIndex([]))
         return self._lookup
 
+    def is_stale(self) -> bool:
+        """Return whether the loaded fallback index should be loaded again.
+
+        That is the case when loading it failed (the empty fallback index is
+        only a stand-in) or when the cached index file changed since it was
+        read.
+        """
+        if self._lookup is None:
+            return False
+        if self._index_path is None or self._index_stamp is None:
+            return True
+        return _file_stamp(self._index_path) != self._index_stamp
+
     def _classify_char(self, char: str) -> FallbackEntry | None:
-        lookup = self._ensure_lookup()
-        candidates = lookup.index.ranges_for_codepoint(ord(char))
-        if not candidates:
-            return None
-        return candidates[0]
+        index = self._ensure_lookup().index
+        position = index.entry_index(ord(char))
+        return index.entries[position] if position >= 0 else None
+
+    def _ensure_segment_keys(self) -> _SegmentKeys:
+        index = self._ensure_lookup().index
+        keys = self._segment_keys
+        if keys is None or keys.index is not index:
+            keys = self._segment_keys = _SegmentKeys(index, self._group_name)
+        return keys
 
     def _group_name(self, entry: FallbackEntry | None) -> str | None:
         if entry is None:
@@ -193,29 +294,29 @@ class ScriptDetector:
         *,
         include_whitespace: bool,
     ) -> list[tuple[str | None, str, FallbackEntry | None]]:
-        override_group = self._resolve_cjk_override(text)
+        table = self._ensure_segment_keys()
+        keys = text.translate(table)
+        classes = table.classes
+        override_group = None
+        if any(classes[ord(key)].cjk for key in set(keys)):
+            override_group = self._resolve_cjk_override(text)
         runs: list[tuple[str | None, str, FallbackEntry | None]] = []
         current_group: str | None = None
         current_entry: FallbackEntry | None = None
         buffer: list[str] = []
 
-        for char in text:
-            entry = self._classify_char(char)
-            group = self._group_name(entry)
-            if (
-                override_group
-                and group
-                and group.lower() in {"chinese", "japanese", "korean", "cjk"}
-            ):
+        # Every character of a run of equal keys takes the same decision as
+        # the first one, so the run is classified once and copied whole.
+        for match in _KEY_RUN.finditer(keys):
+            char_class = classes[ord(match.group(1))]
+            entry = char_class.entry
+            group = char_class.group
+            if override_group and char_class.cjk:
                 group = override_group
-                entry = entry
-            combining = bool(unicodedata.combining(char))
-            if current_group is not None and (
-                combining or (group and group.lower() == "diacritics")
-            ):
+            if current_group is not None and (char_class.combining or char_class.diacritic):
                 group = current_group
                 entry = current_entry
-            if include_whitespace and char.isspace() and current_group is not None:
+            if include_whitespace and char_class.space and current_group is not None:
                 group = current_group
                 entry = current_entry
 
@@ -223,7 +324,7 @@ class ScriptDetector:
                 runs.append((current_group, "".join(buffer), current_entry))
                 buffer.clear()
 
-            buffer.append(char)
+            buffer.append(text[match.start() : match.end()])
             current_group = group
             current_entry = entry if group else None
 
@@ -234,18 +335,14 @@ class ScriptDetector:
 
     def _resolve_cjk_override(self, text: str) -> str | None:
         try:
-            summary = self._ensure_lookup().summary(text)
+            group_counts = self._ensure_lookup().scan(text).group_counts()
         except Exception:
             return None
 
         counts: dict[str, int] = {}
-        for entry in summary:
-            group = entry.get("group")
-            count = entry.get("count")
-            if not isinstance(group, str) or not isinstance(count, int):
-                continue
+        for group, count in group_counts.items():
             lowered = group.lower()
-            if lowered in {"chinese", "japanese", "korean", "cjk"}:
+            if lowered in _CJK_GROUPS:
                 counts[lowered] = counts.get(lowered, 0) + count
 
         if not counts:
@@ -313,6 +410,35 @@ class ScriptDetector:
         return "".join(rendered), usages
 
 
+_DEFAULT_DETECTORS: dict[Path, ScriptDetector] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def default_script_detector() -> ScriptDetector:
+    """Return the process-wide detector bound to the current font cache root.
+
+    Loading the fallback index is the expensive part of script detection, so
+    every document rendered by this process shares one detector instead of
+    reloading the index for each of them. A detector whose index failed to
+    load, or whose ``fallback_index.bin`` changed on disk, is replaced, so a
+    long-running process (``--watch``, ``--serve``) recovers from a transient
+    failure.
+    """
+    cache = FontCache()
+    detector = _DEFAULT_DETECTORS.get(cache.root)
+    if detector is None or detector.is_stale():
+        detector = ScriptDetector(cache=cache)
+        _DEFAULT_DETECTORS[cache.root] = detector
+    return detector
+
+
 def fallback_summary_to_usage(
     summary: Sequence[Mapping[str, object]],
 ) -> list[dict[str, str | None]]:
@@ -413,22 +539,22 @@ def record_script_usage_for_slug(
         detector_key = "_texsmith_script_detector"
         detector = context.runtime.get(detector_key)
         if not isinstance(detector, ScriptDetector):
-            detector = ScriptDetector(cache=FontCache())
+            detector = default_script_detector()
             context.runtime[detector_key] = detector
 
     group = slug
     font_name = None
     try:
-        summary = detector._ensure_lookup().summary(text)  # noqa: SLF001
+        with timed_phase(context.runtime.get("emitter"), "fonts.fallback_scan"):
+            scanned = detector._ensure_lookup().scan(text)  # noqa: SLF001
     except Exception:
-        summary = []
+        scanned = None
 
-    if summary:
-        dominant = max(summary, key=lambda entry: entry.get("count", 0) or 0)
-        candidate_group = dominant.get("group") or dominant.get("class")
-        if isinstance(candidate_group, str) and candidate_group.strip():
+    dominant = scanned.dominant() if scanned else None
+    if dominant is not None:
+        candidate_group, font_meta = dominant
+        if candidate_group.strip():
             group = candidate_group
-        font_meta = dominant.get("font")
         if isinstance(font_meta, Mapping):
             raw_name = font_meta.get("name")
             if isinstance(raw_name, str):
@@ -444,9 +570,8 @@ def record_script_usage_for_slug(
     }
     state_usage = getattr(context.state, "script_usage", [])
     context.state.script_usage = merge_script_usage(state_usage, [usage_entry])
-    if summary:
-        existing = getattr(context.state, "fallback_summary", [])
-        context.state.fallback_summary = merge_fallback_summaries(existing, summary)
+    if scanned:
+        _pending_fallback_usage(context).update(scanned)
     return usage_entry
 
 
@@ -465,28 +590,53 @@ def render_moving_text(
     detector_key = "_texsmith_script_detector"
     detector = context.runtime.get(detector_key)
     if not isinstance(detector, ScriptDetector):
-        detector = ScriptDetector(cache=FontCache())
+        detector = default_script_detector()
         context.runtime[detector_key] = detector
-    rendered, usage = detector.render(
-        text,
-        include_whitespace=include_whitespace,
-        legacy_accents=bool(legacy_accents)
-        if legacy_accents is not None
-        else getattr(context.config, "legacy_latex_accents", False),
-        escape=escape,
-        wrap_scripts=wrap_scripts,
-    )
+    emitter = context.runtime.get("emitter")
+    with timed_phase(emitter, "fonts.scripts"):
+        rendered, usage = detector.render(
+            text,
+            include_whitespace=include_whitespace,
+            legacy_accents=bool(legacy_accents)
+            if legacy_accents is not None
+            else getattr(context.config, "legacy_latex_accents", False),
+            escape=escape,
+            wrap_scripts=wrap_scripts,
+        )
     state_usage = getattr(context.state, "script_usage", [])
     context.state.script_usage = merge_script_usage(state_usage, usage)
     try:
-        summary = detector._ensure_lookup().summary(text)  # noqa: SLF001
-        existing = getattr(context.state, "fallback_summary", [])
-        context.state.fallback_summary = merge_fallback_summaries(existing, summary)
+        with timed_phase(emitter, "fonts.fallback_scan"):
+            scanned = detector._ensure_lookup().scan(text)  # noqa: SLF001
+        _pending_fallback_usage(context).update(scanned)
     except Exception:
         pass
     return rendered
 
 
+def _pending_fallback_usage(context: RenderContextLike) -> FallbackUsage:
+    usage = context.runtime.get(_FALLBACK_USAGE_KEY)
+    if not isinstance(usage, FallbackUsage):
+        usage = FallbackUsage()
+        context.runtime[_FALLBACK_USAGE_KEY] = usage
+    return usage
+
+
+def flush_fallback_usage(context: RenderContextLike) -> None:
+    """Merge the fallback usage recorded during a render into ``context.state``.
+
+    :func:`render_moving_text` and :func:`record_script_usage_for_slug` only
+    add the codepoints of each text to a per-render accumulator; its summary
+    is merged into ``fallback_summary`` once, when the render ends, instead of
+    re-merging the growing summary after every text.
+    """
+    usage = context.runtime.pop(_FALLBACK_USAGE_KEY, None)
+    if not isinstance(usage, FallbackUsage) or not usage:
+        return
+    existing = getattr(context.state, "fallback_summary", [])
+    context.state.fallback_summary = merge_fallback_summaries(existing, usage.summary())
+
+
 def render_script_macros(usages: Iterable[Mapping[str, str | None]]) -> str:
     """Render LaTeX macros declaring script-specific font commands."""
     from texsmith.adapters.latex.formatter import LaTeXFormatter
@@ -0,0 +1,175 @@
+"""Subset fallback fonts to the codepoints a build actually uses.
+
+Fallback families are whole Noto files (a CJK OTF weighs 15 MB or more) while
+a document usually needs a few hundred of their glyphs. :class:`FontSubsetter`
+cuts a font down to a codepoint set with fontTools, keeping the OpenType
+layout tables so shaped scripts still get their ligatures and contextual
+forms, and keeps the result in the font cache keyed by the font content and
+the codepoint set, so rebuilding an unchanged document reuses it.
+
+fontTools is optional (``pip install "texsmith[subset]"``); without it the
+fallback fonts are copied whole.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from functools import cache
+import hashlib
+from importlib.util import find_spec
+import os
+from pathlib import Path
+import re
+import shutil
+
+from texsmith.fonts.cache import FontCache
+from texsmith.fonts.logging import FontPipelineLogger
+
+
+# Always kept: a wrapped run carries spaces and ASCII punctuation into the
+# fallback font.
+BASE_CODEPOINTS = frozenset([*range(0x20, 0x7F), 0xA0])
+
+_RANGE = re.compile(r"U\+([0-9A-Fa-f]{1,6})(?:\s*-\s*U\+([0-9A-Fa-f]{1,6}))?")
+
+
+@cache
+def subsetting_available() -> bool:
+    """Return whether fontTools is installed."""
+    return find_spec("fontTools") is not None
+
+
+def parse_ranges(ranges: Iterable[str]) -> set[int]:
+    """Expand ``U+XXXX`` / ``U+XXXX-U+YYYY`` strings from a fallback summary."""
+    codepoints: set[int] = set()
+    for item in ranges:
+        match = _RANGE.fullmatch(str(item).strip())
+        if match is None:
+            continue
+        start = int(match.group(1), 16)
+        end = int(match.group(2), 16) if match.group(2) else start
+        codepoints.update(range(start, end + 1))
+    return codepoints
+
+
+def codepoints_key(codepoints: Iterable[int]) -> str:
+    """Return a stable digest of a codepoint set."""
+    payload = ",".join(f"{codepoint:x}" for codepoint in sorted(set(codepoints)))
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
+class FontSubsetter:
+    """Produce cached subsets of font files."""
+
+    def __init__(
+        self,
+        *,
+        cache: FontCache | None = None,
+        logger: FontPipelineLogger | None = None,
+    ) -> None:
+        self.cache = cache or FontCache()
+        self.logger = logger or FontPipelineLogger()
+        self._digests: dict[tuple[Path, int, int], str] = {}
+
+    def _font_digest(self, font: Path) -> str:
+        stat = font.stat()
+        key = (font.resolve(), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with font.open("rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    hasher.update(block)
+            digest = self._digests[key] = hasher.hexdigest()
+        return digest
+
+    def subset_path(self, font: Path, codepoints: Iterable[int]) -> Path:
+        """Return the cache path of the subset of ``font`` to ``codepoints``."""
+        name = f"{font.stem}-{self._font_digest(font)[:10]}-{codepoints_key(codepoints)[:10]}"
+        return self.cache.path("subsets", f"{name}{font.suffix}")
+
+    def subset(self, font: Path, codepoints: Iterable[int]) -> Path | None:
+        """Return a subset of ``font`` covering ``codepoints``, building it if needed.
+
+        Returns ``None`` when fontTools is missing or cannot subset the font;
+        the caller then uses the whole font.
+        """
+        if not subsetting_available():
+            return None
+        codepoints = set(codepoints) | BASE_CODEPOINTS
+        try:
+            target = self.subset_path(font, codepoints)
+        except OSError:
+            return None
+        if target.exists():
+            return target
+        staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            _write_subset(font, codepoints, staging)
+            staging.replace(target)
+        except Exception as exc:
+            staging.unlink(missing_ok=True)
+            self.logger.warning("Unable to subset font %s (%s); using the full font.", font, exc)
+            return None
+        self.logger.debug(
+            "Subset %s to %d codepoints (%d -> %d bytes)",
+            font.name,
+            len(codepoints),
+            font.stat().st_size,
+            target.stat().st_size,
+        )
+        return target
+
+    def install(
+        self, fonts: Sequence[Path], codepoints: Iterable[int], destination: Path
+    ) -> dict[Path, Path]:
+        """Copy the subsets of ``fonts`` into ``destination``.
+
+        Returns the installed file of each font that could be subset; the
+        others are left for the caller to copy.
+        """
+        codepoints = set(codepoints)
+        installed: dict[Path, Path] = {}
+        for font in fonts:
+            subset = self.subset(font, codepoints)
+            if subset is None:
+                continue
+            target = destination / subset.name
+            if not target.exists():
+                destination.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(subset, target)
+            installed[font] = target
+        return installed
+
+
+def _write_subset(font: Path, codepoints: set[int], target: Path) -> None:
+    from fontTools import subset as ft_subset
+
+    options = ft_subset.Options()
+    # Keep every layout feature (shaping of Arabic, Indic… scripts reaches
+    # glyphs through GSUB rather than the cmap) and every name record, which
+    # fontspec and luaotfload use to identify the font.
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.name_languages = ["*"]
+    options.name_legacy = True
+    options.notdef_outline = True
+    options.glyph_names = True
+    options.legacy_kern = True
+    subsetter = ft_subset.Subsetter(options=options)
+    ttfont = ft_subset.load_font(str(font), options)
+    try:
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(ttfont)
+        ft_subset.save_font(ttfont, str(target), options)
+    finally:
+        ttfont.close()
+
+
+__all__ = [
+    "BASE_CODEPOINTS",
+    "FontSubsetter",
+    "codepoints_key",
+    "parse_ranges",
+    "subsetting_available",
+]
@@ -60,7 +60,9 @@ class UCharClassesBuilder:
         self.source_url = source_url
         self.extra_sources = extra_sources or []
 
-    def _cached_sty_path(self) -> Path:
+    @property
+    def cache_path(self) -> Path:
+        """Return the path to the cached ucharclasses.sty."""
         return self.cache.path("ucharclasses", "ucharclasses.sty")
 
     def _download_zip(self, target: Path) -> Path:
@@ -80,7 +82,7 @@ class UCharClassesBuilder:
         raise FileNotFoundError("ucharclasses.sty not found in downloaded archive.")
 
     def _ensure_sty(self) -> Path:
-        cached = self._cached_sty_path()
+        cached = self.cache_path
         candidates = [
             cached,
             *self.extra_sources,
@@ -141,7 +143,7 @@ class UCharClassesBuilder:
 
     def build(self) -> list[UCharClass]:
         """Return parsed ucharclasses definitions, downloading assets if needed."""
-        had_cached_sty = self._cached_sty_path().exists()
+        had_cached_sty = self.cache_path.exists()
         sty_path = self._ensure_sty()
         raw = sty_path.read_text(encoding="utf-8")
         seen: dict[str, UCharClass] = {}
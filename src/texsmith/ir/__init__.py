@@ -56,7 +56,9 @@ from texsmith.ir.nodes import (
     Superscript,
     Table,
     TexLogo,
+    TextRun,
     Underline,
+    tokenize_text,
 )
 from texsmith.ir.visitor import (
     NodeVisitor,
@@ -116,9 +118,11 @@ __all__ = [
     "Superscript",
     "Table",
     "TexLogo",
+    "TextRun",
     "Underline",
     "children",
     "iter_child_fields",
     "map_tree",
+    "tokenize_text",
     "walk",
 ]
@@ -22,7 +22,9 @@ Design rules (non-negotiable):
 * **Immutable, structural equality.** Every node is a ``frozen``, ``slots``
   dataclass. Sequences of children are stored as ``tuple`` so nodes are
   hashable and compare by value. This makes ``walk`` / ``map`` and golden
-  comparisons reliable.
+  comparisons reliable. The field-less separators (:class:`Space`,
+  :class:`SoftBreak`, :class:`LineBreak`) are singletons, and long prose may be
+  packed into one :class:`TextRun` instead of a ``Str`` / ``Space`` sequence.
 
 ------------------------------------------------------------------------------
 Typed node vs. generic ``Div`` / ``Span``
@@ -91,7 +93,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, TypeVar
 
 
 if TYPE_CHECKING:
@@ -147,7 +150,9 @@ __all__ = [
     "Superscript",
     "Table",
     "TexLogo",
+    "TextRun",
     "Underline",
+    "tokenize_text",
 ]
 
 
@@ -207,17 +212,43 @@ class Str(Inline):
 
 @dataclass(frozen=True, slots=True)
 class Space(Inline):
-    """Inter-word space."""
+    """Inter-word space. A singleton: every ``Space()`` is the same object."""
+
+    def __new__(cls) -> Space:
+        return _singleton(cls)
 
 
 @dataclass(frozen=True, slots=True)
 class SoftBreak(Inline):
-    """A source line break that does not force a line break in output."""
+    """A source line break that does not force a line break in output (singleton)."""
+
+    def __new__(cls) -> SoftBreak:
+        return _singleton(cls)
 
 
 @dataclass(frozen=True, slots=True)
 class LineBreak(Inline):
-    """A hard line break (``<br>``)."""
+    """A hard line break (``<br>``) (singleton)."""
+
+    def __new__(cls) -> LineBreak:
+        return _singleton(cls)
+
+
+@dataclass(frozen=True, slots=True)
+class TextRun(Inline):
+    """Packed prose: words and the whitespace between them in one string.
+
+    Stands for the ``Str`` / ``Space`` sequence :meth:`expand` returns (see
+    :func:`tokenize_text`), at the cost of one object instead of one per word
+    and separator. Readers emit it only when asked for compact text; writers
+    expand it where they need per-token nodes.
+    """
+
+    text: str
+
+    def expand(self) -> list[Inline]:
+        """Return the ``Str`` / ``Space`` tokens this run stands for."""
+        return tokenize_text(self.text)
 
 
 @dataclass(frozen=True, slots=True)
@@ -651,3 +682,49 @@ class Document(Block):
 
 # Public union used by the visitor / type guards. ``Document`` is a Block.
 AnyNode = Block | Inline | DefinitionItem
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_N = TypeVar("_N", bound=Node)
+_SINGLETONS: dict[type[Node], Node] = {}
+
+# Python's ``\s`` matches exactly the characters ``str.isspace`` accepts.
+_WHITESPACE_RUN = re.compile(r"(\s+)")
+
+
+def _singleton(cls: type[_N]) -> _N:
+    instance = _SINGLETONS.get(cls)
+    if instance is None:
+        instance = _SINGLETONS[cls] = object.__new__(cls)
+    return instance  # type: ignore[return-value]
+
+
+def tokenize_text(text: str) -> list[Inline]:
+    """Tokenise prose into ``Str`` runs and ``Space`` / whitespace separators.
+
+    The legacy ``soup.get_text()`` preserved source whitespace verbatim. A
+    whitespace run containing a newline (soft line wrap + any continuation
+    indentation) or longer than one character is kept literally in a ``Str``
+    (the writers leave whitespace unescaped); a single inter-word space
+    collapses to a ``Space``. Paragraph edge-stripping treats a
+    whitespace-only ``Str`` like a ``Space``.
+    """
+    if not text:
+        return []
+    # ``split`` with a capturing group alternates words (even indices, empty at
+    # the edges) and whitespace runs (odd indices).
+    out: list[Inline] = []
+    append = out.append
+    space = Space()
+    for index, part in enumerate(_WHITESPACE_RUN.split(text)):
+        if index % 2 == 0:
+            if part:
+                append(Str(part))
+        elif len(part) == 1 and part != "\n":
+            append(space)
+        else:
+            append(Str(part))
+    return out
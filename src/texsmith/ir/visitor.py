@@ -18,13 +18,21 @@ Child discovery is structural: any dataclass field whose value is a
 child slot. Scalar fields (text, enums, the embedded tables model, …) are left
 alone. This means new node types need no visitor changes as long as they store
 children in node/tuple fields.
+
+The candidate child fields of each node class are computed once: fields whose
+annotation names only scalar types (``str``, ``tuple[int, ...]``, the enums, the
+tables model, …) are never inspected. :func:`walk` and :func:`map_tree` keep an
+explicit stack, so arbitrarily deep trees (nested lists, block quotes) do not
+hit the interpreter's recursion limit.
 """
 
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 from dataclasses import fields, is_dataclass, replace
+import re
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from texsmith.ir.nodes import Node
 
@@ -32,6 +40,45 @@ from texsmith.ir.nodes import Node
 __all__ = ["NodeVisitor", "children", "iter_child_fields", "map_tree", "walk"]
 
 
+# Names that may appear in the annotation of a field which never holds nodes.
+_SCALAR_NAMES = frozenset(
+    {
+        "str",
+        "int",
+        "float",
+        "bool",
+        "bytes",
+        "None",
+        "tuple",
+        "ListStyle",
+        "MarginSide",
+        "TableModel",
+    }
+)
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CHILD_SLOTS: dict[type, tuple[str, ...]] = {}
+
+
+def _child_slots(cls: type) -> tuple[str, ...]:
+    """Return the names of the fields of ``cls`` that may hold child nodes."""
+    slots = _CHILD_SLOTS.get(cls)
+    if slots is None:
+        slots = _CHILD_SLOTS[cls] = tuple(
+            f.name
+            for f in (fields(cls) if is_dataclass(cls) else ())
+            if not _is_scalar_annotation(f.type)
+        )
+    return slots
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    if not isinstance(annotation, str):
+        # Unevaluated annotations are the norm (``from __future__ import
+        # annotations``); an evaluated one is inspected at visit time.
+        return False
+    return all(name in _SCALAR_NAMES for name in _IDENTIFIER.findall(annotation))
+
+
 def _is_node_container(value: Any) -> bool:
     """True if ``value`` is a node, or a (possibly nested) tuple of nodes."""
     if isinstance(value, Node):
@@ -48,63 +95,83 @@ def iter_child_fields(node: Node) -> Iterator[tuple[str, Any]]:
     scalar fields and non-node objects (e.g. the embedded tables model) are
     skipped.
     """
-    if not is_dataclass(node):  # pragma: no cover - defensive
-        return
-    for f in fields(node):
-        value = getattr(node, f.name)
+    for name in _child_slots(type(node)):
+        value = getattr(node, name)
         if _is_node_container(value):
-            yield f.name, value
+            yield name, value
 
 
-def _iter_nodes(value: Any) -> Iterator[Node]:
-    """Flatten a node / nested-tuple-of-nodes into the nodes it contains."""
+def _collect_nodes(value: Any, out: list[Node]) -> None:
+    """Append the nodes of a node / nested-tuple-of-nodes to ``out``."""
     if isinstance(value, Node):
-        yield value
+        out.append(value)
     elif isinstance(value, tuple):
         for item in value:
-            yield from _iter_nodes(item)
+            _collect_nodes(item, out)
 
 
 def children(node: Node) -> tuple[Node, ...]:
     """Return the direct child nodes of ``node`` in declaration order."""
     result: list[Node] = []
-    for _name, value in iter_child_fields(node):
-        result.extend(_iter_nodes(value))
+    for name in _child_slots(type(node)):
+        _collect_nodes(getattr(node, name), result)
     return tuple(result)
 
 
 def walk(node: Node) -> Iterator[Node]:
     """Yield ``node`` then every descendant, pre-order (depth-first)."""
-    yield node
-    for child in children(node):
-        yield from walk(child)
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        descendants = children(current)
+        if descendants:
+            stack.extend(reversed(descendants))
 
 
-def _map_value(value: Any, fn: Callable[[Node], Node]) -> Any:
-    """Recursively rebuild a field value, mapping any nodes it contains."""
+def _refill(value: Any, mapped: Iterator[Node]) -> Any:
+    """Rebuild a field value, taking its nodes in order from ``mapped``."""
     if isinstance(value, Node):
-        return _map_node(value, fn)
+        return next(mapped)
     if isinstance(value, tuple):
-        return tuple(_map_value(item, fn) for item in value)
+        return tuple(_refill(item, mapped) for item in value)
     return value
 
 
-def _map_node(node: Node, fn: Callable[[Node], Node]) -> Node:
-    """Map children bottom-up, then apply ``fn`` to the rebuilt node."""
-    changes: dict[str, Any] = {}
-    for name, value in iter_child_fields(node):
-        changes[name] = _map_value(value, fn)
-    rebuilt = replace(node, **changes) if changes else node
-    return fn(rebuilt)
-
-
 def map_tree(node: Node, fn: Callable[[Node], Node]) -> Node:
     """Return a new tree with ``fn`` applied to every node, bottom-up.
 
     Children are transformed before their parent, so ``fn`` sees already-mapped
-    descendants. Frozen nodes are never mutated; unchanged subtrees are reused.
+    descendants. Frozen nodes are never mutated; a node whose children all map
+    to themselves is reused rather than rebuilt.
     """
-    return _map_node(node, fn)
+    results: list[Node] = []
+    # ``None`` marks a node whose children are still to be mapped; once they
+    # are, the node is queued again with its children.
+    stack: list[tuple[Node, tuple[Node, ...] | None]] = [(node, None)]
+    while stack:
+        current, pending = stack.pop()
+        if pending is None:
+            descendants = children(current)
+            stack.append((current, descendants))
+            stack.extend((child, None) for child in reversed(descendants))
+            continue
+        rebuilt = current
+        if pending:
+            mapped = results[len(results) - len(pending) :]
+            del results[len(results) - len(pending) :]
+            if any(new is not old for new, old in zip(mapped, pending, strict=True)):
+                source = iter(mapped)
+                changes = {
+                    name: _refill(getattr(current, name), source)
+                    for name in _child_slots(type(current))
+                }
+                rebuilt = replace(current, **changes)
+        results.append(fn(rebuilt))
+    return results[0]
+
+
+_DISPATCH: WeakKeyDictionary[type, dict[type, Callable[[Any, Any], Any]]] = WeakKeyDictionary()
 
 
 class NodeVisitor:
@@ -114,19 +181,31 @@ class NodeVisitor:
     handle. :meth:`visit` resolves the method by walking the node's MRO, so a
     ``visit_Block`` / ``visit_Inline`` handler catches whole families. Anything
     unmatched reaches :meth:`generic_visit`, which by default visits children
-    and returns ``None``.
+    and returns ``None``. The resolution is made once per visitor class and
+    node type.
     """
 
     def visit(self, node: Node) -> Any:
         """Dispatch to the most specific ``visit_<ClassName>`` for ``node``."""
-        for klass in type(node).__mro__:
-            method = getattr(self, f"visit_{klass.__name__}", None)
-            if method is not None:
-                return method(node)
-        return self.generic_visit(node)
+        visitor_class = type(self)
+        table = _DISPATCH.get(visitor_class)
+        if table is None:
+            table = _DISPATCH[visitor_class] = {}
+        method = table.get(type(node))
+        if method is None:
+            method = table[type(node)] = _resolve_visit(visitor_class, type(node))
+        return method(self, node)
 
     def generic_visit(self, node: Node) -> Any:
         """Default: visit each child. Override to customise the fallback."""
         for child in children(node):
             self.visit(child)
         return None
+
+
+def _resolve_visit(visitor_class: type, node_class: type) -> Callable[[Any, Any], Any]:
+    for klass in node_class.__mro__:
+        method = getattr(visitor_class, f"visit_{klass.__name__}", None)
+        if method is not None:
+            return method
+    return visitor_class.generic_visit  # type: ignore[attr-defined, no-any-return]
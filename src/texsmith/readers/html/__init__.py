@@ -5,7 +5,9 @@ Public surface:
 * :class:`HtmlReader` — ``read(html: str) -> ir.Document`` (or ``read_tree``);
 * :func:`reads` / :class:`ReaderRegistry` / :class:`ReadLevel` — the extensible
   lowering registry;
-* :class:`ReadContext` — threaded through every lowering.
+* :class:`ReadContext` — threaded through every lowering;
+* :mod:`.backends` — parser backends (BeautifulSoup builders, optional lxml
+  fast paths).
 
 The reader produces a pure, backend-agnostic IR tree and never emits LaTeX.
 """
@@ -1,8 +1,9 @@
 """Small attribute helpers shared by the HTML lowerings.
 
-A handful of pure BeautifulSoup utilities the reader needs, kept local to
-``readers/`` so the reader carries no dependency on the writer-side helpers.
-They contain no LaTeX and no soup mutation.
+A handful of pure BeautifulSoup utilities the reader needs (plus one IR
+edge-trimming helper), kept local to ``readers/`` so the reader carries no
+dependency on the writer-side helpers. They contain no LaTeX and no soup
+mutation.
 """
 
 from __future__ import annotations
@@ -10,6 +11,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import Any, cast
 
+from texsmith.ir import nodes as ir
+
 
 def coerce_attr(value: Any) -> str | None:
     """Normalise a BeautifulSoup attribute value to a single string or ``None``."""
@@ -42,3 +45,16 @@ def attrs_tuple(extra: dict[str, str]) -> tuple[tuple[str, str], ...]:
 
 
 __all__ = ["attrs_tuple", "classes", "coerce_attr"]
+
+
+def strip_run_edges(inlines: tuple[ir.Inline, ...]) -> tuple[ir.Inline, ...]:
+    """Trim the edge whitespace packed inside a leading/trailing ``TextRun``.
+
+    Completes paragraph edge-stripping, which drops whole ``Space`` nodes, for
+    the compact IR where that whitespace sits inside a run.
+    """
+    if inlines and isinstance(inlines[0], ir.TextRun) and inlines[0].text[:1].isspace():
+        inlines = (ir.TextRun(inlines[0].text.lstrip()), *inlines[1:])
+    if inlines and isinstance(inlines[-1], ir.TextRun) and inlines[-1].text[-1:].isspace():
+        inlines = (*inlines[:-1], ir.TextRun(inlines[-1].text.rstrip()))
+    return inlines
@@ -0,0 +1,241 @@
+"""HTML parser backends for the reader and the conversion front-end.
+
+The ``@reads`` lowerings consume BeautifulSoup nodes, and BeautifulSoup stays
+the reference tree: :func:`parse_html` builds one with the requested builder,
+falling back to the always-available ``html.parser`` when that builder is not
+installed.
+
+Building a BeautifulSoup tree is, however, most of the cost of reading HTML,
+and a full MkDocs page spends most of its markup on navigation, headers and
+search chrome that is thrown away. When ``lxml`` is installed
+(``pip install texsmith[lxml]``) the helpers here work on ``lxml.html`` trees
+instead:
+
+* :func:`select_inner_html` locates the renderable region of a page with an
+  XPath query translated from its CSS selector and serialises it straight from
+  the lxml tree, so no BeautifulSoup tree is built for the page at all;
+* :func:`lxml_to_soup` adapts an ``lxml.html`` element into the BeautifulSoup
+  tree the ``lxml`` builder would have produced for its markup, which is what
+  :meth:`HtmlReader.read_tree <texsmith.readers.html.HtmlReader.read_tree>`
+  does with an lxml element, so only the selected subtree is ever converted.
+
+Both libraries parse with libxml2, so the trees agree; selectors the
+translator does not understand, and markup lxml refuses, take the
+BeautifulSoup path.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+import html as _html
+from importlib.util import find_spec
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.element import Comment, NavigableString, ProcessingInstruction, Tag
+
+
+DEFAULT_PARSER = "html.parser"
+LXML_PARSER = "lxml"
+
+# One compound selector: an optional type selector followed by any number of
+# ``#id``, ``.class`` and ``[attr]`` filters. Attribute value selectors are left
+# to soupsieve, which matches some HTML attribute values case-insensitively.
+_IDENT = r"-?[_a-zA-Z][-_a-zA-Z0-9]*"
+_COMPOUND = re.compile(
+    rf"(?P<type>{_IDENT}|\*)?(?P<filters>(?:#{_IDENT}|\.{_IDENT}|\[\s*{_IDENT}\s*\])*)"
+)
+_FILTER = re.compile(rf"([#.])({_IDENT})|\[\s*({_IDENT})\s*\]")
+_COMBINATOR = re.compile(r"\s*>\s*|\s+")
+_RAW_TEXT_TAGS = frozenset({"script", "style"})
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+@cache
+def lxml_available() -> bool:
+    """Return whether the optional ``lxml`` backend can be imported."""
+    return find_spec("lxml") is not None
+
+
+def parse_html(html: str, parser: str = DEFAULT_PARSER) -> BeautifulSoup:
+    """Parse ``html`` with the ``parser`` builder, or ``html.parser`` if it is missing."""
+    try:
+        return BeautifulSoup(html, parser)
+    except FeatureNotFound:
+        return BeautifulSoup(html, DEFAULT_PARSER)
+
+
+def css_to_xpath(selector: str) -> str | None:
+    """Translate a simple CSS selector into an XPath query over an HTML tree.
+
+    Supports type, universal, ``#id``, ``.class`` and ``[attr]`` selectors
+    joined by descendant or child combinators, and comma-separated groups.
+    Returns ``None`` for anything else.
+    """
+    paths: list[str] = []
+    for group in selector.split(","):
+        path = _group_to_xpath(group.strip())
+        if path is None:
+            return None
+        paths.append(path)
+    return " | ".join(paths) if paths else None
+
+
+def _group_to_xpath(selector: str) -> str | None:
+    if not selector:
+        return None
+    steps: list[str] = []
+    axis = "//"
+    position = 0
+    while True:
+        match = _COMPOUND.match(selector, position)
+        if match is None or match.end() == position:
+            return None
+        steps.append(axis + _compound_to_step(match.group("type"), match.group("filters")))
+        position = match.end()
+        if position == len(selector):
+            return "".join(steps)
+        combinator = _COMBINATOR.match(selector, position)
+        if combinator is None:
+            return None
+        axis = "/" if ">" in combinator.group(0) else "//"
+        position = combinator.end()
+
+
+def _compound_to_step(type_selector: str | None, filters: str) -> str:
+    # lxml lowercases HTML element and attribute names while parsing.
+    step = (type_selector or "*").lower()
+    for prefix, name, attribute in _FILTER.findall(filters):
+        if prefix == "#":
+            step += f"[@id='{name}']"
+        elif prefix == ".":
+            step += f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+        else:
+            step += f"[@{attribute.lower()}]"
+    return step
+
+
+def select_inner_html(html: str, selector: str) -> str | None:
+    """Return the inner HTML of the first element of ``html`` matching ``selector``.
+
+    Uses lxml when it is installed and the selector is simple enough to
+    translate (see :func:`css_to_xpath`); otherwise the page is parsed with
+    BeautifulSoup and queried with soupsieve. Returns ``None`` if nothing
+    matches.
+    """
+    if lxml_available():
+        xpath = css_to_xpath(selector)
+        root = _lxml_document(html) if xpath is not None else None
+        if root is not None:
+            matches = root.xpath(f"({xpath})[1]")
+            return _inner_html(matches[0]) if matches else None
+    element = parse_html(html, LXML_PARSER).select_one(selector)
+    return None if element is None else element.decode_contents()
+
+
+def _lxml_document(html: str) -> Any | None:
+    from lxml import etree
+    import lxml.html
+
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        # Empty documents, and strings carrying an XML encoding declaration.
+        return None
+
+
+def _inner_html(element: Any) -> str:
+    import lxml.html
+
+    text = element.text or ""
+    if text and element.tag not in _RAW_TEXT_TAGS:
+        text = _html.escape(text, quote=False)
+    return text + "".join(lxml.html.tostring(child, encoding="unicode") for child in element)
+
+
+def lxml_to_soup(element: Any) -> BeautifulSoup:
+    """Adapt an ``lxml.html`` element and its subtree into a BeautifulSoup tree.
+
+    The result matches ``BeautifulSoup(markup, "lxml")`` for the element's
+    markup, minus the ``html``/``body`` wrapper the parser adds around a
+    fragment: the element is the only child of the returned document, and its
+    tail text is not included. Boolean attributes keep the value libxml2 gives
+    them in a tree (``checked="checked"`` rather than ``checked=""``).
+    """
+    from lxml import etree
+
+    return _SoupBuilder(etree).build(element)
+
+
+class _SoupBuilder:
+    def __init__(self, etree: Any) -> None:
+        self.soup = BeautifulSoup("", DEFAULT_PARSER)
+        builder = self.soup.builder
+        self.containers = builder.string_containers
+        self.list_attributes = builder.cdata_list_attributes
+        self.universal = self.list_attributes.get("*", frozenset())
+        self.value_list = builder.attribute_value_list_class
+        self.preserve_tags = builder.preserve_whitespace_tags
+        self.comment = etree.Comment
+        self.instruction = etree.ProcessingInstruction
+
+    def build(self, element: Any) -> BeautifulSoup:
+        node = self.convert(element, NavigableString, False)
+        if node is not None:
+            self.soup.append(node)
+        return self.soup
+
+    def convert(self, element: Any, container: type, preserve: bool) -> Any | None:
+        tag = element.tag
+        if tag is self.comment:
+            return Comment(self.text(element.text or "", preserve))
+        if tag is self.instruction:
+            text = f"{element.target} {element.text or ''}"
+            return ProcessingInstruction(self.text(text, preserve))
+        if not isinstance(tag, str):
+            return None
+        node = Tag(self.soup, self.soup.builder, tag)
+        if element.attrib:
+            # Split multi-valued attributes (``class``, ``rel``…) like the builder.
+            specific = self.list_attributes.get(tag, ())
+            attrs = node.attrs
+            for key, value in element.attrib.items():
+                if key in self.universal or key in specific:
+                    value = self.value_list(value.split())
+                attrs[key] = value
+        self.append_children(
+            node,
+            element,
+            self.containers.get(tag, container),
+            preserve or tag in self.preserve_tags,
+        )
+        return node
+
+    def append_children(self, parent: Tag, element: Any, container: type, preserve: bool) -> None:
+        if element.text:
+            parent.append(self.soup.new_string(self.text(element.text, preserve), container))
+        for child in element:
+            node = self.convert(child, container, preserve)
+            if node is not None:
+                parent.append(node)
+            if child.tail:
+                parent.append(self.soup.new_string(self.text(child.tail, preserve), container))
+
+    @staticmethod
+    def text(text: str, preserve: bool) -> str:
+        # The builder collapses whitespace-only strings outside ``<pre>``.
+        if preserve or text.strip(_ASCII_SPACES):
+            return text
+        return "\n" if "\n" in text else " "
+
+
+__all__ = [
+    "DEFAULT_PARSER",
+    "LXML_PARSER",
+    "css_to_xpath",
+    "lxml_available",
+    "lxml_to_soup",
+    "parse_html",
+    "select_inner_html",
+]
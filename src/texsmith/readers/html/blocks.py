@@ -20,7 +20,7 @@ from texsmith.adapters.transformers.mermaid_detect import (
 )
 from texsmith.ir import nodes as ir
 
-from ._helpers import attrs_tuple, classes, coerce_attr
+from ._helpers import attrs_tuple, classes, coerce_attr, strip_run_edges
 from .registry import NotHandled, ReadLevel, reads
 
 
@@ -107,7 +107,7 @@ def _strip_edge_space(inlines: tuple[ir.Inline, ...]) -> tuple[ir.Inline, ...]:
         start += 1
     while end > start and _edge(inlines[end - 1]):
         end -= 1
-    return inlines[start:end]
+    return strip_run_edges(inlines[start:end])
 
 
 @reads("hr", level=ReadLevel.BLOCK, name="horizontal_rule")
@@ -29,8 +29,9 @@ represented and traceable, never lost.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from bs4 import BeautifulSoup
 from bs4.element import Comment, NavigableString, Tag
@@ -39,6 +40,8 @@ from texsmith.core.diagnostics import DiagnosticEmitter, NullEmitter
 from texsmith.ir import nodes as ir
 
 from . import blocks as _blocks, extensions as _extensions, inline as _inline
+from ._helpers import strip_run_edges
+from .backends import lxml_to_soup
 from .context import ReadContext
 from .registry import NotHandled, ReaderRegistry, ReadLevel
 
@@ -50,6 +53,7 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 # Literal inline-math payloads Markdown may leave untouched in text nodes
 # (``$…$`` / ``\(…\)`` / ``\[…\]`` / math environments). Kept verbatim so the
 # writer does not escape them — the legacy ``escape_plain_text`` did the same.
+_WHITESPACE = re.compile(r"\s")
 _MATH_PAYLOAD_PATTERN = re.compile(
     r"""
     (?:\$\$.*?\$\$)
@@ -105,7 +109,7 @@ _INLINE_TAGS: frozenset[str] = frozenset({"img", "script", "ts-marginnote"})
 
 
 def build_reader_registry(extra_modules: Iterable[object] = ()) -> ReaderRegistry:
-    """Assemble a registry from the bundled lowering modules plus ``extra_modules``.
+    """Return the registry of the bundled lowering modules plus ``extra_modules``.
 
     The bundled modules are collected first; any ``extra_modules`` (e.g. a
     template's ``@reads`` module) are layered on top. Because
@@ -113,20 +117,33 @@ def build_reader_registry(extra_modules: Iterable[object] = ()) -> ReaderRegistr
     registration order), an extra handler declaring a higher ``priority`` than a
     bundled one for the same tag is tried first and may return ``NotHandled`` to
     fall through to the bundled handler.
+
+    Registries are built once per module set and shared, so they are frozen;
+    call :meth:`ReaderRegistry.copy` on the result to register further rules.
     """
+    return _shared_registry(tuple(extra_modules))
+
+
+@lru_cache(maxsize=32)
+def _shared_registry(extra_modules: tuple[object, ...]) -> ReaderRegistry:
+    return _build_registry(extra_modules).freeze()
+
+
+def _build_registry(extra_modules: Iterable[object] = ()) -> ReaderRegistry:
+    """Assemble a fresh, mutable registry from the bundled lowering modules."""
     registry = ReaderRegistry()
     for module in (_inline, _blocks, _extensions, *extra_modules):
         registry.collect_from(module)
     return registry
 
 
-def _build_registry() -> ReaderRegistry:
-    """Assemble the default registry from the bundled lowering modules."""
-    return build_reader_registry()
-
-
 class HtmlReader:
-    """Lower HTML (string or parsed tree) into a :class:`texsmith.ir.Document`."""
+    """Lower HTML (string or parsed tree) into a :class:`texsmith.ir.Document`.
+
+    With ``compact_text`` each prose text node becomes a single
+    :class:`~texsmith.ir.TextRun` instead of one ``Str`` per word and one
+    ``Space`` per separator, which keeps the IR of long documents small.
+    """
 
     def __init__(
         self,
@@ -134,9 +151,11 @@ class HtmlReader:
         registry: ReaderRegistry | None = None,
         diagnostics: DiagnosticEmitter | None = None,
         parser: str = "html.parser",
+        compact_text: bool = False,
     ) -> None:
-        self._registry = registry or _build_registry()
+        self._registry = registry or build_reader_registry()
         self._parser = parser
+        self._compact_text = compact_text
         self._context = ReadContext(self, diagnostics or NullEmitter())
 
     # -- public API --------------------------------------------------------
@@ -146,8 +165,15 @@ class HtmlReader:
         soup = BeautifulSoup(html, self._parser)
         return self.read_tree(soup)
 
-    def read_tree(self, root: Tag) -> ir.Document:
-        """Lower an already-parsed BeautifulSoup tree into a ``Document``."""
+    def read_tree(self, root: Tag | Any) -> ir.Document:
+        """Lower an already-parsed tree into a ``Document``.
+
+        ``root`` is a BeautifulSoup tree, or an ``lxml.html`` element whose
+        subtree is adapted with :func:`~.backends.lxml_to_soup` first (the rest
+        of the lxml document is never converted).
+        """
+        if not isinstance(root, Tag):
+            root = lxml_to_soup(root)
         body = root.find("body")
         container = body if isinstance(body, Tag) else root
         return ir.Document(content=self.lower_blocks(container.children))
@@ -198,12 +224,10 @@ class HtmlReader:
             return False
         if name in _BLOCK_TAGS:
             return True
-        if self._registry.candidates(name, ReadLevel.BLOCK):
-            return True
-        # Unknown element with no inline lowering either: treat as a block so it
-        # surfaces through the block fallback (a Div) rather than being folded
-        # silently into a paragraph.
-        return not self._registry.candidates(name, ReadLevel.INLINE)
+        # Elements with a block lowering are blocks. So is an unknown element
+        # with no inline lowering either, so it surfaces through the block
+        # fallback (a Div) rather than being folded silently into a paragraph.
+        return self._registry.level_of(name) is not ReadLevel.INLINE
 
     def _lower_block_tag(self, tag: Tag) -> tuple[ir.Block, ...]:
         name = tag.name or ""
@@ -232,7 +256,7 @@ class HtmlReader:
             if isinstance(child, Comment):
                 continue
             if isinstance(child, NavigableString):
-                result.extend(_text_to_inline(str(child)))
+                result.extend(_text_to_inline(str(child), compact=self._compact_text))
                 continue
             if not isinstance(child, Tag):
                 continue
@@ -282,74 +306,41 @@ def _fallback_attrs(tag: Tag) -> tuple[tuple[str, str], ...]:
     return tuple(attrs)
 
 
-def _text_to_inline(text: str) -> list[ir.Inline]:
+def _text_to_inline(text: str, *, compact: bool = False) -> list[ir.Inline]:
     """Split a text node into inline IR.
 
     Literal math payloads (``$…$`` / ``\\(…\\)`` / ``\\[…\\]`` / math envs that
     Markdown left as plain text) are kept verbatim as ``RawInline`` so the
     writer does not escape them — mirroring the legacy ``escape_plain_text``
     PRE phase, which protected math before escaping. The prose between math
-    payloads is tokenised into ``Str`` runs / ``Space`` separators.
+    payloads is tokenised into ``Str`` runs / ``Space`` separators, or packed
+    into :class:`~texsmith.ir.TextRun` nodes when ``compact`` is set.
     """
     if not text:
         return []
+    # Every math payload opens with ``$`` or a backslash.
+    if "$" not in text and "\\" not in text:
+        return _prose_to_inline(text, compact=compact)
     matches = list(_MATH_PAYLOAD_PATTERN.finditer(text))
     if not matches:
-        return _tokenize_prose(text)
+        return _prose_to_inline(text, compact=compact)
     out: list[ir.Inline] = []
     cursor = 0
     for match in matches:
         if match.start() > cursor:
-            out.extend(_tokenize_prose(text[cursor : match.start()]))
+            out.extend(_prose_to_inline(text[cursor : match.start()], compact=compact))
         out.append(ir.RawInline(format="latex", text=match.group(0)))
         cursor = match.end()
     if cursor < len(text):
-        out.extend(_tokenize_prose(text[cursor:]))
+        out.extend(_prose_to_inline(text[cursor:], compact=compact))
     return out
 
 
-def _tokenize_prose(text: str) -> list[ir.Inline]:
-    """Tokenise prose into ``Str`` runs and ``Space`` / soft-wrap separators."""
-    if not text:
-        return []
-    out: list[ir.Inline] = []
-    run: list[str] = []
-    ws: list[str] = []
-
-    def flush_ws() -> None:
-        if not ws:
-            return
-        # Preserve the distinction the legacy ``soup.get_text()`` kept: a
-        # whitespace run that contains a newline (Markdown's soft line wrap,
-        # possibly with continuation indentation) is kept verbatim as a
-        # ``SoftBreak`` carrying the literal whitespace; inter-word spacing
-        # collapses to a single ``Space`` (rendered as ``" "``).
-        run = "".join(ws)
-        # The legacy ``get_text()`` preserved source whitespace verbatim. A run
-        # containing a newline (soft line wrap + any continuation indentation)
-        # or a run of more than one space is kept literally in a ``Str`` (the
-        # writer leaves whitespace unescaped); a single inter-word space
-        # collapses to a ``Space``. Paragraph edge-stripping treats a
-        # whitespace-only ``Str`` like a ``Space``.
-        if "\n" in run or len(run) > 1:
-            out.append(ir.Str(run))
-        elif not out or not isinstance(out[-1], (ir.Space, ir.SoftBreak)):
-            out.append(ir.Space())
-        ws.clear()
-
-    for char in text:
-        if char.isspace():
-            if run:
-                out.append(ir.Str("".join(run)))
-                run.clear()
-            ws.append(char)
-        else:
-            flush_ws()
-            run.append(char)
-    if run:
-        out.append(ir.Str("".join(run)))
-    flush_ws()
-    return out
+def _prose_to_inline(text: str, *, compact: bool) -> list[ir.Inline]:
+    """Tokenise prose, or pack it into one ``TextRun`` when ``compact``."""
+    if compact and not text.isspace() and _WHITESPACE.search(text):
+        return [ir.TextRun(text)]
+    return ir.tokenize_text(text)
 
 
 def _strip_edges(inlines: tuple[ir.Inline, ...]) -> tuple[ir.Inline, ...]:
@@ -360,7 +351,7 @@ def _strip_edges(inlines: tuple[ir.Inline, ...]) -> tuple[ir.Inline, ...]:
         start += 1
     while end > start and _is_edge_space(inlines[end - 1]):
         end -= 1
-    return inlines[start:end]
+    return strip_run_edges(inlines[start:end])
 
 
 def _is_edge_space(node: ir.Inline) -> bool:
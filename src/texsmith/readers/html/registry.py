@@ -12,6 +12,10 @@ handler. Handlers are tried in registration order — earlier registrations win
 and a handler signals "not mine" by returning :data:`NotHandled`, letting the
 reader fall through to the next candidate (and ultimately to a generic fallback
 that never drops content silently).
+
+Lookups go through an index of ``(tag, level)`` to ordered candidates, built on
+the first lookup and rebuilt only after a registration, so the cost of lowering
+an element does not grow with the number of rules.
 """
 
 from __future__ import annotations
@@ -82,6 +86,14 @@ class ReaderRule:
     priority: int = 0
 
 
+@dataclass(frozen=True)
+class _ReaderIndex:
+    """Precomputed lookups of a registry: candidates and level per tag."""
+
+    candidates: dict[tuple[str, ReadLevel], tuple[ReaderRule, ...]]
+    levels: dict[str, ReadLevel]
+
+
 @dataclass
 class ReaderRegistry:
     """Collects :class:`ReaderRule` instances indexed by ``(level, tag)``.
@@ -90,13 +102,32 @@ class ReaderRegistry:
     ``ANY`` level), highest priority first then registration order. The reader
     walks the candidates, applying the first that does not return
     :data:`NotHandled`.
+
+    A frozen registry (see :meth:`freeze`) rejects new rules; the registries
+    shared through :func:`~texsmith.readers.html.build_reader_registry` are
+    frozen, and :meth:`copy` returns a mutable registry with the same rules.
     """
 
     _rules: list[ReaderRule] = field(default_factory=list)
+    _index: _ReaderIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
 
     def register(self, rule: ReaderRule) -> None:
         """Append ``rule`` to the registry (registration order is stable)."""
+        if self._frozen:
+            raise TypeError("Cannot register a rule on a frozen reader registry.")
         self._rules.append(rule)
+        self._index = None
+
+    def freeze(self) -> ReaderRegistry:
+        """Reject further registrations and build the lookup index; return ``self``."""
+        self._frozen = True
+        self._ensure_index()
+        return self
+
+    def copy(self) -> ReaderRegistry:
+        """Return a mutable registry holding the same rules in the same order."""
+        return ReaderRegistry(list(self._rules))
 
     def collect_from(self, owner: object) -> None:
         """Register every ``@reads``-decorated callable found on ``owner``.
@@ -114,13 +145,39 @@ class ReaderRegistry:
 
     def candidates(self, tag: str, level: ReadLevel) -> tuple[ReaderRule, ...]:
         """Return lowerings for ``tag`` applicable at ``level`` (best first)."""
-        matched = [
-            rule
-            for rule in self._rules
-            if tag in rule.tags and (rule.level is level or rule.level is ReadLevel.ANY)
-        ]
-        matched.sort(key=lambda rule: -rule.priority)
-        return tuple(matched)
+        index = self._index or self._ensure_index()
+        return index.candidates.get((tag, level), ())
+
+    def level_of(self, tag: str) -> ReadLevel | None:
+        """Return the level ``tag`` lowers at, or ``None`` when no rule claims it.
+
+        ``BLOCK`` when some rule lowers ``tag`` at block level (including
+        ``ANY`` rules), ``INLINE`` when only inline rules do.
+        """
+        index = self._index or self._ensure_index()
+        return index.levels.get(tag)
+
+    def _ensure_index(self) -> _ReaderIndex:
+        grouped: dict[tuple[str, ReadLevel], list[ReaderRule]] = {}
+        for rule in self._rules:
+            levels = (
+                (ReadLevel.BLOCK, ReadLevel.INLINE)
+                if rule.level is ReadLevel.ANY
+                else (rule.level,)
+            )
+            for tag in dict.fromkeys(rule.tags):
+                for level in levels:
+                    grouped.setdefault((tag, level), []).append(rule)
+        candidates: dict[tuple[str, ReadLevel], tuple[ReaderRule, ...]] = {}
+        levels_by_tag: dict[str, ReadLevel] = {}
+        for (tag, level), rules in grouped.items():
+            # Stable: equal priorities keep registration order.
+            rules.sort(key=lambda rule: -rule.priority)
+            candidates[tag, level] = tuple(rules)
+            if level is ReadLevel.BLOCK or tag not in levels_by_tag:
+                levels_by_tag[tag] = level
+        self._index = _ReaderIndex(candidates=candidates, levels=levels_by_tag)
+        return self._index
 
 
 @dataclass(frozen=True)
@@ -125,6 +125,15 @@ HashAssetsOption = Annotated[
     ),
 ]
 
+CompactTextOption = Annotated[
+    bool,
+    typer.Option(
+        "--compact-text",
+        help="Keep prose as packed text runs in the document IR to lower memory use.",
+        rich_help_panel=RENDERING_PANEL,
+    ),
+]
+
 HttpUserAgentOption = Annotated[
     str | None,
     typer.Option(
@@ -330,6 +339,25 @@ FontsInfoOption = Annotated[
     ),
 ]
 
+ProfileOption = Annotated[
+    bool,
+    typer.Option(
+        "--profile",
+        help="Print the wall and CPU time spent in each conversion phase, per document.",
+        rich_help_panel=DIAGNOSTICS_PANEL,
+    ),
+]
+
+ProfileTraceOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--profile-trace",
+        metavar="FILE",
+        help="Write the phase timings to FILE as a Chrome trace (implies --profile).",
+        rich_help_panel=DIAGNOSTICS_PANEL,
+    ),
+]
+
 OpenLogOption = Annotated[
     bool,
     typer.Option(
@@ -338,3 +366,60 @@ OpenLogOption = Annotated[
         rich_help_panel=DIAGNOSTICS_PANEL,
     ),
 ]
+
+JobsOption = Annotated[
+    int,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=0,
+        help="Convert documents in parallel using N worker processes (0 uses every CPU).",
+        rich_help_panel=RENDERING_PANEL,
+    ),
+]
+
+FragmentCacheOption = Annotated[
+    bool,
+    typer.Option(
+        "--cache",
+        envvar="TEXSMITH_FRAGMENT_CACHE",
+        help="Reuse the LaTeX of documents unchanged since a previous run (fragment cache).",
+        rich_help_panel=RENDERING_PANEL,
+    ),
+]
+
+WatchOption = Annotated[
+    bool,
+    typer.Option(
+        "--watch",
+        "-w",
+        help="Keep running and re-render (and rebuild with --build) whenever an input changes.",
+        rich_help_panel=RENDERING_PANEL,
+    ),
+]
+
+BatchOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--batch",
+        metavar="JOBS",
+        help=(
+            "Run the independent jobs listed in the JOBS YAML file and print a JSON summary; "
+            "--jobs sets how many run at once and --build compiles their PDFs."
+        ),
+        rich_help_panel=RENDERING_PANEL,
+    ),
+]
+
+ServeOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--serve",
+        metavar="SOCKET",
+        help=(
+            "Run a conversion server answering JSON-RPC requests on the SOCKET Unix socket "
+            "instead of rendering; --jobs sets how many requests run at once."
+        ),
+        rich_help_panel=RENDERING_PANEL,
+    ),
+]
@@ -0,0 +1,141 @@
+"""Batch conversion of independent jobs listed in a YAML file (``texsmith --batch``).
+
+A jobs file holds a ``jobs`` list; every other top-level key is a default
+applied to each job. Jobs and defaults use
+:class:`~texsmith.core.conversion.models.ConversionRequest` field names::
+
+    template: letter
+    copy_assets: false
+    jobs:
+      - name: acme
+        documents: [letters/acme.md]
+        template_options: {recipient: ACME Corp.}
+      - documents: [letters/globex.md, customers.bib]
+
+Mappings such as ``template_options`` are merged key by key with the defaults.
+A job is named after its first document unless it sets ``name``, and renders
+into ``<output>/<name>`` unless it sets ``render_dir``. Relative paths are
+resolved against the directory of the jobs file.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+import time
+from typing import Any
+
+import yaml
+
+from texsmith.core.conversion.debug import ConversionError
+from texsmith.core.conversion.models import ConversionRequest
+from texsmith.core.conversion.service import BatchOutcome, ConversionService
+from texsmith.core.diagnostics import CollectingEmitter
+
+
+@dataclass(slots=True)
+class BatchJob:
+    """One entry of a jobs file."""
+
+    name: str
+    params: dict[str, Any]
+
+
+def load_jobs(path: Path) -> list[BatchJob]:
+    """Read the jobs listed in ``path``.
+
+    Raises :class:`ConversionError` when the file is not a valid jobs file.
+    """
+    try:
+        payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as exc:
+        raise ConversionError(f"Failed to read jobs file '{path}': {exc}") from exc
+    if not isinstance(payload, Mapping) or not isinstance(payload.get("jobs"), list):
+        raise ConversionError(f"Jobs file '{path}' must contain a 'jobs' list.")
+    defaults = {key: value for key, value in payload.items() if key != "jobs"}
+
+    jobs: list[BatchJob] = []
+    seen: set[str] = set()
+    for index, entry in enumerate(payload["jobs"], start=1):
+        if not isinstance(entry, Mapping):
+            raise ConversionError(f"Job #{index} in '{path}' must be a mapping.")
+        params = _merge(defaults, entry)
+        name = str(params.pop("name", "") or _default_name(params, index))
+        if name in seen:
+            raise ConversionError(f"Duplicate job name '{name}' in '{path}'.")
+        seen.add(name)
+        jobs.append(BatchJob(name=name, params=params))
+    return jobs
+
+
+def run_batch(
+    jobs: list[BatchJob],
+    *,
+    service: ConversionService,
+    base_dir: Path,
+    output_dir: Path,
+    workers: int,
+    build: bool = False,
+    build_options: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Run ``jobs`` through :meth:`ConversionService.execute_many` and summarise them.
+
+    The summary lists every job in file order with its status, outputs,
+    diagnostics and timings; jobs whose parameters are invalid are reported
+    as failed without being run.
+    """
+    started = time.perf_counter()
+    # The output directory comes from the command line, not the jobs file.
+    output_dir = output_dir.resolve()
+    entries: list[dict[str, Any]] = []
+    runnable: list[tuple[dict[str, Any], CollectingEmitter]] = []
+    requests: list[ConversionRequest] = []
+    for job in jobs:
+        entry: dict[str, Any] = {"name": job.name}
+        entries.append(entry)
+        emitter = CollectingEmitter()
+        params = dict(job.params)
+        params.setdefault("render_dir", str(output_dir / job.name))
+        try:
+            requests.append(service.build_request(params, emitter=emitter, base_dir=base_dir))
+        except ConversionError as exc:
+            entry.update(status="failed", error=str(exc), diagnostics=emitter.records)
+            continue
+        runnable.append((entry, emitter))
+
+    outcomes: list[BatchOutcome] = service.execute_many(
+        requests, workers=workers, build=build, build_options=build_options
+    )
+    for (entry, emitter), outcome in zip(runnable, outcomes, strict=True):
+        entry.update(outcome.to_json())
+        entry["diagnostics"] = emitter.records
+
+    failed = sum(entry["status"] != "ok" for entry in entries)
+    return {
+        "jobs": entries,
+        "succeeded": len(entries) - failed,
+        "failed": failed,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def _merge(defaults: Mapping[str, Any], entry: Mapping[str, Any]) -> dict[str, Any]:
+    merged = dict(defaults)
+    for key, value in entry.items():
+        current = merged.get(key)
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
+            merged[key] = {**current, **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def _default_name(params: Mapping[str, Any], index: int) -> str:
+    documents = params.get("documents")
+    if isinstance(documents, list) and documents and isinstance(documents[0], str):
+        return Path(documents[0]).stem
+    return f"job-{index}"
+
+
+__all__ = ["BatchJob", "load_jobs", "run_batch"]
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import atexit
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 import contextlib
+from dataclasses import dataclass
+from functools import partial
+import json
 import os
 from pathlib import Path
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 from typing import Annotated, Any
 
 import click
@@ -30,11 +35,17 @@ from texsmith.adapters.markdown import (
 )
 from texsmith.core.bibliography import BibliographyCollection
 from texsmith.core.conversion import ConversionRequest
+from texsmith.core.conversion.cache import FragmentCache
 from texsmith.core.conversion.debug import ConversionError
 from texsmith.core.conversion.inputs import UnsupportedInputError
-from texsmith.core.conversion.service import ConversionService
+from texsmith.core.conversion.service import (
+    DEFAULT_BATCH_WORKERS,
+    ConversionResponse,
+    ConversionService,
+)
 from texsmith.core.conversion.typst import build_typst_pdf, render_typst_document
 from texsmith.core.metadata import PressMetadataError, normalise_press_metadata
+from texsmith.core.profiling import ProfilingEmitter, write_chrome_trace
 from texsmith.core.templates import TemplateError, load_template
 from texsmith.core.templates.runtime import coerce_base_level
 from texsmith.fonts.html_scripts import wrap_scripts_in_html
@@ -44,6 +55,8 @@ from .._options import (
     DIAGNOSTICS_PANEL,
     OUTPUT_PANEL,
     BaseLevelOption,
+    BatchOption,
+    CompactTextOption,
     ConvertAssetsOption,
     DebugHtmlOption,
     DisableFragmentOption,
@@ -51,11 +64,13 @@ from .._options import (
     EnableFragmentOption,
     FontsInfoOption,
     FormatOption,
+    FragmentCacheOption,
     FullDocumentOption,
     HashAssetsOption,
     HtmlOnlyOption,
     HttpUserAgentOption,
     InputPathArgument,
+    JobsOption,
     LanguageOption,
     MakefileDepsOption,
     ManifestOptionWithShort,
@@ -66,13 +81,18 @@ from .._options import (
     OpenLogOption,
     OutputPathOption,
     ParserOption,
+    ProfileOption,
+    ProfileTraceOption,
     SelectorOption,
+    ServeOption,
     SlotsOption,
     StripHeadingOption,
     TemplateAttributeOption,
     TemplateInfoOption,
     TemplateOption,
+    WatchOption,
 )
+from ..batch import load_jobs, run_batch
 from ..bibliography import print_bibliography_overview
 from ..commands.templates import list_templates, scaffold_template, show_template_info
 from ..diagnostics import CliEmitter
@@ -84,9 +104,11 @@ from ..presenter import (
     present_fonts_info,
     present_html_summary,
     present_latex_failure,
+    present_profile,
 )
-from ..state import debug_enabled, emit_error, set_cli_state
+from ..state import CLIState, debug_enabled, emit_error, set_cli_state
 from ..utils import determine_output_target, organise_slot_overrides, write_output_file
+from ..watch import FileWatcher
 
 
 _SERVICE = ConversionService()
@@ -182,6 +204,98 @@ def _format_path_for_event(path: Path) -> str:
         return str(resolved)
 
 
+def _watched_sources(response: ConversionResponse) -> list[Path]:
+    """Return the template files and local assets a render depended on."""
+    sources: list[Path] = []
+    asset_keys: list[str] = []
+    if response.is_template:
+        render_result = response.render_result
+        root = getattr(render_result.template_runtime.instance, "root", None)
+        if root is not None:
+            sources.append(Path(root))
+        asset_keys.extend(render_result.asset_map or {})
+    else:
+        for fragment in response.bundle.fragments:
+            asset_keys.extend(fragment.conversion.assets_map)
+    for key in asset_keys:
+        candidate = Path(key)
+        if candidate.is_absolute() and candidate.is_file():
+            sources.append(candidate)
+    return sources
+
+
+def _serve(socket_path: Path, *, workers: int | None, fragment_cache: bool) -> None:
+    """Run the conversion server until interrupted."""
+    # The server is imported here: it needs Unix domain sockets, which some
+    # platforms lack, and the rest of the CLI must keep working there.
+    from texsmith.core.conversion.server import DEFAULT_WORKERS, ConversionServer
+
+    service = ConversionService(cache=FragmentCache() if fragment_cache else None, warm=True)
+    try:
+        server = ConversionServer(
+            socket_path,
+            service=service,
+            workers=DEFAULT_WORKERS if workers is None else workers,
+            log=lambda line: typer.echo(line, err=True),
+        )
+    except ConversionError as exc:
+        emit_error(str(exc), exception=exc)
+        raise typer.Exit(code=1) from exc
+    try:
+        server.bind()
+    except ConversionError as exc:
+        server.close()
+        emit_error(str(exc), exception=exc)
+        raise typer.Exit(code=1) from exc
+
+    def _stop(_signum: int, _frame: object) -> None:
+        # ``shutdown`` waits for the serve loop, which runs on this thread.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    previous = None
+    if threading.current_thread() is threading.main_thread():
+        previous = signal.signal(signal.SIGTERM, _stop)
+    typer.echo(f"Serving on {socket_path} with {server.workers} workers (Ctrl+C to stop).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if previous is not None:
+            signal.signal(signal.SIGTERM, previous)
+        server.close()
+    typer.echo("Stopped serving.")
+
+
+def _batch(
+    jobs_file: Path,
+    *,
+    output_dir: Path,
+    workers: int,
+    fragment_cache: bool,
+    build: bool,
+    build_options: Mapping[str, Any],
+) -> None:
+    """Run a jobs file and print its JSON summary; exit non-zero when a job failed."""
+    try:
+        jobs = load_jobs(jobs_file)
+    except ConversionError as exc:
+        emit_error(str(exc), exception=exc)
+        raise typer.Exit(code=1) from exc
+    service = ConversionService(cache=FragmentCache() if fragment_cache else None)
+    summary = run_batch(
+        jobs,
+        service=service,
+        base_dir=jobs_file.resolve().parent,
+        output_dir=output_dir,
+        workers=workers,
+        build=build,
+        build_options=build_options,
+    )
+    typer.echo(json.dumps(summary, indent=2))
+    raise typer.Exit(code=1 if summary["failed"] else 0)
+
+
 def _relativize_path(path: Path, base: Path) -> Path:
     """Return a path relative to ``base`` when possible."""
     try:
@@ -396,6 +510,11 @@ def render(
     convert_assets: ConvertAssetsOption = _REQUEST_DEFAULTS.convert_assets,
     hash_assets: HashAssetsOption = _REQUEST_DEFAULTS.hash_assets,
     http_user_agent: HttpUserAgentOption = _REQUEST_DEFAULTS.http_user_agent,
+    jobs: JobsOption = 1,
+    fragment_cache: FragmentCacheOption = False,
+    watch: WatchOption = False,
+    serve: ServeOption = None,
+    batch: BatchOption = None,
     diagrams_backend: Annotated[
         str | None,
         typer.Option(
@@ -465,6 +584,7 @@ def render(
             ),
         ),
     ] = _REQUEST_DEFAULTS.legacy_latex_accents,
+    compact_text: CompactTextOption = _REQUEST_DEFAULTS.compact_text,
     slots: SlotsOption = None,
     markdown_extensions: MarkdownExtensionsOption = None,
     disable_markdown_extensions: DisableMarkdownExtensionsOption = None,
@@ -499,6 +619,8 @@ def render(
         ),
     ] = None,
     fonts_info: FontsInfoOption = False,
+    profile: ProfileOption = False,
+    profile_trace: ProfileTraceOption = None,
     print_context: Annotated[
         bool,
         typer.Option(
@@ -556,6 +678,30 @@ def render(
         list_templates()
         raise typer.Exit()
 
+    if serve is not None:
+        jobs_param_source = ctx.get_parameter_source("jobs") if ctx else None
+        workers = None if jobs_param_source in {None, ParameterSource.DEFAULT} else jobs
+        _serve(serve, workers=workers, fragment_cache=fragment_cache)
+        raise typer.Exit()
+
+    if batch is not None:
+        jobs_param_source = ctx.get_parameter_source("jobs") if ctx else None
+        workers = (
+            DEFAULT_BATCH_WORKERS if jobs_param_source in {None, ParameterSource.DEFAULT} else jobs
+        )
+        _batch(
+            batch,
+            output_dir=output or Path("build"),
+            workers=workers,
+            fragment_cache=fragment_cache,
+            build=build_pdf,
+            build_options={
+                "engine": engine,
+                "isolate_cache": isolate_cache,
+                "use_system_tectonic": system_tectonic,
+            },
+        )
+
     verbosity_level = state.verbosity
     if verbosity_level <= 0 and typer_ctx is not None and typer_ctx.parent is not None:
         verbosity_level = int(typer_ctx.parent.params.get("verbose", 0) or 0)
@@ -573,6 +719,7 @@ def render(
         if stdin_document is not None:
             document_paths = [stdin_document]
 
+    watched_inputs = list(document_paths)
     try:
         split_result = _SERVICE.split_inputs(document_paths)
     except ConversionError as exc:
@@ -802,7 +949,9 @@ def render(
     if not embed_fragments and template_selected and len(document_paths) == 1:
         embed_fragments = True
 
-    emitter = CliEmitter(state=state, debug_enabled=debug_enabled())
+    emitter: CliEmitter | ProfilingEmitter = CliEmitter(state=state, debug_enabled=debug_enabled())
+    if profile or profile_trace is not None:
+        emitter = ProfilingEmitter(emitter)
 
     request_render_dir = render_dir_path
 
@@ -816,6 +965,7 @@ def render(
         language=language,
         http_user_agent=http_user_agent,
         legacy_latex_accents=legacy_latex_accents,
+        compact_text=compact_text,
         diagrams_backend=diagrams_backend.lower() if isinstance(diagrams_backend, str) else None,
         documents=document_paths,
         bibliography_files=bibliography_files,
@@ -850,8 +1000,138 @@ def render(
         },
     )
 
+    if watch:
+        # Watch mode keeps documents, templates, the bibliography and the
+        # fragment of each document warm in memory; --cache keeps fragments on
+        # disk instead, so they also survive the process.
+        service = ConversionService(
+            cache=FragmentCache() if fragment_cache else None,
+            warm=True,
+        )
+    elif fragment_cache:
+        service = ConversionService(cache=FragmentCache())
+    else:
+        service = _SERVICE
+    watcher = (
+        FileWatcher([*document_paths, *bibliography_files, *shared_front_matter_paths])
+        if watch
+        else None
+    )
+
+    render_once = partial(
+        _render_once,
+        service,
+        request,
+        _RenderOptions(
+            output_format=output_format,
+            output_mode=output_mode,
+            resolved_output_target=resolved_output_target,
+            final_pdf_target=final_pdf_target,
+            template_selected=template_selected,
+            html_only=html_only,
+            build_pdf=build_pdf,
+            engine=engine,
+            jobs=jobs,
+            classic_output=classic_output,
+            isolate_cache=isolate_cache,
+            system_tectonic=system_tectonic,
+            open_log=open_log,
+            make_deps=make_deps,
+            print_context=print_context,
+            fonts_info=fonts_info,
+        ),
+        state=state,
+        emitter=emitter,
+        watcher=watcher,
+        flush_diagnostics=_flush_diagnostics,
+    )
+
+    def _report_profile() -> None:
+        if not isinstance(emitter, ProfilingEmitter):
+            return
+        spans = emitter.take()
+        present_profile(state, spans)
+        if profile_trace is not None:
+            try:
+                write_chrome_trace(spans, profile_trace)
+            except OSError as exc:
+                emit_error(f"Failed to write profile trace: {exc}", exception=exc)
+                return
+            state.console.print(f"[cyan]Profile trace written to[/] {profile_trace}")
+
+    if watcher is None:
+        try:
+            render_once()
+        finally:
+            _report_profile()
+        if cleanup_render_dir and cleanup_render_dir_path is not None:
+            shutil.rmtree(cleanup_render_dir_path, ignore_errors=True)
+        return
+
     try:
-        prepared = _SERVICE.prepare_documents(request)
+        while True:
+            try:
+                render_once()
+            except typer.Exit as exc:
+                if exc.exit_code:
+                    state.console.print("[yellow]Rendering failed; waiting for changes.[/]")
+            finally:
+                _report_profile()
+            state.console.print("[cyan]Watching for changes (press Ctrl+C to stop)…[/]")
+            changed = watcher.wait()
+            state.console.print(
+                "[cyan]Changed:[/] " + ", ".join(_format_path_for_event(path) for path in changed)
+            )
+            service.invalidate(changed)
+            if shared_front_matter_paths and set(changed) & {
+                path.resolve() for path in shared_front_matter_paths
+            }:
+                try:
+                    request.front_matter = service.split_inputs(watched_inputs).front_matter
+                except ConversionError as exc:
+                    emit_error(str(exc), exception=exc)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+    finally:
+        if cleanup_render_dir and cleanup_render_dir_path is not None:
+            shutil.rmtree(cleanup_render_dir_path, ignore_errors=True)
+
+
+@dataclass(slots=True)
+class _RenderOptions:
+    """How one render writes its outputs; the conversion itself is the request."""
+
+    output_format: str
+    output_mode: str
+    resolved_output_target: Path | None
+    final_pdf_target: Path | None
+    template_selected: bool
+    html_only: bool
+    build_pdf: bool
+    engine: str | None
+    jobs: int
+    classic_output: bool
+    isolate_cache: bool
+    system_tectonic: bool
+    open_log: bool
+    make_deps: bool
+    print_context: bool
+    fonts_info: bool
+
+
+def _render_once(
+    service: ConversionService,
+    request: ConversionRequest,
+    options: _RenderOptions,
+    *,
+    state: CLIState,
+    emitter: CliEmitter | ProfilingEmitter,
+    watcher: FileWatcher | None,
+    flush_diagnostics: Callable[[], None],
+) -> None:
+    """Convert the request once and write or build its outputs."""
+    try:
+        prepared = service.prepare_documents(request)
     except UnsupportedInputError as exc:
         emit_error(str(exc), exception=exc)
         raise typer.Exit(code=1) from exc
@@ -859,51 +1139,50 @@ def render(
         emit_error(str(exc), exception=exc)
         raise typer.Exit(code=1) from exc
 
-    if output_format == "typst":
+    if options.output_format == "typst":
         typst_output_dir: Path | None = None
-        if output_mode in {"directory", "template"}:
-            typst_output_dir = resolved_output_target
-        elif output_mode == "file" and resolved_output_target is not None:
-            typst_output_dir = resolved_output_target.parent
+        if options.output_mode in {"directory", "template"}:
+            typst_output_dir = options.resolved_output_target
+        elif options.output_mode == "file" and options.resolved_output_target is not None:
+            typst_output_dir = options.resolved_output_target.parent
 
         def _emit_typst(doc: Any) -> str:
             try:
                 return render_typst_document(
                     doc,
-                    template=template,
-                    bibliography_files=bibliography_files,
+                    template=request.template,
+                    bibliography_files=request.bibliography_files,
                     output_dir=typst_output_dir,
-                    diagrams_backend=(
-                        diagrams_backend.lower() if isinstance(diagrams_backend, str) else None
-                    ),
-                    template_options=attribute_overrides,
+                    diagrams_backend=request.diagrams_backend,
+                    template_options=request.template_options,
+                    compact_text=request.compact_text,
                 )
             except TemplateError as exc:
                 emit_error(str(exc), exception=exc)
                 raise typer.Exit(code=1) from exc
 
         typst_docs = [(doc.source_path, _emit_typst(doc)) for doc in prepared.documents]
-        if output_mode == "stdout":
+        if options.output_mode == "stdout":
             typer.echo("\n\n".join(payload for _, payload in typst_docs))
-            _flush_diagnostics()
+            flush_diagnostics()
             return
 
         written_paths: list[Path] = []
-        if output_mode == "file":
-            if resolved_output_target is None:
+        if options.output_mode == "file":
+            if options.resolved_output_target is None:
                 raise typer.BadParameter("Output path is required when writing Typst to a file.")
             try:
-                write_output_file(resolved_output_target, typst_docs[0][1])
+                write_output_file(options.resolved_output_target, typst_docs[0][1])
             except OSError as exc:
                 emit_error(str(exc), exception=exc)
                 raise typer.Exit(code=1) from exc
-            written_paths.append(resolved_output_target)
-        elif output_mode in {"directory", "template"}:
-            if resolved_output_target is None:
+            written_paths.append(options.resolved_output_target)
+        elif options.output_mode in {"directory", "template"}:
+            if options.resolved_output_target is None:
                 raise typer.BadParameter("Output directory is required when writing Typst files.")
-            resolved_output_target.mkdir(parents=True, exist_ok=True)
+            options.resolved_output_target.mkdir(parents=True, exist_ok=True)
             for source_path, payload in typst_docs:
-                target = resolved_output_target / f"{source_path.stem}.typ"
+                target = options.resolved_output_target / f"{source_path.stem}.typ"
                 try:
                     write_output_file(target, payload)
                 except OSError as exc:
@@ -911,20 +1190,20 @@ def render(
                     raise typer.Exit(code=1) from exc
                 written_paths.append(target)
         else:
-            raise RuntimeError(f"Unsupported output mode '{output_mode}' for Typst output.")
+            raise RuntimeError(f"Unsupported output mode '{options.output_mode}' for Typst output.")
 
         for path in written_paths:
             typer.echo(f"Wrote {path}")
-        if build_pdf:
+        if options.build_pdf:
             for path in written_paths:
                 ok, message = build_typst_pdf(path)
                 typer.echo(message)
                 if not ok and debug_enabled():
                     raise typer.Exit(code=1)
-        _flush_diagnostics()
+        flush_diagnostics()
         return
 
-    if html_only:
+    if options.html_only:
         html_fragments = []
         for doc in prepared.documents:
             processed_html = doc.html
@@ -933,54 +1212,54 @@ def render(
             except Exception:
                 processed_html = doc.html
             html_fragments.append((doc.source_path, processed_html))
-        if output_mode == "stdout":
+        if options.output_mode == "stdout":
             typer.echo("\n\n".join(fragment for _, fragment in html_fragments))
-            _flush_diagnostics()
+            flush_diagnostics()
             return
 
         summary_paths: list[Path] = []
-        if output_mode == "file":
-            if resolved_output_target is None:
+        if options.output_mode == "file":
+            if options.resolved_output_target is None:
                 raise typer.BadParameter("Output path is required when writing HTML to a file.")
             try:
-                write_output_file(resolved_output_target, html_fragments[0][1])
+                write_output_file(options.resolved_output_target, html_fragments[0][1])
             except OSError as exc:
                 emit_error(str(exc), exception=exc)
                 raise typer.Exit(code=1) from exc
-            summary_paths.append(resolved_output_target)
-        elif output_mode in {"directory", "template"}:
-            if resolved_output_target is None:
+            summary_paths.append(options.resolved_output_target)
+        elif options.output_mode in {"directory", "template"}:
+            if options.resolved_output_target is None:
                 raise typer.BadParameter("Output directory is required when writing HTML files.")
-            resolved_output_target.mkdir(parents=True, exist_ok=True)
+            options.resolved_output_target.mkdir(parents=True, exist_ok=True)
             for source_path, payload in html_fragments:
-                target = resolved_output_target / f"{source_path.stem}.html"
+                target = options.resolved_output_target / f"{source_path.stem}.html"
                 try:
                     write_output_file(target, payload)
                 except OSError as exc:
                     emit_error(str(exc), exception=exc)
                     raise typer.Exit(code=1) from exc
                 summary_paths.append(target)
-        elif output_mode == "template-pdf":
+        elif options.output_mode == "template-pdf":
             raise typer.BadParameter("--html cannot be combined with a PDF output target.")
         else:
-            raise RuntimeError(f"Unsupported output mode '{output_mode}' for HTML output.")
+            raise RuntimeError(f"Unsupported output mode '{options.output_mode}' for HTML output.")
 
         present_html_summary(
             state=state,
-            output_mode=output_mode,
+            output_mode=options.output_mode,
             output_paths=summary_paths,
         )
-        _flush_diagnostics()
+        flush_diagnostics()
         return
 
     engine_env_key = "TEXSMITH_SELECTED_ENGINE"
     previous_engine_value = os.environ.get(engine_env_key)
-    if engine:
-        os.environ[engine_env_key] = engine
+    if options.engine:
+        os.environ[engine_env_key] = options.engine
     else:
         os.environ.pop(engine_env_key, None)
     try:
-        response = _SERVICE.execute(request, prepared=prepared)
+        response = service.execute(request, prepared=prepared, max_workers=options.jobs)
     except (TemplateError, ConversionError) as exc:
         emit_error(str(exc), exception=exc)
         raise typer.Exit(code=1) from exc
@@ -989,51 +1268,53 @@ def render(
             os.environ.pop(engine_env_key, None)
         else:
             os.environ[engine_env_key] = previous_engine_value
+    if watcher is not None:
+        watcher.watch(_watched_sources(response))
 
-    if not template_selected:
+    if not options.template_selected:
         bundle = response.bundle
 
-        if output_mode == "stdout":
+        if options.output_mode == "stdout":
             typer.echo(bundle.combined_output())
-            _flush_diagnostics()
+            flush_diagnostics()
             return
 
-        if output_mode == "file":
-            if resolved_output_target is None:
+        if options.output_mode == "file":
+            if options.resolved_output_target is None:
                 raise typer.BadParameter("Output path is required when writing to a file.")
             try:
-                write_output_file(resolved_output_target, bundle.combined_output())
+                write_output_file(options.resolved_output_target, bundle.combined_output())
             except OSError as exc:
                 emit_error(str(exc), exception=exc)
                 raise typer.Exit(code=1) from exc
             present_conversion_summary(
                 state=state,
-                output_mode=output_mode,
+                output_mode=options.output_mode,
                 bundle=bundle,
-                output_path=resolved_output_target,
+                output_path=options.resolved_output_target,
                 render_result=None,
             )
-            _flush_diagnostics()
+            flush_diagnostics()
             return
 
-        if output_mode == "directory":
+        if options.output_mode == "directory":
             present_conversion_summary(
                 state=state,
-                output_mode=output_mode,
+                output_mode=options.output_mode,
                 bundle=bundle,
                 output_path=request.render_dir,
                 render_result=None,
             )
-            _flush_diagnostics()
+            flush_diagnostics()
             return
 
-        raise RuntimeError(f"Unsupported output mode '{output_mode}'.")
+        raise RuntimeError(f"Unsupported output mode '{options.output_mode}'.")
 
     render_result = response.render_result
 
     render_dir = render_result.main_tex_path.parent.resolve()
 
-    if not build_pdf:
+    if not options.build_pdf:
         present_conversion_summary(
             state=state,
             output_mode="template",
@@ -1041,31 +1322,32 @@ def render(
             output_path=render_dir,
             render_result=render_result,
         )
-        if print_context:
+        if options.print_context:
             present_context_attributes(state=state, render_result=render_result)
-        if fonts_info:
+        if options.fonts_info:
             present_fonts_info(state, render_result)
-        _flush_diagnostics()
+        flush_diagnostics()
         return
 
     # Engine orchestration (binary selection, command/env build, run) lives in
     # ConversionService.build_pdf; the CLI keeps only presentation, the PDF copy,
     # and dependency-file emission. ``run_engine`` is injected so the engine run
     # stays a clean test seam (tests patch this module's ``run_engine_command``).
-    engine_choice = resolve_engine(engine, render_result.template_engine)
+    engine_choice = resolve_engine(options.engine, render_result.template_engine)
     state.console.print(f"[bold cyan]Running {engine_choice.label}…[/]")
 
     run_engine = getattr(render, "run_engine_command", run_engine_command)
     try:
-        engine_result: EngineResult = _SERVICE.build_pdf(
+        engine_result: EngineResult = service.build_pdf(
             render_result,
-            engine=engine,
-            classic_output=classic_output,
-            isolate_cache=isolate_cache,
+            engine=options.engine,
+            classic_output=options.classic_output,
+            isolate_cache=options.isolate_cache,
             console=state.console,
             verbosity=state.verbosity,
-            use_system_tectonic=system_tectonic,
+            use_system_tectonic=options.system_tectonic,
             run_engine=run_engine,
+            emitter=emitter,
         )
     except ConversionError as exc:
         emit_error(str(exc), exception=exc)
@@ -1082,7 +1364,7 @@ def render(
             state=state,
             log_path=engine_result.log_path,
             messages=messages,
-            open_log=open_log,
+            open_log=options.open_log,
         )
         emit_error(f"{engine_choice.label} exited with status {engine_result.returncode}")
         raise typer.Exit(code=engine_result.returncode)
@@ -1091,8 +1373,8 @@ def render(
     final_pdf_path = pdf_path
     dep_file_path: Path | None = None
 
-    if final_pdf_target is not None:
-        final_destination = final_pdf_target
+    if options.final_pdf_target is not None:
+        final_destination = options.final_pdf_target
         try:
             final_destination.parent.mkdir(parents=True, exist_ok=True)
         except OSError as exc:
@@ -1108,11 +1390,11 @@ def render(
             raise typer.Exit(code=1) from exc
         final_pdf_path = final_destination
 
-    if make_deps:
+    if options.make_deps:
         dependency_paths: set[Path] = set()
-        dependency_paths.update(document_paths)
-        dependency_paths.update(bibliography_files)
-        dependency_paths.update(shared_front_matter_paths)
+        dependency_paths.update(request.documents)
+        dependency_paths.update(request.bibliography_files)
+        dependency_paths.update(request.front_matter_paths)
         dependency_paths.add(render_result.main_tex_path)
         dependency_paths.update(render_result.fragment_paths)
         if render_result.bibliography_path:
@@ -1133,14 +1415,11 @@ def render(
             raise typer.Exit(code=1) from exc
 
     present_build_summary(state=state, render_result=render_result, pdf_path=final_pdf_path)
-    if fonts_info:
+    if options.fonts_info:
         present_fonts_info(state, render_result)
     if dep_file_path is not None:
         state.console.print(f"[cyan]Dependencies written to[/] {dep_file_path}")
-    _flush_diagnostics()
-
-    if cleanup_render_dir and cleanup_render_dir_path is not None:
-        shutil.rmtree(cleanup_render_dir_path, ignore_errors=True)
+    flush_diagnostics()
 
 
 # Expose runtime dependencies for test monkeypatching
@@ -16,6 +16,7 @@ from texsmith.adapters.latex.engines import (
     parse_latex_log,
 )
 from texsmith.core.conversion.core import ConversionBundle
+from texsmith.core.profiling import PhaseSpan, summarise_phases
 from texsmith.core.templates.session import TemplateRenderResult
 
 from .state import CLIState
@@ -293,6 +294,44 @@ def present_fonts_info(state: CLIState, render_result: TemplateRenderResult) ->
         )
 
 
+def present_profile(state: CLIState, spans: Sequence[PhaseSpan]) -> None:
+    """Display wall and CPU time per phase and per document, slowest first."""
+    rows = [
+        (
+            summary.phase,
+            summary.document or "",
+            str(summary.calls),
+            f"{summary.wall * 1000:.1f}",
+            f"{summary.cpu * 1000:.1f}",
+        )
+        for summary in summarise_phases(spans)
+    ]
+    if not rows:
+        typer.echo("Profile: no phases were recorded.")
+        return
+
+    console = _get_console(state)
+    if console is not None:
+        table, _text_cls, _box_module = _build_table(
+            title="Profile (inclusive times)",
+            columns=["Phase", "Document", "Calls", "Wall (ms)", "CPU (ms)"],
+        )
+        if table is not None:
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
+            return
+
+    header = ("phase", "document", "calls", "wall", "cpu")
+    widths = [max(len(row[index]) for row in (header, *rows)) for index in range(5)]
+    typer.echo("Profile (inclusive times, ms):")
+    for phase, document, calls, wall, cpu in (header, *rows):
+        typer.echo(
+            f"  {phase:<{widths[0]}}  {document:<{widths[1]}}  "
+            f"{calls:>{widths[2]}}  {wall:>{widths[3]}}  {cpu:>{widths[4]}}"
+        )
+
+
 def present_context_attributes(state: CLIState, render_result: TemplateRenderResult) -> None:
     """Display resolved context attributes with emitters and consumers."""
 
@@ -642,4 +681,5 @@ __all__ = [
     "present_conversion_summary",
     "present_html_summary",
     "present_latex_failure",
+    "present_profile",
 ]
@@ -0,0 +1,99 @@
+"""Polling file watcher backing ``texsmith render --watch``."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+import time
+
+
+Snapshot = dict[Path, tuple[int, int] | None]
+
+
+class FileWatcher:
+    """Report changes to a set of files and directories by polling their metadata.
+
+    Directories are watched recursively, so files created inside them after the
+    watcher started are reported as well. Polling keeps the watcher portable and
+    free of platform-specific notification backends.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path] = (),
+        *,
+        interval: float = 0.5,
+        debounce: float = 0.2,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.interval = interval
+        self.debounce = debounce
+        self._sleep = sleep
+        self._paths: set[Path] = set()
+        self._snapshot: Snapshot = {}
+        self.watch(paths)
+
+    @property
+    def paths(self) -> frozenset[Path]:
+        """Return the files and directories currently watched."""
+        return frozenset(self._paths)
+
+    def watch(self, paths: Iterable[Path]) -> None:
+        """Add ``paths`` to the watched set, recording their current state."""
+        added = {Path(path).resolve() for path in paths} - self._paths
+        if not added:
+            return
+        self._paths |= added
+        self._snapshot.update(_scan(added))
+
+    def poll(self) -> list[Path]:
+        """Return the paths created, modified or removed since the last poll."""
+        current = _scan(self._paths)
+        changed = sorted(
+            path
+            for path in current.keys() | self._snapshot.keys()
+            if current.get(path) != self._snapshot.get(path)
+        )
+        self._snapshot = current
+        return changed
+
+    def wait(self) -> list[Path]:
+        """Block until something changes, then return every path that changed.
+
+        Changes arriving within ``debounce`` seconds of each other are reported
+        together, so an editor writing several files at once triggers a single
+        rebuild.
+        """
+        changed: set[Path] = set()
+        while not changed:
+            self._sleep(self.interval)
+            changed.update(self.poll())
+        while True:
+            self._sleep(self.debounce)
+            burst = self.poll()
+            if not burst:
+                return sorted(changed)
+            changed.update(burst)
+
+
+def _scan(paths: Iterable[Path]) -> Snapshot:
+    snapshot: Snapshot = {}
+    for path in paths:
+        if path.is_dir():
+            for candidate in path.rglob("*"):
+                if candidate.is_file():
+                    snapshot[candidate] = _stat(candidate)
+        else:
+            snapshot[path] = _stat(path)
+    return snapshot
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+__all__ = ["FileWatcher"]
@@ -54,6 +54,35 @@ def _citation_keys_from_payload(text: str | None) -> list[str]:
     return [key.strip() for key in match.group(1).split(",") if key.strip()]
 
 
+def _attr(attrs: Sequence[tuple[str, str]], name: str) -> str | None:
+    """Return the value of ``name`` in an attrs tuple (last one wins, as ``dict``)."""
+    value = None
+    for key, item in attrs:
+        if key == name:
+            value = item
+    return value
+
+
+def _footnote_definitions(document: ir.Document) -> dict[str, ir.Div]:
+    """Index the ``Div role=footnote-def`` nodes of ``document`` by footnote id.
+
+    Nothing is rendered. Footnote definitions are block-level, so inline
+    subtrees are not descended into; a later definition of an id wins.
+    """
+    definitions: dict[str, ir.Div] = {}
+    stack: list[ir.Node] = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ir.Div) and _attr(node.attrs, "role") == "footnote-def":
+            footnote_id = _normalise_footnote_id(_attr(node.attrs, "id"))
+            if footnote_id:
+                definitions[footnote_id] = node
+        stack.extend(
+            child for child in reversed(ir.children(node)) if not isinstance(child, ir.Inline)
+        )
+    return definitions
+
+
 def _find_image(blocks: Sequence[ir.Block]) -> ir.Image | None:
     from texsmith.ir.visitor import walk
 
@@ -13,6 +13,7 @@ byte-identical.
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 import re
 import unicodedata
 
@@ -48,6 +49,10 @@ _COMMON_SYMBOL_MAP = {
     "∞": r"\(\infty\)",
 }
 
+_BASIC_ESCAPE_TABLE = str.maketrans(_BASIC_LATEX_ESCAPE_MAP)
+_ESCAPE_TABLE = str.maketrans({**_BASIC_LATEX_ESCAPE_MAP, **_COMMON_SYMBOL_MAP})
+_LATEX_SPECIAL_PATTERN = re.compile("[" + re.escape("".join(_BASIC_LATEX_ESCAPE_MAP)) + "]")
+
 _ACCENT_NEEDS_BRACES_PATTERN = re.compile(
     r"\\([" + re.escape("`'^\"~=\\.Hrvuck") + r"])\s*([A-Za-z])(?!\{)"
 )
@@ -72,48 +77,60 @@ def _wrap_latex_output(payload: str) -> str:
     return _ACCENT_CONTROL_TARGET_PATTERN.sub(_repl_control, payload)
 
 
+def _encode_legacy_chunk(chunk: str) -> str:
+    """Escape ``chunk`` and spell its non-ASCII characters as LaTeX macros."""
+    escaped = chunk.translate(_BASIC_ESCAPE_TABLE)
+    encoded = unicode_to_latex(escaped, non_ascii_only=True, unknown_char_warning=False)
+    return _wrap_latex_output(encoded)
+
+
+@lru_cache(maxsize=4096)
+def _is_script_letter(char: str) -> bool:
+    """Return whether ``char`` is a sub/superscript or modifier letter.
+
+    Such characters are kept verbatim (the sub/superscript transforms rewrite
+    them later). The ``unicodedata.name`` lookup is cached per codepoint.
+    """
+    try:
+        name = unicodedata.name(char)
+    except ValueError:
+        return False
+    if "SUPERSCRIPT" in name or "SUBSCRIPT" in name:
+        return True
+    return "MODIFIER LETTER" in name and ("SMALL" in name or "CAPITAL" in name)
+
+
 def escape_latex_chars(text: str, *, legacy_accents: bool = False) -> str:
     """Escape LaTeX special characters leveraging pylatexenc."""
     if not text:
         return text
+    if text.isascii():
+        if _LATEX_SPECIAL_PATTERN.search(text) is None:
+            return text
+        escaped = text.translate(_BASIC_ESCAPE_TABLE)
+        return _wrap_latex_output(escaped) if legacy_accents else escaped
+    if not legacy_accents:
+        # Script letters map to themselves, so one table covers every case.
+        return text.translate(_ESCAPE_TABLE)
+
+    # Legacy accents: common symbols and script letters split the text into
+    # chunks that pylatexenc encodes; only non-ASCII characters can split.
     parts: list[str] = []
-    buffer: list[str] = []
-
-    def _encode_chunk(chunk: str) -> str:
-        escaped = "".join(_BASIC_LATEX_ESCAPE_MAP.get(char, char) for char in chunk)
-        if legacy_accents:
-            encoded = unicode_to_latex(escaped, non_ascii_only=True, unknown_char_warning=False)
-            return _wrap_latex_output(encoded)
-        return escaped
-
-    def _should_skip_encoding(char: str) -> bool:
-        try:
-            name = unicodedata.name(char)
-        except ValueError:
-            return False
-        if "SUPERSCRIPT" in name or "SUBSCRIPT" in name:
-            return True
-        return "MODIFIER LETTER" in name and ("SMALL" in name or "CAPITAL" in name)
-
-    for char in text:
-        replacement = _COMMON_SYMBOL_MAP.get(char)
-        if replacement is not None:
-            if buffer:
-                parts.append(_encode_chunk("".join(buffer)))
-                buffer.clear()
-            parts.append(replacement)
+    start = 0
+    for index, char in enumerate(text):
+        if char.isascii():
             continue
-        if _should_skip_encoding(char):
-            if buffer:
-                parts.append(_encode_chunk("".join(buffer)))
-                buffer.clear()
-            parts.append(char)
-        else:
-            buffer.append(char)
-
-    if buffer:
-        parts.append(_encode_chunk("".join(buffer)))
-
+        replacement = _COMMON_SYMBOL_MAP.get(char)
+        if replacement is None:
+            if not _is_script_letter(char):
+                continue
+            replacement = char
+        if start < index:
+            parts.append(_encode_legacy_chunk(text[start:index]))
+        parts.append(replacement)
+        start = index + 1
+    if start < len(text):
+        parts.append(_encode_legacy_chunk(text[start:]))
     return "".join(parts)
 
 
@@ -185,7 +202,6 @@ _SUPERSCRIPT_MAP = {
     "ᵂ": "W",
 }
 
-_SUPERSCRIPT_PATTERN = re.compile(f"([{''.join(re.escape(char) for char in _SUPERSCRIPT_MAP)}]+)")
 
 _SUBSCRIPT_MAP = {
     "₀": "0",
@@ -227,7 +243,10 @@ _SUBSCRIPT_MAP = {
     "ᵪ": r"\chi",
 }
 
-_SUBSCRIPT_PATTERN = re.compile(f"([{''.join(re.escape(char) for char in _SUBSCRIPT_MAP)}]+)")
+_UNICODE_SCRIPT_PATTERN = re.compile(
+    f"([{''.join(re.escape(char) for char in _SUPERSCRIPT_MAP)}]+)"
+    f"|([{''.join(re.escape(char) for char in _SUBSCRIPT_MAP)}]+)"
+)
 
 _UNICODE_DASH_MAP = {
     "\N{EN DASH}": "--",
@@ -235,7 +254,6 @@ _UNICODE_DASH_MAP = {
     "\N{EM DASH}": "---",
     "\N{HORIZONTAL BAR}": "---",
 }
-_UNICODE_DASH_PATTERN = re.compile("[" + "".join(re.escape(k) for k in _UNICODE_DASH_MAP) + "]")
 
 _UNICODE_PUNCT_MAP = {
     "\N{RIGHT SINGLE QUOTATION MARK}": "'",
@@ -248,7 +266,9 @@ _UNICODE_PUNCT_MAP = {
     "\N{DOUBLE HIGH-REVERSED-9 QUOTATION MARK}": "''",
     "\N{HORIZONTAL ELLIPSIS}": "...",
 }
-_UNICODE_PUNCT_PATTERN = re.compile("[" + "".join(re.escape(k) for k in _UNICODE_PUNCT_MAP) + "]")
+
+# Smart quotes and dashes are plain character substitutions: one table pass.
+_UNICODE_TEXT_TABLE = str.maketrans({**_UNICODE_PUNCT_MAP, **_UNICODE_DASH_MAP})
 
 _MATH_PAYLOAD_PATTERN = re.compile(
     r"""
@@ -262,40 +282,13 @@ _MATH_PAYLOAD_PATTERN = re.compile(
 )
 
 
-def _replace_unicode_scripts(
-    text: str, pattern: re.Pattern[str], mapping: dict[str, str], command: str
-) -> str:
-    if not text:
-        return text
-
-    def _normalize(match: re.Match[str]) -> str:
-        payload = match.group(0)
-        normalized = "".join(mapping.get(char, char) for char in payload)
-        return f"\\{command}{{{normalized}}}"
-
-    return pattern.sub(_normalize, text)
-
-
-def _replace_unicode_superscripts(text: str) -> str:
-    return _replace_unicode_scripts(text, _SUPERSCRIPT_PATTERN, _SUPERSCRIPT_MAP, "textsuperscript")
-
-
-def _replace_unicode_subscripts(text: str) -> str:
-    return _replace_unicode_scripts(text, _SUBSCRIPT_PATTERN, _SUBSCRIPT_MAP, "textsubscript")
-
-
-def _replace_unicode_dashes(text: str) -> str:
-    if not text:
-        return text
-    return _UNICODE_DASH_PATTERN.sub(lambda match: _UNICODE_DASH_MAP.get(match.group(0), "-"), text)
-
-
-def _replace_unicode_punctuation(text: str) -> str:
-    if not text:
-        return text
-    return _UNICODE_PUNCT_PATTERN.sub(
-        lambda match: _UNICODE_PUNCT_MAP.get(match.group(0), ""), text
-    )
+def _normalize_script_run(match: re.Match[str]) -> str:
+    superscript = match.group(1)
+    if superscript is not None:
+        normalized = "".join(_SUPERSCRIPT_MAP[char] for char in superscript)
+        return f"\\textsuperscript{{{normalized}}}"
+    normalized = "".join(_SUBSCRIPT_MAP[char] for char in match.group(2))
+    return f"\\textsubscript{{{normalized}}}"
 
 
 def prepare_plain_text(text: str, *, legacy_accents: bool = False) -> str:
@@ -305,11 +298,12 @@ def prepare_plain_text(text: str, *, legacy_accents: bool = False) -> str:
     and dashes are normalised first, the text is escaped, then unicode
     sub/superscript runs become ``\\textsubscript`` / ``\\textsuperscript``.
     """
-    text = _replace_unicode_punctuation(text)
-    text = _replace_unicode_dashes(text)
+    if text.isascii():
+        # Every character the transforms rewrite is non-ASCII.
+        return escape_latex_chars(text, legacy_accents=legacy_accents)
+    text = text.translate(_UNICODE_TEXT_TABLE)
     escaped = escape_latex_chars(text, legacy_accents=legacy_accents)
-    escaped = _replace_unicode_superscripts(escaped)
-    return _replace_unicode_subscripts(escaped)
+    return _UNICODE_SCRIPT_PATTERN.sub(_normalize_script_run, escaped)
 
 
 def _segment_text_with_emoji(text: str) -> list[tuple[str, str]]:
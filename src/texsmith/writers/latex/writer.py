@@ -10,8 +10,9 @@ mutate-and-flatten pipeline byte-for-byte.
 
 from __future__ import annotations
 
+from itertools import groupby
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from requests.utils import requote_uri as requote_url
 
@@ -22,6 +23,7 @@ from .._ir_queries import (
     _citation_keys_from_payload,
     _find_image,
     _find_table,
+    _footnote_definitions,
     _normalise_footnote_id,
     _split_citation_keys,
 )
@@ -29,7 +31,8 @@ from .escaper import _MATH_PAYLOAD_PATTERN, escape_latex_chars, escape_text_segm
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from typing import TextIO
 
     from .state import WriterState
 
@@ -52,6 +55,10 @@ _CODE_ENGINES = {"minted", "listings", "verbatim", "pygments"}
 _BLOCK_MATH_ENVIRONMENTS = {"align", "align*", "equation", "equation*"}
 _LANGUAGE_TOKEN = re.compile(r"^[A-Za-z0-9_+\-#.]+$")
 _LONE_BOLD_LIMIT = 80
+# Characters of a script run buffered before its font usage is recorded.
+_SCRIPT_SCAN_LIMIT = 65536
+# Distinct text runs memoised per writer (``runtime["escape_cache_size"]``).
+DEFAULT_ESCAPE_CACHE_SIZE = 4096
 
 
 class LaTeXWriter:
@@ -60,6 +67,7 @@ class LaTeXWriter:
     def __init__(self, state: WriterState) -> None:
         self.state = state
         self._invalid_footnotes: set[str] = set()
+        self._footnote_defs: dict[str, ir.Div] = {}
         cls = type(self)
         # One registry per concrete class (a subclass that adds ``@writes``
         # emitters gets its own, not the base class's cached one).
@@ -69,50 +77,83 @@ class LaTeXWriter:
             registry.collect_from_class(cls)
             cls._registry = registry  # type: ignore[attr-defined]
         self.registry = registry
+        # Bound emitters keyed by concrete node type, filled on first use so
+        # ``emit`` is a single dictionary lookup in the hot loop.
+        self._emitters: dict[type, Callable[[Any], str]] = {}
+        self._escape_cache: dict[tuple[str, bool, object], str] = {}
+        self._escape_cache_size: int | None = None
+        # Bumped by every artifact emoji render: a run that triggered one
+        # registered an asset and must be escaped again next time.
+        self._emoji_artifacts = 0
 
     # -- public API --------------------------------------------------------
 
     def write(self, document: ir.Document) -> str:
         """Render a full document IR to LaTeX."""
+        chunks: list[str] = []
+        self.write_to(document, chunks)
+        return "".join(chunks)
+
+    def write_to(self, document: ir.Document, sink: TextIO | list[str]) -> None:
+        """Stream a full document IR to ``sink`` as LaTeX.
+
+        ``sink`` is a text stream or a list collecting the chunks. Top-level
+        blocks and script environments are written as they are emitted, so the
+        document is never assembled into one string. Footnote bodies are
+        rendered at their first reference.
+        """
+        from texsmith.fonts.scripts import flush_fallback_usage
+
+        put = sink.append if isinstance(sink, list) else sink.write
         self._collect_footnotes(document)
-        return self._join_blocks(document.content)
+        for chunk in self._block_chunks(document.content):
+            put(chunk)
+        self._flush_footnotes()
+        flush_fallback_usage(self.state)
 
     def _collect_footnotes(self, document: ir.Document) -> None:
-        """Pre-pass: harvest footnote definition bodies into the state.
+        """Index the footnote definitions of ``document`` without rendering them.
 
-        Mirrors the legacy ``render_footnotes`` body collection: each
-        ``Div role=footnote-def id=<fn>`` is reduced to its single-line text and
-        stored in ``state.footnotes`` keyed by the normalised identifier, so
-        ``footnote-ref`` sites can resolve to a ``\\footnote`` or ``\\cite``.
+        Bodies are rendered once, when their first ``footnote-ref`` site is
+        emitted (see :meth:`_footnote_payload`); definitions no reference used
+        are resolved by :meth:`_flush_footnotes` after the document.
+        """
+        self._footnote_defs = _footnote_definitions(document)
+
+    def _footnote_payload(self, footnote_id: str) -> str | None:
+        """Return the body of footnote ``footnote_id``, rendering it on first use."""
+        definition = self._footnote_defs.pop(footnote_id, None)
+        if definition is not None:
+            self._resolve_footnote(footnote_id, definition)
+        return self.state.state.footnotes.get(footnote_id)
+
+    def _resolve_footnote(self, footnote_id: str, definition: ir.Div) -> None:
+        """Render a footnote definition body into ``state.footnotes``.
+
+        Mirrors the legacy ``render_footnotes`` body collection: the body is
+        reduced to its single-line text, so ``footnote-ref`` sites can resolve
+        to a ``\\footnote`` or ``\\cite``.
         """
         import warnings
 
-        from texsmith.ir.visitor import walk
+        text = self._footnote_body_text(definition.content)
+        lines = [line for line in text.splitlines() if line.strip()]
+        if len(lines) > 1:
+            warnings.warn(
+                f"Footnote '{footnote_id}' spans multiple lines and cannot be "
+                "rendered; dropping it.",
+                stacklevel=2,
+            )
+            # Record so the reference site is dropped silently (not warned).
+            self._invalid_footnotes.add(footnote_id)
+            return
+        self.state.state.footnotes[footnote_id] = text.strip()
 
-        footnotes: dict[str, str] = {}
-        for node in walk(document):
-            if not isinstance(node, ir.Div):
-                continue
-            attrs = dict(node.attrs)
-            if attrs.get("role") != "footnote-def":
-                continue
-            footnote_id = _normalise_footnote_id(attrs.get("id"))
-            if not footnote_id:
-                continue
-            text = self._footnote_body_text(node.content)
-            lines = [line for line in text.splitlines() if line.strip()]
-            if len(lines) > 1:
-                warnings.warn(
-                    f"Footnote '{footnote_id}' spans multiple lines and cannot be "
-                    "rendered; dropping it.",
-                    stacklevel=2,
-                )
-                # Record so the reference site is dropped silently (not warned).
-                self._invalid_footnotes.add(footnote_id)
-                continue
-            footnotes[footnote_id] = text.strip()
-        if footnotes:
-            self.state.state.footnotes.update(footnotes)
+    def _flush_footnotes(self) -> None:
+        """Resolve the definitions no reference used (a later fragment may)."""
+        while self._footnote_defs:
+            footnote_id = next(iter(self._footnote_defs))
+            self._resolve_footnote(footnote_id, self._footnote_defs.pop(footnote_id))
 
     def _footnote_body_text(self, blocks: Sequence[ir.Block]) -> str:
         return self._blocks(blocks).strip()
@@ -121,10 +162,19 @@ class LaTeXWriter:
 
     def emit(self, node: ir.Node) -> str:
         """Emit a single node, dispatching by type."""
-        method = self.registry.method_for(node)
+        emitter = self._emitters.get(type(node))
+        if emitter is None:
+            emitter = self._bind_emitter(node)
+        return emitter(node)
+
+    def _bind_emitter(self, node: ir.Node) -> Callable[[Any], str]:
+        """Resolve and cache the bound emitter for the type of ``node``."""
+        method = self.registry.method_for_type(type(node))
         if method is None:
             raise LaTeXWriteError(node)
-        return getattr(self, method)(node)
+        emitter = getattr(self, method)
+        self._emitters[type(node)] = emitter
+        return emitter
 
     def _blocks(self, blocks: Sequence[ir.Block]) -> str:
         return self._join_blocks(blocks)
@@ -138,31 +188,32 @@ class LaTeXWriter:
         string. We reproduce that — emitters carry their own trailing newlines,
         the join contributes the inter-block ``\\n``.
         """
-        merged = self._merge_script_blocks(blocks)
-        parts = [self.emit(block) for block in merged]
-        return "\n".join(part for part in parts if part)
+        return "".join(self._block_chunks(blocks))
 
-    @staticmethod
-    def _merge_script_blocks(blocks: Sequence[ir.Block]) -> list[ir.Block]:
-        """Merge consecutive ``Div role=script`` siblings of the same slug.
+    def _block_chunks(self, blocks: Iterable[ir.Block]) -> Iterator[str]:
+        """Yield the emissions of ``blocks`` and the newlines between them.
 
         The legacy ``_render_script_paragraphs`` grouped a run of
-        ``<p data-script=slug>`` siblings into a single ``\\begin{slug}…`` env.
+        ``<p data-script=slug>`` siblings into a single ``\\begin{slug}…`` env:
+        consecutive ``Div role=script`` siblings with the same attributes are
+        streamed as one environment.
         """
-        out: list[ir.Block] = []
-        for block in blocks:
-            if (
-                isinstance(block, ir.Div)
-                and dict(block.attrs).get("role") == "script"
-                and out
-                and isinstance(out[-1], ir.Div)
-                and dict(out[-1].attrs) == dict(block.attrs)
-            ):
-                prev = out[-1]
-                out[-1] = ir.Div(content=(*prev.content, *block.content), attrs=prev.attrs)
+        separator = ""
+        for key, group in groupby(blocks, key=_script_run_key):
+            if key is not None:
+                if separator:
+                    yield separator
+                paragraphs = (child for div in group for child in div.content)
+                yield from self._script_chunks(dict(key).get("script", ""), paragraphs)
+                separator = "\n"
                 continue
-            out.append(block)
-        return out
+            for block in group:
+                part = self.emit(block)
+                if part:
+                    if separator:
+                        yield separator
+                    yield part
+                    separator = "\n"
 
     def _inlines(self, inlines: Sequence[ir.Inline]) -> str:
         return "".join(self.emit(node) for node in inlines)
@@ -223,6 +274,7 @@ class LaTeXWriter:
         command = _str_runtime(runtime.get("emoji_command"), r"\texsmithEmoji")
         if mode != "artifact":
             return f"{command}{{{token}}}" if token else ""
+        self._emoji_artifacts += 1
         url = (
             "https://twemoji.maxcdn.com/v/latest/svg/"
             + "-".join(f"{ord(c):x}" for c in token)
@@ -244,10 +296,33 @@ class LaTeXWriter:
 
         Mirrors the legacy ``escape_plain_text``: ``$…$`` / ``\\(…\\)`` / ``\\[…\\]``
         and math environments are kept verbatim; only the surrounding prose is
-        escaped (and emoji-segmented).
+        escaped (and emoji-segmented). Results are memoised per writer, except
+        for runs whose emoji were rendered as artifacts.
         """
         if not text:
             return text
+        runtime = self.state.runtime
+        key = (text, self.state.legacy_accents, runtime.get("emoji_mode"))
+        cache = self._escape_cache
+        escaped = cache.get(key)
+        if escaped is not None:
+            return escaped
+        artifacts = self._emoji_artifacts
+        escaped = self._escape_text(text)
+        if self._emoji_artifacts == artifacts:
+            size = self._escape_cache_size
+            if size is None:
+                size = self._escape_cache_size = _int_runtime(
+                    runtime.get("escape_cache_size"), DEFAULT_ESCAPE_CACHE_SIZE
+                )
+            if size > 0:
+                if len(cache) >= size:
+                    # Evict the oldest entry; frequent words are seen early.
+                    del cache[next(iter(cache))]
+                cache[key] = escaped
+        return escaped
+
+    def _escape_text(self, text: str) -> str:
         # Raw ``\keystroke{…}`` / ``\keystrokes{…}`` typed directly in the source
         # is left verbatim, mirroring the legacy ``escape_plain_text`` guard.
         if "\\keystroke{" in text or "\\keystrokes{" in text:
@@ -277,6 +352,10 @@ class LaTeXWriter:
     def _str(self, node: ir.Str) -> str:
         return self._text(node.text)
 
+    @writes(ir.TextRun)
+    def _text_run(self, node: ir.TextRun) -> str:
+        return self._inlines(node.expand())
+
     @writes(ir.Space)
     def _space(self, _node: ir.Space) -> str:
         return " "
@@ -630,6 +709,8 @@ class LaTeXWriter:
                     parts.append(node.text)
                 elif isinstance(node, ir.Space):
                     parts.append(" ")
+                elif isinstance(node, ir.TextRun):
+                    parts.append(self._plain_text(node.expand()))
         return "".join(parts)
 
     def _script_wrap_block_heading(self, rendered: str) -> str:
@@ -826,11 +907,11 @@ class LaTeXWriter:
 
     def _render_footnote_ref(self, node: ir.Span, ref: str) -> str:
         footnote_id = _normalise_footnote_id(ref)
+        payload = self._footnote_payload(footnote_id)
         if footnote_id in self._invalid_footnotes:
             # Body was dropped (e.g. multi-line) — drop the marker silently.
             return ""
         bibliography = self.state.state.bibliography
-        payload = self.state.state.footnotes.get(footnote_id)
 
         # A footnote body that is purely a comma-separated citation key list
         # resolves to a citation (with on-demand DOI materialisation), mirroring
@@ -861,6 +942,7 @@ class LaTeXWriter:
         if footnote_id:
             import warnings
 
+            self.state.state.unresolved_footnotes.append(footnote_id)
             warnings.warn(
                 f"Reference to '{footnote_id}' is not in your bibliography...",
                 stacklevel=2,
@@ -946,8 +1028,8 @@ class LaTeXWriter:
                     return self._render_mermaid(diagram, width=width)
             return self._blocks(node.content)
         if role in {"footnotes", "footnote-def"}:
-            # Footnote definition bodies are harvested in the write() pre-pass
-            # and resolved at footnote-ref sites; the containers emit nothing.
+            # Footnote definitions are indexed before the write pass and their
+            # bodies rendered at footnote-ref sites; the containers emit nothing.
             return ""
         if role == "table-fallback":
             return self._blocks(node.content)
@@ -961,20 +1043,37 @@ class LaTeXWriter:
         return self.state.formatter.render_template("epigraph", text=text, source=source or None)
 
     def _render_script_paragraphs(self, node: ir.Div, slug: str) -> str:
+        return "".join(self._script_chunks(slug, node.content))
+
+    def _script_chunks(self, slug: str, blocks: Iterable[ir.Block]) -> Iterator[str]:
+        """Stream the paragraphs of ``blocks`` as one ``slug`` environment.
+
+        Only the plain text awaiting the font-usage scan is held back, and it
+        is scanned whenever it reaches ``_SCRIPT_SCAN_LIMIT`` characters.
+        """
         from texsmith.fonts.scripts import record_script_usage_for_slug
 
-        bodies: list[str] = []
-        plains: list[str] = []
-        for block in node.content:
-            if isinstance(block, ir.Para):
-                raw = self._plain_text(block.content)
-                if not raw.strip():
-                    continue
-                bodies.append(escape_latex_chars(raw, legacy_accents=self.state.legacy_accents))
-                plains.append(raw)
-        record_script_usage_for_slug(slug, "\n\n".join(plains), self.state)
-        content = "\n\n".join(bodies)
-        return f"\\begin{{{slug}}}\n{content}\n\\end{{{slug}}}\n\n"
+        yield f"\\begin{{{slug}}}\n"
+        pending: list[str] = []
+        pending_size = 0
+        scanned = False
+        for block in blocks:
+            if not isinstance(block, ir.Para):
+                continue
+            raw = self._plain_text(block.content)
+            if not raw.strip():
+                continue
+            if pending or scanned:
+                yield "\n\n"
+            yield escape_latex_chars(raw, legacy_accents=self.state.legacy_accents)
+            pending.append(raw)
+            pending_size += len(raw)
+            if pending_size >= _SCRIPT_SCAN_LIMIT:
+                record_script_usage_for_slug(slug, "\n\n".join(pending), self.state)
+                pending, pending_size, scanned = [], 0, True
+        if pending or not scanned:
+            record_script_usage_for_slug(slug, "\n\n".join(pending), self.state)
+        yield f"\n\\end{{{slug}}}\n\n"
 
     # -- admonition / callout ---------------------------------------------
 
@@ -1202,12 +1301,27 @@ class LaTeXWriteError(RuntimeError):
 # --------------------------------------------------------------------------- #
 
 
+def _script_run_key(block: ir.Block) -> frozenset[tuple[str, str]] | None:
+    """Group key of a ``Div role=script`` block, ``None`` for any other block."""
+    if isinstance(block, ir.Div):
+        attrs = dict(block.attrs)
+        if attrs.get("role") == "script":
+            return frozenset(attrs.items())
+    return None
+
+
 def _str_runtime(value: object, default: str) -> str:
     if isinstance(value, str) and value.strip():
         return value.strip()
     return default
 
 
+def _int_runtime(value: object, default: int) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return max(value, 0)
+    return default
+
+
 def _payload_is_block_environment(payload: str) -> bool:
     stripped = payload.lstrip()
     match = re.match(r"\\begin\{([^}]+)\}", stripped)
@@ -52,6 +52,9 @@ class WriterRegistry:
 
     def __init__(self) -> None:
         self._by_type: dict[type, str] = {}
+        # MRO resolutions memoised per concrete node type (``None`` included,
+        # so an unhandled type is not walked again either).
+        self._resolved: dict[type, str | None] = {}
 
     def collect_from_class(self, cls: type) -> None:
         """Register every ``@writes`` method declared on ``cls`` (and bases).
@@ -64,14 +67,25 @@ class WriterRegistry:
                 node_type = getattr(attr, _EMITTER_ATTR, None)
                 if node_type is not None:
                     self._by_type[node_type] = name
+        self._resolved.clear()
 
     def method_for(self, node: object) -> str | None:
         """Return the emitter method name for ``node`` (by exact type, then MRO)."""
-        for klass in type(node).__mro__:
+        return self.method_for_type(type(node))
+
+    def method_for_type(self, node_type: type) -> str | None:
+        """Return the emitter method name for ``node_type``, resolved once per type."""
+        try:
+            return self._resolved[node_type]
+        except KeyError:
+            pass
+        method: str | None = None
+        for klass in node_type.__mro__:
             method = self._by_type.get(klass)
             if method is not None:
-                return method
-        return None
+                break
+        self._resolved[node_type] = method
+        return method
 
 
 __all__ = ["WriterRegistry", "writes"]
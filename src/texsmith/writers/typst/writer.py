@@ -35,7 +35,7 @@ builds (``.bib`` files + inline DOI), which the scaffolding wires via
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from texsmith.ir import nodes as ir
 from texsmith.writers.registry import WriterRegistry, writes
@@ -44,6 +44,7 @@ from .._ir_queries import (
     _citation_keys_from_payload,
     _find_image,
     _find_table,
+    _footnote_definitions,
     _normalise_footnote_id,
     _split_citation_keys,
 )
@@ -51,7 +52,7 @@ from .escaper import escape_typst_chars
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from .state import TypstWriterState
 
@@ -74,6 +75,9 @@ class TypstWriter:
             registry.collect_from_class(cls)
             cls._registry = registry  # type: ignore[attr-defined]
         self.registry = registry
+        # Bound emitters keyed by concrete node type, filled on first use so
+        # ``emit`` is a single dictionary lookup in the hot loop.
+        self._emitters: dict[type, Callable[[Any], str]] = {}
 
     # -- public API --------------------------------------------------------
 
@@ -91,18 +95,8 @@ class TypstWriter:
         id=<fn>`` is reduced to its single-line text so a ``footnote-ref`` site
         can resolve to a Typst ``#footnote`` or a ``@key`` citation.
         """
-        from texsmith.ir.visitor import walk
-
         footnotes: dict[str, str] = {}
-        for node in walk(document):
-            if not isinstance(node, ir.Div):
-                continue
-            attrs = dict(node.attrs)
-            if attrs.get("role") != "footnote-def":
-                continue
-            footnote_id = _normalise_footnote_id(attrs.get("id"))
-            if not footnote_id:
-                continue
+        for footnote_id, node in _footnote_definitions(document).items():
             text = self.render_inline_blocks(node.content).strip()
             lines = [line for line in text.splitlines() if line.strip()]
             if len(lines) > 1:
@@ -118,10 +112,19 @@ class TypstWriter:
 
     def emit(self, node: ir.Node) -> str:
         """Emit a single node, dispatching by type."""
-        method = self.registry.method_for(node)
+        emitter = self._emitters.get(type(node))
+        if emitter is None:
+            emitter = self._bind_emitter(node)
+        return emitter(node)
+
+    def _bind_emitter(self, node: ir.Node) -> Callable[[Any], str]:
+        """Resolve and cache the bound emitter for the type of ``node``."""
+        method = self.registry.method_for_type(type(node))
         if method is None:
             raise TypstWriteError(node)
-        return getattr(self, method)(node)
+        emitter = getattr(self, method)
+        self._emitters[type(node)] = emitter
+        return emitter
 
     def _join_blocks(self, blocks: Sequence[ir.Block]) -> str:
         parts = [self.emit(block) for block in blocks]
@@ -161,6 +164,10 @@ class TypstWriter:
     def _str(self, node: ir.Str) -> str:
         return escape_typst_chars(node.text)
 
+    @writes(ir.TextRun)
+    def _text_run(self, node: ir.TextRun) -> str:
+        return self._inlines(node.expand())
+
     @writes(ir.Space)
     def _space(self, _node: ir.Space) -> str:
         return " "
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from texsmith.core.conversion import ConversionRequest
+
+
+@pytest.fixture
+def write_document(tmp_path: Path) -> Callable[[str, str], Path]:
+    """Return a factory writing ``<name>.md`` under ``tmp_path`` with a title and ``body``."""
+
+    def _write(name: str, body: str) -> Path:
+        path = tmp_path / f"{name}.md"
+        path.write_text(f"# {name.title()}\n\n{body}\n", encoding="utf-8")
+        return path
+
+    return _write
+
+
+@pytest.fixture
+def conversion_request(tmp_path: Path) -> Callable[..., ConversionRequest]:
+    """Return a factory for requests rendering under ``tmp_path`` without copying assets."""
+
+    def _request(
+        documents: list[Path], *, render_dir: str = "build", **options: Any
+    ) -> ConversionRequest:
+        options.setdefault("copy_assets", False)
+        return ConversionRequest(documents=documents, render_dir=tmp_path / render_dir, **options)
+
+    return _request
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from texsmith.adapters.latex.engines import EngineResult
+from texsmith.core.conversion import ConversionRequest, service as service_module
+from texsmith.core.conversion.debug import ConversionError
+from texsmith.core.conversion.service import ConversionService
+from texsmith.ui.cli import app
+from texsmith.ui.cli.batch import load_jobs
+
+
+@pytest.fixture
+def letter(
+    write_document: Callable[[str, str], Path],
+    conversion_request: Callable[..., ConversionRequest],
+) -> Callable[..., ConversionRequest]:
+    def _letter(name: str, **options: object) -> ConversionRequest:
+        return conversion_request(
+            [write_document(name, f"Dear {name}.")],
+            render_dir=f"build/{name}",
+            embed_fragments=True,
+            **options,
+        )
+
+    return _letter
+
+
+def test_execute_many_shares_template_runtime(
+    letter: Callable[..., ConversionRequest], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads: list[str] = []
+    original = service_module.load_template_runtime
+
+    def _tracking(identifier: str):
+        loads.append(identifier)
+        return original(identifier)
+
+    monkeypatch.setattr(service_module, "load_template_runtime", _tracking)
+    requests = [letter(f"customer{index}", template="article") for index in range(4)]
+
+    outcomes = ConversionService().execute_many(requests, workers=3)
+
+    assert loads == ["article"]
+    assert [outcome.ok for outcome in outcomes] == [True] * 4
+    for index, outcome in enumerate(outcomes):
+        main_tex = outcome.response.render_result.main_tex_path
+        assert f"Dear customer{index}." in main_tex.read_text(encoding="utf-8")
+        assert {"queued", "execute", "total"} <= outcome.timings.keys()
+
+
+def test_execute_many_checks_template_files_once_per_batch(
+    letter: Callable[..., ConversionRequest], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    walks: list[object] = []
+    original = service_module._template_files
+
+    def _tracking(runtime):
+        walks.append(runtime)
+        return original(runtime)
+
+    monkeypatch.setattr(service_module, "_template_files", _tracking)
+    service = ConversionService()
+
+    first = service.execute_many(
+        [letter(f"first{index}", template="article") for index in range(4)], workers=3
+    )
+    assert len(walks) == 1
+    second = service.execute_many(
+        [letter(f"second{index}", template="article") for index in range(4)], workers=3
+    )
+
+    assert len(walks) == 2
+    assert [outcome.ok for outcome in (*first, *second)] == [True] * 8
+
+
+def test_execute_many_records_failures_without_stopping(
+    tmp_path: Path,
+    letter: Callable[..., ConversionRequest],
+    conversion_request: Callable[..., ConversionRequest],
+) -> None:
+    missing = conversion_request([tmp_path / "missing.md"], render_dir="build/missing")
+    requests = [letter("first"), missing, letter("last")]
+
+    outcomes = ConversionService().execute_many(requests, workers=2)
+
+    assert [outcome.ok for outcome in outcomes] == [True, False, True]
+    assert outcomes[1].response is None
+    assert outcomes[1].to_json()["status"] == "failed"
+    assert "missing.md" in outcomes[1].to_json()["error"]
+    assert "Dear last." in outcomes[2].response.bundle.fragments[0].latex
+
+
+def test_execute_many_records_unexpected_errors(
+    letter: Callable[..., ConversionRequest], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = ConversionService()
+
+    def _build(render_result, **options) -> EngineResult:
+        raise RuntimeError("engine wrapper bug")
+
+    monkeypatch.setattr(service, "build_pdf", _build)
+
+    outcomes = service.execute_many(
+        [letter("letter", template="article"), letter("raw")],
+        workers=2,
+        build=True,
+    )
+
+    assert [outcome.ok for outcome in outcomes] == [False, True]
+    assert isinstance(outcomes[0].error, RuntimeError)
+    assert outcomes[0].to_json()["error"] == "engine wrapper bug"
+    assert "Dear raw." in outcomes[1].response.bundle.fragments[0].latex
+
+
+def test_execute_many_builds_templates(
+    letter: Callable[..., ConversionRequest], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = ConversionService()
+    calls: list[dict[str, object]] = []
+
+    def _build(render_result, **options) -> EngineResult:
+        calls.append(options)
+        pdf = render_result.main_tex_path.with_suffix(".pdf")
+        return EngineResult(1, [], ["tectonic"], pdf.with_suffix(".log"), pdf)
+
+    monkeypatch.setattr(service, "build_pdf", _build)
+
+    outcomes = service.execute_many(
+        [letter("letter", template="article"), letter("raw")],
+        build=True,
+        build_options={"engine": "lualatex"},
+    )
+
+    assert calls == [{"engine": "lualatex"}]
+    assert outcomes[0].to_json()["returncode"] == 1
+    assert not outcomes[0].ok
+    assert "build" not in outcomes[1].timings
+    assert outcomes[1].ok
+
+
+def test_build_request_resolves_paths_against_base_dir(tmp_path: Path) -> None:
+    bibliography = tmp_path / "refs.bib"
+    bibliography.write_text("", encoding="utf-8")
+
+    request = ConversionService().build_request(
+        {"documents": ["doc.md", "refs.bib"], "render_dir": "out"}, base_dir=tmp_path
+    )
+
+    assert list(request.documents) == [tmp_path / "doc.md"]
+    assert list(request.bibliography_files) == [bibliography]
+    assert request.render_dir == tmp_path / "out"
+    with pytest.raises(ConversionError, match="Unknown parameters: bogus"):
+        ConversionService().build_request({"documents": ["a.md"], "render_dir": "b", "bogus": 1})
+
+
+def test_jobs_file_merges_defaults_and_names_jobs(tmp_path: Path) -> None:
+    jobs_file = tmp_path / "jobs.yaml"
+    jobs_file.write_text(
+        "template: article\ntemplate_options: {a: 1}\njobs:\n"
+        "  - documents: [letters/acme.md]\n    template_options: {b: 2}\n"
+        "  - name: second\n    documents: [globex.md]\n    template: book\n",
+        encoding="utf-8",
+    )
+
+    first, second = load_jobs(jobs_file)
+
+    assert first.name == "acme"
+    assert first.params["template_options"] == {"a": 1, "b": 2}
+    assert second.name == "second"
+    assert second.params["template"] == "book"
+    jobs_file.write_text("jobs:\n  - documents: [a.md]\n  - documents: [a.md]\n", encoding="utf-8")
+    with pytest.raises(ConversionError, match="Duplicate job name 'a'"):
+        load_jobs(jobs_file)
+
+
+def test_cli_batch_prints_json_summary(
+    tmp_path: Path, write_document: Callable[[str, str], Path]
+) -> None:
+    write_document("acme", "Dear ACME.")
+    write_document("globex", "Dear Globex.")
+    jobs_file = tmp_path / "jobs.yaml"
+    jobs_file.write_text(
+        "template: article\ncopy_assets: false\nembed_fragments: true\njobs:\n"
+        "  - documents: [acme.md]\n  - documents: [globex.md]\n"
+        "  - documents: [acme.md]\n    name: broken\n    bogus: true\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "out"
+
+    result = CliRunner().invoke(app, ["--batch", str(jobs_file), "-o", str(output), "-j", "2"])
+
+    assert result.exit_code == 1, result.output
+    summary = json.loads(result.stdout[result.stdout.index("{") :])
+    assert [job["status"] for job in summary["jobs"]] == ["ok", "ok", "failed"]
+    assert (summary["succeeded"], summary["failed"]) == (2, 1)
+    assert "Dear Globex." in (output / "globex" / "globex.tex").read_text(encoding="utf-8")
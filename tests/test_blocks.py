@@ -2,6 +2,9 @@ import pytest
 
 from texsmith.adapters.latex import LaTeXRenderer
 from texsmith.core.config import BookConfig
+from texsmith.core.context import DocumentState
+from texsmith.ir import nodes as ir
+from texsmith.writers.latex import LaTeXWriter
 
 
 @pytest.fixture
@@ -269,6 +272,58 @@ def test_multiline_footnote_removed(renderer: LaTeXRenderer) -> None:
     assert "\\footnote" not in latex
 
 
+def test_footnote_bodies_render_once_and_unreferenced_ones_are_kept(
+    renderer: LaTeXRenderer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    html = (
+        '<p>A<sup id="fnref:a"><a class="footnote-ref" href="#fn:a">1</a></sup>'
+        ' and again<sup id="fnref2:a"><a class="footnote-ref" href="#fn:a">1</a></sup>.</p>\n'
+        '<div class="footnote"><ol>'
+        '<li id="fn:a"><p>The note.</p></li><li id="fn:b"><p>Unused.</p></li>'
+        "</ol></div>"
+    )
+    rendered: list[str] = []
+    body_text = LaTeXWriter._footnote_body_text
+
+    def counting(self: LaTeXWriter, blocks: tuple[ir.Block, ...]) -> str:
+        text = body_text(self, blocks)
+        rendered.append(text)
+        return text
+
+    monkeypatch.setattr(LaTeXWriter, "_footnote_body_text", counting)
+    state = DocumentState()
+
+    latex = renderer.render(html, state=state)
+
+    assert latex.count("\\footnote{The note.}") == 2
+    assert rendered == ["The note.", "Unused."]
+    assert state.footnotes == {"a": "The note.", "b": "Unused."}
+
+
+def test_footnote_acronyms_register_at_the_reference_site(renderer: LaTeXRenderer) -> None:
+    """Acronyms in a footnote body are registered where the footnote is referenced.
+
+    Registration order decides which definition keeps the bare key and the
+    order of the glossary, so a body-text acronym that precedes the reference
+    wins over a conflicting one defined in the footnote.
+    """
+    html = (
+        '<p><abbr title="Xylophone Y Z">XYZ</abbr> and <abbr title="Address Bus">AB</abbr>'
+        ' then<sup id="fnref:n"><a class="footnote-ref" href="#fn:n">1</a></sup>'
+        ' and <abbr title="Quite Rare">QR</abbr>.</p>\n'
+        '<div class="footnote"><ol><li id="fn:n"><p>About <abbr title="Alpha Beta C">ABC</abbr>'
+        ' and <abbr title="Alpha Beta">AB</abbr>.</p></li></ol></div>'
+    )
+    state = DocumentState()
+
+    with pytest.warns(UserWarning, match="Inconsistent acronym definition for 'AB'"):
+        latex = renderer.render(html, state=state)
+
+    assert "\\footnote{About \\acrshort{ABC} and \\acrshort{AB}.}" in latex
+    assert list(state.acronyms) == ["XYZ", "AB", "ABC", "QR"]
+    assert state.acronyms["AB"] == ("AB", "Address Bus")
+
+
 def test_horizontal_rule_removed(renderer: LaTeXRenderer) -> None:
     html = "<p>Before</p><hr /><p>After</p>"
     latex = renderer.render(html)
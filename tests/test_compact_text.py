@@ -0,0 +1,100 @@
+"""LaTeX output with the compact IR text representation enabled."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from texsmith.adapters.latex import LaTeXRenderer
+from texsmith.core.conversion import ConversionRequest
+from texsmith.core.conversion.service import ConversionService
+from texsmith.ir import nodes as ir, walk
+from texsmith.ui.cli import app
+from texsmith.writers.latex import LaTeXWriter
+
+
+HTML = (
+    "<h2 id='intro'>An  <em>emphasised</em> heading</h2>\n"
+    "<p>\n  Prose with 50% of $x + y$ math, a\nsoft break,<br>a hard one and "
+    "<strong>bold # words</strong>.</p>\n"
+    "<ul><li>first item</li><li>second\titem</li></ul>\n"
+    "<blockquote><p>Quoted text &amp; more.</p></blockquote>\n"
+    "<p>Greek: αβγ δεζ, and ~tilde~ or _under_score.</p>"
+)
+
+MARKDOWN = (
+    "# Title\n\n"
+    "Some *emphasis*, a footnote[^1] and `code`.\n\n"
+    "- one item\n- two items\n\n"
+    "[^1]: The note text.\n"
+)
+
+
+@pytest.fixture
+def written(monkeypatch: pytest.MonkeyPatch) -> list[ir.Document]:
+    documents: list[ir.Document] = []
+    write_to = LaTeXWriter.write_to
+
+    def _record(self: LaTeXWriter, document: ir.Document, sink: Any) -> None:
+        documents.append(document)
+        write_to(self, document, sink)
+
+    monkeypatch.setattr(LaTeXWriter, "write_to", _record)
+    return documents
+
+
+def _has_text_runs(documents: list[ir.Document]) -> bool:
+    return any(isinstance(node, ir.TextRun) for document in documents for node in walk(document))
+
+
+def test_renderer_output_is_unchanged_with_compact_text(
+    tmp_path: Path, written: list[ir.Document]
+) -> None:
+    expected = LaTeXRenderer(output_root=tmp_path / "default", parser="html.parser").render(HTML)
+    assert not _has_text_runs(written)
+
+    compact = LaTeXRenderer(
+        output_root=tmp_path / "compact", parser="html.parser", compact_text=True
+    ).render(HTML)
+
+    assert _has_text_runs(written)
+    assert compact == expected
+
+
+def test_conversion_request_enables_compact_text(
+    tmp_path: Path, written: list[ir.Document]
+) -> None:
+    source = tmp_path / "doc.md"
+    source.write_text(MARKDOWN, encoding="utf-8")
+
+    def _convert(name: str, **options: Any) -> str:
+        request = ConversionRequest(
+            documents=[source], render_dir=tmp_path / name, copy_assets=False, **options
+        )
+        return ConversionService().execute(request).bundle.combined_output()
+
+    expected = _convert("default")
+    assert not _has_text_runs(written)
+
+    assert _convert("compact", compact_text=True) == expected
+    assert _has_text_runs(written)
+
+
+def test_cli_compact_text_flag(tmp_path: Path, written: list[ir.Document]) -> None:
+    source = tmp_path / "doc.md"
+    source.write_text(MARKDOWN, encoding="utf-8")
+    runner = CliRunner()
+
+    default = runner.invoke(app, [str(source), "-o", str(tmp_path / "default")])
+    compact = runner.invoke(app, [str(source), "-o", str(tmp_path / "compact"), "--compact-text"])
+
+    assert default.exit_code == 0, default.output
+    assert compact.exit_code == 0, compact.output
+    outputs = [sorted((tmp_path / name).iterdir()) for name in ("default", "compact")]
+    assert [path.name for path in outputs[0]] == [path.name for path in outputs[1]]
+    for default_file, compact_file in zip(*outputs, strict=True):
+        assert compact_file.read_bytes() == default_file.read_bytes()
+    assert _has_text_runs(written)
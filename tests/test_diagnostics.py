@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+import threading
+import warnings
 
 import pytest
 
 from texsmith.core.conversion.debug import format_user_friendly_render_error
-from texsmith.core.diagnostics import LoggingEmitter, NullEmitter
+from texsmith.core.diagnostics import LoggingEmitter, NullEmitter, capture_warnings
 from texsmith.core.exceptions import LatexRenderingError, TransformerExecutionError
 from texsmith.ui.cli.diagnostics import CliEmitter
 from texsmith.ui.cli.state import ensure_rich_compat, set_cli_state
@@ -63,3 +65,26 @@ def test_format_user_friendly_render_error_reports_root_cause() -> None:
         message = format_user_friendly_render_error(error)
     assert "Docker executable could not be located." in message
     assert "--debug" in message
+
+
+def test_capture_warnings_keeps_concurrent_threads_apart() -> None:
+    barrier = threading.Barrier(2, timeout=10)
+    caught: dict[str, list[str]] = {}
+
+    def _convert(name: str) -> None:
+        with capture_warnings() as records:
+            # Both blocks are open while either thread warns.
+            barrier.wait()
+            warnings.warn(f"warning from {name}", UserWarning, stacklevel=1)
+            barrier.wait()
+        caught[name] = [str(record.message) for record in records]
+
+    threads = [threading.Thread(target=_convert, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert caught == {"a": ["warning from a"], "b": ["warning from b"]}
+    with pytest.warns(UserWarning, match="outside any block"):
+        warnings.warn("outside any block", UserWarning, stacklevel=1)
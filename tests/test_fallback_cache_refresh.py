@@ -1,8 +1,12 @@
+import mmap
+from pathlib import Path
+
 from texsmith.fonts.cache import FontCache
-from texsmith.fonts.coverage import NotoCoverage
+from texsmith.fonts.coverage import NotoCoverage, NotoCoverageBuilder
 from texsmith.fonts.fallback import FallbackEntry, FallbackIndex, FallbackRepository
 from texsmith.fonts.pipeline import FallbackManager
-from texsmith.fonts.ucharclasses import UCharClass
+from texsmith.fonts.scripts import ScriptDetector
+from texsmith.fonts.ucharclasses import UCharClass, UCharClassesBuilder
 
 
 def test_fallback_cache_rebuilds_when_signature_differs(tmp_path, monkeypatch) -> None:
@@ -75,3 +79,120 @@ def test_fallback_uses_cached_index_without_rebuilding(monkeypatch) -> None:
     plan = manager.scan_text("سلام", strategy="by_class")
     names = {entry["font"]["name"] for entry in plan.summary if entry.get("font")}
     assert "CachedFont" in names
+
+
+def _seed_datasets(repo: FallbackRepository) -> None:
+    for path in repo.source_paths():
+        path.write_text("dataset", encoding="utf-8")
+
+
+def _fail_to_build(*_args, **_kwargs):
+    raise AssertionError("datasets should not be rebuilt on a warm cache")
+
+
+def test_warm_cache_loads_without_building_entries(tmp_path, monkeypatch) -> None:
+    cache = FontCache(root=tmp_path / "fonts-cache")
+    repo = FallbackRepository(cache=cache)
+    _seed_datasets(repo)
+    entry = FallbackEntry(
+        name="Arabic",
+        start=0x0600,
+        end=0x06FF,
+        group="Arabics",
+        font={"name": "CachedFont", "extension": ".otf", "styles": ["regular"]},
+    )
+    repo.save(FallbackIndex([entry]), signature=repo.source_key())
+    monkeypatch.setattr("texsmith.fonts.pipeline.generate_ucharclasses_data", _fail_to_build)
+    monkeypatch.setattr("texsmith.fonts.scripts.generate_ucharclasses_data", _fail_to_build)
+    monkeypatch.setattr(FallbackRepository, "_signature", _fail_to_build)
+
+    detector = ScriptDetector(cache=cache)
+    (segment,) = detector._segment_text("سلام", include_whitespace=True)
+    plan = FallbackManager(cache=cache)._ensure_lookup().summary("سلام")
+
+    assert segment[2] == entry
+    assert plan[0]["font"]["name"] == "CachedFont"
+
+
+def test_changed_dataset_invalidates_the_cached_index(tmp_path) -> None:
+    repo = FallbackRepository(cache=FontCache(root=tmp_path))
+    assert repo.source_key() is None
+    _seed_datasets(repo)
+    key = repo.source_key()
+    repo.save(FallbackIndex([]), signature=key)
+    assert repo.load_current() is not None
+
+    repo.source_paths()[1].write_text("refreshed dataset", encoding="utf-8")
+
+    assert repo.source_key() != key
+    assert repo.load_current() is None
+
+
+def test_binary_index_round_trips_its_lookup_tables(tmp_path) -> None:
+    entries = [
+        FallbackEntry(name="Latin", start=0x0000, end=0x024F, group="latin", font={}),
+        FallbackEntry(name="Greek", start=0x0370, end=0x03FF, group="greek", font={"name": "G"}),
+        FallbackEntry(name="Emoji", start=0x1F300, end=0x1F6FF, group="emoji", font={}),
+        FallbackEntry(name="Symbols", start=0x1F600, end=0x1FAFF, group=None, font={}),
+    ]
+    index = FallbackIndex(entries)
+    repo = FallbackRepository(cache=FontCache(root=tmp_path))
+    repo.save(index, signature="key")
+
+    loaded = repo.load(expected_signature="key")
+
+    assert loaded is not None
+    assert loaded.entries == index.entries
+    for codepoint in (0x41, 0x300, 0x3A9, 0x1F600, 0x1F700, 0x1FB00):
+        assert loaded.entry_index(codepoint) == index.entry_index(codepoint)
+        assert loaded.ranges_for_codepoint(codepoint) == index.ranges_for_codepoint(codepoint)
+    assert repo.load(expected_signature="other") is None
+
+
+def test_truncated_index_file_is_ignored(tmp_path) -> None:
+    repo = FallbackRepository(cache=FontCache(root=tmp_path))
+    repo.save(FallbackIndex([]), signature="key")
+    repo.cache_path.write_bytes(repo.cache_path.read_bytes()[:-4])
+
+    assert repo.load(expected_signature="key") is None
+
+
+def test_source_paths_use_the_builders_cache_paths(tmp_path) -> None:
+    cache = FontCache(root=tmp_path)
+    repo = FallbackRepository(cache=cache)
+
+    assert repo.source_paths() == [
+        UCharClassesBuilder(cache=cache).cache_path,
+        NotoCoverageBuilder(cache=cache).cache_path,
+    ]
+
+
+def test_rejected_index_is_unmapped(tmp_path, monkeypatch) -> None:
+    repo = FallbackRepository(cache=FontCache(root=tmp_path))
+    repo.save(FallbackIndex([]), signature="key")
+    mappings: list[mmap.mmap] = []
+    real_mmap = mmap.mmap
+
+    def recording(*args, **kwargs) -> mmap.mmap:
+        mappings.append(real_mmap(*args, **kwargs))
+        return mappings[-1]
+
+    monkeypatch.setattr(mmap, "mmap", recording)
+
+    assert repo.load(expected_signature="other") is None
+    assert repo.load(expected_signature="key") is not None
+    assert [mapping.closed for mapping in mappings] == [True, False]
+
+
+def test_failed_replace_keeps_the_existing_cache(tmp_path, monkeypatch) -> None:
+    repo = FallbackRepository(cache=FontCache(root=tmp_path))
+    repo.save(FallbackIndex([]), signature="old")
+
+    def locked(self: Path, target: Path) -> Path:
+        raise PermissionError("file is mapped by another process")
+
+    monkeypatch.setattr(Path, "replace", locked)
+    repo.save(FallbackIndex([]), signature="new")
+
+    assert repo.load(expected_signature="old") is not None
+    assert [path.name for path in tmp_path.iterdir()] == [repo.cache_path.name]
@@ -0,0 +1,196 @@
+"""Offline tests for the Noto font downloader."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+import threading
+import urllib.error
+
+import pytest
+
+from texsmith.fonts import downloader as downloader_module
+from texsmith.fonts.cache import FontCache
+from texsmith.fonts.downloader import FontRequest, NotoFontDownloader
+
+
+MIRROR = "http://fonts.example.test/noto"
+FONT = b"OTTO" + bytes(4096)
+
+
+class _Response(io.BytesIO):
+    def __init__(self, payload: bytes, length: int | None = None) -> None:
+        super().__init__(payload)
+        self.headers = {"Content-Length": str(len(payload) if length is None else length)}
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, files: dict[str, bytes]) -> list[str]:
+    requested: list[str] = []
+
+    def fake_open_url(url: str, *, timeout: float | None = None) -> _Response:
+        requested.append(url)
+        name = url.rsplit("/", 1)[-1]
+        if not url.startswith(MIRROR) or name not in files:
+            raise urllib.error.URLError("offline")
+        return _Response(files[name])
+
+    monkeypatch.setattr(downloader_module, "open_url", fake_open_url)
+    return requested
+
+
+def _downloader(tmp_path: Path, mirror: str | Path | None = MIRROR) -> NotoFontDownloader:
+    return NotoFontDownloader(cache=FontCache(tmp_path / "cache"), mirror=mirror)
+
+
+def test_mirror_downloads_land_in_the_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = {"NotoSansArabic-Regular.otf": FONT, "NotoSansArabic-Bold.otf": FONT}
+    requested = _serve(monkeypatch, files)
+    downloader = _downloader(tmp_path)
+
+    downloader.ensure(
+        font_name="NotoSansArabic", styles=["regular", "bold"], extension=".otf", dir_base=None
+    )
+
+    assert sorted(path.name for path in downloader.fonts_dir.iterdir()) == sorted(files)
+    assert f"{MIRROR}/NotoSansArabic-Regular.otf" in requested
+    # Cached files are not fetched again.
+    requested.clear()
+    downloader.ensure(font_name="NotoSansArabic", styles=None, extension=".otf", dir_base=None)
+    assert requested == []
+
+
+def test_local_mirror_directory_is_copied(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requested = _serve(monkeypatch, {})
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    (mirror / "NotoSansThai-Regular.otf").write_bytes(FONT)
+
+    downloader = _downloader(tmp_path, f"file://{mirror}")
+    downloader.ensure_all([FontRequest("NotoSansThai", ("regular",))])
+
+    assert (downloader.fonts_dir / "NotoSansThai-Regular.otf").read_bytes() == FONT
+    assert requested == []
+
+
+def test_environment_selects_the_mirror(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(downloader_module.MIRROR_ENV, f"{MIRROR}/")
+
+    assert _downloader(tmp_path, None).mirror == MIRROR
+
+
+@pytest.mark.parametrize(
+    ("payload", "length"),
+    [(FONT[:2000], len(FONT)), (b"<html>not found</html>" * 100, None), (FONT[:100], None)],
+    ids=["truncated", "not-a-font", "too-small"],
+)
+def test_bad_downloads_leave_no_cache_entry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, payload: bytes, length: int | None
+) -> None:
+    def fake_open_url(url: str, *, timeout: float | None = None) -> _Response:
+        if not url.startswith(MIRROR):
+            raise urllib.error.URLError("offline")
+        return _Response(payload, length)
+
+    monkeypatch.setattr(downloader_module, "open_url", fake_open_url)
+    downloader = _downloader(tmp_path)
+
+    downloader.ensure_all([FontRequest("NotoSansLao", ("regular",))])
+
+    assert list(downloader.fonts_dir.iterdir()) == []
+
+
+def test_mirror_checksums_are_verified(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tampered = FONT + b"\0"
+    checksums = "\n".join(
+        [
+            f"{hashlib.sha256(FONT).hexdigest()}  NotoSansHebrew-Regular.otf",
+            f"{hashlib.sha256(FONT).hexdigest()} *NotoSansHebrew-Bold.otf",
+        ]
+    )
+    _serve(
+        monkeypatch,
+        {
+            "SHA256SUMS": checksums.encode(),
+            "NotoSansHebrew-Regular.otf": FONT,
+            "NotoSansHebrew-Bold.otf": tampered,
+        },
+    )
+    downloader = _downloader(tmp_path)
+
+    downloader.ensure_all([FontRequest("NotoSansHebrew", ("regular", "bold"))])
+
+    assert [path.name for path in downloader.fonts_dir.iterdir()] == ["NotoSansHebrew-Regular.otf"]
+
+
+def test_styles_download_concurrently(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Both downloads must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def fake_open_url(url: str, *, timeout: float | None = None) -> _Response:
+        if not url.startswith(MIRROR) or url.endswith("SHA256SUMS"):
+            raise urllib.error.URLError("offline")
+        barrier.wait()
+        return _Response(FONT)
+
+    monkeypatch.setattr(downloader_module, "open_url", fake_open_url)
+    downloader = _downloader(tmp_path)
+
+    downloader.ensure_all(
+        [FontRequest("NotoSansKhmer", ("regular",)), FontRequest("NotoSansLao", ("bold",))]
+    )
+
+    assert sorted(path.name for path in downloader.fonts_dir.iterdir()) == [
+        "NotoSansKhmer-Regular.otf",
+        "NotoSansLao-Bold.otf",
+    ]
+
+
+def test_upstream_fallback_is_not_checked_against_mirror_checksums(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    upstream = b"OTTO" + bytes(8192)
+    checksums = f"{hashlib.sha256(FONT).hexdigest()}  NotoSansHebrew-Regular.otf"
+
+    def fake_open_url(url: str, *, timeout: float | None = None) -> _Response:
+        name = url.rsplit("/", 1)[-1]
+        if url == f"{MIRROR}/SHA256SUMS":
+            return _Response(checksums.encode())
+        if url.startswith(MIRROR):
+            return _Response(FONT + b"\0")
+        if url.startswith("https://cdn.jsdelivr.net/") and name == "NotoSansHebrew-Regular.otf":
+            return _Response(upstream)
+        raise urllib.error.URLError("offline")
+
+    monkeypatch.setattr(downloader_module, "open_url", fake_open_url)
+    downloader = _downloader(tmp_path)
+
+    downloader.ensure_all([FontRequest("NotoSansHebrew", ("regular",))])
+
+    assert (downloader.fonts_dir / "NotoSansHebrew-Regular.otf").read_bytes() == upstream
+
+
+def test_mirror_checksums_load_once_before_the_fetches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    downloader = _downloader(tmp_path)
+    checksum_reads: list[tuple[str, bool]] = []
+
+    def fake_open_url(url: str, *, timeout: float | None = None) -> _Response:
+        if url.endswith("SHA256SUMS"):
+            checksum_reads.append((threading.current_thread().name, downloader._lock.locked()))
+            return _Response(b"")
+        if not url.startswith(MIRROR):
+            raise urllib.error.URLError("offline")
+        return _Response(FONT)
+
+    monkeypatch.setattr(downloader_module, "open_url", fake_open_url)
+
+    downloader.ensure_all(
+        [FontRequest("NotoSansKhmer", ("regular", "bold")), FontRequest("NotoSansLao")]
+    )
+
+    assert len(list(downloader.fonts_dir.iterdir())) == 4
+    assert checksum_reads == [(threading.current_thread().name, False)]
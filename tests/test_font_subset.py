@@ -0,0 +1,185 @@
+"""Tests for subsetting fallback fonts to the codepoints a build uses."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from texsmith.fonts import provisioning
+from texsmith.fonts.cache import FontCache
+from texsmith.fonts.provisioning import _prepare_fallback_context
+from texsmith.fonts.subset import BASE_CODEPOINTS, FontSubsetter, codepoints_key, parse_ranges
+
+
+def _build_font(path: Path, codepoints: list[int]) -> Path:
+    font_builder = pytest.importorskip("fontTools.fontBuilder")
+    glyph_pen = pytest.importorskip("fontTools.pens.ttGlyphPen")
+
+    names = [".notdef", *(f"uni{codepoint:04X}" for codepoint in codepoints)]
+    builder = font_builder.FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(names)
+    builder.setupCharacterMap(dict(zip(codepoints, names[1:], strict=True)))
+    glyphs = {}
+    for name in names:
+        pen = glyph_pen.TTGlyphPen(None)
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500))
+        pen.lineTo((500, 500))
+        pen.closePath()
+        glyphs[name] = pen.glyph()
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics(dict.fromkeys(names, (600, 0)))
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Tiny", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+    return path
+
+
+def _cmap(path: Path) -> set[int]:
+    tt_lib = pytest.importorskip("fontTools.ttLib")
+    with tt_lib.TTFont(str(path)) as font:
+        return set(font.getBestCmap())
+
+
+def test_parse_ranges_expands_summary_ranges() -> None:
+    assert parse_ranges(["U+0627-U+0629", "U+4E2D", " U+1F600 ", "bogus"]) == {
+        0x627,
+        0x628,
+        0x629,
+        0x4E2D,
+        0x1F600,
+    }
+
+
+def test_codepoints_key_ignores_order_and_duplicates() -> None:
+    assert codepoints_key([3, 1, 2, 1]) == codepoints_key({1, 2, 3})
+    assert codepoints_key([1, 2]) != codepoints_key([1, 2, 3])
+
+
+def test_subset_keeps_requested_and_base_codepoints(tmp_path: Path) -> None:
+    font = _build_font(tmp_path / "Tiny-Regular.ttf", [0x41, 0x42, 0x627, 0x628, 0x4E2D])
+    subsetter = FontSubsetter(cache=FontCache(tmp_path / "cache"))
+
+    result = subsetter.subset(font, {0x627})
+
+    assert result is not None
+    assert result.parent == tmp_path / "cache" / "subsets"
+    # ASCII stays through the base set; U+0628 and U+4E2D are dropped.
+    assert _cmap(result) == {0x41, 0x42, 0x627}
+    assert {0x41, 0x42} <= BASE_CODEPOINTS
+    mtime = result.stat().st_mtime_ns
+    assert subsetter.subset(font, [0x627]) == result
+    assert result.stat().st_mtime_ns == mtime
+    assert subsetter.subset(font, {0x628}) != result
+
+
+def test_unreadable_font_falls_back_to_the_full_font(tmp_path: Path) -> None:
+    pytest.importorskip("fontTools")
+    font = tmp_path / "Broken-Regular.otf"
+    font.write_bytes(b"not a font")
+    subsetter = FontSubsetter(cache=FontCache(tmp_path / "cache"))
+
+    assert subsetter.subset(font, {0x41}) is None
+    assert not list((tmp_path / "cache" / "subsets").iterdir())
+
+
+def _subset_context(**fonts: object) -> dict:
+    return {
+        "fonts": {
+            **fonts,
+            "fallback_summary": [
+                {
+                    "group": "Arabic",
+                    "class": "Arabic",
+                    "font": {
+                        "name": "NotoKufiArabic",
+                        "styles": ["regular", "bold"],
+                        "extension": ".otf",
+                    },
+                    "count": 2,
+                    "ranges": ["U+0627-U+0628"],
+                }
+            ],
+            "script_usage": [
+                {
+                    "group": "Arabic",
+                    "slug": "arabic",
+                    "font_name": "NotoKufiArabic",
+                    "count": 2,
+                }
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def fallback_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache = FontCache(tmp_path / "cache")
+    for name in ("NotoKufiArabic-Regular.otf", "NotoKufiArabic-Bold.otf"):
+        cache.path("fonts", name).write_bytes(b"full font")
+    monkeypatch.setattr(provisioning, "FontCache", lambda: cache)
+    monkeypatch.setattr(
+        "texsmith.fonts.provisioning.NotoFontDownloader.ensure",
+        lambda self, *, font_name, styles, extension, dir_base=None: None,  # noqa: ARG005
+    )
+    monkeypatch.setattr(
+        "texsmith.fonts.provisioning.NotoFontDownloader.ensure_all",
+        lambda self, requests: None,  # noqa: ARG005
+    )
+    return cache.root / "fonts"
+
+
+def test_subset_fonts_replace_the_fallback_files(
+    tmp_path: Path, fallback_sources: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requested: list[set[int]] = []
+
+    def fake_subset(self: FontSubsetter, font: Path, codepoints: set[int]) -> Path:
+        requested.append(set(codepoints))
+        target = tmp_path / "cache" / "subsets" / f"{font.stem}-subset{font.suffix}"
+        target.parent.mkdir(exist_ok=True)
+        target.write_bytes(b"subset")
+        return target
+
+    monkeypatch.setattr(provisioning, "subsetting_available", lambda: True)
+    monkeypatch.setattr(FontSubsetter, "subset", fake_subset)
+    output = tmp_path / "build"
+
+    result = _prepare_fallback_context(_subset_context(subset=True), output_dir=output)
+
+    (entry,) = result["entries"]
+    assert entry["upright"] == "NotoKufiArabic-Regular-subset"
+    assert entry["bold"] == "NotoKufiArabic-Bold-subset"
+    assert requested == [{0x627, 0x628}, {0x627, 0x628}]
+    installed = sorted(path.name for path in (output / "fonts").iterdir())
+    assert installed == ["NotoKufiArabic-Bold-subset.otf", "NotoKufiArabic-Regular-subset.otf"]
+
+
+def test_missing_fonttools_copies_the_full_fonts(
+    tmp_path: Path, fallback_sources: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(provisioning, "subsetting_available", lambda: False)
+    output = tmp_path / "build"
+
+    with pytest.warns(UserWarning, match="fontTools is not installed"):
+        result = _prepare_fallback_context(_subset_context(subset=True), output_dir=output)
+
+    (entry,) = result["entries"]
+    assert entry["upright"] == "NotoKufiArabic-Regular"
+    assert (output / "fonts" / "NotoKufiArabic-Regular.otf").read_bytes() == b"full font"
+
+
+def test_subsetting_is_off_by_default(
+    tmp_path: Path, fallback_sources: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(FontSubsetter, "subset", lambda *_: pytest.fail("subset should not run"))
+    output = tmp_path / "build"
+
+    result = _prepare_fallback_context(_subset_context(), output_dir=output)
+
+    (entry,) = result["entries"]
+    assert entry["bold"] == "NotoKufiArabic-Bold"
+    assert (output / "fonts" / "NotoKufiArabic-Bold.otf").exists()
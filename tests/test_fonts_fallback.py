@@ -21,6 +21,10 @@ def test_fallback_aligns_with_usage_slug(tmp_path, monkeypatch) -> None:
         "texsmith.fonts.provisioning.NotoFontDownloader.ensure",
         lambda self, *, font_name, styles, extension, dir_base=None: None,  # noqa: ARG005
     )
+    monkeypatch.setattr(
+        "texsmith.fonts.provisioning.NotoFontDownloader.ensure_all",
+        lambda self, requests: None,  # noqa: ARG005
+    )
 
     context = {
         "fonts": {
@@ -71,6 +75,10 @@ def test_all_classes_for_slug_receive_transitions(tmp_path, monkeypatch) -> None
         "texsmith.fonts.provisioning.NotoFontDownloader.ensure",
         lambda self, *, font_name, styles, extension, dir_base=None: None,  # noqa: ARG005
     )
+    monkeypatch.setattr(
+        "texsmith.fonts.provisioning.NotoFontDownloader.ensure_all",
+        lambda self, requests: None,  # noqa: ARG005
+    )
 
     context = {
         "fonts": {
@@ -132,6 +140,10 @@ def test_usage_font_preferred_over_stale_entries(tmp_path, monkeypatch) -> None:
         "texsmith.fonts.provisioning.NotoFontDownloader.ensure",
         lambda self, *, font_name, styles, extension, dir_base=None: None,  # noqa: ARG005
     )
+    monkeypatch.setattr(
+        "texsmith.fonts.provisioning.NotoFontDownloader.ensure_all",
+        lambda self, requests: None,  # noqa: ARG005
+    )
 
     context = {
         "fonts": {
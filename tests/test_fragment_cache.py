@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from pathlib import Path
+
+import pytest
+
+from texsmith.core.conversion import ConversionRequest, cache as cache_module, parallel
+from texsmith.core.conversion.cache import DiskStorage, FragmentCache, MemoryStorage
+from texsmith.core.conversion.service import ConversionService
+
+
+FIXTURE_BIB = Path(__file__).resolve().parent / "fixtures" / "bib" / "b.bib"
+
+
+def _write(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _chapters(tmp_path: Path) -> list[Path]:
+    return [
+        _write(tmp_path / "one.md", "# One\n\nFirst chapter citing[^LAWRENCE19841632].\n"),
+        _write(tmp_path / "two.md", "# Two\n\nSecond chapter about HTTP.\n\n*[HTTP]: Hypertext\n"),
+    ]
+
+
+@pytest.fixture
+def rendered(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = parallel.convert_document
+
+    def _tracking(**kwargs):
+        calls.append(kwargs["document"].source_path)
+        return original(**kwargs)
+
+    monkeypatch.setattr(parallel, "convert_document", _tracking)
+    return calls
+
+
+def test_cache_hit_skips_rendering(
+    tmp_path: Path, rendered: list[Path], conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    documents = _chapters(tmp_path)
+    request = conversion_request(documents, bibliography_files=[FIXTURE_BIB])
+    uncached = ConversionService().execute(request).bundle
+    service = ConversionService(cache=FragmentCache(DiskStorage(tmp_path / "cache")))
+
+    first = service.execute(request).bundle
+    second = service.execute(request).bundle
+
+    assert rendered == documents
+    assert [f.latex for f in second.fragments] == [f.latex for f in first.fragments]
+    assert [f.latex for f in second.fragments] == [f.latex for f in uncached.fragments]
+    assert second.fragments[0].conversion.document_state.citations == ["LAWRENCE19841632"]
+
+
+def test_cache_rerenders_only_changed_documents(
+    tmp_path: Path, rendered: list[Path], conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    documents = _chapters(tmp_path)
+    request = conversion_request(documents, template="article", bibliography_files=[FIXTURE_BIB])
+    service = ConversionService(cache=FragmentCache(DiskStorage(tmp_path / "cache")))
+    service.execute(request)
+    rendered.clear()
+
+    _write(documents[1], "# Two\n\nSecond chapter, edited.\n")
+    result = service.execute(request).render_result
+
+    assert rendered == [documents[1]]
+    chapter = result.main_tex_path.parent / "two.tex"
+    assert "Second chapter, edited." in chapter.read_text(encoding="utf-8")
+    assert result.document_state.citations == ["LAWRENCE19841632"]
+
+
+def test_cache_replays_diagnostics(
+    tmp_path: Path, conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    document = _write(tmp_path / "doc.md", "# Doc\n\nMissing[^UNKNOWN_KEY] note.\n")
+    request = conversion_request([document], bibliography_files=[FIXTURE_BIB])
+    service = ConversionService(cache=FragmentCache(DiskStorage(tmp_path / "cache")))
+
+    with pytest.warns(UserWarning, match="UNKNOWN_KEY") as first:
+        service.execute(request)
+    with pytest.warns(UserWarning, match="UNKNOWN_KEY") as second:
+        service.execute(request)
+
+    assert [str(w.message) for w in second] == [str(w.message) for w in first]
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = FragmentCache(DiskStorage(tmp_path, max_bytes=10))
+    for index, name in enumerate(("old", "recent")):
+        entry = _write(tmp_path / f"{name}.pkl", "x" * 8)
+        os.utime(entry, ns=(index * 10**9, index * 10**9))
+
+    cache.prune()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["recent.pkl"]
+
+
+def test_prune_sweeps_stale_temporary_entries(tmp_path: Path) -> None:
+    cache = FragmentCache(DiskStorage(tmp_path))
+    stale = _write(tmp_path / "tmpstale.tmp", "partial")
+    os.utime(stale, ns=(0, 0))
+    _write(tmp_path / "tmpfresh.tmp", "in flight")
+
+    cache.prune()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["tmpfresh.tmp"]
+
+
+def test_failed_store_leaves_no_temporary_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    conversion_request: Callable[..., ConversionRequest],
+) -> None:
+    named_temporary_file = cache_module.tempfile.NamedTemporaryFile
+
+    def _failing(**kwargs):
+        handle = named_temporary_file(**kwargs)
+
+        def _write_fails(_payload: bytes) -> int:
+            raise OSError("disk full")
+
+        handle.write = _write_fails
+        return handle
+
+    monkeypatch.setattr(cache_module.tempfile, "NamedTemporaryFile", _failing)
+    service = ConversionService(cache=FragmentCache(DiskStorage(tmp_path / "cache")))
+
+    service.execute(conversion_request(_chapters(tmp_path), bibliography_files=[FIXTURE_BIB]))
+
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_cached_build_matches_serial_when_documents_share_state(
+    tmp_path: Path, rendered: list[Path], conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    documents = [
+        _write(
+            tmp_path / "one.md",
+            "# One\n\nA-B[^shared].\n\n[^shared]: Defined in one.\n\n*[A-B]: Alpha Beta\n",
+        ),
+        _write(tmp_path / "two.md", "# Two\n\nAB[^shared].\n\n*[AB]: Address Bus\n"),
+        _write(tmp_path / "three.md", "# Three\n\nPlain.\n"),
+    ]
+
+    def build(render_dir: str, cache: FragmentCache | None) -> dict[str, bytes]:
+        request = conversion_request(
+            documents, render_dir=render_dir, template="article", bibliography_files=[FIXTURE_BIB]
+        )
+        ConversionService(cache=cache).execute(request)
+        return {path.name: path.read_bytes() for path in (tmp_path / render_dir).glob("*.tex")}
+
+    serial = build("serial", None)
+    cache = FragmentCache(DiskStorage(tmp_path / "cache"))
+    cold = build("cached", cache)
+    rendered.clear()
+    warm = build("cached", cache)
+
+    assert r"\acrshort{AB2}\footnote{Defined in one.}" in serial["two.tex"].decode()
+    assert cold == serial
+    assert warm == serial
+    # Only the document depending on its predecessor is rendered again.
+    assert rendered == [documents[1]]
+
+
+def test_unserialisable_inputs_are_not_cached(
+    tmp_path: Path, conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    document = _chapters(tmp_path)[0]
+    request = conversion_request([document], bibliography_files=[FIXTURE_BIB])
+    loaded = ConversionService().prepare_documents(request).documents[0]
+    cache = FragmentCache(DiskStorage(tmp_path / "cache"))
+
+    assert cache.key_for(loaded, request, extra=object()) is None
+    assert cache.key_for(loaded, request, extra=1) is not None
+
+
+def test_memory_storage_keeps_latest_entry_per_document(tmp_path: Path) -> None:
+    storage = MemoryStorage()
+    source = tmp_path / "one.md"
+
+    storage.write("old", b"1", source=source)
+    storage.write("new", b"2", source=source)
+    storage.write("other", b"3", source=tmp_path / "two.md")
+
+    assert storage.read("old") is None
+    assert storage.read("new") == b"2"
+
+    storage.invalidate([source])
+
+    assert storage.read("new") is None
+    assert storage.read("other") == b"3"
@@ -0,0 +1,110 @@
+"""Tests for the HTML parser backends (lxml fast paths, BeautifulSoup fallback)."""
+
+from __future__ import annotations
+
+from bs4 import BeautifulSoup
+import pytest
+
+from texsmith.adapters.markdown import DEFAULT_MARKDOWN_EXTENSIONS, render_markdown
+from texsmith.core.conversion.inputs import extract_content
+from texsmith.readers.html import HtmlReader, backends
+from texsmith.readers.html.backends import css_to_xpath, lxml_to_soup, select_inner_html
+
+
+SOURCE = """# Title
+
+Some *emphasis*, `code` & a [link](https://example.com)[^a].
+
+- [x] done
+- [ ] pending
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+```python
+print("hi")
+```
+
+[^a]: The note.
+"""
+
+PAGE = """<!doctype html>
+<html><head><title>Site</title></head>
+<body>
+<nav class="md-nav"><a href="/">Home</a></nav>
+<main><div id="content">
+<article class="md-content__inner md-typeset">{body}</article>
+</div></main>
+<footer>footer</footer>
+</body></html>"""
+
+
+@pytest.mark.parametrize(
+    ("selector", "xpath"),
+    [
+        (
+            "article.md-content__inner",
+            "//article[contains(concat(' ', normalize-space(@class), ' '), ' md-content__inner ')]",
+        ),
+        ("#content > ARTICLE", "//*[@id='content']/article"),
+        ("main [data-x], nav", "//main//*[@data-x] | //nav"),
+    ],
+)
+def test_simple_selectors_translate_to_xpath(selector: str, xpath: str) -> None:
+    assert css_to_xpath(selector) == xpath
+
+
+@pytest.mark.parametrize("selector", ["p:first-child", "a[href=x]", "div ~ p", "> p", ""])
+def test_other_selectors_are_not_translated(selector: str) -> None:
+    assert css_to_xpath(selector) is None
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+@pytest.mark.parametrize("selector", ["article.md-content__inner", "main article:first-child"])
+def test_extracted_content_reads_like_the_soup_extraction(
+    selector: str, use_lxml: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if use_lxml:
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(backends, "lxml_available", lambda: use_lxml)
+    page = PAGE.format(body=render_markdown(SOURCE, DEFAULT_MARKDOWN_EXTENSIONS).html)
+    element = BeautifulSoup(page, "html.parser").select_one(selector)
+    assert element is not None
+
+    extracted = extract_content(page, selector)
+
+    assert HtmlReader().read(extracted) == HtmlReader().read(element.decode_contents())
+
+
+def test_missing_content_is_reported() -> None:
+    assert select_inner_html(PAGE.format(body=""), "article.missing") is None
+    with pytest.raises(ValueError, match=r"article\.missing"):
+        extract_content(PAGE.format(body=""), "article.missing")
+
+
+def test_lxml_subtree_adapts_to_the_lxml_builder_tree() -> None:
+    lxml_html = pytest.importorskip("lxml.html")
+    page = PAGE.format(body=render_markdown(SOURCE, DEFAULT_MARKDOWN_EXTENSIONS).html)
+    article = lxml_html.document_fromstring(page).xpath("//article")[0]
+
+    soup = lxml_to_soup(article)
+
+    expected = BeautifulSoup(page, "lxml").article
+    assert soup.article is not None
+    assert soup.article.get("class") == ["md-content__inner", "md-typeset"]
+    # libxml2 trees spell boolean attributes out; the builder leaves them empty.
+    adapted = str(soup).replace('="checked"', '=""').replace('="disabled"', '=""')
+    assert adapted == str(expected)
+
+
+def test_reader_lowers_an_lxml_element() -> None:
+    lxml_html = pytest.importorskip("lxml.html")
+    html = render_markdown(SOURCE, DEFAULT_MARKDOWN_EXTENSIONS).html
+    root = lxml_html.document_fromstring(PAGE.format(body=html))
+    article = root.xpath("//article")[0]
+
+    from_tree = HtmlReader().read_tree(article)
+
+    expected = HtmlReader().read(f'<article class="md-content__inner md-typeset">{html}</article>')
+    assert from_tree == expected
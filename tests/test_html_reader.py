@@ -8,8 +8,20 @@ silently.
 
 from __future__ import annotations
 
-from texsmith.ir import nodes as ir
-from texsmith.readers.html import HtmlReader, ReaderRegistry, ReadLevel, reads
+from dataclasses import replace
+import random
+import sys
+
+import pytest
+
+from texsmith.ir import iter_child_fields, map_tree, nodes as ir, walk
+from texsmith.readers.html import (
+    HtmlReader,
+    ReaderRegistry,
+    ReadLevel,
+    build_reader_registry,
+    reads,
+)
 
 
 def read(html: str) -> ir.Document:
@@ -671,6 +683,82 @@ def test_unknown_inline_tag_becomes_span_with_warning() -> None:
     assert any("no inline lowering" in w for w in emitter.warnings)
 
 
+# ---------------------------------------------------------------------------
+# Prose tokenisation
+# ---------------------------------------------------------------------------
+
+
+def _reference_tokenize(text: str) -> list[ir.Inline]:
+    """Character-by-character tokeniser the regex version must match."""
+    out: list[ir.Inline] = []
+    run: list[str] = []
+    ws: list[str] = []
+
+    def flush_ws() -> None:
+        if ws:
+            chunk = "".join(ws)
+            out.append(ir.Str(chunk) if "\n" in chunk or len(chunk) > 1 else ir.Space())
+            ws.clear()
+
+    for char in text:
+        if char.isspace():
+            if run:
+                out.append(ir.Str("".join(run)))
+                run.clear()
+            ws.append(char)
+        else:
+            flush_ws()
+            run.append(char)
+    if run:
+        out.append(ir.Str("".join(run)))
+    flush_ws()
+    return out
+
+
+def test_tokenize_text_matches_reference_on_random_text() -> None:
+    rng = random.Random(20240611)
+    whitespace = [c for c in map(chr, range(sys.maxunicode + 1)) if c.isspace()]
+    alphabet = ["a", "Z", "é", "漢", "$", "\\", "-", *whitespace]
+    samples = ["", " ", "\n", "  ", " \n ", "word", " lead", "trail ", "a\u00a0b", "a\u3000b"]
+    for _ in range(2000):
+        samples.append("".join(rng.choices(alphabet, k=rng.randint(1, 40))))
+    for text in samples:
+        assert ir.tokenize_text(text) == _reference_tokenize(text), repr(text)
+
+
+def _expand_runs(node: ir.Node) -> ir.Node:
+    changes = {
+        name: tuple(
+            token
+            for item in value
+            for token in (item.expand() if isinstance(item, ir.TextRun) else (item,))
+        )
+        for name, value in iter_child_fields(node)
+        if isinstance(value, tuple) and any(isinstance(item, ir.TextRun) for item in value)
+    }
+    return replace(node, **changes) if changes else node
+
+
+def test_compact_text_packs_prose_losslessly() -> None:
+    html = (
+        "<h2>A  heading here</h2>\n"
+        "<p>\n  Leading and trailing\n  soft-wrapped prose, <em>with emphasis</em> and $x + y$"
+        " math. </p>\n"
+        "<ul><li>one item</li><li>two\titems</li></ul>\n"
+        "<p>word</p>"
+    )
+    default = HtmlReader().read(html)
+    compact = HtmlReader(compact_text=True).read(html)
+
+    runs = [node for node in walk(compact) if isinstance(node, ir.TextRun)]
+    assert ir.TextRun("with emphasis") in runs
+    para = compact.content[1]
+    assert isinstance(para, ir.Para)
+    assert para.content[0] == ir.TextRun("Leading and trailing\n  soft-wrapped prose, ")
+    assert map_tree(compact, _expand_runs) == default
+    assert sum(1 for _ in walk(compact)) < sum(1 for _ in walk(default))
+
+
 # ---------------------------------------------------------------------------
 # Registry extensibility
 # ---------------------------------------------------------------------------
@@ -695,6 +783,55 @@ def test_reads_decorator_and_custom_registry() -> None:
     assert doc.content[0] == ir.Para(content=(ir.Str("WIDGET"),))
 
 
+def test_registry_index_orders_by_priority_and_tracks_registration() -> None:
+    registry = ReaderRegistry()
+
+    @reads("widget", level=ReadLevel.ANY, name="any")
+    def read_any(tag, ctx):  # type: ignore[no-untyped-def]
+        return None
+
+    @reads("widget", level=ReadLevel.INLINE, name="inline", priority=5)
+    def read_inline(tag, ctx):  # type: ignore[no-untyped-def]
+        return None
+
+    registry.register(read_any.__reader_rule__.bind(read_any))  # type: ignore[attr-defined]
+    assert [rule.name for rule in registry.candidates("widget", ReadLevel.INLINE)] == ["any"]
+    assert registry.level_of("widget") is ReadLevel.BLOCK
+    assert registry.level_of("gadget") is None
+
+    registry.register(read_inline.__reader_rule__.bind(read_inline))  # type: ignore[attr-defined]
+    inline = [rule.name for rule in registry.candidates("widget", ReadLevel.INLINE)]
+    assert inline == ["inline", "any"]
+    assert [rule.name for rule in registry.candidates("widget", ReadLevel.BLOCK)] == ["any"]
+
+
+def test_built_registries_are_shared_and_frozen() -> None:
+    default = build_reader_registry()
+
+    assert build_reader_registry() is default
+    assert HtmlReader()._registry is default
+    assert default.level_of("em") is ReadLevel.INLINE
+    assert default.level_of("blockquote") is ReadLevel.BLOCK
+    with pytest.raises(TypeError):
+        default.register(default._rules[0])
+
+
+def test_copied_registry_accepts_new_rules() -> None:
+    @reads("gadget", level=ReadLevel.INLINE, name="gadget")
+    def read_gadget(tag, ctx):  # type: ignore[no-untyped-def]
+        return ir.Str("GADGET")
+
+    default = build_reader_registry()
+    registry = default.copy()
+    registry.register(read_gadget.__reader_rule__.bind(read_gadget))  # type: ignore[attr-defined]
+
+    assert registry.level_of("gadget") is ReadLevel.INLINE
+    assert default.level_of("gadget") is None
+    assert registry.candidates("em", ReadLevel.INLINE) == default.candidates("em", ReadLevel.INLINE)
+    doc = HtmlReader(registry=registry).read("<p><gadget/></p>")
+    assert doc.content[0] == ir.Para(content=(ir.Str("GADGET"),))
+
+
 # ---------------------------------------------------------------------------
 # Integration — real Markdown through the production adapter, no silent loss
 # ---------------------------------------------------------------------------
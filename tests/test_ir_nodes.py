@@ -170,6 +170,32 @@ def test_table_layout_presentation_fields() -> None:
 # --------------------------------------------------------------------------
 
 
+def test_separators_are_singletons() -> None:
+    import copy
+    import pickle
+
+    for kind in (ir.Space, ir.SoftBreak, ir.LineBreak):
+        node = kind()
+        assert kind() is node
+        assert pickle.loads(pickle.dumps(node)) is node
+        assert copy.deepcopy(node) is node
+    assert ir.Space() != ir.SoftBreak()
+
+
+def test_text_run_expands_to_tokens() -> None:
+    run = ir.TextRun("two  words\n and more")
+    assert run.expand() == [
+        ir.Str("two"),
+        ir.Str("  "),
+        ir.Str("words"),
+        ir.Str("\n "),
+        ir.Str("and"),
+        ir.Space(),
+        ir.Str("more"),
+    ]
+    assert ir.TextRun("").expand() == []
+
+
 def test_raw_nodes_carry_format() -> None:
     assert ir.RawInline("latex", "\\foo").format == "latex"
     assert ir.RawBlock("typst", "#bar").format == "typst"
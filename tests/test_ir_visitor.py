@@ -94,11 +94,36 @@ def test_walk_count() -> None:
     assert len(list(ir.walk(doc))) == len(list(ir.walk(doc)))
 
 
+def deep_quote(depth: int) -> ir.Block:
+    node: ir.Block = ir.Para((ir.Str("core"),))
+    for _ in range(depth):
+        node = ir.BlockQuote((node,))
+    return node
+
+
+def test_walk_handles_trees_deeper_than_the_recursion_limit() -> None:
+    depth = sys.getrecursionlimit() * 2
+    nodes = list(ir.walk(deep_quote(depth)))
+    assert len(nodes) == depth + 2
+    assert nodes[-1] == ir.Str("core")
+
+
 # --------------------------------------------------------------------------
 # map_tree
 # --------------------------------------------------------------------------
 
 
+def test_map_tree_handles_deep_trees_and_reuses_unchanged_nodes() -> None:
+    tree = deep_quote(sys.getrecursionlimit() * 2)
+    assert ir.map_tree(tree, lambda n: n) is tree
+
+    def shout(node: ir.Node) -> ir.Node:
+        return ir.Str("CORE") if node == ir.Str("core") else node
+
+    mapped = ir.map_tree(tree, shout)
+    assert list(ir.walk(mapped))[-1] == ir.Str("CORE")
+
+
 def test_map_tree_rewrites_leaves_bottom_up() -> None:
     doc = sample_doc()
 
@@ -174,6 +199,27 @@ def test_visitor_family_handler_via_mro() -> None:
     assert counter.blocks == 6
 
 
+def test_visitor_dispatch_is_per_visitor_class() -> None:
+    class Texts(ir.NodeVisitor):
+        def __init__(self) -> None:
+            self.seen: list[str] = []
+
+        def visit_Str(self, node: ir.Str) -> None:  # noqa: N802
+            self.seen.append(node.text)
+
+    class Loud(Texts):
+        def visit_Str(self, node: ir.Str) -> None:  # noqa: N802
+            self.seen.append(node.text.upper())
+
+    plain, loud = Texts(), Loud()
+    for _ in range(2):
+        plain.visit(sample_doc())
+        loud.visit(sample_doc())
+    assert plain.seen[:2] == ["Title", "Hello"]
+    assert loud.seen[:2] == ["TITLE", "HELLO"]
+    assert len(plain.seen) == len(loud.seen) == 10
+
+
 def test_visitor_generic_visit_default_returns_none() -> None:
     visitor = ir.NodeVisitor()
     # no handlers defined -> generic_visit walks and returns None
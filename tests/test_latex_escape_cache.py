@@ -0,0 +1,81 @@
+"""Tests for the LaTeX writer's memoised text escaping."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from texsmith.adapters.latex.formatter import LaTeXFormatter
+from texsmith.core.config import BookConfig
+from texsmith.core.context import AssetRegistry, DocumentState
+from texsmith.ir import nodes as ir
+from texsmith.writers.latex import LaTeXWriter
+from texsmith.writers.latex.state import WriterState
+
+
+def _writer(tmp_path: Path, **runtime: Any) -> LaTeXWriter:
+    state = WriterState(
+        state=DocumentState(),
+        config=BookConfig(),
+        formatter=LaTeXFormatter(),
+        assets=AssetRegistry(output_root=tmp_path),
+        runtime=runtime,
+    )
+    return LaTeXWriter(state)
+
+
+def test_repeated_text_is_escaped_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    writer = _writer(tmp_path)
+    calls: list[str] = []
+    escape = writer._escape_text
+
+    def counting(text: str) -> str:
+        calls.append(text)
+        return escape(text)
+
+    monkeypatch.setattr(writer, "_escape_text", counting)
+
+    assert writer.emit(ir.Str("50%")) == r"50\%"
+    assert writer.emit(ir.Str("50%")) == r"50\%"
+    assert calls == ["50%"]
+
+
+def test_escape_cache_is_bounded_by_runtime_size(tmp_path: Path) -> None:
+    writer = _writer(tmp_path, escape_cache_size=2)
+    for word in ("one", "two", "three"):
+        writer.emit(ir.Str(word))
+
+    assert [key[0] for key in writer._escape_cache] == ["two", "three"]
+
+
+def test_zero_size_disables_the_escape_cache(tmp_path: Path) -> None:
+    writer = _writer(tmp_path, escape_cache_size=0)
+    writer.emit(ir.Str("word"))
+
+    assert writer._escape_cache == {}
+
+
+def test_artifact_emoji_runs_are_not_memoised(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import texsmith.adapters.transformers as transformers
+
+    fetched: list[str] = []
+
+    def fake_fetch(url: str, output_dir: Path, **_options: Any) -> Path:
+        fetched.append(url)
+        return output_dir / "emoji.pdf"
+
+    monkeypatch.setattr(transformers, "fetch_image", fake_fetch)
+    writer = _writer(tmp_path, emoji_mode="artifact")
+
+    first = writer.emit(ir.Str("ok 👍"))
+    writer.state.assets.assets_map.clear()
+    second = writer.emit(ir.Str("ok 👍"))
+
+    assert first == second
+    assert len(fetched) == 2
+    assert writer.state.assets.assets_map
+    assert writer._escape_cache == {}
@@ -0,0 +1,87 @@
+"""Tests for LaTeXFormatter's shared environment and format-string partials."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from string import Formatter
+
+import pytest
+
+from texsmith.adapters.latex.formatter import (
+    LaTeXFormatter,
+    TemplateNotFoundError,
+    _BytecodeCache,
+)
+
+
+@pytest.mark.parametrize("name", sorted(LaTeXFormatter.FORMAT_PARTIALS))
+def test_format_partials_match_their_jinja_source(name: str) -> None:
+    formatter = LaTeXFormatter()
+    pattern = LaTeXFormatter.FORMAT_PARTIALS[name]
+    fields = {field for _, field, _, _ in Formatter().parse(pattern) if field}
+    values = {field: f"<{field} & x>" for field in fields}
+
+    expected = formatter._get_template(name).render(**values)
+
+    assert pattern.format_map(values) == expected
+    assert formatter._render(name, **values) == expected
+
+
+def test_missing_format_variable_falls_back_to_jinja() -> None:
+    assert LaTeXFormatter().render_template("label") == r"\label{}"
+
+
+def test_override_disables_the_format_partial() -> None:
+    formatter = LaTeXFormatter()
+    formatter.override_template("italic", r"\textit{\VAR{text}}")
+
+    assert formatter.render_template("italic", "x") == r"\textit{x}"
+    assert LaTeXFormatter().render_template("italic", "x") == r"\emph{x}"
+
+
+def test_formatters_share_environment_and_compiled_partials() -> None:
+    first, second = LaTeXFormatter(), LaTeXFormatter()
+
+    assert first.env is second.env
+    assert first._get_template("heading") is second._get_template("heading")
+
+
+def test_identical_overrides_are_compiled_once() -> None:
+    source = r"\OVERRIDE{\VAR{text}}"
+    first, second = LaTeXFormatter(), LaTeXFormatter()
+    first.override_template("lead", source)
+    second.override_template("lead", source)
+
+    assert first._get_template("lead") is second._get_template("lead")
+
+
+def test_escape_filter_follows_each_formatter_accent_setting() -> None:
+    source = r"\VAR{text | latex_escape}"
+    legacy = LaTeXFormatter()
+    legacy.legacy_latex_accents = True
+    legacy.override_template("lead", source)
+    plain = LaTeXFormatter()
+    plain.override_template("lead", source)
+
+    assert legacy.render_template("lead", "é") == r"\'{e}"
+    assert plain.render_template("lead", "é") == "é"
+
+
+def test_unknown_partial_raises() -> None:
+    with pytest.raises(TemplateNotFoundError):
+        LaTeXFormatter().render_template("does_not_exist", "x")
+
+
+def test_unwritable_bytecode_cache_does_not_fail(tmp_path: Path) -> None:
+    from jinja2.bccache import Bucket
+
+    cache = _BytecodeCache(str(tmp_path / "missing"))
+    env = LaTeXFormatter().env
+    written = Bucket(env, "heading", "checksum")
+    written.code = compile("", "<heading>", "exec")
+    cache.dump_bytecode(written)
+
+    loaded = Bucket(env, "heading", "checksum")
+    cache.load_bytecode(loaded)
+
+    assert loaded.code is None
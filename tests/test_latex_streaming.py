@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from texsmith.adapters.latex.renderer import LaTeXRenderer
+from texsmith.adapters.markdown import DEFAULT_MARKDOWN_EXTENSIONS, render_markdown
+from texsmith.core.config import BookConfig
+from texsmith.core.context import DocumentState
+from texsmith.core.conversion.core import LaTeXFragment, convert_documents
+from texsmith.core.documents import Document
+from texsmith.writers.latex import writer as writer_module
+
+
+SOURCE = """# Title
+
+Some *emphasis*, **strong** and `code` with a note[^a].
+
+> A quote
+> over two lines.
+
+- one
+- two
+    1. nested
+
+!!! note "Heads up"
+    Admonition body with $x^2$.
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+```python
+print("hi")
+```
+
+[^a]: The note.
+"""
+
+SCRIPT_RUN = (
+    '<p data-script="arabics">ألف</p>\n<p data-script="arabics">باء</p>\n'
+    '<p data-script="arabics">تاء</p>\n'
+    '<p>Note<sup id="fnref:a"><a class="footnote-ref" href="#fn:a">1</a></sup>.</p>\n'
+    '<div class="footnote"><ol><li id="fn:a"><p>The note.</p></li></ol></div>'
+)
+
+
+def _renderer() -> LaTeXRenderer:
+    return LaTeXRenderer(config=BookConfig(), parser="html.parser", copy_assets=False)
+
+
+def test_streamed_output_matches_string_output() -> None:
+    html = render_markdown(SOURCE, DEFAULT_MARKDOWN_EXTENSIONS).html
+    stream = io.StringIO()
+
+    expected = _renderer().render(html, state=DocumentState())
+    _renderer().render_to(html, stream, state=DocumentState())
+
+    assert "\\footnote{The note.}" in expected
+    assert stream.getvalue() == expected
+
+
+def test_top_level_blocks_reach_the_sink_one_by_one() -> None:
+    chunks: list[str] = []
+
+    _renderer().render_to("<p>One.</p>\n<p>Two.</p>\n<p>Three.</p>", chunks)
+
+    assert chunks == ["One.\n", "\n", "Two.\n", "\n", "Three.\n"]
+
+
+def test_script_runs_stream_as_one_environment() -> None:
+    chunks: list[str] = []
+
+    _renderer().render_to(SCRIPT_RUN, chunks)
+
+    assert chunks[:6] == ["\\begin{arabics}\n", "ألف", "\n\n", "باء", "\n\n", "تاء"]
+    latex = "".join(chunks)
+    assert latex.count("\\begin{arabics}") == 1
+    assert "\\footnote{The note.}" in latex
+
+
+def test_script_usage_is_scanned_in_bounded_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    whole = DocumentState()
+    expected = _renderer().render(SCRIPT_RUN, state=whole)
+    monkeypatch.setattr(writer_module, "_SCRIPT_SCAN_LIMIT", 1)
+    batched = DocumentState()
+
+    latex = _renderer().render(SCRIPT_RUN, state=batched)
+
+    assert latex == expected
+    (usage,) = batched.script_usage
+    assert usage["slug"] == "arabics"
+    # One scan per paragraph: the separators of the single scan are not counted.
+    assert usage["count"] == whole.script_usage[0]["count"] - 4
+
+
+def test_convert_documents_streams_fragments_to_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "chapter.md"
+    source.write_text(SOURCE, encoding="utf-8")
+
+    def _buffered_write(self: LaTeXFragment, target: Path) -> None:
+        pytest.fail("the fragment must be streamed to its file, not written from a string")
+
+    monkeypatch.setattr(LaTeXFragment, "write_to", _buffered_write)
+
+    bundle = convert_documents([Document.from_markdown(source)], output_dir=tmp_path / "build")
+
+    (fragment,) = bundle.fragments
+    assert fragment.output_path == tmp_path / "build" / "chapter.tex"
+    assert fragment.output_path.read_text(encoding="utf-8") == fragment.latex
+    assert "\\footnote{The note.}" in fragment.latex
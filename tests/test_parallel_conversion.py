@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from texsmith.core.context import DocumentState
+from texsmith.core.conversion import ConversionRequest
+from texsmith.core.conversion.core import convert_documents, merge_document_state
+from texsmith.core.conversion.parallel import resolve_worker_count
+from texsmith.core.conversion.service import ConversionService
+from texsmith.core.diagnostics import DiagnosticEmitter
+
+
+FIXTURE_BIB = Path(__file__).resolve().parent / "fixtures" / "bib" / "b.bib"
+
+CHAPTERS = {
+    "intro.md": (
+        "# Introduction\n\n"
+        "The HTTP protocol #[Protocols][HTTP] was described early[^LAWRENCE19841632].\n\n"
+        "*[HTTP]: Hypertext Transfer Protocol\n"
+    ),
+    "body.md": (
+        "# Body\n\n"
+        "Both HTTP and TCP #[Protocols][TCP] matter[^BERESFORD2001259][^LAWRENCE19841632].\n\n"
+        "*[HTTP]: Hypertext Transfer Protocol\n"
+        "*[TCP]: Transmission Control Protocol\n"
+    ),
+    "outro.md": (
+        "# Conclusion\n\nNothing more to add about TCP.\n\n*[TCP]: Transmission Control Protocol\n"
+    ),
+}
+
+
+class _ListEmitter(DiagnosticEmitter):
+    debug_enabled = False
+
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def warning(self, message: str, exc: BaseException | None = None) -> None:
+        self.messages.append(f"warning:{message}")
+
+    def error(self, message: str, exc: BaseException | None = None) -> None:
+        self.messages.append(f"error:{message}")
+
+    def event(self, name: str, payload: object) -> None:
+        self.messages.append(f"event:{name}")
+
+
+def _write_chapters(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name, content in CHAPTERS.items():
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_resolve_worker_count() -> None:
+    assert resolve_worker_count(None, 8) == 1
+    assert resolve_worker_count(1, 8) == 1
+    assert resolve_worker_count(4, 1) == 1
+    assert resolve_worker_count(16, 3) == 3
+    assert resolve_worker_count(0, 2) >= 1
+    with pytest.raises(ValueError, match="non-negative"):
+        resolve_worker_count(-1, 2)
+
+
+def test_parallel_fragments_match_serial(
+    tmp_path: Path, conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    service = ConversionService()
+    serial_emitter = _ListEmitter()
+    parallel_emitter = _ListEmitter()
+
+    chapters = _write_chapters(tmp_path)
+
+    serial_request = conversion_request(
+        chapters, render_dir="serial", bibliography_files=[FIXTURE_BIB], emitter=serial_emitter
+    )
+    serial = service.execute(serial_request).bundle
+    parallel_request = conversion_request(
+        chapters, render_dir="parallel", bibliography_files=[FIXTURE_BIB], emitter=parallel_emitter
+    )
+    parallel = service.execute(parallel_request, max_workers=2).bundle
+
+    assert [fragment.stem for fragment in parallel.fragments] == ["intro", "body", "outro"]
+    assert [fragment.latex for fragment in parallel.fragments] == [
+        fragment.latex for fragment in serial.fragments
+    ]
+    for name in ("intro.tex", "body.tex", "outro.tex"):
+        assert (tmp_path / "parallel" / name).read_text(encoding="utf-8") == (
+            tmp_path / "serial" / name
+        ).read_text(encoding="utf-8")
+    assert parallel_emitter.messages == serial_emitter.messages
+
+
+def test_parallel_template_render_matches_serial(
+    tmp_path: Path, conversion_request: Callable[..., ConversionRequest]
+) -> None:
+    service = ConversionService()
+
+    chapters = _write_chapters(tmp_path)
+    options = {"template": "article", "bibliography_files": [FIXTURE_BIB]}
+
+    serial = service.execute(
+        conversion_request(chapters, render_dir="serial", **options)
+    ).render_result
+    parallel = service.execute(
+        conversion_request(chapters, render_dir="parallel", **options), max_workers=3
+    ).render_result
+
+    assert parallel.main_tex_path.read_text(encoding="utf-8") == serial.main_tex_path.read_text(
+        encoding="utf-8"
+    )
+    bibliography = "texsmith-bibliography.bib"
+    assert (tmp_path / "parallel" / bibliography).read_text(encoding="utf-8") == (
+        tmp_path / "serial" / bibliography
+    ).read_text(encoding="utf-8")
+    serial_state = serial.document_state
+    parallel_state = parallel.document_state
+    assert parallel_state.citations == ["LAWRENCE19841632", "BERESFORD2001259"]
+    assert parallel_state.citations == serial_state.citations
+    assert parallel_state.acronyms == serial_state.acronyms
+    assert parallel_state.index_entries == serial_state.index_entries
+
+
+def test_parallel_conversion_threads_shared_state(tmp_path: Path) -> None:
+    from texsmith.core.documents import Document
+
+    documents = [Document.from_markdown(path) for path in _write_chapters(tmp_path)]
+    shared = DocumentState()
+    shared.record_citation("EXISTING")
+
+    bundle = convert_documents(
+        documents,
+        output_dir=tmp_path / "build",
+        wrap_document=False,
+        shared_state=shared,
+        bibliography_files=[FIXTURE_BIB],
+        max_workers=2,
+    )
+
+    assert all(fragment.conversion.document_state is shared for fragment in bundle.fragments)
+    assert shared.citations == ["EXISTING", "LAWRENCE19841632", "BERESFORD2001259"]
+    assert sorted(term for term, _ in shared.acronyms.values()) == ["HTTP", "TCP"]
+
+
+def test_merge_document_state_keeps_first_acronym_definition() -> None:
+    target = DocumentState()
+    target.remember_acronym("API", "Application Programming Interface")
+    source = DocumentState()
+    source.remember_acronym("API", "Another Interface")
+    source.remember_acronym("CPU", "Central Processing Unit")
+    source.has_index_entries = True
+
+    with pytest.warns(UserWarning, match="Inconsistent acronym definition"):
+        merge_document_state(target, source)
+
+    assert target.abbreviations == {
+        "API": "Application Programming Interface",
+        "CPU": "Central Processing Unit",
+    }
+    assert target.acronym_keys["CPU"] in target.acronyms
+    assert target.has_index_entries
+
+
+SHARED_STATE_CHAPTERS = {
+    "one.md": (
+        "# One\n\n"
+        "The A-B link[^shared] and HTTP[^LAWRENCE19841632].\n\n"
+        "[^shared]: A note defined in the first chapter.\n\n"
+        "*[A-B]: Alpha Beta\n"
+        "*[HTTP]: Hypertext Transfer Protocol\n"
+    ),
+    "two.md": (
+        "# Two\n\n"
+        "The AB bus[^shared] and HTTP again.\n\n"
+        "*[AB]: Address Bus\n"
+        "*[HTTP]: Hyper Text Transfer Protocol\n"
+    ),
+    "three.md": "# Three\n\nOnly TCP here.\n\n*[TCP]: Transmission Control Protocol\n",
+}
+
+
+def test_parallel_build_matches_serial_with_shared_state(tmp_path: Path) -> None:
+    import warnings
+
+    paths = []
+    for name, content in SHARED_STATE_CHAPTERS.items():
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        paths.append(path)
+
+    def build(render_dir: str, workers: int | None) -> list[str]:
+        request = ConversionRequest(
+            documents=paths,
+            bibliography_files=[FIXTURE_BIB],
+            template="article",
+            render_dir=tmp_path / render_dir,
+            copy_assets=False,
+        )
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            ConversionService().execute(request, max_workers=workers)
+        return [str(entry.message) for entry in caught]
+
+    serial_warnings = build("serial", None)
+    parallel_warnings = build("parallel", 3)
+
+    names = sorted(path.name for path in (tmp_path / "serial").iterdir())
+    assert {"one.tex", "two.tex", "three.tex", "texsmith-bibliography.bib"} <= set(names)
+    assert sorted(path.name for path in (tmp_path / "parallel").iterdir()) == names
+    for name in names:
+        assert (tmp_path / "parallel" / name).read_bytes() == (
+            tmp_path / "serial" / name
+        ).read_bytes(), name
+    two = (tmp_path / "serial" / "two.tex").read_text(encoding="utf-8")
+    assert r"\acrshort{AB2}" in two
+    assert r"\footnote{A note defined in the first chapter.}" in two
+    assert parallel_warnings == serial_warnings
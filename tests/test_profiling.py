@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from typer.testing import CliRunner
+
+from texsmith.core.conversion import ConversionRequest
+from texsmith.core.conversion.cache import DiskStorage, FragmentCache
+from texsmith.core.conversion.service import ConversionService
+from texsmith.core.diagnostics import CollectingEmitter
+from texsmith.core.profiling import (
+    PhaseSpan,
+    ProfilingEmitter,
+    chrome_trace,
+    summarise_phases,
+    timed_phase,
+)
+from texsmith.ui.cli import app
+
+
+class _EventLog(CollectingEmitter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def event(self, name: str, payload: Any) -> None:
+        self.events.append((name, dict(payload)))
+
+
+def test_timed_phase_is_silent_without_profiling() -> None:
+    emitter = _EventLog()
+
+    with timed_phase(emitter, "work"):
+        pass
+
+    assert emitter.events == []
+
+
+def test_profiling_emitter_collects_nested_phases_and_forwards_the_rest() -> None:
+    inner = _EventLog()
+    emitter = ProfilingEmitter(inner)
+
+    with (
+        timed_phase(emitter, "document", document="intro.md"),
+        timed_phase(emitter, "latex_writer"),
+    ):
+        emitter.event("asset_fetch", {"url": "https://example.com"})
+    with timed_phase(emitter, "build", engine="tectonic"):
+        pass
+    emitter.warning("careful")
+
+    spans = emitter.take()
+    assert [(span.phase, span.document) for span in spans] == [
+        ("latex_writer", "intro.md"),
+        ("document", "intro.md"),
+        ("build", None),
+    ]
+    assert spans[2].details == {"engine": "tectonic"}
+    assert spans[1].wall >= spans[0].wall
+    assert inner.events == [("asset_fetch", {"url": "https://example.com"})]
+    assert inner.records == [{"level": "warning", "message": "careful"}]
+    assert emitter.take() == []
+
+
+def test_summary_and_chrome_trace() -> None:
+    spans = [
+        PhaseSpan("html_reader", "a.md", start=10.0, wall=0.5, cpu=0.4),
+        PhaseSpan("html_reader", "a.md", start=11.0, wall=0.25, cpu=0.2),
+        PhaseSpan("html_reader", "b.md", start=12.0, wall=2.0, cpu=1.0),
+        PhaseSpan("build", None, start=13.0, wall=1.0, cpu=0.1, details={"engine": "tectonic"}),
+    ]
+
+    rows = [(row.phase, row.document, row.calls, row.wall) for row in summarise_phases(spans)]
+    assert rows == [
+        ("html_reader", "b.md", 1, 2.0),
+        ("build", None, 1, 1.0),
+        ("html_reader", "a.md", 2, 0.75),
+    ]
+    assert [row.calls for row in summarise_phases(spans, by_document=False)] == [3, 1]
+
+    events = chrome_trace(spans)["traceEvents"]
+    assert events[0] == {
+        "name": "html_reader",
+        "cat": "texsmith",
+        "ph": "X",
+        "ts": 0.0,
+        "dur": 500000.0,
+        "pid": 0,
+        "tid": 0,
+        "args": {"cpu_ms": 400.0, "document": "a.md"},
+    }
+    assert events[3]["ts"] == 3_000_000.0
+    assert events[3]["args"] == {"engine": "tectonic", "cpu_ms": 100.0}
+
+
+def test_cached_fragments_do_not_replay_stale_phases(tmp_path: Path) -> None:
+    document = tmp_path / "doc.md"
+    document.write_text("# Title\n\nBody.\n", encoding="utf-8")
+    service = ConversionService(cache=FragmentCache(DiskStorage(tmp_path / "cache")))
+
+    def _phases() -> list[str]:
+        emitter = ProfilingEmitter()
+        request = ConversionRequest(
+            documents=[document], render_dir=tmp_path / "out", emitter=emitter
+        )
+        service.execute(request)
+        return [span.phase for span in emitter.take()]
+
+    first = _phases()
+    second = _phases()
+
+    assert {"load.markdown", "document", "html_reader", "latex_writer"} <= set(first)
+    assert "html_reader" not in second
+    assert "load.markdown" in second
+
+
+def test_cli_profile_prints_table_and_writes_trace(tmp_path: Path) -> None:
+    document = tmp_path / "doc.md"
+    document.write_text("# Title\n\nBody.\n", encoding="utf-8")
+    trace = tmp_path / "trace.json"
+
+    result = CliRunner().invoke(
+        app,
+        [str(document), "-o", str(tmp_path / "out"), "--profile-trace", str(trace)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Profile" in result.output
+    assert "latex_writer" in result.output
+    payload = json.loads(trace.read_text(encoding="utf-8"))
+    names = {event["name"] for event in payload["traceEvents"]}
+    assert {"document", "html_reader", "latex_writer"} <= names
+    assert all(event["ph"] == "X" for event in payload["traceEvents"])
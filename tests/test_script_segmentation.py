@@ -0,0 +1,210 @@
+"""Offline tests for the fallback index tables and script segmentation."""
+
+# ruff: noqa: RUF001
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from texsmith.core.context import DocumentState
+from texsmith.fonts import scripts as scripts_module
+from texsmith.fonts.cache import FontCache
+from texsmith.fonts.fallback import (
+    FallbackEntry,
+    FallbackIndex,
+    FallbackLookup,
+    FallbackUsage,
+    merge_fallback_summaries,
+)
+from texsmith.fonts.scripts import ScriptDetector, flush_fallback_usage, render_moving_text
+
+
+def _entry(name: str, start: int, end: int, group: str | None) -> FallbackEntry:
+    return FallbackEntry(name=name, start=start, end=end, group=group, font={"name": name})
+
+
+ENTRIES = [
+    _entry("BasicLatin", 0x0000, 0x007F, "latin"),
+    _entry("Diacritics", 0x0300, 0x036F, "Diacritics"),
+    _entry("Greek", 0x0370, 0x03FF, "greek"),
+    _entry("Arabic", 0x0600, 0x06FF, "arabic"),
+    _entry("Devanagari", 0x0900, 0x097F, "devanagari"),
+    # Overlaps the end of the Devanagari block: the earlier entry wins there.
+    _entry("Vedic", 0x0970, 0x09FF, "vedic"),
+    _entry("CJKPunctuation", 0x3000, 0x303F, "CJK"),
+    _entry("Hiragana", 0x3040, 0x309F, "japanese"),
+    _entry("CJKUnifiedIdeographs", 0x4E00, 0x9FFF, "chinese"),
+    _entry("Emoji", 0x1F300, 0x1F6FF, "emoji"),
+    _entry("Pictographs", 0x1F600, 0x1FAFF, "pictographs"),
+    _entry("CJKExtensionB", 0x20000, 0x2A6DF, "chinese"),
+]
+
+
+def _detector() -> ScriptDetector:
+    detector = ScriptDetector()
+    detector._lookup = FallbackLookup(FallbackIndex(ENTRIES))
+    return detector
+
+
+@pytest.mark.parametrize(
+    "codepoint",
+    [0x41, 0x80, 0x301, 0x975, 0x9A0, 0x3001, 0x4E2D, 0x1F600, 0x1F700, 0x20001, 0x2A6E0],
+)
+def test_entry_index_matches_the_first_bucket_hit(codepoint: int) -> None:
+    index = FallbackIndex(ENTRIES)
+    hits = index.ranges_for_codepoint(codepoint)
+
+    position = index.entry_index(codepoint)
+
+    assert position == (index.entries.index(hits[0]) if hits else -1)
+
+
+def test_segments_group_runs_and_keep_marks_and_spaces_with_their_script() -> None:
+    segments = _detector()._segment_text("Say مرحبا بكم and नमस्ते।", include_whitespace=True)
+
+    assert [(group, chunk) for group, chunk, _ in segments] == [
+        (None, "Say "),
+        ("arabic", "مرحبا بكم "),
+        (None, "and "),
+        ("devanagari", "नमस्ते।"),
+    ]
+
+
+def test_whitespace_is_its_own_run_when_not_included() -> None:
+    segments = _detector()._segment_text("α\u0301β γ", include_whitespace=False)
+
+    assert [(group, chunk) for group, chunk, _ in segments] == [
+        ("greek", "α\u0301β"),
+        (None, " "),
+        ("greek", "γ"),
+    ]
+
+
+def test_cjk_runs_follow_the_dominant_cjk_group() -> None:
+    segments = _detector()._segment_text("中文、ひらがなです", include_whitespace=True)
+
+    assert [(group, chunk) for group, chunk, _ in segments] == [("japanese", "中文、ひらがなです")]
+
+
+def test_run_entry_is_the_last_character_entry() -> None:
+    (segment,) = _detector()._segment_text("中\U00020001", include_whitespace=True)
+
+    assert segment[0] == "chinese"
+    assert segment[2] is not None
+    assert segment[2].name == "CJKExtensionB"
+
+
+def test_shared_detector_segments_consistently_across_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    texts = [
+        chr(start + offset) * 3 + " x" for start in (0x370, 0x600, 0x900) for offset in range(8)
+    ]
+    expected = [_detector()._segment_text(text, include_whitespace=True) for text in texts]
+    shared = _detector()
+    char_class = scripts_module._CharClass
+
+    def _slow_char_class(**fields: object) -> object:
+        # Widen the window between deriving a key and publishing its class.
+        time.sleep(0.001)
+        return char_class(**fields)
+
+    monkeypatch.setattr(scripts_module, "_CharClass", _slow_char_class)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        segments = list(
+            pool.map(lambda text: shared._segment_text(text, include_whitespace=True), texts)
+        )
+
+    assert segments == expected
+    table = shared._segment_keys
+    assert table is not None
+    assert sorted(map(ord, table._keys.values())) == list(range(len(table.classes)))
+
+
+TEXTS = ["مرحبا 中文", "بكم 中文😀", "中文 \u0378"]
+
+
+def test_accumulated_usage_counts_like_merged_per_text_summaries() -> None:
+    index = FallbackIndex(ENTRIES)
+    merged: list[dict] = []
+    usage = FallbackUsage()
+    for text in TEXTS:
+        merged = merge_fallback_summaries(merged, FallbackLookup(index).summary(text))
+        usage.update(FallbackLookup(index).scan(text))
+
+    summary = merge_fallback_summaries([], usage.summary())
+
+    assert [(e["class"], e["count"]) for e in summary] == [(e["class"], e["count"]) for e in merged]
+    arabic = next(entry for entry in summary if entry["class"] == "Arabic")
+    assert arabic["ranges"] == ["U+0627-U+0628", "U+062D", "U+0631", "U+0643", "U+0645"]
+    assert usage.group_counts()["chinese"] == 6
+    assert usage.dominant() == ("arabic", ENTRIES[3].font)
+
+
+def test_moving_text_usage_reaches_the_state_when_flushed() -> None:
+    context = SimpleNamespace(
+        runtime={"_texsmith_script_detector": _detector()}, state=DocumentState(), config=None
+    )
+    for text in TEXTS:
+        render_moving_text(text, context, legacy_accents=False)
+
+    assert context.state.fallback_summary == []
+    flush_fallback_usage(context)
+
+    counts = {entry["class"]: entry["count"] for entry in context.state.fallback_summary}
+    assert counts == {
+        "Arabic": 8,
+        "BasicLatin": 3,
+        "CJKUnifiedIdeographs": 6,
+        "Emoji": 1,
+        "Greek": 1,
+        "Pictographs": 1,
+    }
+
+
+@pytest.fixture
+def default_detectors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Serve the fallback index from a temporary cache, failing the first load."""
+    loads: list[str] = []
+    index_file = tmp_path / "fallback_index.bin"
+
+    def load_current(self: object) -> FallbackIndex:
+        loads.append("load")
+        if len(loads) == 1:
+            raise OSError("offline")
+        return FallbackIndex(ENTRIES)
+
+    monkeypatch.setattr(scripts_module, "FontCache", lambda: FontCache(tmp_path))
+    monkeypatch.setattr(scripts_module, "_DEFAULT_DETECTORS", {})
+    monkeypatch.setattr(scripts_module.FallbackRepository, "load_current", load_current)
+    index_file.write_bytes(b"index")
+    return loads
+
+
+def test_default_detector_retries_after_a_failed_load(default_detectors: list[str]) -> None:
+    failed = scripts_module.default_script_detector()
+    assert failed.render("αβγ")[1] == []
+
+    detector = scripts_module.default_script_detector()
+
+    assert detector is not failed
+    assert [usage["group"] for usage in detector.render("αβγ")[1]] == ["greek"]
+    assert scripts_module.default_script_detector() is detector
+    assert default_detectors == ["load", "load"]
+
+
+def test_default_detector_reloads_a_changed_index(
+    tmp_path: Path, default_detectors: list[str]
+) -> None:
+    scripts_module.default_script_detector().render("a")
+    detector = scripts_module.default_script_detector()
+    detector.render("a")
+
+    (tmp_path / "fallback_index.bin").write_bytes(b"rebuilt index")
+
+    assert scripts_module.default_script_detector() is not detector
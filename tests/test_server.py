@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import socket
+import stat
+import subprocess
+import sys
+import threading
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from texsmith.adapters.latex.engines import EngineResult
+from texsmith.core.conversion.cache import DiskStorage, FragmentCache
+from texsmith.core.conversion.debug import ConversionError
+from texsmith.core.conversion.server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    ConversionServer,
+    ServerError,
+    call,
+)
+from texsmith.core.conversion.service import ConversionService
+from texsmith.ui.cli import app
+from texsmith.version import get_version
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not available."
+)
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    instance = ConversionServer(tmp_path / "texsmith.sock", workers=2)
+    instance.bind()
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    yield instance
+    instance.shutdown()
+    thread.join()
+    instance.close()
+
+
+def test_ping_reports_version(server: ConversionServer) -> None:
+    assert call(server.socket_path, "ping") == {"version": get_version(), "workers": 2}
+
+
+def test_socket_is_created_private(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def _no_chmod(*_args: Any, **_kwargs: Any) -> None:
+        pytest.fail("the socket must not need widening or narrowing after bind")
+
+    monkeypatch.setattr(Path, "chmod", _no_chmod)
+    with ConversionServer(tmp_path / "private.sock", workers=1) as instance:
+        mode = stat.S_IMODE(instance.socket_path.stat().st_mode)
+
+    assert mode == 0o600
+
+
+def test_cli_imports_without_unix_sockets() -> None:
+    script = (
+        "import socket, socketserver\n"
+        "del socket.AF_UNIX\n"
+        "for name in [n for n in vars(socketserver) if 'Unix' in n]:\n"
+        "    delattr(socketserver, name)\n"
+        "import texsmith.ui.cli.app\n"
+        "from texsmith.core.conversion.server import unix_sockets_available\n"
+        "assert not unix_sockets_available()\n"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_server_requires_unix_sockets(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delattr(socket, "AF_UNIX")
+
+    with pytest.raises(ConversionError, match="Unix domain sockets"):
+        ConversionServer(tmp_path / "texsmith.sock")
+
+
+def test_execute_renders_template_and_reports_timings(
+    server: ConversionServer, tmp_path: Path, write_document: Callable[[str, str], Path]
+) -> None:
+    document = write_document("report", "Quarterly figures.")
+
+    result = call(
+        server.socket_path,
+        "execute",
+        {
+            "documents": [str(document)],
+            "template": "article",
+            "render_dir": str(tmp_path / "build"),
+            "embed_fragments": True,
+            "copy_assets": False,
+        },
+    )
+
+    main_tex = Path(result["main_tex"])
+    assert "Quarterly figures." in main_tex.read_text(encoding="utf-8")
+    assert isinstance(result["diagnostics"], list)
+    assert {"queued", "execute", "total"} <= result["timings"].keys()
+
+
+def test_concurrent_requests_use_separate_outputs(
+    server: ConversionServer, tmp_path: Path, write_document: Callable[[str, str], Path]
+) -> None:
+    def _convert(index: int) -> str:
+        document = write_document(f"letter{index}", f"Body number {index}.")
+        result = call(
+            server.socket_path,
+            "execute",
+            {"documents": [str(document)], "render_dir": str(tmp_path / f"out{index}")},
+        )
+        return result["fragments"][0]["latex"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outputs = list(pool.map(_convert, range(4)))
+
+    assert [f"Body number {index}." in latex for index, latex in enumerate(outputs)] == [True] * 4
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["serial", "fragment-cache"])
+def test_concurrent_requests_report_only_their_own_warnings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    write_document: Callable[[str, str], Path],
+    cached: bool,
+) -> None:
+    # Every request waits for the others, so all four convert at the same time.
+    barrier = threading.Barrier(4, timeout=30)
+    execute_job = ConversionService.execute_job
+
+    def _execute_job(self: ConversionService, *args: Any, **kwargs: Any) -> Any:
+        barrier.wait()
+        return execute_job(self, *args, **kwargs)
+
+    monkeypatch.setattr(ConversionService, "execute_job", _execute_job)
+    service = ConversionService(
+        cache=FragmentCache(DiskStorage(tmp_path / "cache")) if cached else None, warm=True
+    )
+    instance = ConversionServer(tmp_path / "texsmith.sock", service=service, workers=4)
+    instance.bind()
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+
+    def _convert(index: int) -> list[str]:
+        # An unresolved footnote reference raises a Python warning naming it.
+        document = write_document(f"note{index}", f"See[^ghost{index}].")
+        result = call(
+            instance.socket_path,
+            "execute",
+            {"documents": [str(document)], "render_dir": str(tmp_path / f"out{index}")},
+        )
+        return [record["message"] for record in result["diagnostics"]]
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            diagnostics = list(pool.map(_convert, range(4)))
+    finally:
+        instance.shutdown()
+        thread.join()
+        instance.close()
+
+    assert diagnostics == [
+        [f"Reference to 'ghost{index}' is not in your bibliography..."] for index in range(4)
+    ]
+
+
+def test_build_pdf_runs_engine_after_rendering(
+    server: ConversionServer,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    write_document: Callable[[str, str], Path],
+) -> None:
+    document = write_document("memo", "Memo body.")
+    calls: list[dict[str, object]] = []
+
+    def _build(render_result, **options) -> EngineResult:
+        calls.append(options)
+        pdf = render_result.main_tex_path.with_suffix(".pdf")
+        return EngineResult(0, [], ["tectonic"], pdf.with_suffix(".log"), pdf)
+
+    monkeypatch.setattr(server.service, "build_pdf", _build)
+
+    result = call(
+        server.socket_path,
+        "build_pdf",
+        {
+            "documents": [str(document)],
+            "template": "article",
+            "render_dir": str(tmp_path / "build"),
+            "engine": "lualatex",
+        },
+    )
+
+    assert calls == [{"engine": "lualatex"}]
+    assert result["pdf"].endswith(".pdf")
+    assert result["returncode"] == 0
+    assert "build" in result["timings"]
+
+
+def test_errors_follow_json_rpc(server: ConversionServer, tmp_path: Path) -> None:
+    with pytest.raises(ServerError) as unknown_method:
+        call(server.socket_path, "convert")
+    with pytest.raises(ServerError) as missing_dir:
+        call(server.socket_path, "execute", {"documents": [str(tmp_path / "doc.md")]})
+    with pytest.raises(ServerError) as unknown_param:
+        call(server.socket_path, "execute", {"documents": ["a.md"], "render_dir": "b", "x": 1})
+
+    assert unknown_method.value.code == METHOD_NOT_FOUND
+    assert missing_dir.value.code == INVALID_PARAMS
+    assert "x" in unknown_param.value.message
+    assert f'"code": {PARSE_ERROR}' in server.handle_line(b"{not json")
+    assert server.handle({"jsonrpc": "2.0", "method": "ping"}) is None
+
+
+def test_cli_serve_binds_socket_until_interrupted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    socket_path = tmp_path / "cli.sock"
+    seen: list[tuple[bool, int]] = []
+
+    def _serve_forever(self: ConversionServer) -> None:
+        seen.append((self.socket_path.exists(), self.workers))
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(ConversionServer, "serve_forever", _serve_forever)
+
+    result = CliRunner().invoke(app, ["--serve", str(socket_path), "--jobs", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert seen == [(True, 3)]
+    assert "Stopped serving." in result.output
+    assert not socket_path.exists()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import bs4
+import pytest
+
+from texsmith.core.conversion.core import convert_documents
+from texsmith.core.conversion.templates import extract_slot_fragments
+from texsmith.core.documents import Document
+from texsmith.core.templates.runtime import load_template_runtime
+from texsmith.readers.html import HtmlReader
+from texsmith.readers.html.backends import parse_html
+
+
+HTML = (
+    "<h2 id='abstract'>Abstract</h2><p>Short summary.</p>"
+    "<!-- dropped -->"
+    "<h2 id='intro'>Intro</h2><p>Body <em>text</em>.</p>"
+    "<h3 id='detail'>Detail</h3><p>More.</p>"
+)
+
+
+def _extract(html: str | bs4.BeautifulSoup, requests: dict[str, str]):
+    return extract_slot_fragments(
+        html,
+        requests,
+        "mainmatter",
+        slot_definitions={},
+        parser_backend="html.parser",
+    )
+
+
+def test_slots_extracted_from_tree_match_string_input() -> None:
+    from_string, _ = _extract(HTML, {"abstract": "abstract"})
+    from_tree, missing = _extract(parse_html(HTML), {"abstract": "abstract"})
+
+    assert missing == []
+    assert [f.name for f in from_tree] == ["abstract", "mainmatter"]
+    assert [f.html for f in from_tree] == [f.html for f in from_string]
+    assert [f.heading_levels for f in from_tree] == [[2], [2, 3]]
+    reader = HtmlReader()
+    for fragment in from_tree:
+        assert reader.read_tree(fragment.root) == HtmlReader().read(fragment.html)
+
+
+def test_full_document_slot_keeps_sections_taken_by_other_slots() -> None:
+    fragments, _ = _extract(parse_html(HTML), {"everything": "*", "abstract": "abstract"})
+
+    by_name = {fragment.name: fragment for fragment in fragments}
+    assert "Short summary." in by_name["everything"].html
+    assert "Detail" in by_name["everything"].html
+    assert "Short summary." in by_name["abstract"].html
+    assert by_name["mainmatter"].html == ""
+
+
+def test_document_html_is_parsed_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "doc.md"
+    source.write_text(
+        "---\ntitle: Ada\n---\n# Abstract\n\nBy {{ title }}.\n\n# Intro\n\nBody.\n",
+        encoding="utf-8",
+    )
+    document = Document.from_markdown(source)
+    document.assign_slot("abstract", selector="Abstract")
+    runtime = load_template_runtime("article")
+    parsed: list[str] = []
+    original = bs4.BeautifulSoup.__init__
+
+    def _tracking(self, markup="", *args, **kwargs):
+        parsed.append(str(markup))
+        original(self, markup, *args, **kwargs)
+
+    monkeypatch.setattr(bs4.BeautifulSoup, "__init__", _tracking)
+
+    bundle = convert_documents(
+        [document],
+        output_dir=tmp_path / "build",
+        template="article",
+        template_runtime=runtime,
+        wrap_document=False,
+    )
+
+    # The document is parsed once; the other trees are the empty containers
+    # the slot fragments are moved into.
+    markup = [text for text in parsed if text]
+    assert len(markup) == 1
+    assert "Intro" in markup[0]
+    assert len(parsed) == 1 + len(bundle.fragments[0].conversion.slot_outputs)
+    assert "Intro" in bundle.fragments[0].latex
+    assert "By Ada." in bundle.fragments[0].conversion.slot_outputs["abstract"]
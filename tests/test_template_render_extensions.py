@@ -143,3 +143,11 @@ def test_apply_template_render_extensions_noop_without_runtime() -> None:
     binding = types.SimpleNamespace(runtime=None)
     _apply_template_render_extensions(renderer, binding)  # type: ignore[arg-type]
     assert renderer.reader_registry is None
+
+
+def test_custom_writer_dispatch_cache_uses_subclass_emitter() -> None:
+    # ``_str`` never touches the writer state, so none is needed here.
+    writer = _UpperWriter(None)  # type: ignore[arg-type]
+    assert writer.emit(ir.Str("abc")) == "ABC"
+    assert writer._emitters[ir.Str] == writer._str
+    assert LaTeXWriter._registry is not _UpperWriter._registry  # type: ignore[attr-defined]
@@ -35,6 +35,14 @@ def write_doc(*blocks: ir.Block) -> str:
 # --------------------------------------------------------------------------- #
 
 
+def test_text_run_renders_like_its_tokens() -> None:
+    html = "<p>Some *starred*  prose\nwrapped over #lines.</p><h2>Title with words</h2>"
+    expected = TypstWriter(TypstWriterState()).write(HtmlReader().read(html))
+    compact = HtmlReader(compact_text=True).read(html)
+    assert any(isinstance(node, ir.TextRun) for node in compact.content[0].content)
+    assert TypstWriter(TypstWriterState()).write(compact) == expected
+
+
 def test_str_is_escaped() -> None:
     assert emit(ir.Str("a*b_c#d")) == "a\\*b\\_c\\#d"
 
@@ -489,3 +497,21 @@ def test_registry_is_extensible_via_subclass() -> None:
         ir.MarginNote(content=(ir.Para(content=(ir.Str("m"),)),))
     )
     assert out == "#note[custom]"
+
+
+def test_emitters_are_bound_once_per_node_type() -> None:
+    writer = TypstWriter(TypstWriterState())
+    writer.emit(ir.Str("a"))
+    emitter = writer._emitters[ir.Str]
+    writer.emit(ir.Str("b"))
+    assert writer._emitters[ir.Str] is emitter
+    assert writer.registry.method_for_type(ir.Str) == "_str"
+
+
+def test_subclass_node_dispatches_to_base_emitter() -> None:
+    class TaggedStr(ir.Str):
+        __slots__ = ()
+
+    writer = TypstWriter(TypstWriterState())
+    assert writer.emit(TaggedStr("x#")) == writer.emit(ir.Str("x#"))
+    assert TaggedStr in writer._emitters
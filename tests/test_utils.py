@@ -27,3 +27,28 @@ def test_unicode_characters_use_legacy_macros_when_enabled() -> None:
     assert "\\'{e}" in escaped
     assert "\\textemdash" in escaped
     assert "\\%" in escaped
+
+
+def test_plain_ascii_text_is_returned_unchanged() -> None:
+    payload = "plain words, no specials."
+    assert escape_latex_chars(payload) is payload
+    assert escape_latex_chars(payload, legacy_accents=True) is payload
+
+
+def test_ascii_specials_are_escaped() -> None:
+    assert escape_latex_chars("a_b & 50% {x}") == r"a\_b \& 50\% \{x\}"
+    assert escape_latex_chars("~\\") == r"\textasciitilde{}\textbackslash{}"
+
+
+def test_common_symbols_and_script_letters() -> None:
+    assert escape_latex_chars("x → y ≥ 2²") == r"x \(\rightarrow\) y \(\geq\) 2²"
+    escaped = escape_latex_chars("é → ʰ", legacy_accents=True)
+    assert escaped == r"\'{e} \(\rightarrow\) ʰ"
+
+
+def test_prepare_plain_text_applies_unicode_transforms() -> None:
+    from texsmith.writers.latex.escaper import prepare_plain_text
+
+    assert prepare_plain_text("“H₂O” \N{EN DASH} x²…") == (
+        r"``H\textsubscript{2}O'' -- x\textsuperscript{2}..."
+    )
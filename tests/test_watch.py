@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from texsmith.adapters.latex.engines import EngineResult
+from texsmith.core.conversion import ConversionRequest, parallel, service as service_module
+from texsmith.core.conversion.cache import DiskStorage, FragmentCache
+from texsmith.core.conversion.service import ConversionService
+from texsmith.ui.cli import app
+from texsmith.ui.cli.watch import FileWatcher
+
+
+render_module = importlib.import_module("texsmith.ui.cli.commands.render")
+
+
+@pytest.fixture
+def converted(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = parallel.convert_document
+
+    def _tracking(**kwargs):
+        calls.append(kwargs["document"].source_path)
+        return original(**kwargs)
+
+    monkeypatch.setattr(parallel, "convert_document", _tracking)
+    return calls
+
+
+def _touch(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    stat = path.stat()
+    # Bump the mtime so same-size rewrites are visible on coarse clocks.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return path
+
+
+def test_watcher_reports_modified_created_and_removed_files(tmp_path: Path) -> None:
+    document = _touch(tmp_path / "doc.md", "# Doc\n")
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    removed = _touch(assets / "old.png", "old")
+    watcher = FileWatcher([document, assets])
+
+    assert watcher.poll() == []
+
+    _touch(document, "# Doc\n")
+    created = _touch(assets / "new.png", "new")
+    removed.unlink()
+
+    assert watcher.poll() == sorted(path.resolve() for path in (document, created, removed))
+    assert watcher.poll() == []
+
+
+def test_watcher_wait_debounces_bursts(tmp_path: Path) -> None:
+    first = _touch(tmp_path / "one.md", "one")
+    second = _touch(tmp_path / "two.md", "two")
+    edits = iter([lambda: _touch(first, "one!"), lambda: _touch(second, "two!")])
+
+    def _sleep(_seconds: float) -> None:
+        edit = next(edits, None)
+        if edit is not None:
+            edit()
+
+    watcher = FileWatcher([first, second], sleep=_sleep)
+
+    assert watcher.wait() == [first.resolve(), second.resolve()]
+
+
+def test_warm_service_reuses_template_and_documents(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads: list[str] = []
+    original = service_module.load_template_runtime
+
+    def _tracking(identifier: str):
+        loads.append(identifier)
+        return original(identifier)
+
+    monkeypatch.setattr(service_module, "load_template_runtime", _tracking)
+    document = _touch(tmp_path / "doc.md", "# Doc\n\nFirst draft.\n")
+    service = ConversionService(warm=True)
+
+    def _render() -> str:
+        request = ConversionRequest(
+            documents=[document],
+            template="article",
+            render_dir=tmp_path / "build",
+            copy_assets=False,
+            embed_fragments=True,
+        )
+        result = service.execute(request).render_result
+        return result.main_tex_path.read_text(encoding="utf-8")
+
+    assert "First draft." in _render()
+    assert "First draft." in _render()
+    _touch(document, "# Doc\n\nSecond draft.\n")
+    assert "Second draft." in _render()
+    assert loads == ["article"]
+
+
+def test_cli_watch_renders_until_interrupted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    document = _touch(tmp_path / "doc.md", "# Doc\n\nWatched body.\n")
+    output = tmp_path / "build"
+    waits: list[frozenset[Path]] = []
+
+    def _wait(self: FileWatcher) -> list[Path]:
+        waits.append(self.paths)
+        if len(waits) == 1:
+            _touch(document, "# Doc\n\nEdited body.\n")
+            return [document.resolve()]
+        raise KeyboardInterrupt
+
+    # Without --cache the warm state stays in memory only.
+    monkeypatch.setattr(
+        render_module, "FragmentCache", lambda: pytest.fail("--watch must not imply --cache")
+    )
+    monkeypatch.setattr(FileWatcher, "wait", _wait)
+
+    result = CliRunner().invoke(
+        app, [str(document), "--template", "article", "-o", str(output), "--watch"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Stopped watching." in result.output
+    assert len(waits) == 2
+    assert document.resolve() in waits[0]
+    assert "Edited body." in (output / "doc.tex").read_text(encoding="utf-8")
+
+
+def test_cli_watch_uses_the_fragment_cache_with_cache_flag(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    document = _touch(tmp_path / "doc.md", "# Doc\n\nCached body.\n")
+    caches: list[FragmentCache] = []
+
+    def _cache() -> FragmentCache:
+        caches.append(FragmentCache(DiskStorage(tmp_path / "cache")))
+        return caches[-1]
+
+    def _wait(self: FileWatcher) -> list[Path]:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(render_module, "FragmentCache", _cache)
+    monkeypatch.setattr(FileWatcher, "wait", _wait)
+
+    result = CliRunner().invoke(
+        app,
+        [
+            str(document),
+            "--template",
+            "article",
+            "-o",
+            str(tmp_path / "build"),
+            "--watch",
+            "--cache",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(caches) == 1
+    assert any((tmp_path / "cache").iterdir())
+
+
+def test_cli_watch_builds_with_the_warm_service(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    document = _touch(tmp_path / "doc.md", "# Doc\n\nBuilt body.\n")
+    builders: list[ConversionService] = []
+
+    def _build_pdf(self: ConversionService, render_result, **_kwargs) -> EngineResult:
+        builders.append(self)
+        pdf_path = render_result.main_tex_path.with_suffix(".pdf")
+        pdf_path.write_bytes(b"%PDF-1.4")
+        return EngineResult(
+            returncode=0,
+            messages=[],
+            command=["engine"],
+            log_path=pdf_path.with_suffix(".log"),
+            pdf_path=pdf_path,
+        )
+
+    def _wait(self: FileWatcher) -> list[Path]:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(ConversionService, "build_pdf", _build_pdf)
+    monkeypatch.setattr(FileWatcher, "wait", _wait)
+
+    result = CliRunner().invoke(
+        app,
+        [
+            str(document),
+            "--template",
+            "article",
+            "-o",
+            str(tmp_path / "build"),
+            "--build",
+            "--watch",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(builders) == 1
+    assert builders[0].warm
+    assert builders[0] is not render_module._SERVICE
+
+
+def test_warm_service_memoises_fragments_until_invalidated(
+    tmp_path: Path, converted: list[Path]
+) -> None:
+    documents = [_touch(tmp_path / "one.md", "# One\n"), _touch(tmp_path / "two.md", "# Two\n")]
+    service = ConversionService(warm=True)
+    request = ConversionRequest(
+        documents=documents, render_dir=tmp_path / "build", copy_assets=False
+    )
+
+    first = service.execute(request).bundle
+    second = service.execute(request).bundle
+    assert converted == documents
+    assert [f.latex for f in second.fragments] == [f.latex for f in first.fragments]
+
+    converted.clear()
+    service.invalidate([documents[1]])
+    service.execute(request)
+
+    assert converted == [documents[1]]
+
+
+def test_cli_watch_reconverts_only_changed_documents(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, converted: list[Path]
+) -> None:
+    edited = _touch(tmp_path / "edited.md", "# Edited\n\nFirst draft.\n")
+    untouched = _touch(tmp_path / "untouched.md", "# Untouched\n\nStable text.\n")
+    output = tmp_path / "build"
+    rounds: list[list[Path]] = []
+
+    def _wait(self: FileWatcher) -> list[Path]:
+        rounds.append(list(converted))
+        converted.clear()
+        if len(rounds) == 1:
+            _touch(edited, "# Edited\n\nSecond draft.\n")
+            return [edited.resolve()]
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(FileWatcher, "wait", _wait)
+
+    result = CliRunner().invoke(
+        app,
+        [str(edited), str(untouched), "--template", "article", "-o", str(output), "--watch"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [[path.name for path in paths] for paths in rounds] == [
+        ["edited.md", "untouched.md"],
+        ["edited.md"],
+    ]
+    assert "Second draft." in (output / "edited.tex").read_text(encoding="utf-8")
+    assert "Stable text." in (output / "untouched.tex").read_text(encoding="utf-8")